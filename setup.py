@@ -6,6 +6,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "pandas",
+        "numpy",
         "python-dotenv",
         "flask", 
         "pydantic",
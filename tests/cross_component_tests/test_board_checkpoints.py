@@ -0,0 +1,76 @@
+import asyncio
+
+import httpx
+
+from tpm_job_finder_poc.cache.board_checkpoints import BoardCheckpointStore
+from tpm_job_finder_poc.job_aggregator.aggregators.ashby import AshbyConnector
+from tpm_job_finder_poc.job_aggregator.services.http_client import SharedHTTPClient
+
+
+def _posting(posting_id, title, published="2025-10-01T00:00:00Z"):
+    return {"id": posting_id, "jobUrl": f"https://jobs.ashbyhq.com/acme/{posting_id}",
+            "title": title, "department": "Acme",
+            "location": "Remote", "publishedAt": published}
+
+
+def test_unchanged_board_is_skipped(tmp_path):
+    store = BoardCheckpointStore(str(tmp_path / "checkpoints.db"))
+    payload = {"jobs": [_posting("1", "TPM"), _posting("2", "Senior TPM")]}
+    assert len(store.changed_items("ashby", "acme", payload, payload["jobs"], lambda i: i["id"])) == 2
+    store.commit()
+    assert store.changed_items("ashby", "acme", payload, payload["jobs"], lambda i: i["id"]) == []
+    assert store.get_stats()["boards_skipped"] == 1
+
+
+def test_only_new_or_changed_postings_are_emitted(tmp_path):
+    store = BoardCheckpointStore(str(tmp_path / "checkpoints.db"))
+    first = {"jobs": [_posting("1", "TPM"), _posting("2", "Senior TPM")]}
+    store.changed_items("ashby", "acme", first, first["jobs"], lambda i: i["id"], lambda i: i["publishedAt"])
+    store.commit()
+
+    second = {"jobs": [_posting("1", "TPM"), _posting("2", "Staff TPM"),
+                       _posting("3", "Principal TPM", "2025-10-02T00:00:00Z")]}
+    changed = store.changed_items("ashby", "acme", second, second["jobs"],
+                                  lambda i: i["id"], lambda i: i["publishedAt"])
+    assert [item["id"] for item in changed] == ["2", "3"]
+    store.commit()
+
+    checkpoint = store.get("ashby", "acme")
+    assert checkpoint.last_posting_id == "3"
+    assert checkpoint.last_published_at == "2025-10-02T00:00:00Z"
+    assert set(checkpoint.posting_hashes) == {"1", "2", "3"}
+
+
+def test_uncommitted_checkpoints_are_not_persisted(tmp_path):
+    db_path = str(tmp_path / "checkpoints.db")
+    store = BoardCheckpointStore(db_path)
+    payload = {"jobs": [_posting("1", "TPM")]}
+    store.changed_items("ashby", "acme", payload, payload["jobs"], lambda i: i["id"])
+    store.discard()
+    store.commit()
+    store.close()
+
+    reopened = BoardCheckpointStore(db_path)
+    assert len(reopened.changed_items("ashby", "acme", payload, payload["jobs"], lambda i: i["id"])) == 1
+
+
+def test_connector_emits_only_deltas(tmp_path):
+    boards = [
+        {"jobs": [_posting("1", "TPM")]},
+        {"jobs": [_posting("1", "TPM")]},
+        {"jobs": [_posting("1", "TPM"), _posting("2", "Senior TPM")]},
+    ]
+    responses = iter(boards)
+    store = BoardCheckpointStore(str(tmp_path / "checkpoints.db"))
+    connector = AshbyConnector("acme", checkpoints=store)
+
+    async def run():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=next(responses)))
+        async with SharedHTTPClient(transport=transport) as client:
+            counts = []
+            for _ in boards:
+                counts.append([job.title for job in await connector.fetch(client=client)])
+                store.commit()
+            return counts
+
+    assert asyncio.run(run()) == [["TPM"], [], ["Senior TPM"]]
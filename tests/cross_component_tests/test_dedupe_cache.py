@@ -26,3 +26,49 @@ def test_clear_cache():
     assert not cache.is_duplicate(user_id, url)
     db_file.close()
     os.unlink(db_file.name)
+
+def test_filter_new_and_add_many_persistent():
+    db_file = tempfile.NamedTemporaryFile(delete=False)
+    cache = DedupeCache(db_file.name, persistent=True)
+    user_id = str(uuid.uuid4())
+    cache.add(user_id, "https://example.com/job/known", "known")
+    keys = [
+        (user_id, "https://example.com/job/known", "other"),
+        (user_id, "https://example.com/job/new", "h1"),
+        (user_id, "https://example.com/job/dup-in-batch", "h1"),
+        (user_id, None, "known"),
+        (user_id, "https://example.com/job/new2", None),
+    ]
+    new_keys = cache.filter_new(keys)
+    assert new_keys == [keys[1], keys[4]]
+    cache.add_many(new_keys)
+    assert cache.is_duplicate(user_id, "https://example.com/job/new")
+    assert cache.is_duplicate(user_id, hash_="h1")
+    assert cache.filter_new(keys) == []
+    cache.close()
+    db_file.close()
+    os.unlink(db_file.name)
+
+def test_bloom_filter_front_and_persistence():
+    db_file = tempfile.NamedTemporaryFile(delete=False)
+    user_id = str(uuid.uuid4())
+    cache = DedupeCache(db_file.name, persistent=True, use_bloom_filter=True)
+    cache.add_many([(user_id, f"https://example.com/job/{i}", f"h{i}") for i in range(50)])
+    assert cache.is_duplicate(user_id, "https://example.com/job/7")
+    assert not cache.is_duplicate(user_id, "https://example.com/job/new")
+    stats = cache.get_filter_stats()
+    assert stats['enabled'] and stats['keys'] == 100
+    assert stats['filter_hits'] >= 1
+    assert stats['memory_bytes'] > 0
+    cache.close()
+    assert os.path.exists(cache.bloom_path)
+
+    # Rows written by another writer after the snapshot are folded in on load
+    DedupeCache(db_file.name).add(user_id, "https://example.com/job/late")
+    reloaded = DedupeCache(db_file.name, use_bloom_filter=True)
+    assert reloaded.is_duplicate(user_id, hash_="h42")
+    assert reloaded.is_duplicate(user_id, "https://example.com/job/late")
+    reloaded.close()
+    db_file.close()
+    os.unlink(db_file.name)
+    os.unlink(cache.bloom_path)
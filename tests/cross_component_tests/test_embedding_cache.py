@@ -0,0 +1,83 @@
+"""
+Tests for the two-tier embedding cache.
+"""
+
+import numpy as np
+import pytest
+
+from tpm_job_finder_poc.cache.embedding_cache import EmbeddingCache, embedding_key
+from tpm_job_finder_poc.enrichment.embeddings import EmbeddingEngine
+
+
+class CountingEncoder:
+    def __init__(self, dim=8):
+        self.dim = dim
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return np.array([[len(text) + i / 10 for i in range(self.dim)] for text in texts], dtype=np.float32)
+
+
+def test_key_ignores_whitespace_but_not_model():
+    assert embedding_key("m", "Led  agile\nteams ") == embedding_key("m", "Led agile teams")
+    assert embedding_key("m", "Led agile teams") != embedding_key("other", "Led agile teams")
+
+
+def test_misses_computed_once_in_one_batch(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "emb"))
+    encoder = CountingEncoder()
+
+    first = cache.get_or_compute("m", ["agile", "roadmap", "agile ", "scrum"], encoder)
+    second = cache.get_or_compute("m", ["scrum", "agile"], encoder)
+
+    assert encoder.batches == [["agile", "roadmap", "scrum"]]
+    assert first.dtype == np.float32 and first.shape == (4, 8)
+    np.testing.assert_array_equal(first[0], first[2])
+    np.testing.assert_array_equal(second, first[[3, 0]])
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["memory_hits"], stats["computed"]) == (4, 2, 3)
+    assert stats["hit_rate"] == pytest.approx(2 / 6, abs=1e-4)
+    assert stats["disk_entries"] == 3
+    assert stats["disk_bytes"] == 3 * 8 * 2
+    cache.close()
+
+
+def test_disk_tier_survives_restart_and_returns_identical_vectors(tmp_path):
+    encoder = CountingEncoder()
+    cache = EmbeddingCache(str(tmp_path / "emb"))
+    computed = cache.get_or_compute("m", ["stakeholder management", "agile"], encoder)
+    cache.get_or_compute("other-model", ["agile"], CountingEncoder(dim=4))
+    cache.close()
+
+    reopened = EmbeddingCache(str(tmp_path / "emb"), memory_size=1)
+    cached = reopened.get_or_compute("m", ["agile", "stakeholder management", "new phrase"], encoder)
+
+    np.testing.assert_array_equal(cached[:2], computed[[1, 0]])
+    assert encoder.batches[-1] == ["new phrase"]
+    stats = reopened.get_stats()
+    assert (stats["disk_hits"], stats["misses"]) == (2, 1)
+    assert stats["memory_entries"] == 1
+    assert stats["disk_entries"] == 4
+    # A later write extends the mapped file
+    np.testing.assert_array_equal(reopened.get_many("m", ["new phrase"])[0], cached[2])
+    reopened.close()
+
+
+def test_engine_encodes_through_cache(tmp_path, monkeypatch):
+    class FakeModel:
+        calls = 0
+
+        def encode(self, texts, **kwargs):
+            FakeModel.calls += 1
+            return CountingEncoder()(texts)
+
+    monkeypatch.setattr(EmbeddingEngine, "model", FakeModel())
+    engine = EmbeddingEngine(cache=EmbeddingCache(str(tmp_path / "emb")))
+
+    first = engine.encode(["Led agile teams", "Cut costs 20%"])
+    again = engine.encode(["Cut costs 20%"])
+
+    assert FakeModel.calls == 1
+    np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, rtol=1e-5)
+    np.testing.assert_array_equal(again[0], first[1])
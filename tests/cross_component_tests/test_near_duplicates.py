@@ -0,0 +1,88 @@
+import os
+import tempfile
+
+from tpm_job_finder_poc.cache.near_duplicates import NearDuplicateDetector
+
+
+def _fields(job):
+    return job["url"], job["title"], job["company"], job.get("description")
+
+
+def test_folds_syndicated_title_variants():
+    detector = NearDuplicateDetector()
+    jobs = [
+        {"url": "https://indeed.com/1", "title": "Senior Technical Program Manager", "company": "Stripe"},
+        {"url": "https://linkedin.com/1", "title": "Sr. Technical Program Manager - Remote", "company": "Stripe, Inc."},
+        {"url": "https://greenhouse.io/1", "title": "Staff Technical Program Manager", "company": "Stripe"},
+        {"url": "https://greenhouse.io/2", "title": "Technical Program Manager, Identity", "company": "Stripe"},
+    ]
+    unique, matches = detector.deduplicate(jobs, _fields)
+    assert [job["url"] for job in unique] == ["https://indeed.com/1", "https://greenhouse.io/1", "https://greenhouse.io/2"]
+    assert len(matches) == 1
+    assert matches[0].key == "https://linkedin.com/1"
+    assert matches[0].cluster_id == "https://indeed.com/1"
+
+
+def test_cluster_head_survives_a_repeated_run():
+    detector = NearDuplicateDetector()
+    jobs = [
+        {"url": "https://indeed.com/1", "title": "Senior Technical Program Manager", "company": "Stripe"},
+        {"url": "https://linkedin.com/1", "title": "Sr. Technical Program Manager - Remote", "company": "Stripe, Inc."},
+    ]
+    detector.deduplicate(jobs, _fields)
+    unique, matches = detector.deduplicate(jobs, _fields)
+    assert [job["url"] for job in unique] == ["https://indeed.com/1"]
+    assert [(m.key, m.cluster_id) for m in matches] == [("https://linkedin.com/1", "https://indeed.com/1")]
+
+
+def test_different_companies_are_not_folded():
+    detector = NearDuplicateDetector()
+    jobs = [
+        {"url": "https://a.com/1", "title": "Technical Program Manager", "company": "Stripe"},
+        {"url": "https://b.com/1", "title": "Technical Program Manager", "company": "Airbnb"},
+    ]
+    unique, matches = detector.deduplicate(jobs, _fields)
+    assert len(unique) == 2 and not matches
+
+
+def test_incremental_on_disk_index():
+    db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    db_file.close()
+    first = NearDuplicateDetector(db_path=db_file.name)
+    first.deduplicate([{"url": "https://indeed.com/1", "title": "TPM, Payments", "company": "Stripe"}], _fields)
+    first.close()
+
+    second = NearDuplicateDetector(db_path=db_file.name)
+    unique, matches = second.deduplicate([
+        {"url": "https://indeed.com/1", "title": "TPM, Payments", "company": "Stripe"},
+        {"url": "https://linkedin.com/9", "title": "Technical Program Manager - Payments", "company": "Stripe"},
+    ], _fields)
+    assert [job["url"] for job in unique] == ["https://indeed.com/1"]
+    assert matches[0].cluster_id == "https://indeed.com/1"
+    second.close()
+    os.unlink(db_file.name)
+
+
+def test_in_memory_index_bounded_by_retention(monkeypatch):
+    import tpm_job_finder_poc.cache.near_duplicates as near_duplicates
+
+    clock = [1_000_000.0]
+    monkeypatch.setattr(near_duplicates.time, "time", lambda: clock[0])
+    detector = NearDuplicateDetector(retention_days=2)
+    for day in range(10):
+        detector.prune()
+        jobs = [{"url": f"https://a.com/{day}/{i}", "title": f"Program Manager {day} {i}", "company": f"Co{i}"}
+                for i in range(20)]
+        detector.deduplicate(jobs, _fields)
+        clock[0] += 86400
+
+    # Only the two days inside the retention window and the latest run remain,
+    # in both the entries and the band buckets
+    assert len(detector._entries) == 3 * 20
+    assert {key for keys in detector._buckets.values() for key in keys} == set(detector._entries)
+
+    unique, matches = detector.deduplicate(
+        [{"url": "https://b.com/0", "title": "Program Manager 0 3", "company": "Co3"}], _fields
+    )
+    # A repost of a pruned posting is no longer folded away
+    assert len(unique) == 1 and not matches
@@ -76,7 +76,7 @@ class TestScrapingServiceIntegration:
     async def test_health_checks_integration(self, orchestrator):
         """Test health checks across all scrapers."""
         # Mock the browser setup to avoid actual browser launches
-        with patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.ChromeDriverManager'):
+        with patch('tpm_job_finder_poc.scraping_service.scrapers.browser_pool.ChromeDriverManager'):
             with patch('selenium.webdriver.Chrome') as mock_chrome:
                 mock_driver = Mock()
                 mock_driver.get = Mock()
@@ -86,13 +86,13 @@ class TestCareerjetIntegration:
             }
         ]
     
-    @patch('tpm_job_finder_poc.job_aggregator.aggregators.careerjet.CareerjetConnector.fetch_since')
+    @patch('tpm_job_finder_poc.job_aggregator.aggregators.careerjet.CareerjetConnector.fetch')
     async def test_careerjet_integration_with_aggregation_service(
-        self, mock_fetch_since, careerjet_config, mock_careerjet_jobs
+        self, mock_fetch, careerjet_config, mock_careerjet_jobs
     ):
         """Test Careerjet integration with JobAggregationService."""
         # Setup mock
-        mock_fetch_since.return_value = mock_careerjet_jobs
+        mock_fetch.return_value = mock_careerjet_jobs
         
         # Initialize service with Careerjet config
         service = JobAggregationService(
@@ -6,7 +6,7 @@ from tpm_job_finder_poc.job_aggregator.aggregators.recruitee import RecruiteeCon
 from tpm_job_finder_poc.job_aggregator.aggregators.smartrecruiters import SmartRecruitersConnector
 
 def test_ashby_regression(monkeypatch):
-    def dummy_get(url):
+    def dummy_get(url, **kwargs):
         class DummyResp:
             def raise_for_status(self): pass
             def json(self):
@@ -17,7 +17,7 @@ def test_ashby_regression(monkeypatch):
     assert jobs[0].description == "desc"
 
 def test_smartrecruiters_regression(monkeypatch):
-    def dummy_get(url):
+    def dummy_get(url, **kwargs):
         class DummyResp:
             def raise_for_status(self): pass
             def json(self):
@@ -31,7 +31,7 @@ def test_smartrecruiters_regression(monkeypatch):
     assert jobs[0].description == "desc"
 
 def test_workable_regression(monkeypatch):
-    def dummy_get(url):
+    def dummy_get(url, **kwargs):
         class DummyResp:
             def raise_for_status(self): pass
             def json(self):
@@ -42,7 +42,7 @@ def test_workable_regression(monkeypatch):
     assert jobs[0].description == "desc"
 
 def test_recruitee_regression(monkeypatch):
-    def dummy_get(url):
+    def dummy_get(url, **kwargs):
         class DummyResp:
             def raise_for_status(self): pass
             def json(self):
@@ -0,0 +1,115 @@
+"""
+Unit tests for scoring one resume against many job descriptions at once.
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+from tpm_job_finder_poc.enrichment import batch_scorer, embeddings
+from tpm_job_finder_poc.enrichment.batch_scorer import BatchScorer, bucket_scores
+from tpm_job_finder_poc.enrichment.heuristic_scorer import HeuristicScorer
+
+
+class BagOfWordsModel:
+    def __init__(self, model_name):
+        self.calls = 0
+
+    def encode(self, texts, **kwargs):
+        self.calls += 1
+        rows = []
+        for text in texts:
+            vector = np.zeros(16)
+            for word in text.lower().split():
+                vector += np.random.default_rng(zlib.crc32(word.encode())).normal(size=16)
+            rows.append(vector)
+        return np.array(rows)
+
+
+JOBS = [
+    {
+        "responsibilities": ["program management", "roadmap planning", "program"],
+        "keywords": ["roadmap", "stakeholder", "Stakeholder", "api"],
+        "skills": ["sql", "agile", "python"],
+        "education": ["MBA"],
+        "certifications": ["PMP"],
+        "project_impact": ["migration", "cost"],
+        "years_experience": 5,
+        "location": "remote",
+    },
+    {},
+    {"keywords": ["tpm"], "skills": ["jira", "sql"], "years_experience": 10, "education": ["PhD", "MBA"]},
+    {"responsibilities": ["Lead vendor contracts"], "keywords": ["cloud"], "project_impact": ["launch"],
+     "location": "NYC"},
+]
+BULLETS = [
+    "Led program management for roadmap planning across 4 stakeholder groups",
+    "Improved SQL reporting and cut cloud cost 30% during migration",
+    "Lead vendor contracts",
+    "",
+]
+META = {"education": "MBA", "certifications": "pmp", "years_experience": 6, "location": "Remote US"}
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    monkeypatch.setattr(embeddings, "SentenceTransformer", BagOfWordsModel)
+    monkeypatch.setattr(embeddings, "_models", {})
+    monkeypatch.setattr(embeddings, "_default_cache", None)
+
+
+def _without_sims(result):
+    sims = []
+    for bullet in result["bullets"]:
+        sims.append((bullet.pop("resp_sem_sim"), bullet.pop("skill_sem_sim")))
+    return result, sims
+
+
+class TestBucketScores:
+    """Test the vectorized bucket function."""
+
+    def test_matches_scalar_bucket_score(self):
+        scorer = HeuristicScorer({})
+        matches, totals, points = np.meshgrid(np.arange(8), np.arange(8), [10, 15, 20], indexing="ij")
+        expected = np.vectorize(scorer._bucket_score)(matches, totals, points)
+        np.testing.assert_array_equal(bucket_scores(matches, totals, points), expected)
+
+
+class TestBatchScorer:
+    """Test batch results against per-job HeuristicScorer results."""
+
+    @pytest.mark.parametrize("resume_meta", [META, None, {"education": "BA"}])
+    def test_matches_per_job_score_resume(self, fake_model, resume_meta):
+        context = {"channel": "referral"}
+        batch = BatchScorer(JOBS).score_resume(BULLETS, resume_meta, context)
+        per_job = [HeuristicScorer(job).score_resume(BULLETS, resume_meta, context) for job in JOBS]
+
+        assert len(batch) == len(JOBS)
+        for got, expected in zip(batch, per_job):
+            got, got_sims = _without_sims(got)
+            expected, expected_sims = _without_sims(expected)
+            assert got == expected
+            np.testing.assert_allclose(got_sims, expected_sims, atol=1e-5)
+        # A bullet identical to a responsibility earns the semantic bonus
+        assert per_job[3]["bullets"][2]["responsibilities"] == 20
+
+    def test_embeds_bullets_and_distinct_terms_once(self, fake_model):
+        scorer = BatchScorer(JOBS * 50)
+        scorer.score_resume(BULLETS, META)
+        assert embeddings.get_model().calls == 2
+        np.testing.assert_array_equal(
+            scorer.overall_scores(BULLETS, META),
+            [r["overall_score"] for r in scorer.score_resume(BULLETS, META)]
+        )
+
+    def test_numpy_fallback_matches_sparse_path(self, monkeypatch):
+        monkeypatch.setattr(embeddings, "SentenceTransformer", None)
+        monkeypatch.setattr(embeddings, "_models", {})
+        expected = BatchScorer(JOBS).score_resume(BULLETS, META)
+        monkeypatch.setattr(batch_scorer, "SCIPY_AVAILABLE", False)
+        assert BatchScorer(JOBS).score_resume(BULLETS, META) == expected
+
+    def test_no_jobs_or_bullets(self, fake_model):
+        assert BatchScorer([]).score_resume(BULLETS) == []
+        assert BatchScorer(JOBS).score_resume([], META) == [HeuristicScorer(j).score_resume([], META) for j in JOBS]
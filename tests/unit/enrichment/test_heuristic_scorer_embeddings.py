@@ -0,0 +1,119 @@
+"""
+Unit tests for the shared embedding model registry and batched semantic scoring.
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+from tpm_job_finder_poc.enrichment import embeddings
+from tpm_job_finder_poc.enrichment.embeddings import EmbeddingEngine, get_model
+from tpm_job_finder_poc.enrichment.heuristic_scorer import HeuristicScorer
+
+
+class FakeSentenceTransformer:
+    """Bag-of-words model: each word maps to a fixed random direction."""
+
+    loads = 0
+
+    def __init__(self, model_name):
+        FakeSentenceTransformer.loads += 1
+        self.encode_calls = []
+
+    def encode(self, texts, convert_to_numpy=True, **kwargs):
+        self.encode_calls.append(list(texts))
+        rows = []
+        for text in texts:
+            vector = np.zeros(16)
+            for word in text.lower().split():
+                vector += np.random.default_rng(zlib.crc32(word.encode())).normal(size=16)
+            rows.append(vector)
+        return np.array(rows)
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    FakeSentenceTransformer.loads = 0
+    monkeypatch.setattr(embeddings, "SentenceTransformer", FakeSentenceTransformer)
+    monkeypatch.setattr(embeddings, "_models", {})
+    monkeypatch.setattr(embeddings, "_default_cache", None)
+    return FakeSentenceTransformer
+
+
+def _cosine(model, a, b):
+    va, vb = model.encode([a])[0], model.encode([b])[0]
+    return float(va @ vb / (np.linalg.norm(va) * np.linalg.norm(vb)))
+
+
+JOB = {
+    "responsibilities": ["drive cross team delivery", "own release planning", "manage vendor contracts"],
+    "skills": ["stakeholder management", "agile delivery"],
+    "keywords": ["roadmap"],
+}
+BULLETS = [
+    "Drive delivery across team boundaries",
+    "Owned release planning for the roadmap and improved cadence 30%",
+    "Managed stakeholder expectations",
+    "",
+]
+
+
+class TestModelRegistry:
+    """Test the process-wide model registry."""
+
+    def test_model_loaded_once_for_all_engines(self, fake_model):
+        engines = [EmbeddingEngine() for _ in range(5)]
+        assert fake_model.loads == 0
+        assert all(engine.model is get_model() for engine in engines)
+        assert fake_model.loads == 1
+
+    def test_similarity_matrix_matches_pairwise_cosine(self, fake_model):
+        engine = EmbeddingEngine()
+        matrix = engine.similarity_matrix(BULLETS[:3], JOB["responsibilities"])
+        assert matrix.shape == (3, 3)
+        for i, bullet in enumerate(BULLETS[:3]):
+            for j, term in enumerate(JOB["responsibilities"]):
+                assert matrix[i, j] == pytest.approx(_cosine(engine.model, bullet, term), abs=1e-5)
+        assert engine.similarity(BULLETS[0], JOB["skills"][0]) == pytest.approx(
+            _cosine(engine.model, BULLETS[0], JOB["skills"][0]), abs=1e-5)
+
+
+class TestBatchedSemanticScoring:
+    """Test the batched scoring path of HeuristicScorer."""
+
+    def test_score_resume_encodes_bullets_and_terms_once(self, fake_model):
+        scorer = HeuristicScorer(JOB)
+        result = scorer.score_resume(BULLETS)
+
+        model = get_model()
+        assert fake_model.loads == 1
+        # One batch for the JD terms, one for the bullets
+        assert len(model.encode_calls) == 2
+        assert sorted(model.encode_calls[0]) == sorted(scorer.responsibilities | scorer.skills)
+        assert model.encode_calls[1] == BULLETS
+
+        scorer.score_resume(BULLETS[:2])
+        assert len(model.encode_calls) == 3
+
+        for bullet, bullet_result in zip(BULLETS, result["bullets"]):
+            expected_resp = max(_cosine(model, bullet, r) for r in scorer.responsibilities) if bullet else 0.0
+            expected_skill = max(_cosine(model, bullet, s) for s in scorer.skills) if bullet else 0.0
+            assert bullet_result["resp_sem_sim"] == pytest.approx(expected_resp, abs=1e-5)
+            assert bullet_result["skill_sem_sim"] == pytest.approx(expected_skill, abs=1e-5)
+
+    def test_single_bullet_path_matches_batched_path(self, fake_model):
+        scorer = HeuristicScorer(JOB)
+        batched = scorer.score_resume(BULLETS)["bullets"]
+        for bullet, expected in zip(BULLETS, batched):
+            single = scorer.score_bullet(bullet)
+            for key in ("resp_sem_sim", "skill_sem_sim"):
+                assert single.pop(key) == pytest.approx(expected[key], abs=1e-5)
+            assert single["total"] == expected["total"]
+            assert single["rationale"] == expected["rationale"]
+
+    def test_missing_model_scores_zero_similarity(self, monkeypatch):
+        monkeypatch.setattr(embeddings, "SentenceTransformer", None)
+        monkeypatch.setattr(embeddings, "_models", {})
+        result = HeuristicScorer(JOB).score_resume(BULLETS[:2])
+        assert all(b["resp_sem_sim"] == 0.0 and b["skill_sem_sim"] == 0.0 for b in result["bullets"])
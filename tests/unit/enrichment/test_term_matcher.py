@@ -0,0 +1,88 @@
+"""
+Unit tests for single-pass term matching in HeuristicScorer.
+"""
+
+import random
+
+from tpm_job_finder_poc.enrichment.heuristic_scorer import HeuristicScorer
+from tpm_job_finder_poc.enrichment.term_matcher import TermMatcher
+
+
+def _substring_counts(groups, text):
+    return {name: sum(1 for term in terms if term.lower() in text.lower()) for name, terms in groups.items()}
+
+
+class TestTermMatcher:
+    """Test the automaton against per-term substring scans."""
+
+    def test_overlapping_and_nested_terms_all_match(self):
+        groups = {
+            "responsibilities": ["Program Manager", "program", "gram", "manager of managers"],
+            "skills": ["AGILE", "agile", "gil", ""],
+        }
+        matcher = TermMatcher(groups)
+
+        text = "Senior program manager driving agile delivery"
+        assert matcher.count(text) == _substring_counts(groups, text) == {"responsibilities": 3, "skills": 4}
+        assert matcher.find(text) == {"program manager", "program", "gram", "agile", "gil", ""}
+        assert matcher.any("skills", "") and not TermMatcher({"skills": ["sql"]}).any("skills", "")
+
+    def test_matches_substring_semantics_on_random_inputs(self):
+        rng = random.Random(11)
+        alphabet = "abcAB -"
+        for _ in range(2000):
+            terms = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5))) for _ in range(rng.randint(0, 10))]
+            groups = {"a": terms[:6], "b": terms[4:]}
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            assert TermMatcher(groups).count(text) == _substring_counts(groups, text)
+
+
+class TestScorerTermMatching:
+    """Test the scorer's compiled term sets."""
+
+    JOB = {
+        "responsibilities": ["program", "program management", "roadmap planning"],
+        "keywords": ["roadmap", "stakeholder", "Stakeholder"],
+        "skills": ["sql", "agile"],
+        "education": ["MBA", "BS Computer Science"],
+        "certifications": ["PMP", "CSM"],
+        "project_impact": ["migration", "cost"],
+        "years_experience": 5,
+    }
+    BULLETS = [
+        "Led program management for roadmap planning across 4 stakeholder groups",
+        "Improved SQL reporting and cut cloud cost 30% during migration",
+        "Coached agile teams",
+        "",
+    ]
+    META = {"education": "MBA, Wharton", "certifications": "pmp; scrum", "years_experience": 6}
+
+    def test_bullet_counts_identical_to_substring_scans(self):
+        scorer = HeuristicScorer(self.JOB)
+        for bullet in self.BULLETS:
+            expected = _substring_counts({
+                "responsibilities": scorer.responsibilities,
+                "keywords": scorer.keywords,
+                "skills": scorer.skills,
+                "impact": scorer.impact_terms,
+                "project_impact": scorer.project_impact_terms,
+            }, bullet)
+            assert scorer.term_matcher.count(bullet) == expected
+
+            result = scorer.score_bullet(bullet, self.META)
+            assert result["responsibilities"] >= scorer._bucket_score(
+                expected["responsibilities"], len(scorer.responsibilities), scorer.weights["responsibilities"])
+            assert result["keywords"] == scorer._bucket_score(
+                expected["keywords"], len(scorer.keywords), scorer.weights["keywords"])
+            assert result["impact"] == scorer._bucket_score(expected["impact"], 2, scorer.weights["impact"])
+            assert f"Project impact matches: {expected['project_impact']}/2" in result["rationale"]
+            assert "Education matches: 1/2" in result["rationale"]
+            assert "Certifications matches: 1/2" in result["rationale"]
+
+    def test_knockouts_use_compiled_term_sets(self):
+        scorer = HeuristicScorer(self.JOB)
+        assert scorer._check_kos(self.META) == {"ko_failed": False, "failed_fields": []}
+        assert scorer._check_kos({"education": "BA History", "certifications": "", "years_experience": 2}) == {
+            "ko_failed": True,
+            "failed_fields": ["education", "certifications", "years_experience"],
+        }
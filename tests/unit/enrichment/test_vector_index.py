@@ -0,0 +1,245 @@
+"""
+Unit tests for the vector index, resume search and job pre-filtering.
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+from tpm_job_finder_poc.enrichment import embeddings
+from tpm_job_finder_poc.enrichment.orchestrator import ResumeScoringOrchestrator
+from tpm_job_finder_poc.enrichment.vector_index import VectorIndex
+from tpm_job_finder_poc.resume_store.search import ResumeSearch
+
+
+def _word_vector(word, dim=32):
+    return np.random.default_rng(zlib.crc32(word.encode())).normal(size=dim)
+
+
+class BagOfWordsEngine:
+    """Stands in for EmbeddingEngine: a text is the sum of its word vectors."""
+
+    def encode(self, texts):
+        rows = np.array([sum((_word_vector(w) for w in t.lower().split()), np.zeros(32)) for t in texts])
+        return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+class BagOfWordsModel:
+    def __init__(self, model_name):
+        pass
+
+    def encode(self, texts, **kwargs):
+        return BagOfWordsEngine().encode(texts)
+
+
+def _clustered(n, dim=24, clusters=40, seed=1):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    return centers[rng.integers(clusters, size=n)] + 0.3 * rng.normal(size=(n, dim))
+
+
+def _normalize_rows(vectors):
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _brute_force(vectors, query, k):
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    return [f"v{i}" for i in np.argsort(-scores)[:k]]
+
+
+class TestVectorIndex:
+    """Test search, updates and persistence."""
+
+    def test_exact_search_matches_brute_force(self):
+        vectors = _clustered(500)
+        index = VectorIndex()
+        index.add([f"v{i}" for i in range(500)], vectors)
+
+        results = index.search(vectors[:5] + 0.1, k=10)
+
+        assert not index.is_trained
+        for query, hits in zip(vectors[:5] + 0.1, results):
+            assert [item_id for item_id, _ in hits] == _brute_force(vectors, query, 10)
+            assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+
+    def test_ivf_search_recall_and_fewer_vectors_scored(self):
+        vectors = _clustered(5000)
+        index = VectorIndex(nprobe=8, min_train_size=2000)
+        index.add([f"v{i}" for i in range(5000)], vectors)
+        queries = _clustered(50, seed=2)
+
+        results = index.search(queries, k=10)
+
+        assert index.is_trained
+        recall = np.mean([
+            len({item_id for item_id, _ in hits} & set(_brute_force(vectors, query, 10))) / 10
+            for query, hits in zip(queries, results)
+        ])
+        assert recall >= 0.9
+        stats = index.get_stats()
+        assert stats["ivf_queries"] == 50
+        assert stats["vectors_scored"] < 50 * 5000 / 2
+
+    def test_search_restricted_to_ids(self):
+        vectors = _clustered(3000)
+        index = VectorIndex(min_train_size=1000)
+        index.add([f"v{i}" for i in range(3000)], vectors)
+        subset = [f"v{i}" for i in range(0, 3000, 10)] + ["missing"]
+        queries = _clustered(5, seed=4)
+
+        ivf = index.search(queries, k=5, ids=subset)
+        exact = index.search(queries, k=5, exact=True, ids=subset)
+
+        assert index.is_trained
+        for query, ivf_hits, exact_hits in zip(queries, ivf, exact):
+            expected = [f"v{i * 10}" for i in np.argsort(-(_normalize_rows(vectors[::10]) @ query))[:5]]
+            assert [item_id for item_id, _ in exact_hits] == expected
+            assert {item_id for item_id, _ in ivf_hits} <= set(subset)
+        assert index.get_stats()["vectors_scored"] <= 2 * 5 * 300
+        assert index.search(queries[0], k=5, ids=["missing"]) == []
+
+    def test_insert_replace_delete_after_training(self):
+        vectors = _clustered(300)
+        index = VectorIndex(min_train_size=100)
+        index.add([f"v{i}" for i in range(300)], vectors)
+        index.train(nlist=10)
+
+        index.add(["new", "v7"], np.stack([vectors[3] * 2, -vectors[7]]))
+        assert index.remove(["v3", "v100", "missing"]) == 2
+
+        assert len(index) == 299
+        assert "v3" not in index and "new" in index
+        assert index.search(vectors[3], k=1)[0][0] == "new"
+        assert index.search(-vectors[7], k=1, exact=True)[0][0] == "v7"
+        # Slots moved by deletes still map to their own vectors
+        for item_id in ("v298", "v299", "v5"):
+            assert index.search(index.get_vector(item_id), k=1, exact=True)[0][0] == item_id
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        vectors = _clustered(400)
+        index = VectorIndex(min_train_size=100)
+        index.add([f"v{i}" for i in range(400)], vectors)
+        index.train(nlist=12)
+        path = str(tmp_path / "index.npz")
+
+        index.save(path)
+        loaded = VectorIndex.load(path)
+
+        assert len(loaded) == 400 and loaded.is_trained
+        queries = _clustered(5, seed=3)
+        assert loaded.search(queries, k=5) == index.search(queries, k=5)
+
+    def test_rejects_mismatched_dimensions(self):
+        index = VectorIndex()
+        index.add(["a"], np.ones(4))
+        with pytest.raises(ValueError):
+            index.add(["b"], np.ones(5))
+
+
+class TestResumeSearch:
+    """Test resume retrieval on top of the index."""
+
+    def test_search_and_similar_resumes(self, tmp_path):
+        path = str(tmp_path / "resumes.npz")
+        search = ResumeSearch(engine=BagOfWordsEngine(), index_path=path)
+        search.index_resume("tpm", "technical program manager cloud migration delivery")
+        search.index_resume("tpm2", "technical program manager cloud delivery roadmap")
+        search.index_resume("chef", "pastry chef bakery kitchen")
+        search.save_index()
+
+        reloaded = ResumeSearch(engine=BagOfWordsEngine(), index_path=path)
+        hits = reloaded.search_resumes("cloud program manager", top_k=2)
+
+        assert {hit["resume_id"] for hit in hits} == {"tpm", "tpm2"}
+        assert reloaded.find_similar_resumes("tpm", top_k=1) == ["tpm2"]
+        assert reloaded.remove_resume("chef")
+        assert reloaded.find_similar_resumes("missing") == []
+
+
+class TestShortlistJobs:
+    """Test pre-filtering jobs before full scoring."""
+
+    def test_keeps_jobs_closest_to_resume_bullets(self, monkeypatch):
+        monkeypatch.setattr(embeddings, "SentenceTransformer", BagOfWordsModel)
+        monkeypatch.setattr(embeddings, "_models", {})
+        monkeypatch.setattr(embeddings, "_default_cache", None)
+        orchestrator = ResumeScoringOrchestrator(job_desc={})
+        jobs = [{"id": f"filler-{i}", "title": f"role {i}", "description": f"unrelated duty {i} warehouse"}
+                for i in range(50)]
+        jobs[17] = {"id": "match-a", "title": "Technical Program Manager", "description": "cloud migration"}
+        jobs[33] = {"id": "match-b", "title": "Program Manager", "description": "vendor contracts budget"}
+        job_index = VectorIndex()
+        job_index.add(["stale"], BagOfWordsEngine().encode(["technical program manager cloud migration"]))
+
+        shortlist = orchestrator.shortlist_jobs(
+            jobs, bullets=["led cloud migration program", "managed vendor contracts budget"],
+            top_k=2, job_index=job_index
+        )
+
+        assert {job["id"] for job in shortlist} == {"match-a", "match-b"}
+        assert len(job_index) == 51
+
+    def test_reused_index_not_scanned_for_small_batch(self, monkeypatch):
+        monkeypatch.setattr(embeddings, "SentenceTransformer", BagOfWordsModel)
+        monkeypatch.setattr(embeddings, "_models", {})
+        monkeypatch.setattr(embeddings, "_default_cache", None)
+        orchestrator = ResumeScoringOrchestrator(job_desc={})
+        job_index = VectorIndex(min_train_size=1000)
+        job_index.add([f"old-{i}" for i in range(3000)], _clustered(3000, dim=32))
+        # Yesterday's postings closest to the resume must not crowd out today's
+        job_index.add(["old-tpm"], BagOfWordsEngine().encode(["led cloud migration program"]))
+        jobs = [{"id": f"filler-{i}", "title": f"role {i}", "description": f"unrelated duty {i} warehouse"}
+                for i in range(40)]
+        jobs[5] = {"id": "match-a", "title": "Technical Program Manager", "description": "cloud migration"}
+
+        shortlist = orchestrator.shortlist_jobs(jobs, bullets=["led cloud migration program"],
+                                                top_k=1, job_index=job_index)
+
+        assert [job["id"] for job in shortlist] == ["match-a"]
+        assert len(job_index) == 3041
+        # Only this batch's vectors are scored, not the rest of the index
+        assert job_index.get_stats()["vectors_scored"] <= 40
+
+    def test_batch_without_index_is_searched_exactly(self, monkeypatch):
+        monkeypatch.setattr(embeddings, "SentenceTransformer", BagOfWordsModel)
+        monkeypatch.setattr(embeddings, "_models", {})
+        monkeypatch.setattr(embeddings, "_default_cache", None)
+        import tpm_job_finder_poc.enrichment.vector_index as vector_index
+        monkeypatch.setattr(vector_index.VectorIndex, "train",
+                            lambda self, *args, **kwargs: pytest.fail("throwaway index was trained"))
+        orchestrator = ResumeScoringOrchestrator(job_desc={})
+        jobs = [{"id": f"filler-{i}", "title": f"role {i}", "description": f"unrelated duty {i} warehouse"}
+                for i in range(3000)]
+        jobs[1234] = {"id": "match-a", "title": "Technical Program Manager", "description": "cloud migration"}
+
+        shortlist = orchestrator.shortlist_jobs(jobs, bullets=["led cloud migration program"], top_k=1)
+
+        assert [job["id"] for job in shortlist] == ["match-a"]
+
+    def test_jobs_without_id_keyed_by_content_across_runs(self, monkeypatch):
+        monkeypatch.setattr(embeddings, "SentenceTransformer", BagOfWordsModel)
+        monkeypatch.setattr(embeddings, "_models", {})
+        monkeypatch.setattr(embeddings, "_default_cache", None)
+        orchestrator = ResumeScoringOrchestrator(job_desc={})
+        job_index = VectorIndex()
+        fillers = [{"title": f"role {i}", "description": f"unrelated duty {i} warehouse"} for i in range(5)]
+        yesterday = fillers + [{"title": "Technical Program Manager", "description": "cloud migration"}]
+        today = fillers + [{"title": "Pastry Chef", "description": "bakery kitchen"}]
+        bullets = ["led cloud migration program"]
+
+        orchestrator.shortlist_jobs(yesterday, bullets=bullets, top_k=1, job_index=job_index)
+        shortlist = orchestrator.shortlist_jobs(today + [{"title": "Technical Program Manager"}],
+                                                bullets=bullets, top_k=1, job_index=job_index)
+
+        # Today's job at yesterday's position gets its own vector, not yesterday's
+        assert shortlist == [{"title": "Technical Program Manager"}]
+        assert len(job_index) == 8
+
+    def test_returns_all_jobs_without_embeddings(self, monkeypatch):
+        monkeypatch.setattr(embeddings, "SentenceTransformer", None)
+        monkeypatch.setattr(embeddings, "_models", {})
+        orchestrator = ResumeScoringOrchestrator(job_desc={})
+        jobs = [{"id": str(i)} for i in range(5)]
+        assert orchestrator.shortlist_jobs(jobs, bullets=["anything"], top_k=2) == jobs
@@ -1,10 +1,13 @@
 """Unit tests for Careerjet connector."""
 
+import asyncio
 import pytest
 import os
+import httpx
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 from tpm_job_finder_poc.job_aggregator.aggregators.careerjet import CareerjetConnector
+from tpm_job_finder_poc.job_aggregator.services.http_client import SharedHTTPClient
 
 # Fast mode check
 FAST_MODE = os.getenv('PYTEST_FAST_MODE', '0') == '1'
@@ -207,6 +210,27 @@ class TestCareerjetConnector:
         no_date_job = {'posted_date': ''}
         assert self.connector._is_recent_job(no_date_job, since) is True
     
+    @pytest.mark.asyncio
+    async def test_fetch_caps_requests_in_flight(self):
+        """Test async fetch keeps at most max_concurrency searches in flight."""
+        in_flight = {"now": 0, "peak": 0, "total": 0}
+        
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["total"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200, json={"type": "JOBS", "jobs": []})
+            
+        connector = CareerjetConnector(self.affiliate_id, self.locales, max_concurrency=2)
+        async with SharedHTTPClient(transport=httpx.MockTransport(handler)) as client:
+            jobs = await connector.fetch(client=client)
+            
+        assert jobs == []
+        assert in_flight["total"] == len(self.locales) * len(connector.SEARCH_TERMS)
+        assert in_flight["peak"] == 2
+    
     def test_locale_regions_mapping(self):
         """Test that all defined locales have region mappings."""
         for locale in self.connector.LOCALE_REGIONS:
@@ -0,0 +1,75 @@
+"""
+Unit tests for the shared async HTTP client and the async connector fetch path.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tpm_job_finder_poc.job_aggregator.aggregators.ashby import AshbyConnector
+from tpm_job_finder_poc.job_aggregator.aggregators.smartrecruiters import SmartRecruitersConnector
+from tpm_job_finder_poc.job_aggregator.services.http_client import (
+    SharedHTTPClient,
+    get_http_client,
+    close_http_client,
+)
+
+
+def _client(handler):
+    return SharedHTTPClient(transport=httpx.MockTransport(handler))
+
+
+class TestSharedHTTPClient:
+    """Test SharedHTTPClient behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_get_json_raises_on_error_status(self):
+        async with _client(lambda request: httpx.Response(503)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_json("https://example.com/jobs")
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_reused_per_loop(self):
+        client = get_http_client()
+        assert get_http_client() is client
+        await close_http_client()
+        assert client.is_closed
+        assert get_http_client() is not client
+        await close_http_client()
+
+
+class TestAsyncConnectorFetch:
+    """Test the async fetch coroutines on API connectors."""
+
+    @pytest.mark.asyncio
+    async def test_ashby_fetch(self):
+        payload = {"jobs": [{"title": "TPM", "department": "Eng", "jobUrl": "https://example.com/job/1",
+                             "publishedAt": "2024-01-01T00:00:00Z", "descriptionPlain": "desc"}]}
+        async with _client(lambda request: httpx.Response(200, json=payload)) as client:
+            jobs = await AshbyConnector("demo").fetch(client=client)
+        assert jobs[0].title == "TPM"
+        assert jobs[0].description == "desc"
+
+    @pytest.mark.asyncio
+    async def test_smartrecruiters_fetches_details_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            if "postings?" in str(request.url):
+                return httpx.Response(200, json={"content": [
+                    {"id": str(i), "name": f"TPM {i}", "location": {"city": "SF"},
+                     "applyUrl": f"https://example.com/job/{i}"} for i in range(3)
+                ]})
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"jobAd": {"sections": {"jobDescription": {"text": "desc"}}}})
+
+        async with _client(handler) as client:
+            jobs = await SmartRecruitersConnector("demo").fetch(client=client)
+        assert [job.title for job in jobs] == ["TPM 0", "TPM 1", "TPM 2"]
+        assert peak > 1
@@ -0,0 +1,157 @@
+"""
+Unit tests for batch job description extraction and the description store.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tpm_job_finder_poc.cache.description_store import DescriptionStore, canonical_url, posting_key
+from tpm_job_finder_poc.job_aggregator.scrapers.response_cache import ResponseCache
+from tpm_job_finder_poc.job_aggregator.services.http_client import SharedHTTPClient
+from tpm_job_finder_poc.job_aggregator.services.job_description_extractor import JobDescriptionExtractor
+
+
+def _page(text: str) -> str:
+    return f"<html><body><div class='content'><div class='description'><p>{text}</p></div></div></body></html>"
+
+
+class TestDescriptionStore:
+    """Test canonical URLs and the persistent store."""
+
+    def test_canonical_url_drops_tracking_variants(self):
+        assert canonical_url("https://www.Example.com/jobs/42/?utm_source=x&gh_src=abc&b=2&a=1#apply") \
+            == "https://example.com/jobs/42?a=1&b=2"
+        assert canonical_url("https://example.com/jobs/42") == canonical_url("https://example.com/jobs/42/")
+
+    def test_syndicated_descriptions_stored_once(self, tmp_path):
+        store = DescriptionStore(str(tmp_path / "descriptions.db"))
+        store.put_many([
+            ("https://a.example.com/jobs/1", "Build  data pipelines", None),
+            ("https://b.example.com/postings/9", "Build data pipelines", None),
+        ])
+
+        assert store.get("https://a.example.com/jobs/1?utm_medium=email") == "Build  data pipelines"
+        assert store.get_stats() == {"descriptions": 1, "urls": 2}
+        store.close()
+
+    def test_expired_descriptions_not_served_and_pruned(self, tmp_path):
+        path = str(tmp_path / "descriptions.db")
+        store = DescriptionStore(path, max_age_days=7)
+        store.put("https://a.example.com/jobs/1", "Old text", posting_key("TPM", "Acme"))
+        store._conn.execute("UPDATE descriptions SET fetched_at = '2020-01-01T00:00:00+00:00'")
+        store._conn.commit()
+
+        assert store.get("https://a.example.com/jobs/1") is None
+        assert store.find_by_posting_keys([posting_key("TPM", "Acme")]) == {}
+        store.close()
+
+        # Reopening prunes the expired row; storing it again serves it again
+        store = DescriptionStore(path, max_age_days=7)
+        assert store.get_stats() == {"descriptions": 0, "urls": 0}
+        store.put("https://a.example.com/jobs/1", "New text")
+        assert store.get("https://a.example.com/jobs/1") == "New text"
+        store.close()
+
+
+class TestExtractMany:
+    """Test batch extraction."""
+
+    @staticmethod
+    def _extractor(tmp_path, handler, **kwargs):
+        client = SharedHTTPClient(transport=httpx.MockTransport(handler))
+        extractor = JobDescriptionExtractor(
+            store=DescriptionStore(str(tmp_path / "descriptions.db")),
+            response_cache=ResponseCache(cache_dir=str(tmp_path / "cache")),
+            client=client,
+            **kwargs
+        )
+        return extractor, client
+
+    @pytest.mark.asyncio
+    async def test_fetches_each_posting_once_and_never_refetches(self, tmp_path):
+        requests = []
+
+        def handler(request):
+            requests.append(str(request.url))
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, text=_page(f"Role at {request.url.path}"))
+
+        extractor, client = self._extractor(tmp_path, handler)
+        key = posting_key("Senior TPM", "Acme", "Remote")
+        urls = [
+            "https://boards.greenhouse.io/acme/jobs/1",
+            "https://boards.greenhouse.io/acme/jobs/1?gh_src=linkedin",
+            "https://jobs.lever.co/acme/abc",
+            "https://aggregator.example.com/view/77",
+            "https://example.com/missing",
+        ]
+        keys = {urls[0]: key, urls[3]: key}
+
+        results = await extractor.extract_many(urls, posting_keys=keys)
+
+        assert results[urls[0]] == "Role at /acme/jobs/1"
+        assert results[urls[1]] == results[urls[0]]
+        # Syndicated copy shares the original's description without a request
+        assert results[urls[3]] == results[urls[0]]
+        assert results[urls[4]] is None
+        assert len(requests) == 3
+        stats = extractor.get_stats()
+        assert stats["duplicate_urls"] == 1
+        assert stats["syndicated_hits"] == 1
+        assert stats["failed"] == 1
+
+        # Stored descriptions are answered from the store, even by a new extractor
+        extractor.response_cache = ResponseCache(cache_dir=str(tmp_path / "other-cache"))
+        again = await extractor.extract_many(urls[:4] + ["https://mirror.example.com/p/5"],
+                                             posting_keys={"https://mirror.example.com/p/5": key})
+        assert again["https://mirror.example.com/p/5"] == results[urls[0]]
+        assert len(requests) == 3
+        assert extractor.get_stats()["store_hits"] == 3
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_store_is_opt_in(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        client = SharedHTTPClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=_page("Role"))
+        ))
+        extractor = JobDescriptionExtractor(
+            response_cache=ResponseCache(cache_dir=str(tmp_path / "cache")), client=client
+        )
+
+        results = await extractor.extract_many(["https://a.example.com/jobs/1"])
+
+        assert results == {"https://a.example.com/jobs/1": "Role"}
+        assert extractor.store is None
+        assert not list(tmp_path.glob("*.db"))
+
+        extractor.store_path = str(tmp_path / "stored" / "descriptions.db")
+        (tmp_path / "stored").mkdir()
+        await extractor.extract_many(["https://a.example.com/jobs/1"])
+        assert extractor.get_stats()["store"] == {"descriptions": 1, "urls": 1}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_caps_requests_in_flight_per_domain(self, tmp_path):
+        in_flight = {"a.example.com": 0, "b.example.com": 0}
+        peak = dict(in_flight)
+
+        async def handler(request):
+            host = request.url.host
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200, text=_page(str(request.url)))
+
+        extractor, client = self._extractor(tmp_path, handler, per_domain_limit=2)
+        urls = [f"https://{host}/jobs/{i}" for host in in_flight for i in range(6)]
+
+        results = await extractor.extract_many(urls)
+
+        assert all(results[url] == url for url in urls)
+        assert peak == {"a.example.com": 2, "b.example.com": 2}
+        await client.aclose()
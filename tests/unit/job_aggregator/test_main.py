@@ -324,6 +324,20 @@ class TestJobAggregatorConfiguration:
         
         assert aggregator.config == config
         
+    def test_incremental_fetch_is_opt_in(self, tmp_path, monkeypatch):
+        """Test board checkpoints are only kept when enabled, next to the output."""
+        monkeypatch.chdir(tmp_path)
+        assert JobAggregatorService().board_checkpoints is None
+        assert not list(tmp_path.glob("**/board_checkpoints.db"))
+        
+        aggregator = JobAggregatorService(config={
+            'incremental_fetch': {'enabled': True},
+            'output': {'path': str(tmp_path / "out" / "jobs.xlsx")}
+        })
+        
+        assert aggregator.board_checkpoints.db_path == str(tmp_path / "out" / "board_checkpoints.db")
+        assert (tmp_path / "out" / "board_checkpoints.db").exists()
+        
     def test_source_filtering(self):
         """Test filtering sources based on configuration."""
         aggregator = JobAggregatorService()
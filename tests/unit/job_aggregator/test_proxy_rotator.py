@@ -0,0 +1,141 @@
+"""
+Unit tests for weighted proxy selection, per-domain scores and shared-session probing.
+"""
+
+import random
+import time
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from tpm_job_finder_poc.job_aggregator.scrapers import proxy_rotator
+from tpm_job_finder_poc.job_aggregator.scrapers.proxy_rotator import FenwickTree, ProxyRotator
+
+
+def _healthy(rotator, proxy, successes=10, response_time=0.0):
+    for _ in range(successes):
+        rotator.report_success(proxy, response_time=response_time)
+
+
+class TestFenwickTree:
+    """Test the selection index."""
+
+    def test_find_matches_linear_scan(self):
+        rng = random.Random(7)
+        weights = [rng.choice([0.0, rng.random()]) for _ in range(37)]
+        tree = FenwickTree(weights)
+        for i in range(0, 37, 5):
+            weights[i] = rng.random()
+            tree.set(i, weights[i])
+
+        assert tree.total() == pytest.approx(sum(weights))
+        for _ in range(500):
+            target = rng.random() * sum(weights)
+            cumulative = 0.0
+            for expected, weight in enumerate(weights):
+                cumulative += weight
+                if target < cumulative:
+                    break
+            assert tree.find(target) == expected
+
+    def test_all_zero_weights_find_nothing(self):
+        tree = FenwickTree([0.0, 0.0])
+        assert tree.find(0.0) is None
+
+
+class TestProxySelection:
+    """Test weighted selection."""
+
+    def test_unvalidated_and_banned_proxies_not_selected(self):
+        rotator = ProxyRotator(["http://a", "http://b", "http://c"], max_failures=2)
+        assert rotator.get_proxy() is None
+
+        _healthy(rotator, "http://a")
+        _healthy(rotator, "http://b")
+        rotator.report_failure("http://b")
+        rotator.report_failure("http://b")
+
+        assert {rotator.get_proxy() for _ in range(50)} == {"http://a"}
+
+    def test_ban_expiry_restores_weight(self):
+        rotator = ProxyRotator(["http://a"], max_failures=1, ban_duration=0.05)
+        _healthy(rotator, "http://a", successes=20)
+        rotator.report_failure("http://a")
+        assert rotator.get_proxy() is None
+
+        time.sleep(0.06)
+        assert rotator.get_proxy() == "http://a"
+
+    def test_faster_proxy_selected_more_often(self):
+        random.seed(3)
+        rotator = ProxyRotator(["http://fast", "http://slow"])
+        _healthy(rotator, "http://fast", response_time=0.1)
+        _healthy(rotator, "http://slow", response_time=3.0)
+
+        picks = Counter(rotator.get_proxy() for _ in range(2000))
+        # Weights are 1/1.1 vs 1/4.0
+        assert picks["http://fast"] / picks["http://slow"] == pytest.approx(4.0 / 1.1, rel=0.2)
+
+    def test_domain_scores_steer_selection_for_that_domain_only(self):
+        random.seed(5)
+        rotator = ProxyRotator(["http://a", "http://b"], min_success_rate=0.5, max_failures=100)
+        _healthy(rotator, "http://a", successes=30)
+        _healthy(rotator, "http://b", successes=30)
+        for _ in range(10):
+            rotator.report_failure("http://a", domain="jobs.example.com")
+            rotator.report_success("http://b", domain="jobs.example.com")
+
+        scores = rotator.get_domain_scores("jobs.example.com")
+        assert scores["http://a"] < 0.2 < 0.9 < scores["http://b"]
+        on_domain = Counter(rotator.get_proxy("jobs.example.com") for _ in range(500))
+        assert on_domain["http://b"] > 0.8 * 500
+        elsewhere = Counter(rotator.get_proxy("other.example.com") for _ in range(500))
+        assert elsewhere["http://a"] > 0.3 * 500
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    instances = 0
+
+    def __init__(self, *args, **kwargs):
+        FakeSession.instances += 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def get(self, url, proxy=None, timeout=None):
+        if proxy == "http://dead":
+            raise ConnectionError("proxy refused connection")
+        return FakeResponse(200)
+
+
+class TestProxyProbing:
+    """Test health probes."""
+
+    @pytest.mark.asyncio
+    async def test_validate_shares_one_session_and_removes_failures(self):
+        FakeSession.instances = 0
+        proxies = [f"http://p{i}" for i in range(25)] + ["http://dead"]
+        rotator = ProxyRotator(proxies)
+
+        with patch.object(proxy_rotator.aiohttp, "ClientSession", FakeSession):
+            await rotator.validate_proxies(concurrency=5)
+
+        assert FakeSession.instances == 1
+        assert "http://dead" not in rotator.proxies
+        assert len(rotator.proxies) == 25
+        assert rotator.get_proxy() in rotator.proxies
@@ -0,0 +1,64 @@
+"""
+Unit tests for the GCRA RateLimiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from tpm_job_finder_poc.job_aggregator.scrapers.rate_limiter import RateLimiter
+from tpm_job_finder_poc.scraping_service.core.base_job_source import RateLimitConfig
+
+
+class TestRateLimiter:
+    """Test burst, pacing and shared-state behaviour."""
+
+    def test_burst_then_paced(self):
+        limiter = RateLimiter(requests_per_minute=600, burst_limit=3)
+        now = time.time()
+        waits = [limiter._reserve_local("example.com", now) for _ in range(5)]
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.1, abs=1e-3)
+        assert waits[4] == pytest.approx(0.2, abs=1e-3)
+
+    def test_hourly_limit_applies_after_minute_budget(self):
+        limiter = RateLimiter(requests_per_minute=6000, requests_per_hour=3, burst_limit=10)
+        now = time.time()
+        waits = [limiter._reserve_local("example.com", now) for _ in range(4)]
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(1200.0, abs=1e-3)
+
+    def test_domains_are_independent(self):
+        limiter = RateLimiter(requests_per_minute=60, burst_limit=1)
+        now = time.time()
+        assert limiter._reserve_local("a.com", now) == 0.0
+        assert limiter._reserve_local("b.com", now) == 0.0
+        assert limiter._reserve_local("a.com", now) == pytest.approx(1.0, abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_spaced(self):
+        limiter = RateLimiter(requests_per_minute=1200, burst_limit=1)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("example.com") for _ in range(4)))
+        # Three of the four callers must wait 50ms, 100ms and 150ms
+        assert time.monotonic() - start >= 0.14
+        assert limiter.get_stats()["waits"] == 3
+
+    def test_shared_state_across_limiters(self, tmp_path):
+        db_path = str(tmp_path / "rate_limits.db")
+        first = RateLimiter(requests_per_minute=60, burst_limit=2, db_path=db_path)
+        second = RateLimiter(requests_per_minute=60, burst_limit=2, db_path=db_path)
+        now = time.time()
+        assert first._reserve_shared("example.com", now) == 0.0
+        assert second._reserve_shared("example.com", now) == 0.0
+        assert first._reserve_shared("example.com", now) == pytest.approx(1.0, abs=1e-3)
+        first.close()
+        second.close()
+
+    def test_from_config(self):
+        limiter = RateLimiter.from_config(
+            RateLimitConfig(requests_per_minute=30, requests_per_hour=500, burst_limit=5)
+        )
+        assert [limit.name for limit in limiter.limits] == ["minute", "hour"]
+        assert limiter.burst_limit == 5
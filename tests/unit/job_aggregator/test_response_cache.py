@@ -0,0 +1,147 @@
+"""
+Unit tests for the indexed ResponseCache and conditional-GET revalidation.
+"""
+
+import hashlib
+import time
+
+import httpx
+import pytest
+
+from tpm_job_finder_poc.job_aggregator.scrapers.response_cache import ResponseCache
+from tpm_job_finder_poc.job_aggregator.services.http_client import SharedHTTPClient
+
+URL = "https://boards.example.com/jobs"
+BODY = '{"jobs": [{"id": 1}]}'
+
+
+class TestResponseCacheStore:
+    """Test the SQLite-indexed store."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_stats(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path))
+        await cache.set(URL, BODY * 100, {"Content-Type": "application/json"}, 200)
+
+        entry = await cache.get(URL)
+        assert entry.content == BODY * 100
+        assert entry.headers == {"Content-Type": "application/json"}
+        assert entry.status_code == 200
+
+        stats = await cache.get_stats()
+        assert stats["entries"] == 1
+        # Bodies are stored compressed
+        assert 0 < stats["size_bytes"] < len(BODY * 100)
+
+        await cache.clear()
+        assert await cache.get(URL) is None
+        assert (await cache.get_stats())["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_count(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), max_size=10)
+        for i in range(10):
+            await cache.set(f"{URL}/{i}", BODY, {}, 200)
+        # Touch the oldest entry so it survives eviction
+        assert await cache.get(f"{URL}/0") is not None
+        await cache.set(f"{URL}/10", BODY, {}, 200)
+
+        stats = await cache.get_stats()
+        assert stats["entries"] == 9
+        assert stats["evictions"] == 2
+        assert await cache.get(f"{URL}/0") is not None
+        assert await cache.get(f"{URL}/1") is None
+        assert await cache.get(f"{URL}/10") is not None
+
+    @pytest.mark.asyncio
+    async def test_evicts_by_bytes_and_survives_reopen(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), max_bytes=2000)
+        for i in range(20):
+            await cache.set(f"{URL}/{i}", f"{i}-" + hashlib.sha256(str(i).encode()).hexdigest() * 4, {}, 200)
+        stats = await cache.get_stats()
+        assert stats["size_bytes"] <= 2000
+        cache.close()
+
+        reopened = ResponseCache(cache_dir=str(tmp_path), max_bytes=2000)
+        assert (await reopened.get_stats())["size_bytes"] == stats["size_bytes"]
+        assert await reopened.get(f"{URL}/19") is not None
+
+
+class TestResponseCacheRevalidation:
+    """Test ETag/Last-Modified revalidation."""
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_304(self, tmp_path):
+        seen = []
+
+        def handler(request):
+            seen.append(dict(request.headers))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, text=BODY, headers={"ETag": '"v1"'})
+
+        cache = ResponseCache(cache_dir=str(tmp_path), max_age=60)
+        async with SharedHTTPClient(transport=httpx.MockTransport(handler)) as client:
+            first = await cache.fetch(URL, client=client)
+            assert first.content == BODY
+
+            # Fresh entries are served without a request
+            await cache.fetch(URL, client=client)
+            assert len(seen) == 1
+
+            entry = await cache.get_stale(URL)
+            entry.timestamp = time.time() - 120
+            await cache._write(entry)
+            assert await cache.get(URL) is None
+
+            refreshed = await cache.fetch(URL, client=client)
+
+        assert len(seen) == 2
+        assert seen[1]["if-none-match"] == '"v1"'
+        assert refreshed.content == BODY
+        assert not refreshed.is_expired(60)
+
+        stats = await cache.get_stats()
+        host = stats["hosts"]["boards.example.com"]
+        assert host["revalidation_hits"] == 1
+        assert host["misses"] == 1
+        assert host["hits"] == 1
+        assert host["bytes_saved"] == len(BODY)
+
+    @pytest.mark.asyncio
+    async def test_error_responses_are_not_cached(self, tmp_path):
+        statuses = [503, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            return httpx.Response(status, text=BODY if status == 200 else "busy")
+
+        cache = ResponseCache(cache_dir=str(tmp_path), max_age=3600)
+        async with SharedHTTPClient(transport=httpx.MockTransport(handler)) as client:
+            failed = await cache.fetch(URL, client=client)
+            assert failed.status_code == 503
+            assert await cache.get_stale(URL) is None
+
+            retried = await cache.fetch(URL, client=client)
+
+        assert retried.status_code == 200
+        assert retried.content == BODY
+        assert (await cache.get(URL)).content == BODY
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_without_validators_is_removed(self, tmp_path):
+        cache = ResponseCache(cache_dir=str(tmp_path), max_age=0)
+        await cache.set(URL, BODY, {}, 200)
+        time.sleep(0.01)
+        assert await cache.get(URL) is None
+        assert await cache.get_stale(URL) is None
+
+    def test_conditional_headers_use_both_validators(self, tmp_path):
+        from tpm_job_finder_poc.job_aggregator.scrapers.response_cache import CacheEntry
+
+        entry = CacheEntry(BODY, URL, time.time(),
+                           {"etag": '"abc"', "last-modified": "Wed, 01 Oct 2025 00:00:00 GMT"}, 200)
+        assert entry.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Oct 2025 00:00:00 GMT",
+        }
@@ -0,0 +1,152 @@
+"""
+Unit tests for compiled selector plans, buffered counters and batched health checks.
+"""
+
+import json
+
+import pytest
+from bs4 import BeautifulSoup
+
+from tpm_job_finder_poc.job_aggregator.scrapers.base import BaseJobScraper
+from tpm_job_finder_poc.job_aggregator.scrapers.selector_health import SelectorHealthChecker
+from tpm_job_finder_poc.job_aggregator.scrapers.selector_maintainer import (
+    SelectorMaintainer,
+    SelectorPlan,
+    compile_selector,
+)
+
+SEARCH_HTML = """
+<html><body>
+  <ul>
+    <li class="card"><h3 class="title">Senior TPM</h3><h4 class="company">Acme</h4>
+        <a class="job_link" href="https://jobs.example.com/1">View</a></li>
+    <li class="card"><h3 class="title">Program Lead</h3><h4 class="company"></h4>
+        <span class="location">Remote</span></li>
+  </ul>
+</body></html>
+"""
+
+DETAIL_HTML = "<html><body><h1 class='job-title'>Senior TPM</h1><div class='desc'>Own delivery.</div></body></html>"
+
+SELECTORS = {
+    "fakeboard": {
+        "job_card_title": {"selector": "li.card h3.title", "fallbacks": []},
+        "job_card_company": {"selector": "li.card + li.card h4.company", "fallbacks": []},
+        "job_card_location": {"selector": "span.location", "fallbacks": []},
+        "job_card_salary": {"selector": "span.salary", "fallbacks": []},
+        "job_card_date": {"selector": "li[", "fallbacks": []},
+        "job_title": {"selector": "h1.job-title", "fallbacks": []},
+        "job_description": {"selector": "div.desc", "fallbacks": []},
+    }
+}
+
+
+@pytest.fixture
+def selectors_file(tmp_path):
+    path = tmp_path / "selectors.json"
+    path.write_text(json.dumps(SELECTORS))
+    return str(path)
+
+
+class FakeBoardScraper(BaseJobScraper):
+    BASE_SEARCH_URL = "https://fakeboard.example.com/search"
+
+    def __init__(self):
+        super().__init__()
+        self.fetched = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def _get_page(self, url):
+        self.fetched.append(url)
+        return BeautifulSoup(SEARCH_HTML if url == self.BASE_SEARCH_URL else DETAIL_HTML, "html.parser")
+
+    async def scrape_jobs(self, *args, **kwargs):
+        return []
+
+    async def get_job_details(self, job_url):
+        return {}
+
+
+class TestSelectorPlan:
+    """Test single-pass evaluation."""
+
+    def test_matches_select_one_per_selector(self):
+        soup = BeautifulSoup(SEARCH_HTML, "html.parser")
+        selectors = {
+            "title": "li.card h3.title",
+            "company": "h4.company",
+            "second_card": "li.card + li.card",
+            "link": "a.job_link",
+            "missing": "span.salary",
+            "unset": None,
+        }
+
+        matches = SelectorPlan(selectors).evaluate(soup)
+
+        for purpose, selector in selectors.items():
+            expected = soup.select_one(selector) if selector else None
+            assert matches[purpose] is expected
+
+    def test_invalid_selector_compiles_to_none(self):
+        assert compile_selector("li[") is None
+        assert compile_selector("h3.title") is compile_selector("h3.title")
+
+
+class TestSelectorMaintainerCounters:
+    """Test buffered usage counters."""
+
+    def test_counters_flushed_on_interval_not_per_report(self, selectors_file):
+        maintainer = SelectorMaintainer(selectors_file, flush_interval=3600)
+        for _ in range(5):
+            maintainer.report_success("fakeboard", "job_title")
+        maintainer.report_failure("fakeboard", "job_title")
+
+        on_disk = json.loads(open(selectors_file).read())
+        assert "success_count" not in on_disk["fakeboard"]["job_title"]
+
+        maintainer.flush()
+        reloaded = SelectorMaintainer(selectors_file)
+        info = reloaded.selectors["fakeboard"]["job_title"]
+        assert (info.success_count, info.failure_count) == (5, 1)
+        assert info.last_success is not None
+
+    def test_plan_refreshed_after_selector_changes(self, selectors_file):
+        maintainer = SelectorMaintainer(selectors_file)
+        plan = maintainer.get_plan("fakeboard", ["job_title"])
+        assert maintainer.get_plan("fakeboard", ["job_title"]) is plan
+
+        maintainer.selectors["fakeboard"]["job_title"].selector = "h1"
+        assert maintainer.get_plan("fakeboard", ["job_title"]).selectors == {"job_title": "h1"}
+
+
+class TestSelectorHealthChecker:
+    """Test health checks."""
+
+    @pytest.mark.asyncio
+    async def test_check_all_fetches_search_page_once(self, selectors_file):
+        maintainer = SelectorMaintainer(selectors_file, flush_interval=3600)
+        checker = SelectorHealthChecker(maintainer)
+        scraper = FakeBoardScraper()
+
+        results = await checker.check_all([scraper])
+
+        assert results["fakeboard"]["search_page"] == {
+            "job_card_title": True,
+            "job_card_company": False,
+            "job_card_location": True,
+            "job_card_salary": False,
+            "job_card_date": False,
+        }
+        assert results["fakeboard"]["detail_page"] == {"job_title": True, "job_description": True}
+        assert scraper.fetched == [FakeBoardScraper.BASE_SEARCH_URL, "https://jobs.example.com/1"]
+
+        report = checker.get_health_report()
+        assert report["fakeboard"]["job_card_title"]["success_rate"] == 100
+        # Counters buffered during the run were written once at the end
+        on_disk = json.loads(open(selectors_file).read())
+        assert on_disk["fakeboard"]["job_card_company"]["failure_count"] == 1
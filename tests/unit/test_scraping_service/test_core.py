@@ -28,10 +28,13 @@ from tpm_job_finder_poc.scraping_service.core.base_job_source import (
     FetchParams,
     HealthCheckResult,
     HealthStatus,
-    RateLimitConfig
+    RateLimitConfig,
+    RateLimitError,
+    SourceUnavailableError
 )
 from tpm_job_finder_poc.scraping_service.core.service_registry import ServiceRegistry
 from tpm_job_finder_poc.scraping_service.core.orchestrator import ScrapingOrchestrator
+from tpm_job_finder_poc.scraping_service.core.concurrency import AdaptiveConcurrencyLimiter
 
 
 class MockJobSource(BaseJobSource):
@@ -360,6 +363,153 @@ class TestScrapingOrchestrator:
         assert "max_concurrent" in stats
         assert stats["max_concurrent"] == 2
         assert "semaphore_available" in stats
+        
+    @pytest.mark.asyncio
+    async def test_stats_expose_source_concurrency(self, orchestrator):
+        """Test per-source adaptive limits are reported after a fetch."""
+        await orchestrator.fetch_all_sources(FetchParams(keywords=["python"]))
+        
+        stats = orchestrator.get_orchestrator_stats()
+        source_stats = stats["source_concurrency"]["source1"]
+        assert source_stats["samples"] == 1
+        assert source_stats["in_flight"] == 0
+        assert source_stats["latency_p50"] is not None
+        
+    @pytest.mark.asyncio
+    async def test_request_gating_source_limit_adapts_within_a_fetch(self):
+        """Test a source gating its own page requests widens its limit in one run."""
+        registry = ServiceRegistry()
+        source = PagedJobSource("paged", pages=20)
+        registry.register_source(source)
+        orchestrator = ScrapingOrchestrator(registry, max_concurrent_per_source=6,
+                                            initial_concurrency_per_source=1)
+        
+        await orchestrator.fetch_all_sources(FetchParams(keywords=["python"]))
+        
+        source_stats = orchestrator.get_orchestrator_stats()["source_concurrency"]["paged"]
+        assert source_stats["samples"] == 20
+        assert source_stats["limit"] > 1
+        assert 1 < source.peak_in_flight <= 6
+
+
+class PagedJobSource(MockJobSource):
+    """Mock job source that takes a limiter slot per page request."""
+    
+    gates_requests = True
+    
+    def __init__(self, name: str, pages: int):
+        super().__init__(name)
+        self.pages = pages
+        self.peak_in_flight = 0
+        
+    async def fetch_jobs(self, params: FetchParams) -> List[JobPosting]:
+        async def load_page():
+            await self.concurrency_limiter.acquire()
+            self.peak_in_flight = max(self.peak_in_flight, self.concurrency_limiter.in_flight)
+            await asyncio.sleep(0.01)
+            await self.concurrency_limiter.release(0.01)
+            
+        await asyncio.gather(*(load_page() for _ in range(self.pages)))
+        return await super().fetch_jobs(params)
+
+
+class SlowJobSource(MockJobSource):
+    """Mock job source that answers after a delay."""
+    
+    def __init__(self, name: str, delay: float):
+        super().__init__(name)
+        self.delay = delay
+        
+    async def fetch_jobs(self, params: FetchParams) -> List[JobPosting]:
+        await asyncio.sleep(self.delay)
+        return await super().fetch_jobs(params)
+
+
+class TestStreamingOrchestrator:
+    """Test ScrapingOrchestrator.stream_all_sources."""
+    
+    @pytest.mark.asyncio
+    async def test_fast_sources_are_not_held_back(self):
+        registry = ServiceRegistry()
+        registry.register_source(SlowJobSource("slow", 0.2))
+        registry.register_source(MockJobSource("fast"))
+        orchestrator = ScrapingOrchestrator(registry)
+        
+        events = [event async for event in orchestrator.stream_all_sources(FetchParams())]
+        
+        assert [(e.type, e.source) for e in events] == [
+            ("job", "fast"), ("source_complete", "fast"),
+            ("source_complete", "slow"),
+            ("summary", None),
+        ]
+        summary = events[-1].metadata
+        assert summary["sources_queried"] == 2
+        assert summary["raw_jobs"] == 2
+        assert summary["total_jobs"] == 1
+        assert summary["duplicates_removed"] == 1
+        
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_as_events(self):
+        registry = ServiceRegistry()
+        failing = MockJobSource("failing")
+        failing.fetch_jobs = AsyncMock(side_effect=SourceUnavailableError("down"))
+        registry.register_source(failing)
+        orchestrator = ScrapingOrchestrator(registry)
+        
+        events = [event async for event in orchestrator.stream_all_sources(FetchParams())]
+        
+        assert events[0].type == "source_error"
+        assert events[0].error == "down"
+        assert events[-1].metadata["failed_sources"] == 1
+
+
+class TestAdaptiveConcurrency:
+    """Test AIMD per-source concurrency limits."""
+    
+    @pytest.mark.asyncio
+    async def test_additive_increase_on_healthy_fetches(self):
+        limiter = AdaptiveConcurrencyLimiter("source", initial_limit=1, max_limit=4)
+        for _ in range(10):
+            await limiter.acquire()
+            await limiter.release(0.01)
+        assert 3 <= limiter.limit <= 4
+        
+    @pytest.mark.asyncio
+    async def test_multiplicative_decrease_on_errors(self):
+        limiter = AdaptiveConcurrencyLimiter("source", initial_limit=8, max_limit=8)
+        await limiter.acquire()
+        await limiter.release(0.01, SourceUnavailableError("down"))
+        assert limiter.limit == 4
+        await limiter.acquire()
+        await limiter.release(0.01, RateLimitError("slow down"))
+        assert limiter.limit == 2
+        assert limiter.get_stats()["decreases"] == 2
+        
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_source(self):
+        limiter = AdaptiveConcurrencyLimiter("source")
+        await limiter.acquire()
+        await limiter.release(0.01, RateLimitError("slow down", retry_after=0.2))
+        
+        start = asyncio.get_running_loop().time()
+        await limiter.acquire()
+        assert asyncio.get_running_loop().time() - start >= 0.15
+        await limiter.release(0.01)
+        
+    @pytest.mark.asyncio
+    async def test_limit_caps_in_flight_fetches(self):
+        limiter = AdaptiveConcurrencyLimiter("source", initial_limit=2, max_limit=2)
+        peak = 0
+        
+        async def fetch():
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+            await limiter.release(0.01)
+            
+        await asyncio.gather(*(fetch() for _ in range(6)))
+        assert peak == 2
 
 
 class TestDeduplication:
@@ -11,10 +11,15 @@ Tests the browser-based job scrapers:
 
 import pytest
 import os
+import json
+import re
+import httpx
 import asyncio
+import time
 from datetime import datetime, timezone
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, List
+from selenium.webdriver.remote.webelement import WebElement
 
 # Fast mode check
 FAST_MODE = os.getenv('PYTEST_FAST_MODE', '0') == '1'
@@ -23,6 +28,15 @@ FAST_MODE = os.getenv('PYTEST_FAST_MODE', '0') == '1'
 pytestmark = pytest.mark.skipif(FAST_MODE, reason="Browser scraper tests use Selenium and are slow - skipped in fast mode")
 
 from tpm_job_finder_poc.scraping_service.scrapers.base_scraper import BaseScraper, BrowserProfile
+from tpm_job_finder_poc.scraping_service.scrapers.browser_pool import BrowserPool
+from tpm_job_finder_poc.scraping_service.scrapers.async_driver import AsyncWebDriver
+from tpm_job_finder_poc.scraping_service.scrapers.page_snapshot import PageSnapshot
+from tpm_job_finder_poc.scraping_service.scrapers.readiness import PageReadiness, ReadinessProfile
+from tpm_job_finder_poc.scraping_service.scrapers.resource_blocking import (
+    ResourceBlocker, ResourceBlockingRules, TYPICAL_BYTES
+)
+from tpm_job_finder_poc.job_aggregator.services.http_client import SharedHTTPClient
+from tpm_job_finder_poc.scraping_service.core.concurrency import AdaptiveConcurrencyLimiter
 from tpm_job_finder_poc.scraping_service.scrapers.indeed.scraper import IndeedScraper
 from tpm_job_finder_poc.scraping_service.scrapers.linkedin.scraper import LinkedInScraper
 from tpm_job_finder_poc.scraping_service.scrapers.ziprecruiter.scraper import ZipRecruiterScraper
@@ -32,7 +46,8 @@ from tpm_job_finder_poc.scraping_service.core.base_job_source import (
     JobPosting, 
     HealthStatus,
     SourceType,
-    RateLimitConfig
+    RateLimitConfig,
+    SourceUnavailableError
 )
 
 
@@ -110,7 +125,7 @@ class TestBaseScraper:
         
     @pytest.mark.asyncio
     @patch('selenium.webdriver.Chrome')
-    @patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.ChromeDriverManager')
+    @patch('tpm_job_finder_poc.scraping_service.scrapers.browser_pool.ChromeDriverManager')
     async def test_setup_browser(self, mock_driver_manager, mock_chrome, mock_scraper):
         """Test browser setup."""
         mock_driver = Mock()
@@ -123,7 +138,7 @@ class TestBaseScraper:
         assert mock_driver.execute_script.called  # Anti-detection script
         
     @pytest.mark.asyncio
-    @patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.ChromeDriverManager')
+    @patch('tpm_job_finder_poc.scraping_service.scrapers.browser_pool.ChromeDriverManager')
     async def test_initialize_cleanup(self, mock_driver_manager, mock_scraper):
         """Test initialization and cleanup."""
         with patch.object(mock_scraper, 'setup_browser') as mock_setup:
@@ -140,6 +155,660 @@ class TestBaseScraper:
             assert mock_driver.quit.called
 
 
+class TestBrowserPool:
+    """Test warm browser session pooling."""
+    
+    class PooledMockScraper(TestBaseScraper.MockScraper):
+        """Mock scraper whose browser launches are counted."""
+        
+        def __init__(self, name="pooled_scraper"):
+            super().__init__(name)
+            self.launches = 0
+            
+        async def setup_browser(self):
+            self.launches += 1
+            return Mock()
+    
+    @pytest.mark.asyncio
+    async def test_sessions_are_reused_across_queries(self):
+        pool = BrowserPool(size=2)
+        scraper = self.PooledMockScraper()
+        scraper.use_browser_pool(pool)
+        
+        for _ in range(3):
+            assert await scraper.initialize() is True
+            driver = scraper._driver
+            await scraper.cleanup()
+            
+        assert scraper.launches == 1
+        assert not driver.quit.called
+        stats = pool.get_stats()
+        assert stats["leases"] == 3
+        assert stats["reused"] == 2
+        assert stats["idle"] == 1
+        
+        await pool.close()
+        assert driver.quit.called
+        
+    @pytest.mark.asyncio
+    async def test_sessions_recycled_after_page_budget(self):
+        pool = BrowserPool(size=1, max_pages_per_session=2)
+        scraper = self.PooledMockScraper()
+        
+        session = await pool.acquire(scraper)
+        session.record_page(2)
+        await pool.release(session)
+        
+        assert session.driver.quit.called
+        await pool.release(await pool.acquire(scraper))
+        assert scraper.launches == 2
+        assert pool.get_stats()["recycled"] == 1
+        
+    @pytest.mark.asyncio
+    async def test_dead_sessions_are_replaced(self):
+        pool = BrowserPool(size=1)
+        scraper = self.PooledMockScraper()
+        
+        session = await pool.acquire(scraper)
+        await pool.release(session)
+        session.driver.execute_script.side_effect = Exception("session deleted")
+        
+        replacement = await pool.acquire(scraper)
+        assert replacement is not session
+        assert pool.get_stats()["health_failures"] == 1
+        
+    @pytest.mark.asyncio
+    async def test_pool_size_bounds_live_sessions(self):
+        pool = BrowserPool(size=1)
+        scraper = self.PooledMockScraper()
+        first = await pool.acquire(scraper)
+        
+        waiter = asyncio.create_task(pool.acquire(scraper))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        
+        await pool.release(first)
+        assert await waiter is first
+        assert pool.get_stats()["utilization"] == 1.0
+
+
+class TestAsyncWebDriver:
+    """Test the executor-backed WebDriver facade."""
+    
+    @staticmethod
+    def slow_driver(delay=0.2):
+        driver = Mock()
+        driver.get.side_effect = lambda url: time.sleep(delay)
+        return driver
+    
+    @pytest.mark.asyncio
+    async def test_sessions_overlap_without_blocking_loop(self):
+        browsers = [AsyncWebDriver(self.slow_driver(), name=f"s{i}") for i in range(3)]
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        await asyncio.gather(*(b.get("https://example.com") for b in browsers))
+        elapsed = loop.time() - start
+        
+        # Three 0.2s page loads run concurrently rather than back to back
+        assert elapsed < 0.45
+        for browser in browsers:
+            await browser.aclose()
+            assert browser.driver.quit.called
+            
+    @pytest.mark.asyncio
+    async def test_run_keeps_routine_on_session_thread(self):
+        browser = AsyncWebDriver(Mock(), name="routine")
+        
+        async def routine(value):
+            await asyncio.sleep(0)
+            # Nested facade calls execute inline instead of deadlocking the worker
+            await browser.get("https://example.com")
+            return browser.in_worker_thread(), value
+            
+        assert await browser.run(routine, 42) == (True, 42)
+        assert not browser.in_worker_thread()
+        browser.driver.get.assert_called_once_with("https://example.com")
+        await browser.aclose()
+
+
+class TestPageSnapshot:
+    """Test parsing result pages from a single HTML snapshot."""
+    
+    INDEED_PAGE = """
+    <html><head><title>Python Jobs</title></head><body>
+      <div data-testid="job-result">
+        <h2 data-testid="job-title"><a href="/viewjob?jk=abc123">Senior
+          Python Engineer</a></h2>
+        <span data-testid="company-name">Acme Corp</span>
+        <div class="companyLocation">Remote</div>
+        <div data-testid="salary-snippet">$150,000 a year</div>
+        <div data-testid="job-snippet"><ul><li>Build APIs</li><li>Mentor</li></ul></div>
+        <span data-testid="job-posted-date">Posted 2 days ago</span>
+      </div>
+      <div data-testid="job-result">
+        <h2 class="jobTitle"><a href="https://www.indeed.com/viewjob?jk=def456">Data Engineer</a></h2>
+        <span class="companyName">Initech</span>
+      </div>
+      <div data-testid="job-result"><span>Sponsored</span></div>
+    </body></html>
+    """
+    
+    @pytest.mark.asyncio
+    async def test_indeed_cards_parsed_from_snapshot(self):
+        scraper = IndeedScraper()
+        page = PageSnapshot(self.INDEED_PAGE, "https://www.indeed.com/jobs?q=python")
+        
+        jobs = await scraper.parse_job_elements(page)
+        
+        assert [job.id for job in jobs] == ["indeed_abc123", "indeed_def456"]
+        first, second = jobs
+        assert first.title == "Senior Python Engineer"
+        assert first.url == "https://www.indeed.com/viewjob?jk=abc123"
+        assert first.company == "Acme Corp"
+        assert first.location == "Remote"
+        assert first.salary == "$150,000 a year"
+        assert first.description == "Build APIs\nMentor"
+        assert first.raw_data["page_url"] == "https://www.indeed.com/jobs?q=python"
+        assert second.company == "Initech"
+        assert second.location is None
+        
+    @pytest.mark.asyncio
+    async def test_empty_snapshot_does_not_poll(self):
+        scraper = IndeedScraper()
+        page = PageSnapshot("<html><body>No results</body></html>", "https://www.indeed.com/jobs")
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        assert await scraper.parse_job_elements(page) == []
+        assert loop.time() - start < 1.0
+        
+    @pytest.mark.asyncio
+    async def test_fetch_parses_page_with_one_capture(self):
+        scraper = IndeedScraper()
+        driver = MagicMock()
+        
+        def execute_script(script, *args):
+            if "outerHTML" in script:
+                return [self.INDEED_PAGE, "https://www.indeed.com/jobs?q=python", "Python Jobs"]
+            return "complete"
+        driver.execute_script.side_effect = execute_script
+        scraper._driver = driver
+        scraper.max_pages = 1
+        
+        with patch.object(scraper, '_wait_for_page_load', AsyncMock()):
+            jobs = await scraper.fetch_jobs(FetchParams(keywords=["python"]))
+            
+        assert len(jobs) == 2
+        # Cards are never queried through the live driver
+        assert not driver.find_elements.called
+        await scraper.cleanup()
+        
+    def test_snapshot_elements_mirror_webelement_api(self):
+        page = PageSnapshot(
+            '<div class="card" data-job-id="42"><a href="jobs/42" class="x y">Go</a>'
+            '<button disabled style="display: none">Next</button></div>',
+            "https://boards.example.com/acme/"
+        )
+        card = page.find_element("css selector", ".card")
+        link = card.find_element("tag name", "a")
+        button = card.find_element("css selector", "button")
+        
+        assert card.get_attribute("data-job-id") == "42"
+        assert link.get_attribute("href") == "https://boards.example.com/acme/jobs/42"
+        assert link.get_attribute("class") == "x y"
+        assert not button.is_enabled()
+        assert not button.is_displayed()
+        assert card.find_elements("css selector", ".missing") == []
+        with pytest.raises(Exception):
+            card.find_element("css selector", ".missing")
+
+
+class TestHttpFirstFetch:
+    """Test the HTTP fast path with browser fallback."""
+    
+    ZIPRECRUITER_PAGE = """
+    <html><head><script type="application/ld+json">%s</script></head>
+    <body><div id="app"></div></body></html>
+    """ % json.dumps({
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "WebPage", "name": "Python jobs"},
+            {
+                "@type": "JobPosting",
+                "title": "Backend Engineer",
+                "identifier": {"@type": "PropertyValue", "value": "zr-77"},
+                "url": "/c/Acme/Job/Backend-Engineer",
+                "datePosted": "2024-05-01",
+                "description": "<p>Build <b>services</b></p>",
+                "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+                "jobLocation": {"@type": "Place", "address": {
+                    "addressLocality": "Austin", "addressRegion": "TX"}},
+                "baseSalary": {"@type": "MonetaryAmount", "currency": "USD", "value": {
+                    "minValue": 120000, "maxValue": 150000, "unitText": "YEAR"}}
+            }
+        ]
+    })
+    
+    GREENHOUSE_BOARD = """
+    <html><head><title>Jobs at Acme</title></head><body>
+      <div class="opening"><a href="/acme/jobs/4001">Product Manager</a>
+        <span class="location">New York</span></div>
+      <div class="opening"><a href="/acme/jobs/4002">Program Manager</a>
+        <span class="location">Remote</span></div>
+    </body></html>
+    """
+    
+    CAPTCHA_PAGE = """
+    <html><body><form action="/verify"><div class="g-recaptcha" data-sitekey="abc"></div></form>
+    <script src="https://www.google.com/recaptcha/api.js"></script></body></html>
+    """
+    
+    @staticmethod
+    def client_for(body, status=200):
+        return SharedHTTPClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(status, text=body, request=request)
+        ))
+        
+    @staticmethod
+    def paged_client_for(pages, seen=None):
+        """Client serving pages[n] for ``page=n+1`` and an empty page beyond them."""
+        def handler(request):
+            page = int(request.url.params.get("page", 1)) - 1
+            if seen is not None:
+                seen.append(page)
+            body = pages[page] if page < len(pages) else "<html><body><div id='app'></div></body></html>"
+            return httpx.Response(200, text=body, request=request)
+        return SharedHTTPClient(transport=httpx.MockTransport(handler))
+        
+    @pytest.mark.asyncio
+    async def test_structured_data_served_without_browser(self):
+        scraper = ZipRecruiterScraper()
+        client = self.paged_client_for([self.ZIPRECRUITER_PAGE])
+        
+        with patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.get_http_client',
+                   return_value=client), \
+             patch.object(scraper, 'initialize', AsyncMock()) as mock_init, \
+             patch.object(scraper, '_apply_rate_limiting', AsyncMock()):
+            jobs = await scraper.fetch_jobs(FetchParams(keywords=["python"]))
+            
+        assert not mock_init.called
+        assert len(jobs) == 1
+        job = jobs[0]
+        assert job.id == "ziprecruiter_zr-77"
+        assert job.company == "Acme"
+        assert job.location == "Austin, TX"
+        assert job.salary == "USD 120000-150000 per year"
+        assert job.url == "https://www.ziprecruiter.com/c/Acme/Job/Backend-Engineer"
+        assert job.description == "Build services"
+        assert job.date_posted.year == 2024
+        stats = scraper.get_fetch_stats()
+        assert stats["http_hit_rate"] == 1.0
+        assert stats["structured_data_hits"] == 1
+        assert stats["browser_fetches"] == 0
+        await client.aclose()
+        
+    @pytest.mark.asyncio
+    async def test_later_pages_fetched_over_http_until_limit(self):
+        scraper = ZipRecruiterScraper()
+        pages = [self.ZIPRECRUITER_PAGE.replace("zr-77", f"zr-{n}") for n in range(4)]
+        seen = []
+        client = self.paged_client_for(pages, seen)
+        
+        with patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.get_http_client',
+                   return_value=client), \
+             patch.object(scraper, 'initialize', AsyncMock()) as mock_init, \
+             patch.object(scraper, '_apply_rate_limiting', AsyncMock()):
+            jobs = await scraper.fetch_jobs(FetchParams(keywords=["python"], limit=3, date_range=None))
+            
+        assert not mock_init.called
+        assert [job.id for job in jobs] == ["ziprecruiter_zr-0", "ziprecruiter_zr-1", "ziprecruiter_zr-2"]
+        # The fourth page is never requested once the limit is covered
+        assert seen == [0, 1, 2]
+        await client.aclose()
+        
+    @pytest.mark.asyncio
+    async def test_click_paginated_site_uses_browser_when_limit_not_covered(self):
+        scraper = ZipRecruiterScraper()
+        client = self.paged_client_for([self.ZIPRECRUITER_PAGE])
+        
+        with patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.get_http_client',
+                   return_value=client), \
+             patch.object(scraper, 'get_page_url', return_value=None), \
+             patch.object(scraper, 'initialize', AsyncMock(side_effect=RuntimeError("no browser"))) as mock_init, \
+             patch.object(scraper, '_apply_rate_limiting', AsyncMock()):
+            with pytest.raises(SourceUnavailableError):
+                await scraper.fetch_jobs(FetchParams(keywords=["python"], limit=10))
+                
+        assert mock_init.called
+        assert scraper.get_fetch_stats()["http_hits"] == 1
+        await client.aclose()
+        
+    @pytest.mark.asyncio
+    async def test_static_markup_parsed_when_no_structured_data(self):
+        scraper = GreenhouseScraper()
+        client = self.client_for(self.GREENHOUSE_BOARD)
+        
+        with patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.get_http_client',
+                   return_value=client), \
+             patch.object(scraper, 'initialize', AsyncMock()) as mock_init:
+            jobs = await scraper.fetch_jobs(FetchParams(extra_params={'company': 'acme'}))
+            
+        assert not mock_init.called
+        assert [job.id for job in jobs] == ["greenhouse_4001", "greenhouse_4002"]
+        assert jobs[0].url == "https://acme.greenhouse.io/acme/jobs/4001"
+        assert jobs[0].company == "Acme"
+        assert jobs[1].location == "Remote"
+        assert scraper.get_fetch_stats()["structured_data_hits"] == 0
+        await client.aclose()
+        
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body,status,reason", [
+        (CAPTCHA_PAGE, 200, "captcha"),
+        ("Forbidden", 403, "http_403"),
+        ("<html><body><div id='app'></div></body></html>", 200, "no_jobs"),
+    ])
+    async def test_falls_back_to_browser(self, body, status, reason):
+        scraper = GreenhouseScraper()
+        client = self.client_for(body, status)
+        
+        with patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.get_http_client',
+                   return_value=client), \
+             patch.object(scraper, 'initialize', AsyncMock(return_value=False)) as mock_init:
+            jobs = await scraper.fetch_jobs(FetchParams(extra_params={'company': 'acme'}))
+            
+        assert jobs == []
+        assert mock_init.called
+        stats = scraper.get_fetch_stats()
+        assert stats["http_hit_rate"] == 0.0
+        assert stats["fallback_reasons"] == {reason: 1}
+        await client.aclose()
+        
+    @pytest.mark.asyncio
+    async def test_throttled_request_backs_off_source_limit(self):
+        scraper = GreenhouseScraper()
+        scraper.concurrency_limiter = AdaptiveConcurrencyLimiter("greenhouse", initial_limit=4, max_limit=4)
+        client = SharedHTTPClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(429, text="Too Many Requests", request=request)
+        ))
+        
+        with patch('tpm_job_finder_poc.scraping_service.scrapers.base_scraper.get_http_client',
+                   return_value=client), \
+             patch.object(scraper, 'initialize', AsyncMock(return_value=False)):
+            await scraper.fetch_jobs(FetchParams(extra_params={'company': 'acme'}))
+            
+        stats = scraper.concurrency_limiter.get_stats()
+        assert stats["limit"] == 2
+        assert stats["in_flight"] == 0
+        await client.aclose()
+
+
+class TestOffsetPagination:
+    """Test concurrent URL-addressed pagination."""
+    
+    class FakeDriver:
+        """Driver serving Indeed-style result pages keyed by the start offset."""
+        
+        def __init__(self, per_page=2, empty_from=None, delay=0.0):
+            self.per_page = per_page
+            self.empty_from = empty_from
+            self.delay = delay
+            self.current_url = None
+            self.visited = []
+            self.quit = Mock()
+            
+        def get(self, url):
+            time.sleep(self.delay)
+            self.current_url = url
+            self.visited.append(url)
+            
+        def find_element(self, by, value):
+            return Mock()
+            
+        def execute_script(self, script, *args):
+            if "outerHTML" not in script:
+                return "complete"
+            match = re.search(r'start=(\d+)', self.current_url)
+            start = int(match.group(1)) if match else 0
+            page = start // 10
+            count = 0 if self.empty_from is not None and page >= self.empty_from else self.per_page
+            cards = "".join(
+                f'<div data-testid="job-result"><h2 data-testid="job-title">'
+                f'<a href="/viewjob?jk={page:02x}{i:02x}">Job {page}-{i}</a></h2></div>'
+                for i in range(count)
+            )
+            return [f"<html><body>{cards}</body></html>", self.current_url, "Jobs"]
+            
+    def make_scraper(self, driver):
+        scraper = IndeedScraper()
+        scraper._driver = driver
+        scraper._wait_for_page_load = AsyncMock()
+        scraper._handle_popups = AsyncMock()
+        scraper._apply_rate_limiting = AsyncMock()
+        return scraper
+        
+    def test_page_urls_use_start_offset(self):
+        scraper = IndeedScraper()
+        url = scraper.get_search_url(q="python")
+        
+        assert scraper.get_page_url(url, 0) == url
+        assert "start=20" in scraper.get_page_url(url, 2)
+        assert "q=python" in scraper.get_page_url(url, 2)
+        assert "start=25" in LinkedInScraper().get_page_url(url, 1)
+        
+    @pytest.mark.asyncio
+    async def test_stops_requesting_pages_once_limit_is_covered(self):
+        driver = self.FakeDriver(per_page=2)
+        scraper = self.make_scraper(driver)
+        
+        jobs = await scraper.fetch_jobs(FetchParams(keywords=["python"], limit=5))
+        
+        assert len(jobs) == 5
+        # Pages 0-2 hold 6 jobs; page 3 is never loaded
+        assert len(driver.visited) == 3
+        assert [job.id for job in jobs][:3] == ["indeed_0000", "indeed_0001", "indeed_0100"]
+        
+    @pytest.mark.asyncio
+    async def test_empty_page_ends_pagination(self):
+        driver = self.FakeDriver(per_page=2, empty_from=2)
+        scraper = self.make_scraper(driver)
+        
+        jobs = await scraper.fetch_jobs(FetchParams(keywords=["python"]))
+        
+        assert len(jobs) == 4
+        assert len(driver.visited) == 3
+        
+    @pytest.mark.asyncio
+    async def test_pages_load_concurrently_on_pooled_sessions(self):
+        pool = BrowserPool(size=3)
+        scraper = self.make_scraper(None)
+        scraper.setup_browser = AsyncMock(side_effect=lambda: self.FakeDriver(delay=0.2))
+        scraper.use_browser_pool(pool)
+        assert await scraper.initialize()
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        jobs = await scraper.fetch_jobs(FetchParams(keywords=["python"]))
+        elapsed = loop.time() - start
+        
+        # First page, then pages 1-3 side by side on three sessions
+        assert elapsed < 0.7
+        assert scraper.setup_browser.await_count == 3
+        assert [job.id for job in jobs] == [
+            f"indeed_{page:02x}{i:02x}" for page in range(4) for i in range(2)
+        ]
+        assert pool.get_stats()["in_use"] == 1
+        await scraper.cleanup()
+        await pool.close()
+        
+    @pytest.mark.asyncio
+    async def test_pages_in_flight_bounded_by_source_limit(self):
+        pool = BrowserPool(size=3)
+        scraper = self.make_scraper(None)
+        scraper.setup_browser = AsyncMock(side_effect=lambda: self.FakeDriver(delay=0.1))
+        scraper.use_browser_pool(pool)
+        scraper.concurrency_limiter = AdaptiveConcurrencyLimiter(
+            "indeed", initial_limit=1, max_limit=1, latency_tolerance=100
+        )
+        assert await scraper.initialize()
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        jobs = await scraper.fetch_jobs(FetchParams(keywords=["python"]))
+        elapsed = loop.time() - start
+        
+        # Sessions are free, but the source's limit loads one page at a time
+        assert len(jobs) == 8
+        assert elapsed >= 0.35
+        assert scraper.concurrency_limiter.get_stats()["samples"] == 4
+        await scraper.cleanup()
+        await pool.close()
+
+
+class TestPageReadiness:
+    """Test event-driven readiness waits."""
+    
+    @pytest.mark.asyncio
+    async def test_settle_returns_when_page_reports_quiet(self):
+        driver = Mock()
+        driver.execute_async_script.return_value = {"reason": "quiet", "elapsed": 120.0}
+        browser = AsyncWebDriver(driver, name="ready")
+        readiness = PageReadiness("site")
+        readiness.record_page()
+        
+        waited = await readiness.settle(browser, baseline=2.0, require_change=True)
+        
+        assert waited < 1.0
+        args = driver.execute_async_script.call_args[0]
+        assert args[1:] == (None, 300, 10000, True)
+        stats = readiness.get_stats()
+        assert stats["waits"] == 1
+        assert stats["total_saved_seconds"] > 1.0
+        assert stats["avg_saved_per_page"] == stats["total_saved_seconds"]
+        assert stats["profile"]["samples"] == 1
+        await browser.aclose()
+        
+    def test_timeout_learned_from_history(self):
+        profile = ReadinessProfile(quiet_ms=300, min_timeout=1.0, max_timeout=10.0)
+        assert profile.timeout() == 10.0
+        
+        for _ in range(10):
+            profile.record(0.2)
+        assert profile.timeout() == 1.0
+        
+        for _ in range(50):
+            profile.record(2.0)
+        assert profile.timeout() == pytest.approx(3.3)
+        
+    @pytest.mark.asyncio
+    async def test_falls_back_to_fixed_delay_without_script_support(self):
+        driver = Mock()
+        driver.execute_async_script.side_effect = Exception("javascript error: document unloaded")
+        browser = AsyncWebDriver(driver, name="fallback")
+        readiness = PageReadiness("site")
+        
+        waited = await readiness.settle(browser, baseline=0.05)
+        
+        assert waited >= 0.05
+        stats = readiness.get_stats()
+        assert stats["fallbacks"] == 1
+        assert stats["profile"]["samples"] == 0
+        await browser.aclose()
+        
+    @pytest.mark.asyncio
+    async def test_popup_wait_ends_when_element_hidden(self):
+        browser = AsyncWebDriver(Mock(), name="popup")
+        readiness = PageReadiness("site")
+        element = Mock(spec=WebElement)
+        element.is_displayed.return_value = False
+        
+        waited = await readiness.until_hidden(browser, element, baseline=1.0)
+        
+        assert waited < 0.5
+        assert readiness.get_stats()["total_saved_seconds"] > 0.5
+        await browser.aclose()
+
+
+class TestResourceBlocking:
+    """Test request blocking rules and accounting."""
+    
+    @staticmethod
+    def _log_entry(method: str, **params) -> Dict:
+        return {"level": "INFO", "message": json.dumps({"message": {"method": method, "params": params}})}
+        
+    def test_patterns_apply_site_deny_and_allow(self):
+        rules = ResourceBlockingRules(categories=["image", "tracker"]).extend(
+            deny=["*example.com/beacon*"], allow=["*.svg*"]
+        )
+        patterns = rules.patterns()
+        
+        assert "*.png*" in patterns
+        assert "*google-analytics.com*" in patterns
+        assert "*example.com/beacon*" in patterns
+        assert "*.svg*" not in patterns
+        assert "*.woff*" not in patterns
+        assert len(patterns) == len(set(patterns))
+        
+    def test_unknown_category_rejected(self):
+        with pytest.raises(ValueError):
+            ResourceBlockingRules(categories=["stylesheets"])
+            
+    def test_apply_installs_blocklist_over_cdp(self):
+        driver = Mock()
+        blocker = ResourceBlocker("site", ResourceBlockingRules(categories=["font"]))
+        
+        assert blocker.apply(driver) is True
+        
+        driver.execute_cdp_cmd.assert_any_call('Network.enable', {})
+        driver.execute_cdp_cmd.assert_called_with(
+            'Network.setBlockedURLs', {'urls': ResourceBlockingRules(categories=["font"]).patterns()}
+        )
+        assert blocker.get_stats()["sessions"] == 1
+        
+    def test_collect_counts_blocked_and_loaded_per_page(self):
+        driver = Mock()
+        driver.get_log.return_value = [
+            self._log_entry("Network.requestWillBeSent", requestId="1"),
+            self._log_entry("Network.loadingFinished", requestId="1", encodedDataLength=48000),
+            self._log_entry("Network.loadingFailed", requestId="2", type="Image",
+                            errorText="net::ERR_BLOCKED_BY_CLIENT", blockedReason="inspector"),
+            self._log_entry("Network.loadingFailed", requestId="3", type="Font", blockedReason="inspector"),
+            self._log_entry("Network.loadingFailed", requestId="4", type="XHR", errorText="net::ERR_FAILED"),
+        ]
+        blocker = ResourceBlocker("site", ResourceBlockingRules())
+        
+        page = blocker.collect(driver)
+        
+        driver.get_log.assert_called_once_with('performance')
+        assert page == {
+            "requests_blocked": 2,
+            "bytes_blocked": TYPICAL_BYTES["Image"] + TYPICAL_BYTES["Font"],
+            "requests_loaded": 1,
+            "bytes_loaded": 48000
+        }
+        stats = blocker.get_stats()
+        assert stats["pages"] == 1
+        assert stats["blocked_by_type"] == {"Image": 1, "Font": 1}
+        assert stats["avg_bytes_loaded_per_page"] == 48000
+        
+    def test_collect_tolerates_missing_performance_log(self):
+        driver = Mock()
+        driver.get_log.side_effect = Exception("log type 'performance' not found")
+        blocker = ResourceBlocker("site", ResourceBlockingRules())
+        
+        assert blocker.collect(driver) is None
+        assert blocker.get_stats()["log_unavailable"] == 1
+        assert blocker.get_stats()["pages"] == 0
+        
+    def test_linkedin_extends_default_rules(self):
+        scraper = LinkedInScraper()
+        patterns = scraper.get_resource_rules().patterns()
+        
+        assert "*realtime.www.linkedin.com*" in patterns
+        assert set(ResourceBlockingRules().patterns()) <= set(patterns)
+        assert scraper.get_fetch_stats()["resource_blocking"]["enabled"] is True
+
+
 class TestIndeedScraper:
     """Test Indeed scraper implementation."""
     
@@ -0,0 +1,105 @@
+"""
+Bloom Filter
+Compact probabilistic set used in front of the SQLite dedupe table so that
+lookups for never-seen keys are answered in memory without touching disk.
+"""
+import hashlib
+import math
+import os
+import struct
+from typing import Optional
+
+_MAGIC = b"DDBF"
+_VERSION = 1
+# magic, version, num_bits, num_hashes, capacity, count, watermark
+_HEADER = struct.Struct("<4sBQBQQQ")
+
+
+class BloomFilter:
+    """Bloom filter over string keys using double hashing of one blake2b digest."""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+        # Highest source-table row id folded into the filter; lets a loaded
+        # filter catch up on rows written after it was saved.
+        self.watermark = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        h2 |= 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        bits = self.bits
+        added = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                added = True
+        # Re-adding a key already present does not inflate the count
+        if added:
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    @property
+    def is_saturated(self) -> bool:
+        return self.count > self.capacity
+
+    def estimated_false_positive_rate(self) -> float:
+        """Expected false-positive rate for the number of keys added so far."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def save(self, path: str):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(_HEADER.pack(_MAGIC, _VERSION, self.num_bits, self.num_hashes,
+                                  self.capacity, self.count, self.watermark))
+            fh.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, error_rate: float = 0.01) -> Optional["BloomFilter"]:
+        """Load a saved filter, or return None if the file is missing or unreadable."""
+        try:
+            with open(path, "rb") as fh:
+                header = fh.read(_HEADER.size)
+                magic, version, num_bits, num_hashes, capacity, count, watermark = _HEADER.unpack(header)
+                if magic != _MAGIC or version != _VERSION:
+                    return None
+                bits = bytearray(fh.read())
+        except (OSError, struct.error):
+            return None
+        if len(bits) != (num_bits + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.error_rate = error_rate
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bits
+        bloom.count = count
+        bloom.watermark = watermark
+        return bloom
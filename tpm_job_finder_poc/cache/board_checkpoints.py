@@ -0,0 +1,192 @@
+"""
+Board Checkpoints
+SQLite-backed high-water marks for incremental ATS board fetches.
+
+For each (source, board) the store remembers a content hash of the last board
+payload, the newest posting id / publish date seen, and a content hash per
+posting. Connectors use it to skip an unchanged board outright and to emit only
+new or changed postings when a board did change.
+
+Checkpoint updates are staged in memory and only written by ``commit()``, so a
+run that fails before its postings are persisted downstream re-emits them next
+time instead of losing them.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def content_hash(payload: Any) -> str:
+    """Stable hash of a JSON-serializable payload."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class BoardCheckpoint:
+    source: str
+    board: str
+    payload_hash: Optional[str] = None
+    last_posting_id: Optional[str] = None
+    last_published_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    posting_hashes: Dict[str, str] = field(default_factory=dict)
+
+
+class BoardCheckpointStore:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        if db_path != ":memory:" and os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS board_checkpoints (
+                source TEXT NOT NULL,
+                board TEXT NOT NULL,
+                payload_hash TEXT,
+                last_posting_id TEXT,
+                last_published_at TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (source, board)
+            );
+            CREATE TABLE IF NOT EXISTS board_postings (
+                source TEXT NOT NULL,
+                board TEXT NOT NULL,
+                posting_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                PRIMARY KEY (source, board, posting_id)
+            );
+        """)
+        self._conn.commit()
+        self._pending: Dict[Tuple[str, str], BoardCheckpoint] = {}
+        self._boards_skipped = 0
+        self._postings_skipped = 0
+        self._postings_emitted = 0
+
+    def get(self, source: str, board: str) -> BoardCheckpoint:
+        """Committed checkpoint for a board (empty if the board was never fetched)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload_hash, last_posting_id, last_published_at, updated_at "
+                "FROM board_checkpoints WHERE source = ? AND board = ?",
+                (source, board)
+            ).fetchone()
+            if row is None:
+                return BoardCheckpoint(source, board)
+            postings = self._conn.execute(
+                "SELECT posting_id, content_hash FROM board_postings WHERE source = ? AND board = ?",
+                (source, board)
+            ).fetchall()
+        return BoardCheckpoint(source, board, *row, posting_hashes=dict(postings))
+
+    def changed_items(self, source: str, board: str, payload: Any, items: Iterable[Dict[str, Any]],
+                      id_of: Callable[[Dict[str, Any]], Any],
+                      published_of: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None
+                      ) -> List[Dict[str, Any]]:
+        """Return the postings in ``items`` that are new or changed since the last commit.
+
+        Args:
+            source: Connector name, e.g. ``"ashby"``
+            board: Board/company identifier within the source
+            payload: Full board response, hashed to detect an unchanged board
+            items: Postings contained in ``payload``
+            id_of: Returns a posting's stable id
+            published_of: Returns a posting's publish timestamp (ISO string), if any
+
+        Returns:
+            New or changed postings, in payload order; empty if the board is unchanged
+        """
+        items = list(items)
+        previous = self.get(source, board)
+        payload_hash = content_hash(payload)
+        if previous.payload_hash == payload_hash:
+            self._boards_skipped += 1
+            self._postings_skipped += len(items)
+            return []
+
+        hashes = {}
+        changed = []
+        last_posting_id, last_published_at = previous.last_posting_id, previous.last_published_at
+        for item in items:
+            posting_id = str(id_of(item))
+            item_hash = content_hash(item)
+            hashes[posting_id] = item_hash
+            if previous.posting_hashes.get(posting_id) != item_hash:
+                changed.append(item)
+            published = published_of(item) if published_of else None
+            if published and (last_published_at is None or published > last_published_at):
+                last_published_at, last_posting_id = published, posting_id
+        if last_posting_id is None and hashes:
+            last_posting_id = posting_id
+
+        self._pending[(source, board)] = BoardCheckpoint(
+            source, board, payload_hash, last_posting_id, last_published_at,
+            datetime.now(timezone.utc).isoformat(), hashes
+        )
+        self._postings_skipped += len(items) - len(changed)
+        self._postings_emitted += len(changed)
+        return changed
+
+    def commit(self):
+        """Persist checkpoints staged since the last commit."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            with self._conn:
+                for cp in pending.values():
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO board_checkpoints "
+                        "(source, board, payload_hash, last_posting_id, last_published_at, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (cp.source, cp.board, cp.payload_hash, cp.last_posting_id,
+                         cp.last_published_at, cp.updated_at)
+                    )
+                    # Postings that left the board are dropped with the old snapshot
+                    self._conn.execute(
+                        "DELETE FROM board_postings WHERE source = ? AND board = ?",
+                        (cp.source, cp.board)
+                    )
+                    self._conn.executemany(
+                        "INSERT INTO board_postings (source, board, posting_id, content_hash) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(cp.source, cp.board, pid, h) for pid, h in cp.posting_hashes.items()]
+                    )
+
+    def discard(self):
+        """Drop staged checkpoints so the next run re-emits their postings."""
+        self._pending.clear()
+
+    def reset(self, source: Optional[str] = None, board: Optional[str] = None):
+        """Forget checkpoints (all, one source, or one board) to force a full re-fetch."""
+        clause, params = "", ()
+        if source is not None:
+            clause, params = " WHERE source = ?", (source,)
+            if board is not None:
+                clause, params = " WHERE source = ? AND board = ?", (source, board)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM board_checkpoints{clause}", params)
+            self._conn.execute(f"DELETE FROM board_postings{clause}", params)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            boards = self._conn.execute("SELECT COUNT(*) FROM board_checkpoints").fetchone()[0]
+        return {
+            'boards_tracked': boards,
+            'boards_skipped': self._boards_skipped,
+            'postings_skipped': self._postings_skipped,
+            'postings_emitted': self._postings_emitted,
+            'pending_boards': len(self._pending)
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
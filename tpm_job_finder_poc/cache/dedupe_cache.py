@@ -2,10 +2,25 @@
 Dedupe Cache (MVP)
 SQLite-based cache to filter duplicates by URL/hash and user_id.
 Supports multi-user, persistent deduplication for Orchestrator and Excel Exporter.
+
+With ``persistent=True`` the cache keeps one long-lived WAL-mode connection per
+thread instead of connecting and committing on every call; ``filter_new`` and
+``add_many`` resolve a whole batch of keys in a single query/transaction.
+
+With ``use_bloom_filter=True`` an in-memory Bloom filter, loaded from the table at
+startup and saved next to the database as ``<db_path>.bloom``, answers lookups for
+never-seen keys without touching SQLite; only probable positives are confirmed on disk.
 """
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .bloom_filter import BloomFilter
+
+# (user_id, url, hash_) - the same triple accepted by is_duplicate/add
+DedupeKey = Tuple[str, Optional[str], Optional[str]]
 
 class DedupeCache:
     def dedupe(self, df, user_id_col='user_id', url_col='url', jobid_col='JobID'):
@@ -15,12 +30,29 @@ class DedupeCache:
         elif url_col in df.columns:
             df = df.drop_duplicates(subset=[url_col])
         return df
-    def __init__(self, db_path: str = "dedupe_cache.db"):
+    def __init__(self, db_path: str = "dedupe_cache.db", persistent: bool = False,
+                 use_bloom_filter: bool = False, bloom_capacity: Optional[int] = None,
+                 bloom_error_rate: float = 0.01):
         self.db_path = db_path
+        self.persistent = persistent
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_db()
 
+        self.bloom_path = f"{db_path}.bloom"
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self._bloom: Optional[BloomFilter] = None
+        self._bloom_lock = threading.Lock()
+        self._filter_hits = 0
+        self._filter_misses = 0
+        self._false_positives = 0
+        if use_bloom_filter:
+            self._load_bloom()
+
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS dedupe (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -30,13 +62,142 @@ class DedupeCache:
                     UNIQUE(user_id, url, hash)
                 )
             """)
-            conn.commit()
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dedupe_user_url ON dedupe (user_id, url)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dedupe_user_hash ON dedupe (user_id, hash)")
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # check_same_thread=False only so close() can run from any thread;
+            # each connection is otherwise used exclusively by its owner thread.
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        if self.persistent:
+            conn = self._thread_connection()
+            with conn:
+                yield conn
+            return
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # --- Bloom filter front ---
+
+    @staticmethod
+    def _bloom_tokens(user_id: str, url: Optional[str], hash_: Optional[str]) -> List[str]:
+        tokens = []
+        if url:
+            tokens.append(f"u\x1f{user_id}\x1f{url}")
+        if hash_:
+            tokens.append(f"h\x1f{user_id}\x1f{hash_}")
+        return tokens
+
+    def _new_bloom(self, row_count: int) -> BloomFilter:
+        # Each row contributes up to two keys (url and hash); leave 2x headroom
+        capacity = max(self.bloom_capacity or 100_000, 4 * row_count)
+        return BloomFilter(capacity=capacity, error_rate=self.bloom_error_rate)
+
+    def _load_bloom(self):
+        bloom = BloomFilter.load(self.bloom_path, self.bloom_error_rate)
+        with self._connection() as conn:
+            row_count, max_id = conn.execute("SELECT COUNT(*), COALESCE(MAX(id), 0) FROM dedupe").fetchone()
+        # A filter newer than the table (db replaced) or too small for it is rebuilt
+        if bloom is None or bloom.watermark > max_id or 2 * row_count > bloom.capacity:
+            bloom = self._new_bloom(row_count)
+        self._bloom = bloom
+        self._catch_up_bloom()
+
+    def _catch_up_bloom(self):
+        """Fold rows written since the filter's watermark (by any process) into it."""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT id, user_id, url, hash FROM dedupe WHERE id > ? ORDER BY id",
+                (self._bloom.watermark,),
+            ).fetchall()
+        with self._bloom_lock:
+            for row_id, user_id, url, hash_ in rows:
+                for token in self._bloom_tokens(user_id, url, hash_):
+                    self._bloom.add(token)
+                self._bloom.watermark = row_id
+
+    def _bloom_add(self, keys: Iterable[DedupeKey]):
+        with self._bloom_lock:
+            for user_id, url, hash_ in keys:
+                for token in self._bloom_tokens(user_id, url, hash_):
+                    self._bloom.add(token)
+        if self._bloom.is_saturated:
+            with self._connection() as conn:
+                row_count = conn.execute("SELECT COUNT(*) FROM dedupe").fetchone()[0]
+            self._bloom = self._new_bloom(row_count)
+            self._catch_up_bloom()
+
+    def _maybe_present(self, user_id: str, url: Optional[str], hash_: Optional[str]) -> bool:
+        return any(token in self._bloom for token in self._bloom_tokens(user_id, url, hash_))
+
+    def save_filter(self):
+        """Persist the Bloom filter next to the database (no-op when disabled)."""
+        if self._bloom is None:
+            return
+        self._catch_up_bloom()
+        with self._bloom_lock:
+            self._bloom.save(self.bloom_path)
+
+    def get_filter_stats(self) -> Dict[str, Any]:
+        """Bloom filter sizing and effectiveness counters."""
+        if self._bloom is None:
+            return {'enabled': False}
+        # Lookups that were truly absent: the ones the filter rejected plus the
+        # ones it let through by mistake.
+        true_negatives = self._filter_misses + self._false_positives
+        return {
+            'enabled': True,
+            'capacity': self._bloom.capacity,
+            'keys': self._bloom.count,
+            'num_hashes': self._bloom.num_hashes,
+            'memory_bytes': self._bloom.memory_bytes,
+            'target_false_positive_rate': self._bloom.error_rate,
+            'estimated_false_positive_rate': self._bloom.estimated_false_positive_rate(),
+            'observed_false_positive_rate': self._false_positives / true_negatives if true_negatives else 0.0,
+            'filter_hits': self._filter_hits,
+            'filter_misses': self._filter_misses,
+            'false_positives': self._false_positives,
+        }
+
+    # --- Lookups ---
 
     def is_duplicate(self, user_id: str, url: Optional[str] = None, hash_: Optional[str] = None) -> bool:
-        with sqlite3.connect(self.db_path) as conn:
+        if self._bloom is not None:
+            if not self._maybe_present(user_id, url, hash_):
+                self._filter_misses += 1
+                return False
+            self._filter_hits += 1
+            found = self._is_duplicate_on_disk(user_id, url, hash_)
+            if not found:
+                self._false_positives += 1
+            return found
+        return self._is_duplicate_on_disk(user_id, url, hash_)
+
+    def _is_duplicate_on_disk(self, user_id: str, url: Optional[str], hash_: Optional[str]) -> bool:
+        with self._connection() as conn:
             cur = conn.cursor()
             if url and hash_:
-                cur.execute("SELECT 1 FROM dedupe WHERE user_id=? AND (url=? OR hash=?)", (user_id, url, hash_))
+                # UNION instead of OR so each branch can use its own index
+                cur.execute(
+                    "SELECT 1 FROM dedupe WHERE user_id=? AND url=? "
+                    "UNION ALL SELECT 1 FROM dedupe WHERE user_id=? AND hash=? LIMIT 1",
+                    (user_id, url, user_id, hash_),
+                )
             elif url:
                 cur.execute("SELECT 1 FROM dedupe WHERE user_id=? AND url=?", (user_id, url))
             elif hash_:
@@ -45,18 +206,101 @@ class DedupeCache:
                 return False
             return cur.fetchone() is not None
 
+    def filter_new(self, keys: Iterable[DedupeKey]) -> List[DedupeKey]:
+        """Return the ``(user_id, url, hash_)`` keys that are not yet cached.
+
+        Membership is resolved with one join against a temp table. Order is
+        preserved, and a key that repeats the url or hash of an earlier key in
+        the same batch is dropped, matching a sequential is_duplicate/add loop.
+        """
+        keys = [tuple(key) for key in keys]
+        if not keys:
+            return []
+        probe = list(enumerate(keys))
+        if self._bloom is not None:
+            probe = [(pos, key) for pos, key in probe if self._maybe_present(*key)]
+            self._filter_hits += len(probe)
+            self._filter_misses += len(keys) - len(probe)
+        known = self._known_positions(probe) if probe else set()
+        if self._bloom is not None:
+            self._false_positives += len(probe) - len(known)
+
+        new_keys = []
+        seen_urls, seen_hashes = set(), set()
+        for pos, (user_id, url, hash_) in enumerate(keys):
+            if pos in known:
+                continue
+            if (url and (user_id, url) in seen_urls) or (hash_ and (user_id, hash_) in seen_hashes):
+                continue
+            if url:
+                seen_urls.add((user_id, url))
+            if hash_:
+                seen_hashes.add((user_id, hash_))
+            new_keys.append((user_id, url, hash_))
+        return new_keys
+
+    def _known_positions(self, probe: List[Tuple[int, DedupeKey]]) -> Set[int]:
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS dedupe_probe "
+                "(pos INTEGER PRIMARY KEY, user_id TEXT, url TEXT, hash TEXT)"
+            )
+            conn.execute("DELETE FROM dedupe_probe")
+            conn.executemany(
+                "INSERT INTO dedupe_probe (pos, user_id, url, hash) VALUES (?, ?, ?, ?)",
+                ((pos, user_id, url, hash_) for pos, (user_id, url, hash_) in probe),
+            )
+            known = {row[0] for row in conn.execute("""
+                SELECT p.pos FROM dedupe_probe p
+                WHERE (p.url IS NOT NULL AND p.url != '' AND EXISTS (
+                           SELECT 1 FROM dedupe d WHERE d.user_id = p.user_id AND d.url = p.url))
+                   OR (p.hash IS NOT NULL AND p.hash != '' AND EXISTS (
+                           SELECT 1 FROM dedupe d WHERE d.user_id = p.user_id AND d.hash = p.hash))
+            """)}
+            conn.execute("DELETE FROM dedupe_probe")
+        return known
+
+    # --- Writes ---
+
     def add(self, user_id: str, url: Optional[str] = None, hash_: Optional[str] = None):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("INSERT OR IGNORE INTO dedupe (user_id, url, hash) VALUES (?, ?, ?)", (user_id, url, hash_))
-            conn.commit()
+        if self._bloom is not None:
+            self._bloom_add([(user_id, url, hash_)])
+
+    def add_many(self, keys: Iterable[DedupeKey]):
+        """Insert ``(user_id, url, hash_)`` keys in a single transaction."""
+        keys = [tuple(key) for key in keys]
+        with self._connection() as conn:
+            conn.executemany("INSERT OR IGNORE INTO dedupe (user_id, url, hash) VALUES (?, ?, ?)", keys)
+        if self._bloom is not None:
+            self._bloom_add(keys)
 
     def clear(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("DELETE FROM dedupe")
-            conn.commit()
+        if self._bloom is not None:
+            # AUTOINCREMENT ids never repeat, so the watermark stays valid
+            with self._bloom_lock:
+                self._bloom.clear()
+
+    def close(self):
+        """Save the Bloom filter (if enabled) and close every pooled connection."""
+        self.save_filter()
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
 
 # Example usage:
 # cache = DedupeCache()
 # if not cache.is_duplicate(user_id, url, hash_):
 #     cache.add(user_id, url, hash_)
 #     ...process...
+#
+# Batched, for pipelines:
+# cache = DedupeCache(persistent=True, use_bloom_filter=True)
+# new_keys = cache.filter_new([(user_id, url, hash_), ...])
+# cache.add_many(new_keys)
+# cache.close()  # persists dedupe_cache.db.bloom
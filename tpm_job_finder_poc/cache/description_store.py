@@ -0,0 +1,190 @@
+"""
+Description Store
+SQLite-backed store of full job descriptions keyed by canonical URL.
+
+Descriptions are stored once per content hash; each canonical posting URL maps
+to the hash of its description, so syndicated copies of one posting share a
+row. URLs can also carry a posting key (a hash of title/company/location) so a
+copy seen under a new URL is resolved from the store without fetching it.
+Descriptions older than ``max_age_days`` are not served and are pruned when the
+store is opened, so edited or taken-down postings are fetched again.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# Query parameters that identify a referral or campaign, not the posting
+_TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref', 'referrer', 'src', 'source',
+    'trk', 'trackingid', 'refid', 'from', 'gh_src', 'lever-source', 'lever-origin'
+}
+_WHITESPACE = re.compile(r'\s+')
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_BATCH_SIZE = 500
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a posting URL so tracking variants of it compare equal."""
+    parts = urlparse(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunparse((parts.scheme.lower() or 'https', host, path, '', urlencode(query), ''))
+
+
+def description_hash(description: str) -> str:
+    """Hash of a description's text, ignoring whitespace differences."""
+    normalized = _WHITESPACE.sub(' ', description).strip().lower()
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def posting_key(title: str, company: str, location: Optional[str] = None) -> str:
+    """Identity of a posting across the boards that syndicate it."""
+    parts = [_WHITESPACE.sub(' ', value or '').strip().lower() for value in (title, company, location)]
+    return hashlib.blake2b('|'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class DescriptionStore:
+    def __init__(self, db_path: str, max_age_days: Optional[float] = 30):
+        """
+        Args:
+            db_path: SQLite database path (``:memory:`` for a throwaway store)
+            max_age_days: Age after which a stored description is fetched
+                again; None keeps descriptions forever
+        """
+        self.db_path = db_path
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS descriptions (
+                content_hash TEXT PRIMARY KEY,
+                description TEXT NOT NULL,
+                fetched_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS description_urls (
+                canonical_url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                posting_key TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_description_urls_posting_key
+                ON description_urls(posting_key);
+        """)
+        self._conn.commit()
+        self.prune()
+
+    def _cutoff(self) -> str:
+        """Oldest ``fetched_at`` still served."""
+        if self.max_age_days is None:
+            return ''
+        return (datetime.now(timezone.utc) - timedelta(days=self.max_age_days)).isoformat()
+
+    def prune(self) -> int:
+        """Delete descriptions older than ``max_age_days`` and the URLs mapped to them.
+
+        Returns:
+            Number of descriptions deleted
+        """
+        with self._lock, self._conn:
+            deleted = self._conn.execute(
+                "DELETE FROM descriptions WHERE fetched_at < ?", (self._cutoff(),)
+            ).rowcount
+            if deleted:
+                self._conn.execute(
+                    "DELETE FROM description_urls WHERE content_hash NOT IN "
+                    "(SELECT content_hash FROM descriptions)"
+                )
+        return deleted
+
+    def get(self, url: str) -> Optional[str]:
+        """Stored description for a posting URL, if any."""
+        return self.get_many([url]).get(canonical_url(url))
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Stored descriptions for many URLs, keyed by canonical URL."""
+        canonical = list(dict.fromkeys(canonical_url(url) for url in urls))
+        found: Dict[str, str] = {}
+        cutoff = self._cutoff()
+        with self._lock:
+            for start in range(0, len(canonical), _BATCH_SIZE):
+                batch = canonical[start:start + _BATCH_SIZE]
+                rows = self._conn.execute(
+                    "SELECT u.canonical_url, d.description FROM description_urls u "
+                    "JOIN descriptions d ON d.content_hash = u.content_hash "
+                    f"WHERE u.canonical_url IN ({','.join('?' * len(batch))}) AND d.fetched_at >= ?",
+                    batch + [cutoff]
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def find_by_posting_keys(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Stored descriptions for postings already fetched under another URL, keyed by posting key."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        cutoff = self._cutoff()
+        with self._lock:
+            for start in range(0, len(keys), _BATCH_SIZE):
+                batch = keys[start:start + _BATCH_SIZE]
+                rows = self._conn.execute(
+                    "SELECT u.posting_key, d.description FROM description_urls u "
+                    "JOIN descriptions d ON d.content_hash = u.content_hash "
+                    f"WHERE u.posting_key IN ({','.join('?' * len(batch))}) AND d.fetched_at >= ?",
+                    batch + [cutoff]
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def put(self, url: str, description: str, key: Optional[str] = None) -> str:
+        """Store a description for a URL (and optional posting key); returns its content hash."""
+        return self.put_many([(url, description, key)])[0]
+
+    def put_many(self, items: Iterable[Tuple[str, str, Optional[str]]]) -> List[str]:
+        """Store ``(url, description, posting_key)`` tuples in one transaction.
+
+        Returns:
+            Content hash of each description, in input order
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        hashes, descriptions, urls = [], {}, []
+        for url, description, key in items:
+            digest = description_hash(description)
+            hashes.append(digest)
+            descriptions.setdefault(digest, description)
+            urls.append((canonical_url(url), digest, key))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO descriptions (content_hash, description, fetched_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(content_hash) DO UPDATE SET fetched_at = excluded.fetched_at",
+                [(digest, description, now) for digest, description in descriptions.items()]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO description_urls (canonical_url, content_hash, posting_key) "
+                "VALUES (?, ?, ?)",
+                urls
+            )
+        return hashes
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            descriptions = self._conn.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+            urls = self._conn.execute("SELECT COUNT(*) FROM description_urls").fetchone()[0]
+        return {
+            'descriptions': descriptions,
+            'urls': urls
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,267 @@
+"""
+Embedding Cache
+Content-addressed cache of text embeddings keyed by (model name, normalized text).
+
+Two tiers sit in front of the model: an in-process LRU of recently used
+vectors, and an on-disk tier that stores float16 vectors in one memory-mapped
+file per model with a SQLite index of row offsets. Resume bullets and common
+JD phrases are therefore embedded once and read back on every later run.
+
+Vectors are rounded to float16 before they are returned, so a cached vector is
+identical to the one handed out when it was first computed.
+"""
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_BATCH_SIZE = 500
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so formatting differences share a cache entry."""
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def embedding_key(model_name: str, text: str) -> str:
+    """Cache key of a text's embedding under a model."""
+    payload = f"{model_name}\0{normalize_text(text)}".encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class EmbeddingCache:
+    def __init__(self, cache_dir: str = "embedding_cache", memory_size: int = 20000):
+        """
+        Args:
+            cache_dir: Directory holding the vector files and their index
+                (created on first write)
+            memory_size: Vectors kept in the in-process LRU tier
+        """
+        self.cache_dir = cache_dir
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # model name -> read-only map of its vector file
+        self._maps: Dict[str, np.memmap] = {}
+        self._stats = defaultdict(int)
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Autocommit mode: writes take an explicit IMMEDIATE transaction so
+            # processes sharing the directory append to the vector files in turn
+            self._conn = sqlite3.connect(os.path.join(self.cache_dir, "index.db"),
+                                         check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS models (
+                    model_name TEXT PRIMARY KEY,
+                    file TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    rows INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    model_name TEXT NOT NULL,
+                    row INTEGER NOT NULL
+                );
+            """)
+        return self._conn
+
+    def _vector_file(self, model_name: str) -> str:
+        digest = hashlib.blake2b(model_name.encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.f16")
+
+    def _rows(self, model_name: str, rows: List[int]) -> Optional[np.ndarray]:
+        """Read rows of a model's vector file, remapping it if it has grown."""
+        model = self._db().execute(
+            "SELECT file, dim FROM models WHERE model_name = ?", (model_name,)
+        ).fetchone()
+        if model is None:
+            return None
+        path, dim = os.path.join(self.cache_dir, model[0]), model[1]
+        mapped = self._maps.get(model_name)
+        if mapped is None or max(rows) >= mapped.shape[0]:
+            available = os.path.getsize(path) // (dim * 2)
+            if max(rows) >= available:
+                return None
+            mapped = np.memmap(path, dtype=np.float16, mode='r', shape=(available, dim))
+            self._maps[model_name] = mapped
+        return np.asarray(mapped[rows], dtype=np.float32)
+
+    def _remember(self, key: str, vector: np.ndarray):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        self._memory[key] = vector
+        self._memory_bytes += vector.nbytes
+        while len(self._memory) > self.memory_size:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def get_many(self, model_name: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Cached vectors for texts, None where a text has not been embedded yet."""
+        keys = [embedding_key(model_name, text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            missing = []
+            for key in dict.fromkeys(keys):
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+                else:
+                    missing.append(key)
+            self._stats['memory_hits'] += sum(1 for key in keys if key in found)
+
+            if missing and (self._conn is not None or os.path.exists(self.cache_dir)):
+                offsets = {}
+                for start in range(0, len(missing), _BATCH_SIZE):
+                    batch = missing[start:start + _BATCH_SIZE]
+                    offsets.update((key, row) for key, row in self._db().execute(
+                        "SELECT key, row FROM embeddings "
+                        f"WHERE model_name = ? AND key IN ({','.join('?' * len(batch))})",
+                        [model_name, *batch]
+                    ))
+                if offsets:
+                    vectors = self._rows(model_name, list(offsets.values()))
+                    if vectors is not None:
+                        for key, vector in zip(offsets, vectors):
+                            found[key] = vector
+                            self._remember(key, vector)
+                        self._stats['disk_hits'] += sum(1 for key in keys if key in offsets)
+
+            self._stats['misses'] += sum(1 for key in keys if key not in found)
+        return [found.get(key) for key in keys]
+
+    def put_many(self, model_name: str, texts: Sequence[str], vectors: np.ndarray) -> np.ndarray:
+        """Store one vector per text.
+
+        Returns:
+            The vectors as stored (rounded to float16, as float32)
+        """
+        stored = np.asarray(vectors, dtype=np.float16)
+        rows = {embedding_key(model_name, text): i for i, text in enumerate(texts)}
+        with self._lock:
+            for key, i in rows.items():
+                self._remember(key, stored[i].astype(np.float32))
+            try:
+                self._write(model_name, rows, stored)
+            except (sqlite3.Error, OSError) as e:
+                # The memory tier still holds the vectors for this process
+                logger.warning(f"Failed to write {model_name} embeddings to {self.cache_dir}: {e}")
+        return stored.astype(np.float32)
+
+    def _write(self, model_name: str, rows: Dict[str, int], stored: np.ndarray):
+        conn = self._db()
+        dim = stored.shape[1]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            model = conn.execute("SELECT file, dim, rows FROM models WHERE model_name = ?",
+                                 (model_name,)).fetchone()
+            if model is None:
+                model = (os.path.basename(self._vector_file(model_name)), dim, 0)
+                conn.execute("INSERT INTO models (model_name, file, dim, rows) VALUES (?, ?, ?, 0)",
+                             (model_name, model[0], dim))
+            if model[1] != dim:
+                logger.warning(f"Not caching {model_name} vectors on disk: dimension {dim} != {model[1]}")
+                conn.execute("ROLLBACK")
+                return
+            known = set()
+            keys = list(rows)
+            for start in range(0, len(keys), _BATCH_SIZE):
+                batch = keys[start:start + _BATCH_SIZE]
+                known.update(key for (key,) in conn.execute(
+                    f"SELECT key FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                ))
+            new = [key for key in keys if key not in known]
+            if not new:
+                conn.execute("ROLLBACK")
+                return
+            # Rows past the indexed count are leftovers of an interrupted write
+            path = os.path.join(self.cache_dir, model[0])
+            with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+                f.seek(model[2] * dim * 2)
+                f.write(stored[[rows[key] for key in new]].tobytes())
+            conn.executemany("INSERT INTO embeddings (key, model_name, row) VALUES (?, ?, ?)",
+                             [(key, model_name, model[2] + i) for i, key in enumerate(new)])
+            conn.execute("UPDATE models SET rows = ? WHERE model_name = ?", (model[2] + len(new), model_name))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._stats['disk_writes'] += len(new)
+
+    def get_or_compute(self, model_name: str, texts: Sequence[str],
+                       compute: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """Vectors for texts, computing only the ones not cached in one call to ``compute``.
+
+        Returns:
+            Float32 array with one row per text
+        """
+        vectors = self.get_many(model_name, texts)
+        missing: Dict[str, List[int]] = defaultdict(list)
+        for i, (text, vector) in enumerate(zip(texts, vectors)):
+            if vector is None:
+                missing[normalize_text(text)].append(i)
+        if missing:
+            batch = list(missing)
+            computed = self.put_many(model_name, batch, compute(batch))
+            self._stats['computed'] += len(batch)
+            for row, positions in zip(computed, missing.values()):
+                for i in positions:
+                    vectors[i] = row
+        if not vectors:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack(vectors)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits per tier, misses, hit rate, vectors computed and
+            bytes held in memory and on disk
+        """
+        with self._lock:
+            lookups = self._stats['memory_hits'] + self._stats['disk_hits'] + self._stats['misses']
+            disk_entries, disk_bytes = 0, 0
+            if self._conn is not None or os.path.exists(self.cache_dir):
+                for file, dim, rows in self._db().execute("SELECT file, dim, rows FROM models"):
+                    disk_entries += rows
+                    disk_bytes += rows * dim * 2
+            return {
+                'memory_hits': self._stats['memory_hits'],
+                'disk_hits': self._stats['disk_hits'],
+                'misses': self._stats['misses'],
+                'hit_rate': round((lookups - self._stats['misses']) / lookups, 4) if lookups else 0.0,
+                'computed': self._stats['computed'],
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'disk_entries': disk_entries,
+                'disk_bytes': disk_bytes
+            }
+
+    def close(self):
+        with self._lock:
+            self._maps.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# Example usage:
+# cache = EmbeddingCache("embedding_cache")
+# vectors = cache.get_or_compute("all-MiniLM-L6-v2", bullets, model.encode)
+# cache.get_stats()  # hit rate and bytes per tier
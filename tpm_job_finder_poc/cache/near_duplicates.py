@@ -0,0 +1,338 @@
+"""
+Near-Duplicate Detector
+MinHash/LSH engine that folds the same role syndicated by several sources
+(Indeed, LinkedIn, Greenhouse, ...) into one cluster, even when titles differ
+slightly. Candidates come from LSH band buckets, so each job is only compared
+against postings that share a bucket instead of every previous posting.
+
+With ``db_path`` set, signatures and band buckets of the last ``retention_days``
+are kept in SQLite, so each run is checked incrementally against recent history.
+Either way ``prune()`` drops postings older than ``retention_days`` from the
+in-process index, so a long-lived detector stays bounded.
+"""
+import hashlib
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+# (key, title, company, description) - what the detector needs from a job record
+JobFields = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+_ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "jr": "junior", "mgr": "manager",
+    "eng": "engineer", "engr": "engineer", "dev": "developer", "pm": "product manager",
+    "tpm": "technical program manager", "prog": "program", "mgmt": "management",
+}
+_NOISE_WORDS = {
+    "remote", "hybrid", "onsite", "on", "site", "fulltime", "full", "time", "parttime",
+    "contract", "m", "f", "d", "w", "x", "the", "a", "an", "of", "and", "for", "in", "at",
+}
+_COMPANY_SUFFIXES = {"inc", "llc", "ltd", "corp", "corporation", "co", "gmbh", "plc", "limited", "company"}
+# Seniority / level markers: two postings that differ here are different roles
+_LEVEL_WORDS = {
+    "intern", "junior", "senior", "staff", "principal", "lead", "head", "director",
+    "vp", "i", "ii", "iii", "iv", "v", "1", "2", "3", "4", "5",
+}
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _words(text: Optional[str]) -> List[str]:
+    return _WORD_RE.findall((text or "").lower())
+
+
+def normalize_title(title: Optional[str]) -> str:
+    words = []
+    for word in _words(title):
+        words.extend(_ABBREVIATIONS.get(word, word).split())
+    return " ".join(w for w in words if w not in _NOISE_WORDS)
+
+
+def normalize_company(company: Optional[str]) -> str:
+    return " ".join(w for w in _words(company) if w not in _COMPANY_SUFFIXES)
+
+
+def level_tokens(title: Optional[str]) -> str:
+    return " ".join(sorted(set(normalize_title(title).split()) & _LEVEL_WORDS))
+
+
+@dataclass
+class NearDuplicateMatch:
+    """A job folded into an existing cluster."""
+    key: str
+    cluster_id: str
+    matched_key: str
+    similarity: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class NearDuplicateDetector:
+    """MinHash signatures over title/company/description shingles with LSH banding."""
+
+    def __init__(self,
+                 threshold: float = 0.8,
+                 num_perm: int = 128,
+                 shingle_size: int = 4,
+                 max_description_chars: int = 2000,
+                 db_path: Optional[str] = None,
+                 retention_days: int = 14,
+                 seed: int = 1):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.max_description_chars = max_description_chars
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self.bands, self.rows = self._choose_bands(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        # a, b < 2**31 and shingle hashes < 2**32 keep a*x+b inside uint64
+        self._perm_a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._perm_b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+        # In-process index: (band, bucket) -> keys, plus per-key metadata and when it was added
+        self._buckets: Dict[Tuple[int, bytes], List[str]] = {}
+        self._entries: Dict[str, Tuple[str, str, str, np.ndarray]] = {}
+        self._added_at: Dict[str, float] = {}
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._init_db()
+
+    @staticmethod
+    def _choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+        """Pick the (bands, rows) split whose S-curve midpoint is closest to threshold."""
+        best = (num_perm, 1)
+        best_gap = float("inf")
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            gap = abs((1 / bands) ** (1 / rows) - threshold)
+            if gap < best_gap:
+                best, best_gap = (bands, rows), gap
+        return best
+
+    # --- Signatures ---
+
+    def _shingles(self, title: Optional[str], company: Optional[str], description: Optional[str]) -> Set[str]:
+        head = f"{normalize_title(title)} | {normalize_company(company)}"
+        k = self.shingle_size
+        shingles = {head[i:i + k] for i in range(max(1, len(head) - k + 1))}
+        words = _words((description or "")[:self.max_description_chars])
+        shingles.update(" ".join(words[i:i + 3]) for i in range(len(words) - 2))
+        return shingles
+
+    def signature(self, title: Optional[str], company: Optional[str], description: Optional[str] = None) -> np.ndarray:
+        shingles = self._shingles(title, company, description)
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little") for s in shingles),
+            dtype=np.uint64, count=len(shingles),
+        )
+        permuted = (np.outer(hashes, self._perm_a) + self._perm_b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_buckets(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        r = self.rows
+        return [(band, signature[band * r:(band + 1) * r].tobytes()) for band in range(self.bands)]
+
+    @staticmethod
+    def _bucket_id(bucket: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(bucket, digest_size=8).digest(), "little", signed=True)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.count_nonzero(sig_a == sig_b)) / len(sig_a)
+
+    # --- Persistence ---
+
+    def _init_db(self):
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS near_dedupe_signatures (
+                    job_key TEXT PRIMARY KEY,
+                    cluster_id TEXT,
+                    company TEXT,
+                    levels TEXT,
+                    signature BLOB,
+                    created_at REAL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS near_dedupe_bands (
+                    band INTEGER,
+                    bucket INTEGER,
+                    job_key TEXT,
+                    created_at REAL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_near_dedupe_bucket ON near_dedupe_bands (band, bucket)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_near_dedupe_key ON near_dedupe_bands (job_key)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_near_dedupe_created ON near_dedupe_bands (created_at)")
+        self.prune()
+
+    def prune(self):
+        """Drop signatures older than ``retention_days`` from the in-process and on-disk index."""
+        cutoff = time.time() - self.retention_days * 86400
+        expired = [key for key, added_at in self._added_at.items() if added_at < cutoff]
+        for key in expired:
+            for bucket in self._band_buckets(self._entries.pop(key)[3]):
+                keys = self._buckets.get(bucket)
+                if keys and key in keys:
+                    keys.remove(key)
+                    if not keys:
+                        del self._buckets[bucket]
+            del self._added_at[key]
+        if self._conn is None:
+            return
+        with self._conn:
+            self._conn.execute("DELETE FROM near_dedupe_bands WHERE created_at < ?", (cutoff,))
+            self._conn.execute("DELETE FROM near_dedupe_signatures WHERE created_at < ?", (cutoff,))
+
+    def _disk_candidates(self, buckets_by_pos: List[List[Tuple[int, bytes]]]) -> Dict[int, Set[str]]:
+        with self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS near_dedupe_probe (pos INTEGER, band INTEGER, bucket INTEGER)")
+            self._conn.execute("DELETE FROM near_dedupe_probe")
+            self._conn.executemany(
+                "INSERT INTO near_dedupe_probe (pos, band, bucket) VALUES (?, ?, ?)",
+                ((pos, band, self._bucket_id(bucket))
+                 for pos, buckets in enumerate(buckets_by_pos) for band, bucket in buckets),
+            )
+            rows = self._conn.execute("""
+                SELECT DISTINCT p.pos, b.job_key FROM near_dedupe_probe p
+                JOIN near_dedupe_bands b ON b.band = p.band AND b.bucket = p.bucket
+            """).fetchall()
+            self._conn.execute("DELETE FROM near_dedupe_probe")
+        candidates: Dict[int, Set[str]] = {}
+        for pos, job_key in rows:
+            candidates.setdefault(pos, set()).add(job_key)
+        return candidates
+
+    def _load_entries(self, keys: Iterable[str]):
+        missing = [k for k in keys if k not in self._entries]
+        for i in range(0, len(missing), 500):
+            chunk = missing[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for job_key, cluster_id, company, levels, blob, created_at in self._conn.execute(
+                f"SELECT job_key, cluster_id, company, levels, signature, created_at FROM near_dedupe_signatures "
+                f"WHERE job_key IN ({placeholders})", chunk
+            ):
+                self._entries[job_key] = (cluster_id, company, levels, np.frombuffer(blob, dtype=np.uint32))
+                self._added_at[job_key] = created_at
+
+    def _persist(self, records: List[Tuple[str, str, str, str, np.ndarray]]):
+        now = time.time()
+        with self._conn:
+            self._conn.executemany("DELETE FROM near_dedupe_bands WHERE job_key = ?", ((r[0],) for r in records))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO near_dedupe_signatures "
+                "(job_key, cluster_id, company, levels, signature, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                ((key, cluster_id, company, levels, sig.tobytes(), now)
+                 for key, cluster_id, company, levels, sig in records),
+            )
+            self._conn.executemany(
+                "INSERT INTO near_dedupe_bands (band, bucket, job_key, created_at) VALUES (?, ?, ?, ?)",
+                ((band, self._bucket_id(bucket), key, now)
+                 for key, _, _, _, sig in records for band, bucket in self._band_buckets(sig)),
+            )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --- Deduplication ---
+
+    def deduplicate(self, jobs: Sequence[T], fields: Callable[[T], JobFields]) -> Tuple[List[T], List[NearDuplicateMatch]]:
+        """Fold near-duplicate jobs into clusters.
+
+        Args:
+            jobs: Job records of any shape
+            fields: Maps a record to ``(key, title, company, description)``
+
+        Returns:
+            The jobs that start (or continue to head) a cluster, in input order,
+            and one NearDuplicateMatch per job that was folded away.
+        """
+        extracted = [fields(job) for job in jobs]
+        signatures = [self.signature(title, company, description) for _, title, company, description in extracted]
+        buckets_by_pos = [self._band_buckets(sig) for sig in signatures]
+
+        disk_candidates: Dict[int, Set[str]] = {}
+        if self._conn is not None and jobs:
+            disk_candidates = self._disk_candidates(buckets_by_pos)
+            self._load_entries({k for keys in disk_candidates.values() for k in keys}
+                               | {key for key, _, _, _ in extracted})
+
+        unique: List[T] = []
+        matches: List[NearDuplicateMatch] = []
+        new_records = []
+        for pos, (job, (key, title, company, _)) in enumerate(zip(jobs, extracted)):
+            sig = signatures[pos]
+            company_key = normalize_company(company)
+            levels = level_tokens(title)
+
+            # A posting that already heads a cluster keeps heading it on later runs
+            existing = self._entries.get(key)
+            candidates = set()
+            if existing is None or existing[0] != key:
+                candidates.update(disk_candidates.get(pos, ()))
+                for bucket in buckets_by_pos[pos]:
+                    candidates.update(self._buckets.get(bucket, ()))
+            # The same key seen again is the same posting, not a near-duplicate
+            candidates.discard(key)
+
+            best_key, best_score = None, 0.0
+            for candidate in candidates:
+                entry = self._entries.get(candidate)
+                if entry is None:
+                    continue
+                cand_cluster, cand_company, cand_levels, cand_sig = entry
+                # Never fold a posting into a cluster it heads itself
+                if cand_cluster == key:
+                    continue
+                if cand_company != company_key or cand_levels != levels:
+                    continue
+                score = self.similarity(sig, cand_sig)
+                if score >= self.threshold and score > best_score:
+                    best_key, best_score = candidate, score
+
+            if best_key is None:
+                cluster_id = key
+                unique.append(job)
+            else:
+                cluster_id = self._entries[best_key][0]
+                matches.append(NearDuplicateMatch(key=key, cluster_id=cluster_id,
+                                                  matched_key=best_key, similarity=best_score))
+
+            if key not in self._entries:
+                self._entries[key] = (cluster_id, company_key, levels, sig)
+                self._added_at[key] = time.time()
+                for bucket in buckets_by_pos[pos]:
+                    self._buckets.setdefault(bucket, []).append(key)
+                new_records.append((key, cluster_id, company_key, levels, sig))
+
+        if self._conn is not None and new_records:
+            self._persist(new_records)
+        return unique, matches
+
+# Example usage:
+# detector = NearDuplicateDetector(db_path="near_dedupe.db")
+# unique, matches = detector.deduplicate(jobs, lambda j: (j.url, j.title, j.company, j.description))
+# for m in matches:
+#     print(f"{m.key} folded into cluster {m.cluster_id} ({m.similarity:.2f})")
@@ -58,7 +58,8 @@ class AutomatedJobSearchRunner:
             'enrichment': {
                 'enable_scoring': True,
                 'enable_feedback': True,
-                'llm_provider': 'openai'
+                'llm_provider': 'openai',
+                'embedding_cache_dir': './output/embedding_cache'
             }
         }
         
@@ -81,6 +82,13 @@ class AutomatedJobSearchRunner:
             from ..enrichment.orchestrator import ResumeScoringOrchestrator
             from ..resume_uploader.uploader import ResumeUploader
             
+            # Embed each resume bullet and JD phrase once across jobs and runs
+            cache_dir = self.config.get('enrichment', {}).get('embedding_cache_dir')
+            if cache_dir:
+                from ..cache.embedding_cache import EmbeddingCache
+                from ..enrichment.embeddings import set_default_cache
+                set_default_cache(EmbeddingCache(cache_dir))
+            
             self.job_aggregator = JobAggregatorService(self.config)
             self.enrichment_service = ResumeScoringOrchestrator(job_desc={}) # Provide empty job desc for initialization
             self.resume_uploader = ResumeUploader()
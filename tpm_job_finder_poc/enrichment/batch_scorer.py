@@ -0,0 +1,338 @@
+"""
+BatchScorer: Score one resume against many job descriptions at once
+Vectorized counterpart of HeuristicScorer.score_resume
+
+Term hits are found with one pass over each bullet against the union of every
+job's terms, then turned into per-job counts with a sparse term-by-job matrix
+(scipy.sparse when installed, an equivalent NumPy reduction otherwise).
+Bullets and the distinct JD terms are each embedded once and compared with a
+single matrix multiply. Component scores, totals, categories and knockouts for
+all (bullet, job) pairs are computed with NumPy; the results are identical to
+calling ``HeuristicScorer(job).score_resume(...)`` for each job.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from tpm_job_finder_poc.enrichment.heuristic_scorer import HeuristicScorer
+from tpm_job_finder_poc.enrichment.term_matcher import TermMatcher
+
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    sparse = None
+    SCIPY_AVAILABLE = False
+
+# Term categories matched against bullets and against resume metadata fields
+BULLET_CATEGORIES = ["responsibilities", "keywords", "skills", "project_impact"]
+META_CATEGORIES = ["education", "certifications"]
+
+# Jobs whose similarity columns are reduced together, bounding memory use
+_JOB_CHUNK = 2048
+
+_BUCKETS = [(0.85, 1.0), (0.65, 0.8), (0.45, 0.6), (0.25, 0.4)]
+
+
+def bucket_scores(matches: np.ndarray, total_possible: np.ndarray, max_points: np.ndarray) -> np.ndarray:
+    """Vectorized ``HeuristicScorer._bucket_score`` over broadcastable arrays."""
+    matches = np.asarray(matches, dtype=np.float64)
+    total_possible = np.asarray(total_possible, dtype=np.float64)
+    max_points = np.asarray(max_points, dtype=np.float64)
+    ratio = matches / np.where(total_possible == 0, 1.0, total_possible)
+    conditions = [ratio >= threshold for threshold, _ in _BUCKETS] + [matches > 0]
+    choices = [np.trunc(max_points * share) for _, share in _BUCKETS] + [np.trunc(max_points * 0.2)]
+    scores = np.select(conditions, np.broadcast_arrays(*choices), 0.0)
+    return np.where(total_possible == 0, 0, scores).astype(np.int64)
+
+
+class BatchScorer:
+    def __init__(self, job_descs: Sequence[Dict[str, Any]], weights: Optional[Dict[str, int]] = None,
+                 config_path: Optional[str] = None):
+        """
+        Args:
+            job_descs: Job descriptions, in the form HeuristicScorer takes
+            weights: Component weights (HeuristicScorer defaults if omitted)
+            config_path: Weights file, as for HeuristicScorer
+        """
+        # Per-job scorers hold each job's canonicalized term sets, weights and helpers
+        self.scorers = [HeuristicScorer(job_desc, weights, config_path) for job_desc in job_descs]
+        n_jobs = len(self.scorers)
+        # Achievement and impact terms are the same for every job
+        self._job_independent = self.scorers[0] if self.scorers else HeuristicScorer({}, weights, config_path)
+
+        # One automaton over every job's terms, and a term-by-job count matrix per category
+        categories = {
+            "responsibilities": lambda s: s.responsibilities,
+            "keywords": lambda s: s.keywords,
+            "skills": lambda s: s.skills,
+            "project_impact": lambda s: s.project_impact_terms,
+            "education": lambda s: s.education,
+            "certifications": lambda s: s.certifications,
+        }
+        self._vocabulary: Dict[str, int] = {}
+        self._entries: Dict[str, tuple] = {}
+        self._sizes: Dict[str, np.ndarray] = {}
+        for category, terms_of in categories.items():
+            rows, cols, counts = [], [], []
+            for j, scorer in enumerate(self.scorers):
+                per_term: Dict[int, int] = {}
+                for term in terms_of(scorer):
+                    column = self._vocabulary.setdefault(term.lower(), len(self._vocabulary))
+                    per_term[column] = per_term.get(column, 0) + 1
+                rows.extend(per_term)
+                cols.extend([j] * len(per_term))
+                counts.extend(per_term.values())
+            self._entries[category] = (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64),
+                                       np.array(counts, dtype=np.int64))
+            self._sizes[category] = np.array([len(terms_of(s)) for s in self.scorers], dtype=np.int64)
+        self.term_matcher = TermMatcher({"all": self._vocabulary})
+        self._matrices = {}
+        if SCIPY_AVAILABLE:
+            for category, (rows, cols, counts) in self._entries.items():
+                self._matrices[category] = sparse.csr_matrix(
+                    (counts, (rows, cols)), shape=(len(self._vocabulary), n_jobs)
+                )
+
+        self._weights = {
+            key: np.array([s.weights[key] for s in self.scorers], dtype=np.int64)
+            for key in HeuristicScorer.DEFAULT_WEIGHTS
+        }
+        self._required_experience = np.array([s.required_experience or 0 for s in self.scorers])
+
+        # Distinct responsibility/skill texts, embedded once for all jobs
+        self._sem_terms: List[str] = sorted(
+            {t for s in self.scorers for t in s.responsibilities | s.skills}
+        )
+        positions = {term: i for i, term in enumerate(self._sem_terms)}
+        self._resp_columns = [[positions[t] for t in s._resp_terms] for s in self.scorers]
+        self._skill_columns = [[positions[t] for t in s._skill_terms] for s in self.scorers]
+        self._term_vectors = None
+        self._embedding_engine = None
+
+    def _term_counts(self, texts: Sequence[str], categories: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Per-category term hits of each text in each job, shape ``(len(texts), n_jobs)``."""
+        n_jobs = len(self.scorers)
+        hit_columns = [
+            np.array([self._vocabulary[term] for term in self.term_matcher.find(text)], dtype=np.int64)
+            for text in texts
+        ]
+        counts = {}
+        if SCIPY_AVAILABLE:
+            rows = np.repeat(np.arange(len(texts)), [len(c) for c in hit_columns])
+            hits = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.int64), (rows, np.concatenate(hit_columns or [np.zeros(0, np.int64)]))),
+                shape=(len(texts), len(self._vocabulary))
+            )
+            for category in categories:
+                counts[category] = np.asarray((hits @ self._matrices[category]).todense(), dtype=np.int64)
+            return counts
+        for category in categories:
+            term_rows, job_cols, term_counts = self._entries[category]
+            result = np.zeros((len(texts), n_jobs), dtype=np.int64)
+            for i, columns in enumerate(hit_columns):
+                mask = np.isin(term_rows, columns)
+                result[i] = np.bincount(job_cols[mask], weights=term_counts[mask], minlength=n_jobs)
+            counts[category] = result
+        return counts
+
+    def _semantic_similarities(self, bullets: List[str]):
+        """Best responsibility and skill similarity of each bullet in each job."""
+        shape = (len(bullets), len(self.scorers))
+        resp, skill = np.zeros(shape), np.zeros(shape)
+        if not bullets or not self._sem_terms:
+            return resp, skill
+        try:
+            if self._embedding_engine is None:
+                from tpm_job_finder_poc.enrichment.embeddings import EmbeddingEngine
+                self._embedding_engine = EmbeddingEngine()
+            if self._term_vectors is None:
+                self._term_vectors = self._embedding_engine.encode(self._sem_terms)
+            sims = self._embedding_engine.encode(bullets) @ self._term_vectors.T
+        except Exception as e:
+            from tpm_job_finder_poc.error_handler.handler import handle_error
+            handle_error(e, context={'component': 'batch_scorer', 'method': '_semantic_similarities', 'bullets': len(bullets)})
+            return resp, skill
+        for columns, out in ((self._resp_columns, resp), (self._skill_columns, skill)):
+            for start in range(0, len(columns), _JOB_CHUNK):
+                chunk = columns[start:start + _JOB_CHUNK]
+                jobs = [j for j, cols in enumerate(chunk) if cols]
+                if not jobs:
+                    continue
+                flat = np.concatenate([chunk[j] for j in jobs])
+                offsets = np.cumsum([0] + [len(chunk[j]) for j in jobs[:-1]])
+                out[:, start + np.array(jobs)] = np.maximum.reduceat(sims[:, flat], offsets, axis=1)
+        return resp, skill
+
+    def compute(self, bullets: List[str], resume_meta: Optional[Dict[str, Any]] = None) -> Dict[str, np.ndarray]:
+        """Component scores for every (bullet, job) pair, without building result dicts.
+
+        Returns:
+            Arrays of shape ``(len(bullets), n_jobs)`` per component, plus match
+            counts, ``overall`` (per job) and ``ko_failed`` (per job)
+        """
+        n_bullets = len(bullets)
+        w = self._weights
+        counts = self._term_counts(bullets, BULLET_CATEGORIES)
+        resp_sim, skill_sim = self._semantic_similarities(bullets)
+
+        resp = bucket_scores(counts["responsibilities"], self._sizes["responsibilities"], w["responsibilities"])
+        resp = np.where(resp_sim > 0.7, np.maximum(resp, np.trunc(w["responsibilities"] * resp_sim)), resp)
+        kw = bucket_scores(counts["keywords"], self._sizes["keywords"], w["keywords"])
+        skill = bucket_scores(counts["skills"], self._sizes["skills"], w["skills"])
+        skill = np.where(skill_sim > 0.7, np.maximum(skill, np.trunc(w["skills"] * skill_sim)), skill)
+
+        scorer = self._job_independent
+        ach_matches = np.array([len(scorer.achievement_pattern.findall(b)) for b in bullets],
+                               dtype=np.int64).reshape(-1, 1)
+        impact_matches = np.array([scorer.term_matcher.count(b)["impact"] for b in bullets],
+                                  dtype=np.int64).reshape(-1, 1)
+        ach = bucket_scores(ach_matches, 3, w["achievements"])
+        impact = bucket_scores(impact_matches, 2, w["impact"])
+
+        meta = resume_meta or {}
+        meta_counts = {
+            category: self._term_counts([meta.get(category) or ""], [category])[category][0]
+            for category in META_CATEGORIES
+        }
+        years = meta.get("years_experience", 0)
+        zeros = np.zeros((n_bullets, len(self.scorers)), dtype=np.int64)
+        edu = cert = exp = proj = zeros
+        if resume_meta:
+            edu = zeros + bucket_scores(meta_counts["education"], self._sizes["education"], w["education"])
+            cert = zeros + bucket_scores(meta_counts["certifications"], self._sizes["certifications"],
+                                         w["certifications"])
+            exp = zeros + np.where(years >= self._required_experience, w["experience"], 0)
+            proj = bucket_scores(counts["project_impact"], self._sizes["project_impact"], w["project_impact"])
+
+        resp, skill = resp.astype(np.int64), skill.astype(np.int64)
+        total = resp + kw + skill + ach + impact + edu + cert + exp + proj
+        return {
+            "responsibilities": resp, "keywords": kw, "skills": skill,
+            "achievements": zeros + ach, "impact": zeros + impact,
+            "education": edu, "certifications": cert, "experience": exp, "project_impact": proj,
+            "total": total,
+            "resp_sem_sim": resp_sim, "skill_sem_sim": skill_sim,
+            "counts": counts, "ach_matches": ach_matches[:, 0], "impact_matches": impact_matches[:, 0],
+            "meta_counts": meta_counts,
+            "overall": total.sum(axis=0) // max(1, n_bullets),
+        }
+
+    def overall_scores(self, bullets: List[str], resume_meta: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Overall fit score per job, as ``score_resume`` would report it."""
+        return self.compute(bullets, resume_meta)["overall"]
+
+    def _check_kos(self, j: int, meta: Dict[str, Any], meta_counts: Dict[str, np.ndarray]) -> List[str]:
+        scorer = self.scorers[j]
+        failed = []
+        if "location" in scorer.job_desc:
+            required_loc = scorer.job_desc["location"].lower()
+            if required_loc and required_loc not in meta.get("location", "").lower():
+                failed.append("location")
+        if scorer.education and not meta_counts["education"][j]:
+            failed.append("education")
+        if scorer.certifications and not meta_counts["certifications"][j]:
+            failed.append("certifications")
+        if scorer.required_experience and meta.get("years_experience", 0) < scorer.required_experience:
+            failed.append("years_experience")
+        return failed
+
+    def score_resume(self, bullets: List[str], resume_meta: Optional[Dict[str, Any]] = None,
+                     context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Score a resume against every job.
+
+        Returns:
+            One result per job, in job order, matching ``HeuristicScorer.score_resume``
+        """
+        arrays = self.compute(bullets, resume_meta)
+        columns = ["responsibilities", "keywords", "skills", "achievements", "impact",
+                   "education", "certifications", "experience", "project_impact", "total"]
+        by_job = {key: arrays[key].T.tolist() for key in columns + ["resp_sem_sim", "skill_sem_sim"]}
+        counts = {key: value.T.tolist() for key, value in arrays["counts"].items()}
+        ach_matches = arrays["ach_matches"].tolist()
+        impact_matches = arrays["impact_matches"].tolist()
+        meta = resume_meta or {}
+        years = meta.get("years_experience", 0)
+
+        results = []
+        for j, scorer in enumerate(self.scorers):
+            if resume_meta:
+                edu_matches = int(arrays["meta_counts"]["education"][j])
+                cert_matches = int(arrays["meta_counts"]["certifications"][j])
+            bullet_results = []
+            for i, bullet in enumerate(bullets):
+                resp_sem_sim = float(by_job["resp_sem_sim"][j][i])
+                skill_sem_sim = float(by_job["skill_sem_sim"][j][i])
+                bm25_scores = None
+                if scorer.bm25_matcher:
+                    try:
+                        bm25_scores = scorer.bm25_matcher.score(bullet)
+                    except Exception as e:
+                        from tpm_job_finder_poc.error_handler.handler import handle_error
+                        handle_error(e, context={'component': 'batch_scorer', 'method': 'score_resume', 'bullet': bullet})
+                rationale_parts = []
+                if resume_meta:
+                    rationale_parts = [
+                        f"Education matches: {edu_matches}/{len(scorer.education)}",
+                        f"Certifications matches: {cert_matches}/{len(scorer.certifications)}",
+                        f"Years experience: {years} (required: {scorer.required_experience})",
+                        f"Project impact matches: {counts['project_impact'][j][i]}/{len(scorer.project_impact_terms)}",
+                    ]
+                rationale = scorer._feedback(bullet, counts["responsibilities"][j][i], counts["keywords"][j][i],
+                                             counts["skills"][j][i], ach_matches[i], impact_matches[i])
+                rationale += f"; Embedding Resp sim: {resp_sem_sim:.2f}; Embedding Skill sim: {skill_sem_sim:.2f}; " \
+                    + "; ".join(rationale_parts)
+                if bm25_scores:
+                    rationale += f"; BM25/TFIDF: {bm25_scores}"
+                result = {"bullet": bullet}
+                result.update({key: by_job[key][j][i] for key in columns})
+                result.update({
+                    "category": scorer._categorize(result["total"]),
+                    "rationale": rationale,
+                    "resp_sem_sim": resp_sem_sim,
+                    "skill_sem_sim": skill_sem_sim,
+                    "bm25_tfidf": bm25_scores,
+                })
+                bullet_results.append(result)
+            results.append(self._assemble(j, bullet_results, int(arrays["overall"][j]),
+                                          self._check_kos(j, meta, arrays["meta_counts"]), context))
+        return results
+
+    def _assemble(self, j: int, results: List[Dict[str, Any]], overall: int, failed_fields: List[str],
+                  context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Per-job summary, laid out as HeuristicScorer.score_resume returns it."""
+        scorer = self.scorers[j]
+        ko_failed = bool(failed_fields)
+        evidence_keys = ["responsibilities", "keywords", "skills", "education", "certifications",
+                         "experience", "project_impact"]
+        evidence_map = {
+            idx: {"bullet": r["bullet"], "matches": {key: r[key] for key in evidence_keys}}
+            for idx, r in enumerate(results)
+        }
+        gap_map = [f"KO failed: {field}" for field in failed_fields]
+        # Same totals as HeuristicScorer's gap check, which never flags project_impact
+        possible = {
+            "responsibilities": len(scorer.responsibilities), "keywords": len(scorer.keywords),
+            "skills": len(scorer.skills), "education": len(scorer.education),
+            "certifications": len(scorer.certifications), "experience": scorer.required_experience,
+            "project_impact": None,
+        }
+        for key in evidence_keys:
+            if possible[key] and sum(r[key] for r in results) == 0:
+                gap_map.append(f"No match for {key}")
+        return {
+            "bullets": results,
+            "overall_score": overall,
+            "category": scorer._categorize(overall),
+            "rationales": [r["rationale"] for r in results],
+            "ko_failed": ko_failed,
+            "failed_kos": failed_fields,
+            "evidence_map": evidence_map,
+            "gap_map": gap_map,
+            "psl": scorer._map_psl(overall, ko_failed, context),
+        }
+
+# Example usage:
+# batch = BatchScorer([job_desc_1, job_desc_2, ...])
+# results = batch.score_resume(bullets, resume_meta)   # one HeuristicScorer-style result per job
+# overall = batch.overall_scores(bullets, resume_meta) # just the fit scores, as an array
@@ -1,8 +1,19 @@
 """
 Embeddings: Utility for semantic similarity between resume bullets and JD sections
 Uses SentenceTransformers (e.g., all-MiniLM-L6-v2)
+
+Models are loaded once per process through ``get_model`` and shared by every
+EmbeddingEngine. ``similarity_matrix`` encodes each list of texts in one batch
+and scores every pair with a single matrix multiply of unit vectors.
+
+With an EmbeddingCache (passed to an engine, or installed for all engines with
+``set_default_cache``) each distinct text is encoded once per model and read
+back from the cache afterwards.
 """
-from typing import List
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 try:
     from sentence_transformers import SentenceTransformer, util
@@ -12,35 +23,101 @@ except ImportError as e:
     SentenceTransformer = None
     util = None
 
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+# Cache used by engines created without one
+_default_cache = None
+
+# Loaded models by name; None records a model that failed to load
+_models: Dict[str, Any] = {}
+_models_lock = threading.Lock()
+
+
+def get_model(model_name: str = DEFAULT_MODEL) -> Optional[Any]:
+    """Shared SentenceTransformer for a model name, loaded on first use.
+
+    Returns:
+        The model, or None if sentence-transformers is missing or loading failed
+    """
+    if model_name in _models:
+        return _models[model_name]
+    with _models_lock:
+        if model_name not in _models:
+            model = None
+            if SentenceTransformer:
+                try:
+                    model = SentenceTransformer(model_name)
+                except Exception as e:
+                    from tpm_job_finder_poc.error_handler.handler import handle_error
+                    handle_error(e, context={'component': 'embeddings', 'method': 'get_model', 'model_name': model_name})
+            _models[model_name] = model
+        return _models[model_name]
+
+
+def set_default_cache(cache) -> None:
+    """Install an EmbeddingCache for engines created without one (None removes it)."""
+    global _default_cache
+    _default_cache = cache
+
+
 class EmbeddingEngine:
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
-        if SentenceTransformer:
-            try:
-                self.model = SentenceTransformer(model_name)
-            except Exception as e:
-                from tpm_job_finder_poc.error_handler.handler import handle_error
-                handle_error(e, context={'component': 'embeddings', 'method': '__init__', 'model_name': model_name})
-                self.model = None
-        else:
-            self.model = None
+    def __init__(self, model_name: str = DEFAULT_MODEL, cache=None):
+        self.model_name = model_name
+        self.cache = cache
+
+    @property
+    def model(self):
+        return get_model(self.model_name)
+
+    def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Raw embeddings of texts, through the cache if there is one."""
+        cache = self.cache if self.cache is not None else _default_cache
+
+        def compute(batch: List[str]) -> np.ndarray:
+            return np.asarray(self.model.encode(batch, convert_to_numpy=True), dtype=np.float32)
+
+        if cache is None:
+            return compute(list(texts))
+        return cache.get_or_compute(self.model_name, texts, compute)
 
     def get_embeddings(self, texts: List[str]):
         if not self.model:
             raise ImportError("sentence-transformers not installed")
         try:
+            if self.cache is not None or _default_cache is not None:
+                import torch
+                return torch.from_numpy(self._embed(texts))
             return self.model.encode(texts, convert_to_tensor=True)
         except Exception as e:
             from tpm_job_finder_poc.error_handler.handler import handle_error
             handle_error(e, context={'component': 'embeddings', 'method': 'get_embeddings', 'texts': texts})
             return None
 
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Encode texts in one batch as unit-length float32 rows."""
+        if not self.model:
+            raise ImportError("sentence-transformers not installed")
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        vectors = self._embed(texts)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    def similarity_matrix(self, texts_a: Sequence[str], texts_b: Sequence[str]) -> np.ndarray:
+        """Cosine similarity of every text in ``texts_a`` to every text in ``texts_b``.
+
+        Returns:
+            Array of shape ``(len(texts_a), len(texts_b))``
+        """
+        if not texts_a or not texts_b:
+            return np.zeros((len(texts_a), len(texts_b)), dtype=np.float32)
+        return self.encode(texts_a) @ self.encode(texts_b).T
+
     def similarity(self, text_a: str, text_b: str) -> float:
         if not self.model:
             raise ImportError("sentence-transformers not installed")
         try:
-            emb_a = self.model.encode([text_a], convert_to_tensor=True)
-            emb_b = self.model.encode([text_b], convert_to_tensor=True)
-            return float(util.pytorch_cos_sim(emb_a, emb_b)[0][0])
+            return float(self.similarity_matrix([text_a], [text_b])[0, 0])
         except Exception as e:
             from tpm_job_finder_poc.error_handler.handler import handle_error
             handle_error(e, context={'component': 'embeddings', 'method': 'similarity', 'text_a': text_a, 'text_b': text_b})
@@ -49,3 +126,4 @@ class EmbeddingEngine:
 # Example usage:
 # engine = EmbeddingEngine()
 # sim = engine.similarity("Led agile teams", "lead projects")
+# sims = engine.similarity_matrix(bullets, responsibilities)
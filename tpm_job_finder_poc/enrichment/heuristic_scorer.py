@@ -2,24 +2,52 @@
 HeuristicScorer: Deterministic resume-to-job fit scoring for Senior TPM roles
 Objective scoring, informed by recruiter/hiring manager psychology
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import re
 
 import json
 import os
 from tpm_job_finder_poc.storage.secure_storage import SecureStorage
+from tpm_job_finder_poc.enrichment.term_matcher import TermMatcher
 
 class HeuristicScorer:
     def _semantic_similarity(self, text_a: str, text_b: str) -> float:
         # Use sentence transformer embeddings for semantic similarity
         try:
-            from tpm_job_finder_poc.enrichment.embeddings import EmbeddingEngine
-            engine = EmbeddingEngine()
-            return engine.similarity(text_a, text_b)
+            return self._get_embedding_engine().similarity(text_a, text_b)
         except Exception as e:
             from tpm_job_finder_poc.error_handler.handler import handle_error
             handle_error(e, context={'component': 'heuristic_scorer', 'method': '_semantic_similarity', 'text_a': text_a, 'text_b': text_b})
             return 0.0
+
+    def _get_embedding_engine(self):
+        if self._embedding_engine is None:
+            from tpm_job_finder_poc.enrichment.embeddings import EmbeddingEngine
+            self._embedding_engine = EmbeddingEngine()
+        return self._embedding_engine
+
+    def _semantic_similarities(self, bullets: List[str]) -> List[Tuple[float, float]]:
+        """Best responsibility and skill similarity for each bullet.
+
+        Bullets are encoded in one batch and JD terms once per scorer; every
+        bullet/term pair is scored with one matrix multiply.
+        """
+        if not bullets or not (self.responsibilities or self.skills):
+            return [(0.0, 0.0)] * len(bullets)
+        try:
+            engine = self._get_embedding_engine()
+            if self._term_vectors is None:
+                self._term_vectors = engine.encode(self._resp_terms + self._skill_terms)
+            sims = engine.encode(bullets) @ self._term_vectors.T
+        except Exception as e:
+            from tpm_job_finder_poc.error_handler.handler import handle_error
+            handle_error(e, context={'component': 'heuristic_scorer', 'method': '_semantic_similarities', 'bullets': len(bullets)})
+            return [(0.0, 0.0)] * len(bullets)
+        split = len(self._resp_terms)
+        resp = sims[:, :split].max(axis=1) if split else [0.0] * len(bullets)
+        skill = sims[:, split:].max(axis=1) if self._skill_terms else [0.0] * len(bullets)
+        return [(float(r), float(s)) for r, s in zip(resp, skill)]
+
     KO_FIELDS = ["location", "education", "certifications", "years_experience"]
 
     def _check_kos(self, resume_meta: Dict[str, Any]) -> Dict[str, Any]:
@@ -33,12 +61,12 @@ class HeuristicScorer:
                 failed.append("location")
         # Education KO
         if self.education:
-            edu_matches = any(e.lower() in resume_meta.get("education", "").lower() for e in self.education)
+            edu_matches = self._education_matcher.any("education", resume_meta.get("education", ""))
             if not edu_matches:
                 failed.append("education")
         # Certifications KO
         if self.certifications:
-            cert_matches = any(c.lower() in resume_meta.get("certifications", "").lower() for c in self.certifications)
+            cert_matches = self._certification_matcher.any("certifications", resume_meta.get("certifications", ""))
             if not cert_matches:
                 failed.append("certifications")
         # Years experience KO
@@ -83,7 +111,22 @@ class HeuristicScorer:
         self.impact_terms = {"improved", "increased", "reduced", "saved", "delivered", "launched", "grew", "cut", "boosted"}
         self.achievement_pattern = re.compile(r"\b(\d+|%|million|billion|k)\b", re.I)
         self.weights = self._load_weights(weights, config_path)
+        # Term sets compiled once; each bullet or resume field is scanned in a single pass
+        self.term_matcher = TermMatcher({
+            "responsibilities": self.responsibilities,
+            "keywords": self.keywords,
+            "skills": self.skills,
+            "impact": self.impact_terms,
+            "project_impact": self.project_impact_terms,
+        })
+        self._education_matcher = TermMatcher({"education": self.education})
+        self._certification_matcher = TermMatcher({"certifications": self.certifications})
         self.feedback_log = []
+        # JD term embeddings are computed on first use and reused for every bullet
+        self._resp_terms = sorted(self.responsibilities)
+        self._skill_terms = sorted(self.skills)
+        self._term_vectors = None
+        self._embedding_engine = None
         # BM25/TF-IDF matcher setup
         try:
             from bm25_tfidf.bm25_tfidf_matcher import BM25TFIDFMatcher
@@ -109,27 +152,29 @@ class HeuristicScorer:
                 handle_error(e, context={'component': 'heuristic_scorer', 'method': '_load_weights', 'config_path': config_path})
         return self.DEFAULT_WEIGHTS.copy()
 
-    def score_bullet(self, bullet: str, resume_meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        bullet_lower = bullet.lower()
+    def score_bullet(self, bullet: str, resume_meta: Optional[Dict[str, Any]] = None,
+                     semantic_sims: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
         # Classic matches
-        resp_matches = sum(1 for r in self.responsibilities if r.lower() in bullet_lower)
-        kw_matches = sum(1 for k in self.keywords if k.lower() in bullet_lower)
-        skill_matches = sum(1 for s in self.skills if s.lower() in bullet_lower)
-        # Embedding-based semantic similarity for responsibilities (sentence transformers)
-        resp_sem_sim = max([self._semantic_similarity(bullet, r) for r in self.responsibilities], default=0.0) if self.responsibilities else 0.0
+        hits = self.term_matcher.count(bullet)
+        resp_matches = hits["responsibilities"]
+        kw_matches = hits["keywords"]
+        skill_matches = hits["skills"]
+        # Embedding-based semantic similarity for responsibilities and skills (sentence transformers);
+        # score_resume passes in values computed for all bullets at once
+        if semantic_sims is None:
+            semantic_sims = self._semantic_similarities([bullet])[0]
+        resp_sem_sim, skill_sem_sim = semantic_sims
         resp_score = self._bucket_score(resp_matches, len(self.responsibilities), self.weights["responsibilities"])
         # Add bonus for semantic similarity above threshold
         if resp_sem_sim > 0.7:
             resp_score = max(resp_score, int(self.weights["responsibilities"] * resp_sem_sim))
         kw_score = self._bucket_score(kw_matches, len(self.keywords), self.weights["keywords"])
-        # Embedding-based semantic similarity for skills (sentence transformers)
-        skill_sem_sim = max([self._semantic_similarity(bullet, s) for s in self.skills], default=0.0) if self.skills else 0.0
         skill_score = self._bucket_score(skill_matches, len(self.skills), self.weights["skills"])
         if skill_sem_sim > 0.7:
             skill_score = max(skill_score, int(self.weights["skills"] * skill_sem_sim))
         ach_matches = len(self.achievement_pattern.findall(bullet))
         ach_score = self._bucket_score(ach_matches, 3, self.weights["achievements"])
-        impact_matches = sum(1 for t in self.impact_terms if t in bullet_lower)
+        impact_matches = hits["impact"]
         impact_score = self._bucket_score(impact_matches, 2, self.weights["impact"])
         # BM25/TF-IDF matcher scores
         bm25_scores = None
@@ -148,11 +193,11 @@ class HeuristicScorer:
         rationale_parts = []
         if resume_meta:
             # Education
-            edu_matches = sum(1 for e in self.education if e.lower() in resume_meta.get("education", "").lower())
+            edu_matches = self._education_matcher.count(resume_meta.get("education", ""))["education"]
             edu_score = self._bucket_score(edu_matches, len(self.education), self.weights["education"])
             rationale_parts.append(f"Education matches: {edu_matches}/{len(self.education)}")
             # Certifications
-            cert_matches = sum(1 for c in self.certifications if c.lower() in resume_meta.get("certifications", "").lower())
+            cert_matches = self._certification_matcher.count(resume_meta.get("certifications", ""))["certifications"]
             cert_score = self._bucket_score(cert_matches, len(self.certifications), self.weights["certifications"])
             rationale_parts.append(f"Certifications matches: {cert_matches}/{len(self.certifications)}")
             # Experience
@@ -160,7 +205,7 @@ class HeuristicScorer:
             exp_score = self.weights["experience"] if years >= self.required_experience else 0
             rationale_parts.append(f"Years experience: {years} (required: {self.required_experience})")
             # Project impact
-            proj_matches = sum(1 for p in self.project_impact_terms if p.lower() in bullet_lower)
+            proj_matches = hits["project_impact"]
             proj_score = self._bucket_score(proj_matches, len(self.project_impact_terms), self.weights["project_impact"])
             rationale_parts.append(f"Project impact matches: {proj_matches}/{len(self.project_impact_terms)}")
         total = resp_score + kw_score + skill_score + ach_score + impact_score + edu_score + cert_score + exp_score + proj_score
@@ -190,7 +235,8 @@ class HeuristicScorer:
         }
 
     def score_resume(self, bullets: List[str], resume_meta: Optional[Dict[str, Any]] = None, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        results = [self.score_bullet(b, resume_meta) for b in bullets]
+        sims = self._semantic_similarities(bullets)
+        results = [self.score_bullet(b, resume_meta, sim) for b, sim in zip(bullets, sims)]
         overall = sum(r["total"] for r in results) // max(1, len(results))
         category = self._categorize(overall)
         rationales = [r["rationale"] for r in results]
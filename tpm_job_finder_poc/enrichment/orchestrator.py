@@ -173,6 +173,57 @@ class ResumeScoringOrchestrator:
             "aggregate": self._aggregate_results(heuristic_result, ml_result, llm_result, avg_resp_sem_sim, avg_skill_sem_sim, bm25_tfidf_agg)
         }
 
+    def shortlist_jobs(self, jobs, bullets=None, top_k=300, job_index=None):
+        """Pre-filter jobs to the ``top_k`` closest to the resume before full scoring.
+
+        Jobs are embedded and each resume bullet retrieves its nearest jobs; a
+        job ranks by its best bullet similarity. Without ``job_index`` the batch
+        is searched exactly. Pass ``job_index`` to reuse one across runs: jobs
+        seen before are not embedded again, and its partitions are searched
+        restricted to this batch. If embeddings are unavailable the jobs are
+        returned unfiltered.
+        """
+        if bullets is None and self.resume_struct:
+            bullets = self.resume_struct["sections"].get("experience", [])
+        jobs = list(jobs)
+        if not bullets or len(jobs) <= top_k:
+            return jobs
+        try:
+            from tpm_job_finder_poc.enrichment.embeddings import EmbeddingEngine
+            from tpm_job_finder_poc.enrichment.vector_index import VectorIndex
+            engine = EmbeddingEngine()
+            index = job_index if job_index is not None else VectorIndex()
+            by_key = {self._job_key(job): job for job in jobs}
+            new_keys = [key for key in by_key if key not in index]
+            if new_keys:
+                index.add(new_keys, engine.encode([self._job_text(by_key[key]) for key in new_keys]))
+            # A throwaway index is searched exactly rather than partitioned first;
+            # a reused one may also hold jobs outside this batch, so restrict to it
+            matches = index.search(engine.encode(bullets), k=top_k, exact=job_index is None,
+                                   ids=list(by_key) if job_index is not None else None)
+        except Exception as e:
+            handle_error(e, context={'component': 'enrichment', 'method': 'shortlist_jobs', 'jobs': len(jobs)})
+            return jobs
+        best = {}
+        for bullet_matches in matches:
+            for key, score in bullet_matches:
+                if score > best.get(key, -2.0):
+                    best[key] = score
+        ranked = sorted(best, key=best.get, reverse=True)[:top_k]
+        return [by_key[key] for key in ranked]
+
+    @classmethod
+    def _job_key(cls, job):
+        if job.get("id") or job.get("url"):
+            return str(job.get("id") or job.get("url"))
+        # Content-addressed, so a reused index never mixes up jobs across runs
+        import hashlib
+        return "job-" + hashlib.sha1(cls._job_text(job).encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _job_text(job):
+        return " ".join(str(job.get(field) or "") for field in ("title", "company", "description")).strip()
+
     def _extract_years_experience(self, text):
         import re
         match = re.search(r"(\d+)\+? years?", text, re.I)
@@ -202,3 +253,4 @@ class ResumeScoringOrchestrator:
 # Example usage:
 # orchestrator = ResumeScoringOrchestrator(job_desc)
 # result = orchestrator.score_resume(bullets, resume_data)
+# candidates = orchestrator.shortlist_jobs(jobs, bullets, top_k=300)
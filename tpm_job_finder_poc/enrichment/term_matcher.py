@@ -0,0 +1,86 @@
+"""
+TermMatcher: Single-pass matching of JD term sets against resume text
+Aho-Corasick automaton over the lowercased terms of several named groups
+
+``count`` gives, per group, how many of its terms occur in a text as
+case-insensitive substrings - the same result as testing
+``term.lower() in text.lower()`` for every term, overlapping matches
+included - but reads the text once instead of once per term.
+"""
+from collections import Counter, deque
+from typing import Dict, Iterable, List, Mapping, Set
+
+
+class TermMatcher:
+    def __init__(self, groups: Mapping[str, Iterable[str]]):
+        """
+        Args:
+            groups: Terms to match, by group name; a term listed twice in a
+                group (in any case) counts twice, as a per-term scan would
+        """
+        # Multiplicity of each lowercased term within each group
+        self.groups: Dict[str, Counter] = {
+            name: Counter(term.lower() for term in terms) for name, terms in groups.items()
+        }
+        patterns = {term for counts in self.groups.values() for term in counts}
+        self._matches_empty = "" in patterns
+        self._build({term for term in patterns if term})
+
+    def _build(self, patterns: Set[str]):
+        # State 0 is the root; each state has its transitions, failure link and
+        # the patterns ending there (own output merged with its failure chain)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = nxt
+            self._output[state].append(pattern)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """Distinct lowercased terms occurring in ``text``."""
+        found = {""} if self._matches_empty else set()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Number of each group's terms occurring in ``text``."""
+        found = self.find(text)
+        return {
+            name: sum(n for term, n in counts.items() if term in found) if found else 0
+            for name, counts in self.groups.items()
+        }
+
+    def any(self, group: str, text: str) -> bool:
+        """Whether any term of ``group`` occurs in ``text``."""
+        return self.count(text)[group] > 0
+
+# Example usage:
+# matcher = TermMatcher({"skills": ["Python", "SQL"], "keywords": ["roadmap"]})
+# matcher.count("Built a Python roadmap")  # {"skills": 1, "keywords": 1}
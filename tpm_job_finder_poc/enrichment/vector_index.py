@@ -0,0 +1,272 @@
+"""
+VectorIndex: Approximate nearest-neighbour search over job and resume embeddings
+IVF (inverted file) index in NumPy with exact-search fallback
+
+Vectors are stored unit-length, so inner product is cosine similarity. Once the
+index holds ``min_train_size`` vectors it is partitioned with spherical
+k-means; a query is then scored only against the vectors of its ``nprobe``
+closest partitions. Smaller indexes, and queries whose probed partitions hold
+fewer than ``k`` vectors, are answered by exact search. Vectors can be added,
+replaced and removed at any time, and the index is saved as a single .npz file.
+"""
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Rows scored per block when assigning vectors to partitions
+_CHUNK = 8192
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k highest scores, best first."""
+    if k < len(scores):
+        top = np.argpartition(-scores, k - 1)[:k]
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+class VectorIndex:
+    def __init__(self, dim: Optional[int] = None, nprobe: int = 8, min_train_size: int = 2048, seed: int = 0):
+        """
+        Args:
+            dim: Vector dimension (taken from the first vectors added if omitted)
+            nprobe: Partitions scanned per query once the index is trained
+            min_train_size: Vectors needed before the index is partitioned;
+                smaller indexes are searched exactly
+            seed: Seed for k-means initialisation
+        """
+        self.dim = dim
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self.seed = seed
+        self._vectors = np.zeros((0, dim or 0), dtype=np.float32)
+        self._ids: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+        self._lock = threading.RLock()
+        self._stats = {'exact_queries': 0, 'ivf_queries': 0, 'vectors_scored': 0}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._slots
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray):
+        """Add vectors, replacing any already stored under the same ids."""
+        vectors = _normalize(vectors)
+        if len(ids) != len(vectors):
+            raise ValueError(f"{len(ids)} ids for {len(vectors)} vectors")
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self._vectors = np.zeros((0, self.dim), dtype=np.float32)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected vectors of dimension {self.dim}, got {vectors.shape[1]}")
+            assignments = self._assign(vectors) if self.is_trained else np.zeros(len(ids), dtype=np.int32)
+            new_ids, new_rows = [], []
+            # The last vector given for an id wins
+            latest = {item_id: i for i, item_id in enumerate(ids)}
+            for item_id, i in latest.items():
+                slot = self._slots.get(item_id)
+                if slot is None:
+                    self._slots[item_id] = len(self._ids) + len(new_ids)
+                    new_ids.append(item_id)
+                    new_rows.append(i)
+                else:
+                    self._vectors[slot] = vectors[i]
+                    self._assignments[slot] = assignments[i]
+            if new_ids:
+                self._ids.extend(new_ids)
+                self._vectors = np.concatenate([self._vectors, vectors[new_rows]])
+                self._assignments = np.concatenate([self._assignments, assignments[new_rows]])
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Remove vectors by id.
+
+        Returns:
+            Number of vectors removed
+        """
+        removed = 0
+        with self._lock:
+            for item_id in ids:
+                slot = self._slots.pop(item_id, None)
+                if slot is None:
+                    continue
+                # Move the last vector into the freed slot to keep storage contiguous
+                last = len(self._ids) - 1
+                if slot != last:
+                    moved = self._ids[last]
+                    self._ids[slot] = moved
+                    self._slots[moved] = slot
+                    self._vectors[slot] = self._vectors[last]
+                    self._assignments[slot] = self._assignments[last]
+                self._ids.pop()
+                removed += 1
+            if removed:
+                self._vectors = self._vectors[:len(self._ids)].copy()
+                self._assignments = self._assignments[:len(self._ids)].copy()
+        return removed
+
+    def train(self, nlist: Optional[int] = None, iterations: int = 10):
+        """Partition the stored vectors with spherical k-means.
+
+        Args:
+            nlist: Number of partitions (defaults to about the square root of the size)
+            iterations: k-means iterations
+        """
+        with self._lock:
+            count = len(self._ids)
+            if count == 0:
+                return
+            nlist = min(count, nlist or max(1, int(np.sqrt(count))))
+            rng = np.random.default_rng(self.seed)
+            centroids = self._vectors[rng.choice(count, nlist, replace=False)].copy()
+            for _ in range(iterations):
+                assignments = self._assign(self._vectors, centroids)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assignments, self._vectors)
+                counts = np.bincount(assignments, minlength=nlist)
+                empty = counts == 0
+                # Reseed empty partitions with random vectors
+                sums[empty] = self._vectors[rng.choice(count, int(empty.sum()))]
+                centroids = _normalize(sums)
+            self._centroids = centroids
+            self._assignments = self._assign(self._vectors)
+            self._trained_size = count
+            logger.info(f"Trained vector index: {count} vectors in {nlist} partitions")
+
+    def _assign(self, vectors: np.ndarray, centroids: Optional[np.ndarray] = None) -> np.ndarray:
+        centroids = self._centroids if centroids is None else centroids
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), _CHUNK):
+            block = vectors[start:start + _CHUNK]
+            assignments[start:start + _CHUNK] = np.argmax(block @ centroids.T, axis=1)
+        return assignments
+
+    def search(self, queries: np.ndarray, k: int = 10, exact: bool = False,
+               ids: Optional[Iterable[str]] = None) -> Union[List[Tuple[str, float]], List[List[Tuple[str, float]]]]:
+        """Find the stored vectors most similar to each query.
+
+        Args:
+            queries: One query vector, or a 2-D array of query vectors
+            k: Results per query
+            exact: Score every stored vector instead of the probed partitions
+            ids: Only return these stored ids (unknown ids are ignored)
+
+        Returns:
+            ``(id, cosine similarity)`` pairs, best first; a list of them per
+            query when ``queries`` is 2-D
+        """
+        single = np.asarray(queries).ndim == 1
+        queries = _normalize(queries)
+        with self._lock:
+            allowed = None
+            if ids is not None:
+                allowed = np.array(sorted({self._slots[i] for i in ids if i in self._slots}), dtype=np.int64)
+            if not self._ids or k <= 0 or (allowed is not None and not len(allowed)):
+                return [] if single else [[] for _ in queries]
+            if not exact and len(self._ids) >= self.min_train_size and len(self._ids) > 2 * self._trained_size:
+                # Partition once the index is large enough, and again when it has doubled
+                self.train()
+            if exact or not self.is_trained:
+                slots = np.arange(len(self._ids)) if allowed is None else allowed
+                self._stats['exact_queries'] += len(queries)
+                self._stats['vectors_scored'] += len(queries) * len(slots)
+                scores = queries @ self._vectors[slots].T
+                results = [self._results(row, slots, k) for row in scores]
+            else:
+                results = [self._search_ivf(query, k, allowed) for query in queries]
+        return results[0] if single else results
+
+    def _search_ivf(self, query: np.ndarray, k: int, allowed: Optional[np.ndarray] = None) -> List[Tuple[str, float]]:
+        probed = _top_k(self._centroids @ query, min(self.nprobe, len(self._centroids)))
+        if allowed is None:
+            candidates = np.flatnonzero(np.isin(self._assignments, probed))
+        else:
+            candidates = allowed[np.isin(self._assignments[allowed], probed)]
+        if len(candidates) < k:
+            candidates = np.arange(len(self._ids)) if allowed is None else allowed
+            self._stats['exact_queries'] += 1
+        else:
+            self._stats['ivf_queries'] += 1
+        self._stats['vectors_scored'] += len(candidates)
+        return self._results(self._vectors[candidates] @ query, candidates, k)
+
+    def _results(self, scores: np.ndarray, slots: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        return [(self._ids[slots[i]], float(scores[i])) for i in _top_k(scores, k)]
+
+    def get_vector(self, item_id: str) -> Optional[np.ndarray]:
+        with self._lock:
+            slot = self._slots.get(item_id)
+            return None if slot is None else self._vectors[slot].copy()
+
+    def save(self, path: str):
+        """Write the index to ``path`` (an .npz file), replacing it atomically."""
+        with self._lock:
+            arrays = {
+                'vectors': self._vectors,
+                'ids': np.array(self._ids, dtype=str),
+                'assignments': self._assignments,
+                'params': np.array([self.dim or 0, self.nprobe, self.min_train_size, self.seed, self._trained_size]),
+            }
+            if self._centroids is not None:
+                arrays['centroids'] = self._centroids
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "VectorIndex":
+        """Read an index written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            dim, nprobe, min_train_size, seed, trained_size = (int(v) for v in data['params'])
+            index = cls(dim=dim or None, nprobe=nprobe, min_train_size=min_train_size, seed=seed)
+            index._vectors = data['vectors'].astype(np.float32)
+            index._ids = [str(item_id) for item_id in data['ids']]
+            index._slots = {item_id: slot for slot, item_id in enumerate(index._ids)}
+            index._assignments = data['assignments'].astype(np.int32)
+            index._centroids = data['centroids'] if 'centroids' in data.files else None
+            index._trained_size = trained_size
+        return index
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with size, partitioning and the number of vectors scored by queries
+        """
+        with self._lock:
+            return {
+                'vectors': len(self._ids),
+                'dim': self.dim,
+                'partitions': 0 if self._centroids is None else len(self._centroids),
+                'nprobe': self.nprobe,
+                **self._stats
+            }
+
+# Example usage:
+# index = VectorIndex()
+# index.add(job_ids, engine.encode(job_texts))
+# index.search(engine.encode([resume_text])[0], k=300)
+# index.save("job_index.npz")
@@ -1,6 +1,7 @@
 import requests
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
+from tpm_job_finder_poc.job_aggregator.services.http_client import SYNC_TIMEOUT, get_http_client
 
 class AdzunaConnector:
     source = "adzuna"
@@ -12,20 +13,31 @@ class AdzunaConnector:
         self.base_url = f"http://api.adzuna.com/v1/api/jobs/{country}/search/1"
 
     def fetch_since(self, since: datetime) -> List[Dict]:
-        params = {
+        resp = requests.get(self.base_url, params=self._params(since), timeout=SYNC_TIMEOUT)
+        resp.raise_for_status()
+        return self._parse_jobs(resp.json())
+
+    async def fetch(self, since: Optional[datetime] = None, client=None) -> List[Dict]:
+        """Async fetch over the shared pooled HTTP client (defaults to the last 7 days)."""
+        client = client or get_http_client()
+        since = since or datetime.now() - timedelta(days=7)
+        return self._parse_jobs(await client.get_json(self.base_url, params=self._params(since)))
+
+    def _params(self, since: datetime) -> Dict:
+        return {
             "app_id": self.app_id,
             "app_key": self.app_key,
             "results_per_page": 50,
             "what": "technical program manager",
-            "max_days_old": (datetime.now() - since).days,
+            "max_days_old": (datetime.now(since.tzinfo) - since).days,
             "sort_by": "date",
             "salary_include_unknown": 1,
             "content-type": "application/json"
         }
-        resp = requests.get(self.base_url, params=params)
-        resp.raise_for_status()
+
+    def _parse_jobs(self, data: Dict) -> List[Dict]:
         jobs = []
-        for result in resp.json().get("results", []):
+        for result in data.get("results", []):
             jobs.append({
                 "title": result.get("title"),
                 "company": result.get("company", {}).get("display_name"),
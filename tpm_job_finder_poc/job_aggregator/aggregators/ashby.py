@@ -1,19 +1,37 @@
 import requests
 from tpm_job_finder_poc.job_normalizer.jobs.schema import JobPosting
+from tpm_job_finder_poc.job_aggregator.services.http_client import SYNC_TIMEOUT, get_http_client
 
 class AshbyConnector:
     API_URL_PATTERN = "https://api.ashbyhq.com/posting-api/job-board/{board_name}?includeCompensation=true"
 
-    def __init__(self, board_name):
+    def __init__(self, board_name, checkpoints=None):
         self.board_name = board_name
+        # Optional BoardCheckpointStore; when set only new/changed postings are returned
+        self.checkpoints = checkpoints
 
     def fetch_jobs(self):
         url = self.API_URL_PATTERN.format(board_name=self.board_name)
-        resp = requests.get(url)
+        resp = requests.get(url, timeout=SYNC_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        return self._parse_jobs(resp.json())
+
+    async def fetch(self, since=None, client=None):
+        """Async fetch over the shared pooled HTTP client."""
+        client = client or get_http_client()
+        url = self.API_URL_PATTERN.format(board_name=self.board_name)
+        return self._parse_jobs(await client.get_json(url))
+
+    def _parse_jobs(self, data):
         jobs = []
-        for item in data.get("jobs", []):
+        items = data.get("jobs", [])
+        if self.checkpoints is not None:
+            items = self.checkpoints.changed_items(
+                "ashby", self.board_name, data, items,
+                id_of=lambda item: item.get("id") or item.get("jobUrl"),
+                published_of=lambda item: item.get("publishedAt")
+            )
+        for item in items:
                 # Parse publishedAt to datetime
                 from datetime import datetime, timezone
                 published_at = item.get("publishedAt")
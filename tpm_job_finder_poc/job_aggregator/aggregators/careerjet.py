@@ -1,9 +1,12 @@
 """Careerjet API connector for international job aggregation."""
 
+import asyncio
 import logging
 import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+
+from tpm_job_finder_poc.job_aggregator.services.http_client import get_http_client
 # Lazy imports for performance
 # import pycountry
 # from forex_python.converter import CurrencyRates
@@ -17,6 +20,16 @@ class CareerjetConnector:
     
     source = "careerjet"
     
+    # Search terms relevant to TPM roles
+    SEARCH_TERMS = [
+        "technical program manager",
+        "senior technical program manager", 
+        "principal technical program manager",
+        "TPM",
+        "program manager",
+        "technical project manager"
+    ]
+    
     # Supported Careerjet locales mapped to regions
     LOCALE_REGIONS = {
         # North America
@@ -81,15 +94,17 @@ class CareerjetConnector:
         "fr_MA": {"region": "Africa", "country": "MA", "currency": "MAD"},
     }
     
-    def __init__(self, affiliate_id: str, locales: Optional[List[str]] = None):
+    def __init__(self, affiliate_id: str, locales: Optional[List[str]] = None, max_concurrency: int = 4):
         """Initialize Careerjet connector.
         
         Args:
             affiliate_id: Careerjet affiliate ID for API access
             locales: List of locales to search (defaults to major English-speaking markets)
+            max_concurrency: Search requests in flight at once in ``fetch``
         """
         self.affiliate_id = affiliate_id
         self.locales = locales or ["en_US", "en_GB", "en_CA", "en_AU", "en_SG"]
+        self.max_concurrency = max_concurrency
         self.currency_converter = None  # Lazy initialization for performance
         
         # Base URLs for different locales
@@ -210,6 +225,66 @@ class CareerjetConnector:
         logger.info(f"Total Careerjet jobs fetched: {len(all_jobs)}")
         return all_jobs
     
+    async def fetch(self, since: Optional[datetime] = None, client=None) -> List[Dict]:
+        """Async variant of fetch_since over the shared pooled HTTP client.
+        
+        Locale/search-term requests are issued concurrently, at most
+        ``max_concurrency`` at a time, instead of one blocking request at a time.
+        
+        Args:
+            since: Fetch jobs posted after this datetime (defaults to 7 days ago)
+            client: Optional SharedHTTPClient; defaults to the process-wide one
+            
+        Returns:
+            List of job dictionaries with standardized format
+        """
+        client = client or get_http_client()
+        since = since or datetime.now() - timedelta(days=7)
+        requests_to_make = [
+            (locale, search_term)
+            for locale in self.locale_urls.keys()
+            for search_term in self.SEARCH_TERMS
+        ]
+        limit = asyncio.Semaphore(self.max_concurrency)
+        
+        async def search(locale: str, search_term: str) -> Dict:
+            async with limit:
+                return await client.get_json('http://public-api.careerjet.com/search',
+                                             params=self._search_params(locale, search_term))
+                
+        results = await asyncio.gather(*(
+            search(locale, search_term) for locale, search_term in requests_to_make
+        ), return_exceptions=True)
+        
+        all_jobs = []
+        for (locale, search_term), result in zip(requests_to_make, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error searching Careerjet for '{search_term}' in {locale}: {result}")
+                continue
+            if result.get('type') == 'JOBS':
+                region_info = self.LOCALE_REGIONS[locale]
+                for job_data in result.get('jobs', []):
+                    job = self._normalize_job(job_data, locale, region_info, search_term)
+                    if job and self._is_recent_job(job, since):
+                        all_jobs.append(job)
+                        
+        logger.info(f"Total Careerjet jobs fetched: {len(all_jobs)}")
+        return all_jobs
+    
+    def _search_params(self, locale: str, search_term: str) -> Dict:
+        """Query parameters for a date-sorted global search within a locale."""
+        return {
+            'keywords': search_term,
+            'location': '',  # Global search within locale
+            'affid': self.affiliate_id,
+            'user_ip': '11.22.33.44',  # Required by API
+            'user_agent': 'Mozilla/5.0 (TPM Job Finder)',
+            'pagesize': 50,  # Maximum results per page
+            'page': 1,
+            'sort': 'date',  # Sort by posting date
+            'locale_code': locale
+        }
+    
     def _fetch_jobs_for_locale(self, locale: str, since: datetime) -> List[Dict]:
         """Fetch jobs for a specific locale.
         
@@ -223,37 +298,12 @@ class CareerjetConnector:
         jobs = []
         region_info = self.LOCALE_REGIONS[locale]
         
-        # Search terms relevant to TPM roles
-        search_terms = [
-            "technical program manager",
-            "senior technical program manager", 
-            "principal technical program manager",
-            "TPM",
-            "program manager",
-            "technical project manager"
-        ]
-        
-        for search_term in search_terms:
+        for search_term in self.SEARCH_TERMS:
             try:
-                # Calculate days since for API parameter
-                days_old = max(1, (datetime.now() - since).days)
-                
                 # Make HTTP request to Careerjet API
-                params = {
-                    'keywords': search_term,
-                    'location': '',  # Global search within locale
-                    'affid': self.affiliate_id,
-                    'user_ip': '11.22.33.44',  # Required by API
-                    'user_agent': 'Mozilla/5.0 (TPM Job Finder)',
-                    'pagesize': 50,  # Maximum results per page
-                    'page': 1,
-                    'sort': 'date',  # Sort by posting date
-                    'locale_code': locale
-                }
-                
                 response = requests.get(
                     'http://public-api.careerjet.com/search',
-                    params=params,
+                    params=self._search_params(locale, search_term),
                     timeout=30
                 )
                 response.raise_for_status()
@@ -1,7 +1,8 @@
 import http.client
 import json
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+from tpm_job_finder_poc.job_aggregator.services.http_client import SYNC_TIMEOUT, get_http_client
 
 class JoobleConnector:
     source = "jooble"
@@ -11,28 +12,42 @@ class JoobleConnector:
         self.host = "jooble.org"
 
     def fetch_since(self, since: datetime) -> List[Dict]:
-        connection = http.client.HTTPSConnection(self.host)
+        connection = http.client.HTTPSConnection(self.host, timeout=SYNC_TIMEOUT[1])
         headers = {"Content-type": "application/json"}
-        body = json.dumps({
+        body = json.dumps(self._query())
+        connection.request("POST", f"/api/{self.api_key}", body, headers)
+        response = connection.getresponse()
+        if response.status == 200:
+            return self._parse_jobs(json.loads(response.read().decode()))
+        return []
+
+    async def fetch(self, since: Optional[datetime] = None, client=None) -> List[Dict]:
+        """Async fetch over the shared pooled HTTP client."""
+        client = client or get_http_client()
+        response = await client.post(f"https://{self.host}/api/{self.api_key}", json=self._query())
+        if response.status_code == 200:
+            return self._parse_jobs(response.json())
+        return []
+
+    def _query(self) -> Dict:
+        return {
             "keywords": "technical program manager",
             "location": "United States",
             "page": 1
-        })
-        connection.request("POST", f"/api/{self.api_key}", body, headers)
-        response = connection.getresponse()
+        }
+
+    def _parse_jobs(self, data: Dict) -> List[Dict]:
         jobs = []
-        if response.status == 200:
-            data = json.loads(response.read().decode())
-            for job in data.get("jobs", []):
-                jobs.append({
-                    "title": job.get("title"),
-                    "company": job.get("company"),
-                    "location": job.get("location"),
-                    "posted_date": job.get("updated"),
-                    "canonical_url": job.get("link"),
-                    "source_site": self.source,
-                    "salary_min": None,
-                    "salary_max": None,
-                    "description": job.get("snippet"),
-                })
+        for job in data.get("jobs", []):
+            jobs.append({
+                "title": job.get("title"),
+                "company": job.get("company"),
+                "location": job.get("location"),
+                "posted_date": job.get("updated"),
+                "canonical_url": job.get("link"),
+                "source_site": self.source,
+                "salary_min": None,
+                "salary_max": None,
+                "description": job.get("snippet"),
+            })
         return jobs
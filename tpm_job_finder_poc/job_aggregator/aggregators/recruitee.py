@@ -1,5 +1,6 @@
 import requests
 from tpm_job_finder_poc.job_normalizer.jobs.schema import JobPosting
+from tpm_job_finder_poc.job_aggregator.services.http_client import SYNC_TIMEOUT, get_http_client
 
 class RecruiteeConnector:
     API_URL_PATTERN = "https://{subdomain}.recruitee.com/api/offers/"
@@ -9,9 +10,17 @@ class RecruiteeConnector:
 
     def fetch_jobs(self):
         url = self.API_URL_PATTERN.format(subdomain=self.subdomain)
-        resp = requests.get(url)
+        resp = requests.get(url, timeout=SYNC_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        return self._parse_jobs(resp.json())
+
+    async def fetch(self, since=None, client=None):
+        """Async fetch over the shared pooled HTTP client."""
+        client = client or get_http_client()
+        url = self.API_URL_PATTERN.format(subdomain=self.subdomain)
+        return self._parse_jobs(await client.get_json(url))
+
+    def _parse_jobs(self, data):
         jobs = []
         from datetime import datetime, timezone
         for item in data.get("offers", []):
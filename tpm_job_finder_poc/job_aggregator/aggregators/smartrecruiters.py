@@ -1,47 +1,76 @@
+import asyncio
 import requests
 from tpm_job_finder_poc.job_normalizer.jobs.schema import JobPosting
+from tpm_job_finder_poc.job_aggregator.services.http_client import SYNC_TIMEOUT, get_http_client
 
 class SmartRecruitersConnector:
     API_URL_PATTERN = "https://api.smartrecruiters.com/v1/companies/{company}/postings?limit=20&offset=0"
     JOB_DETAILS_URL = "https://api.smartrecruiters.com/v1/companies/{company}/postings/{postingId}"
 
-    def __init__(self, company):
+    def __init__(self, company, checkpoints=None):
         self.company = company
+        # Optional BoardCheckpointStore; when set only new/changed postings are
+        # returned and unchanged postings skip the per-posting details request
+        self.checkpoints = checkpoints
 
     def fetch_jobs(self):
         url = self.API_URL_PATTERN.format(company=self.company)
-        resp = requests.get(url)
+        resp = requests.get(url, timeout=SYNC_TIMEOUT)
         resp.raise_for_status()
         data = resp.json()
         jobs = []
-        for item in data.get("content", []):
+        for item in self._changed_items(data):
             posting_id = item.get("id")
             details_url = self.JOB_DETAILS_URL.format(company=self.company, postingId=posting_id)
-            details_resp = requests.get(details_url)
+            details_resp = requests.get(details_url, timeout=SYNC_TIMEOUT)
             details_resp.raise_for_status()
-            details = details_resp.json()
-            job_ad = details.get("jobAd", {}).get("sections", {})
-            description = job_ad.get("jobDescription", {}).get("text", "")
-            # Parse createdOn to datetime
-            from datetime import datetime, timezone
-            created_on = item.get("createdOn")
-            if created_on:
-                try:
-                    date_posted = datetime.fromisoformat(created_on.replace("Z", "+00:00"))
-                except Exception:
-                    date_posted = datetime.now(timezone.utc)
-            else:
-                date_posted = datetime.now(timezone.utc)
-            jobs.append(JobPosting(
-                id=posting_id,
-                source="smartrecruiters",
-                company=self.company,
-                title=item.get("name"),
-                location=item.get("location", {}).get("city"),
-                salary=None,
-                url=item.get("applyUrl"),
-                date_posted=date_posted,
-                raw=details,
-                description=description
-            ))
+            jobs.append(self._parse_job(item, details_resp.json()))
         return jobs
+
+    async def fetch(self, since=None, client=None):
+        """Async fetch over the shared pooled HTTP client; posting details are fetched concurrently."""
+        client = client or get_http_client()
+        data = await client.get_json(self.API_URL_PATTERN.format(company=self.company))
+        items = self._changed_items(data)
+        details = await asyncio.gather(*(
+            client.get_json(self.JOB_DETAILS_URL.format(company=self.company, postingId=item.get("id")))
+            for item in items
+        ))
+        return [self._parse_job(item, detail) for item, detail in zip(items, details)]
+
+    def _changed_items(self, data):
+        items = data.get("content", [])
+        if self.checkpoints is None:
+            return items
+        return self.checkpoints.changed_items(
+            "smartrecruiters", self.company, data, items,
+            id_of=lambda item: item.get("id"),
+            published_of=lambda item: item.get("releasedDate") or item.get("createdOn")
+        )
+
+    def _parse_job(self, item, details):
+        posting_id = item.get("id")
+        job_ad = details.get("jobAd", {}).get("sections", {})
+        description = job_ad.get("jobDescription", {}).get("text", "")
+        # Parse createdOn to datetime
+        from datetime import datetime, timezone
+        created_on = item.get("createdOn")
+        if created_on:
+            try:
+                date_posted = datetime.fromisoformat(created_on.replace("Z", "+00:00"))
+            except Exception:
+                date_posted = datetime.now(timezone.utc)
+        else:
+            date_posted = datetime.now(timezone.utc)
+        return JobPosting(
+            id=posting_id,
+            source="smartrecruiters",
+            company=self.company,
+            title=item.get("name"),
+            location=item.get("location", {}).get("city"),
+            salary=None,
+            url=item.get("applyUrl"),
+            date_posted=date_posted,
+            raw=details,
+            description=description
+        )
@@ -1,6 +1,7 @@
 import requests
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+from tpm_job_finder_poc.job_aggregator.services.http_client import SYNC_TIMEOUT, get_http_client
 
 class USAJobsConnector:
     source = "usajobs"
@@ -11,19 +12,32 @@ class USAJobsConnector:
         self.base_url = "https://data.usajobs.gov/api/Search"
 
     def fetch_since(self, since: datetime) -> List[Dict]:
-        headers = {
+        resp = requests.get(self.base_url, headers=self._headers(), params=self._params(), timeout=SYNC_TIMEOUT)
+        resp.raise_for_status()
+        return self._parse_jobs(resp.json())
+
+    async def fetch(self, since: Optional[datetime] = None, client=None) -> List[Dict]:
+        """Async fetch over the shared pooled HTTP client."""
+        client = client or get_http_client()
+        data = await client.get_json(self.base_url, headers=self._headers(), params=self._params())
+        return self._parse_jobs(data)
+
+    def _headers(self) -> Dict:
+        return {
             "User-Agent": self.user_agent,
             "Authorization-Key": self.api_key
         }
-        params = {
+
+    def _params(self) -> Dict:
+        return {
             "Keyword": "Technical Program Manager",
             "ResultsPerPage": 50,
             "WhoMayApply": "all"
         }
-        resp = requests.get(self.base_url, headers=headers, params=params)
-        resp.raise_for_status()
+
+    def _parse_jobs(self, data: Dict) -> List[Dict]:
         jobs = []
-        for item in resp.json().get("SearchResult", {}).get("SearchResultItems", []):
+        for item in data.get("SearchResult", {}).get("SearchResultItems", []):
             desc = item.get("MatchedObjectDescriptor", {})
             jobs.append({
                 "title": desc.get("PositionTitle"),
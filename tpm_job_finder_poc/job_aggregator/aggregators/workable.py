@@ -1,20 +1,37 @@
 import requests
 from tpm_job_finder_poc.job_normalizer.jobs.schema import JobPosting
+from tpm_job_finder_poc.job_aggregator.services.http_client import SYNC_TIMEOUT, get_http_client
 
 class WorkableConnector:
     API_URL_PATTERN = "https://api.workable.com/api/accounts/{subdomain}"
 
-    def __init__(self, subdomain):
+    def __init__(self, subdomain, checkpoints=None):
         self.subdomain = subdomain
+        # Optional BoardCheckpointStore; when set only new/changed postings are returned
+        self.checkpoints = checkpoints
 
     def fetch_jobs(self):
         url = self.API_URL_PATTERN.format(subdomain=self.subdomain)
-        resp = requests.get(url)
+        resp = requests.get(url, timeout=SYNC_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        return self._parse_jobs(resp.json())
+
+    async def fetch(self, since=None, client=None):
+        """Async fetch over the shared pooled HTTP client."""
+        client = client or get_http_client()
+        url = self.API_URL_PATTERN.format(subdomain=self.subdomain)
+        return self._parse_jobs(await client.get_json(url))
+
+    def _parse_jobs(self, data):
         jobs = []
         from datetime import datetime, timezone
-        for item in data.get("jobs", []):
+        items = data.get("jobs", [])
+        if self.checkpoints is not None:
+            items = self.checkpoints.changed_items(
+                "workable", self.subdomain, data, items,
+                id_of=lambda item: item.get("shortcode")
+            )
+        for item in items:
             # Use current UTC time if no date is provided
             date_posted = datetime.now(timezone.utc)
             jobs.append(JobPosting(
@@ -7,16 +7,18 @@ consolidates results for processing pipeline.
 
 import logging
 import asyncio
+import inspect
+import os
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from .aggregators import (
     RemoteOKConnector, GreenhouseConnector, LeverConnector,
     AshbyConnector, WorkableConnector, SmartRecruitersConnector
 )
+from ..cache.board_checkpoints import BoardCheckpointStore
 from ..cache.dedupe_cache import DedupeCache
+from ..cache.near_duplicates import NearDuplicateDetector
 from ..models.job import Job
 
 logger = logging.getLogger(__name__)
@@ -38,7 +40,9 @@ class JobAggregatorService:
             config: Configuration dictionary for aggregators and scrapers
         """
         self.config = config or {}
-        self.dedupe_cache = DedupeCache()
+        self.dedupe_cache = DedupeCache(persistent=True, use_bloom_filter=True)
+        self._init_near_duplicate_detector()
+        self._init_board_checkpoints()
         
         # Initialize API-based aggregators
         self._init_api_aggregators()
@@ -46,6 +50,41 @@ class JobAggregatorService:
         # Initialize browser scrapers (scraping_service_v2)
         self._init_browser_scrapers()
         
+    def _init_near_duplicate_detector(self):
+        """Initialize cross-source near-duplicate folding.
+
+        Configured via ``config['near_dedupe']``: ``enabled`` (default True),
+        ``threshold``, ``retention_days`` (postings older than this are pruned at
+        the start of each run) and ``db_path`` to check each run against an
+        on-disk index of recent postings instead of only in-process.
+        """
+        near_cfg = self.config.get('near_dedupe', {})
+        self.near_duplicate_detector = None
+        self.last_near_duplicates = []
+        if near_cfg.get('enabled', True):
+            self.near_duplicate_detector = NearDuplicateDetector(
+                threshold=near_cfg.get('threshold', 0.8),
+                db_path=near_cfg.get('db_path'),
+                retention_days=near_cfg.get('retention_days', 14)
+            )
+        
+    def _init_board_checkpoints(self):
+        """Initialize per-board high-water marks for incremental ATS fetches.
+
+        Opt-in via ``config['incremental_fetch']``: ``enabled`` (default False)
+        and ``db_path`` (default ``board_checkpoints.db`` next to the configured
+        ``output.path``). Checkpoints are only committed once a run has
+        deduplicated its jobs.
+        """
+        incremental_cfg = self.config.get('incremental_fetch', {})
+        self.board_checkpoints = None
+        if incremental_cfg.get('enabled', False):
+            db_path = incremental_cfg.get('db_path')
+            if not db_path:
+                output_path = self.config.get('output', {}).get('path', './output/jobs.xlsx')
+                db_path = os.path.join(os.path.dirname(output_path) or '.', 'board_checkpoints.db')
+            self.board_checkpoints = BoardCheckpointStore(db_path)
+        
     def _init_api_aggregators(self):
         """Initialize all API-based job aggregators."""
         self.api_aggregators = {
@@ -58,16 +97,24 @@ class JobAggregatorService:
             'lever': LeverConnector(
                 companies=self.config.get('lever_companies', [])
             ),
-            'ashby': AshbyConnector('default'),
-            'workable': WorkableConnector('default'),
-            'smartrecruiters': SmartRecruitersConnector('default')
+            'ashby': AshbyConnector('default', checkpoints=self.board_checkpoints),
+            'workable': WorkableConnector('default', checkpoints=self.board_checkpoints),
+            'smartrecruiters': SmartRecruitersConnector('default', checkpoints=self.board_checkpoints)
         }
         logger.info(f"Initialized {len(self.api_aggregators)} API aggregators")
         
     def _init_browser_scrapers(self):
-        """Initialize browser-based scrapers."""
+        """Initialize browser-based scrapers.
+
+        Scrapers lease warm Chrome sessions from a shared ``BrowserPool``
+        configured via ``config['browser_pool']`` (``size``,
+        ``max_pages_per_session``, ``max_idle_seconds``), so a run does not pay
+        a browser cold start per scraper.
+        """
+        self.browser_pool = None
         try:
             from tpm_job_finder_poc.scraping_service import registry
+            from tpm_job_finder_poc.scraping_service.scrapers.browser_pool import BrowserPool
             
             # Register default scrapers if not already done
             registry.register_default_scrapers()
@@ -85,6 +132,16 @@ class JobAggregatorService:
                 if scraper is not None
             }
             
+            pool_cfg = self.config.get('browser_pool', {})
+            self.browser_pool = BrowserPool(
+                size=pool_cfg.get('size', 2),
+                max_pages_per_session=pool_cfg.get('max_pages_per_session', 50),
+                max_idle_seconds=pool_cfg.get('max_idle_seconds', 300.0)
+            )
+            for scraper in self.browser_scrapers.values():
+                if hasattr(scraper, 'use_browser_pool'):
+                    scraper.use_browser_pool(self.browser_pool)
+            
             logger.info(f"Initialized {len(self.browser_scrapers)} browser scrapers")
             
         except Exception as e:
@@ -106,6 +163,10 @@ class JobAggregatorService:
         """
         logger.info("Starting daily job aggregation process")
         
+        # Postings past the retention window no longer count as duplicates
+        if self.near_duplicate_detector is not None:
+            self.near_duplicate_detector.prune()
+            
         all_jobs = []
         
         # Step 1: Collect from API aggregators
@@ -123,6 +184,10 @@ class JobAggregatorService:
         # Step 3: Deduplicate and normalize
         deduplicated_jobs = self._deduplicate_jobs(all_jobs)
         
+        # Boards fetched this run only count as seen once their jobs made it through
+        if self.board_checkpoints is not None:
+            self.board_checkpoints.commit()
+        
         # Step 4: Enrich with metadata
         enriched_jobs = self._enrich_job_data(deduplicated_jobs)
         
@@ -133,49 +198,61 @@ class JobAggregatorService:
     async def _collect_from_api_aggregators(self, 
                                           search_params: Dict[str, Any],
                                           max_jobs: int) -> List[Dict[str, Any]]:
-        """Collect jobs from all API-based aggregators."""
-        jobs = []
+        """Collect jobs from all API-based aggregators.
         
-        # Use ThreadPoolExecutor for parallel API calls
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_source = {}
-            
-            for source_name, aggregator in self.api_aggregators.items():
-                try:
-                    if hasattr(aggregator, 'fetch_jobs'):
-                        future = executor.submit(
-                            aggregator.fetch_jobs, 
-                            **search_params
-                        )
-                        future_to_source[future] = source_name
-                    elif hasattr(aggregator, 'fetch_since'):
-                        # For simple connectors that just fetch recent jobs
-                        future = executor.submit(
-                            aggregator.fetch_since,
-                            days=1  # Daily aggregation
-                        )
-                        future_to_source[future] = source_name
-                        
-                except Exception as e:
-                    logger.error(f"Error setting up {source_name} aggregation: {e}")
-                    
-            # Collect results
-            for future in as_completed(future_to_source):
-                source_name = future_to_source[future]
-                try:
-                    source_jobs = future.result(timeout=30)  # 30 second timeout
-                    
-                    # Normalize job data format
-                    normalized_jobs = self._normalize_api_jobs(source_jobs, source_name)
-                    jobs.extend(normalized_jobs[:max_jobs])  # Limit per source
-                    
-                    logger.info(f"{source_name}: collected {len(normalized_jobs)} jobs")
-                    
-                except Exception as e:
-                    logger.error(f"Error collecting from {source_name}: {e}")
-                    
+        Connectors exposing an async ``fetch`` coroutine run concurrently on the
+        event loop over the shared pooled HTTP client; legacy synchronous
+        connectors are moved to worker threads so they never block the loop.
+        """
+        since = datetime.now(timezone.utc) - timedelta(days=1)  # Daily aggregation
+        source_names = list(self.api_aggregators.keys())
+        
+        results = await asyncio.gather(*(
+            asyncio.wait_for(
+                self._fetch_from_api_aggregator(aggregator, search_params, since),
+                timeout=30  # 30 second timeout
+            )
+            for aggregator in self.api_aggregators.values()
+        ), return_exceptions=True)
+        
+        jobs = []
+        for source_name, result in zip(source_names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error collecting from {source_name}: {result}")
+                continue
+            if result is None:
+                continue
+            try:
+                # Normalize job data format
+                normalized_jobs = self._normalize_api_jobs(result, source_name)
+                jobs.extend(normalized_jobs[:max_jobs])  # Limit per source
+                
+                logger.info(f"{source_name}: collected {len(normalized_jobs)} jobs")
+                
+            except Exception as e:
+                logger.error(f"Error collecting from {source_name}: {e}")
+                
         return jobs
         
+    async def _fetch_from_api_aggregator(self,
+                                         aggregator: Any,
+                                         search_params: Dict[str, Any],
+                                         since: datetime) -> Optional[List[Any]]:
+        """Fetch from one API aggregator without blocking the event loop."""
+        # Checked on the class so mocks without a real coroutine use the legacy path
+        if asyncio.iscoroutinefunction(getattr(type(aggregator), 'fetch', None)):
+            return await aggregator.fetch(since=since)
+        if hasattr(aggregator, 'fetch_jobs'):
+            result = await asyncio.to_thread(aggregator.fetch_jobs, **search_params)
+        elif hasattr(aggregator, 'fetch_since'):
+            # For simple connectors that just fetch recent jobs
+            result = await asyncio.to_thread(aggregator.fetch_since, days=1)
+        else:
+            return None
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+        
     async def _collect_from_browser_scrapers(self,
                                            search_params: Dict[str, Any], 
                                            max_jobs: int) -> List[Dict[str, Any]]:
@@ -221,12 +298,16 @@ class JobAggregatorService:
                 jobs.extend(normalized_jobs)
                 logger.info(f"{source_name}: collected {len(normalized_jobs)} jobs")
                 
-                # Cleanup scraper
-                await scraper.cleanup()
-                
             except Exception as e:
                 logger.error(f"Error scraping from {source_name}: {e}")
                 
+            finally:
+                # Cleanup scraper (pooled browsers are returned warm, not quit)
+                try:
+                    await scraper.cleanup()
+                except Exception as e:
+                    logger.warning(f"Error cleaning up {source_name} scraper: {e}")
+                
         return jobs
         
     def _normalize_api_jobs(self, jobs: List[Any], source: str) -> List[Dict[str, Any]]:
@@ -274,22 +355,42 @@ class JobAggregatorService:
         if not jobs:
             return []
             
-        # Use the existing dedupe cache
-        unique_jobs = []
-        
+        # Use the existing dedupe cache, resolving the whole batch in one query
+        # and recording the new keys in one transaction
+        keyed_jobs = {}
         for job in jobs:
             # Create a deduplication key
             dedupe_key = f"{job.get('company', '')}-{job.get('title', '')}-{job.get('location', '')}"
-            job_url = job.get('url', '')
-            
-            if not self.dedupe_cache.is_duplicate(dedupe_key, dedupe_key):
-                unique_jobs.append(job)
-                self.dedupe_cache.add(dedupe_key, dedupe_key)
+            keyed_jobs.setdefault((dedupe_key, dedupe_key, None), job)
+
+        new_keys = self.dedupe_cache.filter_new(keyed_jobs.keys())
+        self.dedupe_cache.add_many(new_keys)
+        self.dedupe_cache.save_filter()
+        unique_jobs = [keyed_jobs[key] for key in new_keys]
+
+        # Fold the same role syndicated by several sources with slightly different titles
+        if self.near_duplicate_detector is not None:
+            unique_jobs, self.last_near_duplicates = self.near_duplicate_detector.deduplicate(
+                unique_jobs, self._near_duplicate_fields
+            )
+            for match in self.last_near_duplicates:
+                logger.debug(f"Folded {match.key} into cluster {match.cluster_id} ({match.similarity:.2f})")
                 
         logger.info(f"Deduplicated {len(jobs)} jobs to {len(unique_jobs)} unique jobs")
         
         return unique_jobs
         
+    @staticmethod
+    def _near_duplicate_fields(job: Dict[str, Any]):
+        raw_data = job.get('raw_data')
+        description = job.get('description') or (raw_data.get('description') if isinstance(raw_data, dict) else None)
+        return (
+            str(job.get('url') or job.get('id')),
+            job.get('title'),
+            job.get('company'),
+            description if isinstance(description, str) else None
+        )
+        
     def _enrich_job_data(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add enrichment metadata to job postings."""
         for job in jobs:
@@ -347,6 +448,13 @@ class JobAggregatorService:
             'total_api_aggregators': len(self.api_aggregators),
             'total_browser_scrapers': len(self.browser_scrapers),
             'last_run': None,
+            'near_duplicates_last_run': len(self.last_near_duplicates),
+            'board_checkpoints': self.board_checkpoints.get_stats() if self.board_checkpoints else None,
+            'browser_pool': self.browser_pool.get_stats() if self.browser_pool else None,
+            'browser_fetch_paths': {
+                name: scraper.get_fetch_stats() for name, scraper in self.browser_scrapers.items()
+                if hasattr(scraper, 'get_fetch_stats')
+            },
             'api_aggregator_names': list(self.api_aggregators.keys()),
             'browser_scraper_names': list(self.browser_scrapers.keys())
         }
@@ -365,6 +473,11 @@ class JobAggregatorService:
             }
         }
     
+    async def close(self):
+        """Release long-lived resources (warm browser sessions)."""
+        if self.browser_pool is not None:
+            await self.browser_pool.close()
+    
     def get_enabled_sources(self) -> Dict[str, Any]:
         """Get list of enabled job sources."""
         return {
@@ -416,7 +529,10 @@ async def run_daily_job_search(search_params: Dict[str, Any],
     """
     aggregator = JobAggregatorService()
     
-    jobs = await aggregator.run_daily_aggregation(search_params)
+    try:
+        jobs = await aggregator.run_daily_aggregation(search_params)
+    finally:
+        await aggregator.close()
     
     if output_path:
         import json
@@ -1,7 +1,17 @@
-"""IP rotation and proxy validation utilities."""
+"""IP rotation and proxy validation utilities.
+
+Proxy selection is weighted by success rate and response time. Weights live in
+a Fenwick tree that is updated in O(log n) whenever a proxy's stats change, so
+``get_proxy`` samples in O(log n) instead of rebuilding a weight vector over
+the whole pool on every call. Each target domain that has reported outcomes
+gets its own tree, scaled by an EWMA of the proxy's success on that domain.
+Health probes share one HTTP session with bounded concurrency and can run in
+the background.
+"""
 
 import asyncio
-from typing import List, Dict, Optional, Set
+import heapq
+from typing import List, Dict, Optional, Set, Tuple
 import aiohttp
 import logging
 import json
@@ -12,6 +22,11 @@ import random
 
 logger = logging.getLogger(__name__)
 
+# Eligible proxies with no measured weight yet are drawn uniformly among themselves
+MIN_WEIGHT = 1e-9
+
+# Floating-point drift from incremental updates is cleared by a periodic rebuild
+REBUILD_EVERY = 10000
 @dataclass
 class ProxyStats:
     """Statistics for a proxy server."""
@@ -45,6 +60,88 @@ class ProxyStats:
             alpha = 0.1  # Smoothing factor
             self.avg_response_time = (1 - alpha) * self.avg_response_time + alpha * new_time
 
+class FenwickTree:
+    """Binary indexed tree over non-negative weights for O(log n) weighted sampling."""
+    
+    def __init__(self, weights: Optional[List[float]] = None):
+        self.values: List[float] = []
+        self._tree: List[float] = [0.0]
+        self._updates = 0
+        for weight in weights or []:
+            self.append(weight)
+            
+    def __len__(self) -> int:
+        return len(self.values)
+        
+    def _prefix(self, count: int) -> float:
+        """Sum of the first ``count`` weights."""
+        total = 0.0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+        
+    def append(self, weight: float):
+        """Add a weight at the end."""
+        self.values.append(weight)
+        n = len(self.values)
+        # Node n covers (n - lowbit(n), n]
+        self._tree.append(weight + self._prefix(n - 1) - self._prefix(n - (n & -n)))
+        
+    def set(self, index: int, weight: float):
+        """Replace the weight at ``index``."""
+        delta = weight - self.values[index]
+        if delta == 0:
+            return
+        self.values[index] = weight
+        self._updates += 1
+        if self._updates >= REBUILD_EVERY:
+            self.rebuild()
+            return
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+            
+    def rebuild(self):
+        """Recompute the tree from the stored weights in O(n)."""
+        tree = [0.0] + list(self.values)
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._updates = 0
+        
+    def total(self) -> float:
+        return self._prefix(len(self.values))
+        
+    def find(self, target: float) -> Optional[int]:
+        """Index of the weight whose cumulative range contains ``target``.
+        
+        Args:
+            target: Value in [0, total())
+            
+        Returns:
+            Index drawn with probability proportional to its weight, or None if all weights are zero
+        """
+        n = len(self.values)
+        position = 0
+        step = 1 << n.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= n and self._tree[nxt] <= target:
+                position = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        if position < n and self.values[position] > 0:
+            return position
+        # Rounding pushed the target past the end; take the last positive weight
+        for index in range(min(position, n - 1), -1, -1):
+            if self.values[index] > 0:
+                return index
+        return None
+
 class ProxyRotator:
     """Manages and rotates through proxy servers."""
     
@@ -53,7 +150,8 @@ class ProxyRotator:
         proxies: List[str],
         min_success_rate: float = 0.7,
         max_failures: int = 3,
-        ban_duration: int = 300  # 5 minutes
+        ban_duration: int = 300,  # 5 minutes
+        domain_alpha: float = 0.2
     ):
         """Initialize the proxy rotator.
         
@@ -62,93 +160,241 @@ class ProxyRotator:
             min_success_rate: Minimum success rate to keep using a proxy
             max_failures: Maximum consecutive failures before temporary ban
             ban_duration: How long to ban failing proxies (seconds)
+            domain_alpha: Smoothing factor of the per-domain success EWMA
         """
-        self.proxies = {proxy: ProxyStats(proxy) for proxy in proxies}
+        self.proxies: Dict[str, ProxyStats] = {}
         self.min_success_rate = min_success_rate
         self.max_failures = max_failures
         self.ban_duration = ban_duration
-        self.current_failures: Dict[str, int] = {proxy: 0 for proxy in proxies}
+        self.domain_alpha = domain_alpha
+        self.current_failures: Dict[str, int] = {}
+        # Selection index: slot per proxy ever added; removed proxies keep a zero-weight slot
+        self._slots: Dict[str, int] = {}
+        self._addresses: List[str] = []
+        self._tree = FenwickTree()
+        # domain -> proxy -> EWMA success on that domain (proxies start at 1.0)
+        self._domain_scores: Dict[str, Dict[str, float]] = {}
+        self._domain_trees: Dict[str, FenwickTree] = {}
+        self._bans: List[Tuple[datetime, str]] = []
+        self._prober: Optional[asyncio.Task] = None
+        for proxy in proxies:
+            self.add_proxy(proxy)
+            
+    def add_proxy(self, proxy: str):
+        """Add a proxy to the pool (it is selectable once it meets ``min_success_rate``)."""
+        if proxy in self.proxies:
+            return
+        self.proxies[proxy] = ProxyStats(proxy)
+        self.current_failures[proxy] = 0
+        if proxy not in self._slots:
+            self._slots[proxy] = len(self._addresses)
+            self._addresses.append(proxy)
+            self._tree.append(0.0)
+            for tree in self._domain_trees.values():
+                tree.append(0.0)
+        self._refresh(proxy)
         
-    async def validate_proxies(self, test_url: str = "https://api.ipify.org?format=json"):
-        """Test all proxies and remove invalid ones.
+    def remove_proxy(self, proxy: str):
+        """Drop a proxy from the pool."""
+        if self.proxies.pop(proxy, None) is None:
+            return
+        self.current_failures.pop(proxy, None)
+        self._refresh(proxy)
+        
+    def _weight(self, proxy: str) -> float:
+        """Selection weight from success rate and response time; 0 if unavailable."""
+        stats = self.proxies.get(proxy)
+        if stats is None or stats.is_banned or stats.success_rate < self.min_success_rate:
+            return 0.0
+        # Normalize response time (lower is better)
+        response_score = 1.0 / (stats.avg_response_time + 1.0)
+        # Combine success rate and response score
+        return max(stats.success_rate * response_score, MIN_WEIGHT)
+        
+    def _refresh(self, proxy: str):
+        """Recompute a proxy's weight in the global and per-domain indexes."""
+        slot = self._slots[proxy]
+        weight = self._weight(proxy)
+        self._tree.set(slot, weight)
+        for domain, tree in self._domain_trees.items():
+            tree.set(slot, weight * self._domain_scores[domain].get(proxy, 1.0))
+            
+    def _domain_tree(self, domain: str) -> FenwickTree:
+        tree = self._domain_trees.get(domain)
+        if tree is None:
+            scores = self._domain_scores.setdefault(domain, {})
+            tree = FenwickTree([
+                weight * scores.get(proxy, 1.0)
+                for proxy, weight in zip(self._addresses, self._tree.values)
+            ])
+            self._domain_trees[domain] = tree
+        return tree
+        
+    def _release_expired_bans(self):
+        now = datetime.now()
+        while self._bans and self._bans[0][0] <= now:
+            _, proxy = heapq.heappop(self._bans)
+            if proxy in self.proxies and not self.proxies[proxy].is_banned:
+                self._refresh(proxy)
+                
+    async def probe(
+        self,
+        proxies: Optional[List[str]] = None,
+        test_url: str = "https://api.ipify.org?format=json",
+        concurrency: int = 20,
+        timeout: float = 10.0
+    ) -> Dict[str, bool]:
+        """Health-check proxies through one shared session.
         
         Args:
+            proxies: Proxies to test (defaults to the whole pool)
             test_url: URL to use for testing proxies
+            concurrency: Probes in flight at once
+            timeout: Per-probe timeout in seconds
+            
+        Returns:
+            Dict of proxy -> whether it answered with HTTP 200
         """
-        async def test_proxy(proxy: str) -> bool:
-            try:
-                start_time = time.time()
-                async with aiohttp.ClientSession() as session:
+        proxies = list(self.proxies) if proxies is None else proxies
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def test_proxy(session: aiohttp.ClientSession, proxy: str) -> bool:
+            async with semaphore:
+                ok = False
+                try:
+                    start_time = time.time()
                     async with session.get(
                         test_url,
                         proxy=proxy,
-                        timeout=aiohttp.ClientTimeout(total=10)
+                        timeout=aiohttp.ClientTimeout(total=timeout)
                     ) as resp:
-                        if resp.status == 200:
-                            response_time = time.time() - start_time
-                            self.proxies[proxy].update_response_time(response_time)
-                            self.proxies[proxy].success_count += 1
-                            self.proxies[proxy].last_success = datetime.now()
-                            return True
-            except Exception as e:
-                logger.warning(f"Proxy validation failed for {proxy}: {str(e)}")
-                self.proxies[proxy].failure_count += 1
-                return False
+                        ok = resp.status == 200
+                        response_time = time.time() - start_time
+                except Exception as e:
+                    logger.warning(f"Proxy validation failed for {proxy}: {str(e)}")
+                stats = self.proxies.get(proxy)
+                if stats is not None:
+                    if ok:
+                        stats.update_response_time(response_time)
+                        stats.success_count += 1
+                        stats.last_success = datetime.now()
+                    else:
+                        stats.failure_count += 1
+                    self._refresh(proxy)
+                return ok
                 
-        # Test all proxies concurrently
-        tasks = [test_proxy(proxy) for proxy in self.proxies]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(*(test_proxy(session, proxy) for proxy in proxies))
+        return dict(zip(proxies, results))
+        
+    async def validate_proxies(self, test_url: str = "https://api.ipify.org?format=json",
+                               concurrency: int = 20):
+        """Test all proxies and remove invalid ones.
+        
+        Args:
+            test_url: URL to use for testing proxies
+            concurrency: Probes in flight at once
+        """
+        results = await self.probe(test_url=test_url, concurrency=concurrency)
         
         # Remove failed proxies
-        for proxy, result in zip(list(self.proxies.keys()), results):
-            if not result:
+        for proxy, ok in results.items():
+            if not ok:
                 logger.warning(f"Removing invalid proxy: {proxy}")
-                del self.proxies[proxy]
+                self.remove_proxy(proxy)
+                
+    def start_prober(
+        self,
+        interval: float = 300.0,
+        test_url: str = "https://api.ipify.org?format=json",
+        concurrency: int = 20
+    ) -> asyncio.Task:
+        """Re-probe the pool in the background so weights track proxy health.
+        
+        Args:
+            interval: Seconds between probe rounds
+            test_url: URL to use for testing proxies
+            concurrency: Probes in flight at once
+            
+        Returns:
+            The background task
+        """
+        async def run():
+            while True:
+                try:
+                    await self.probe(test_url=test_url, concurrency=concurrency)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Proxy probe round failed: {str(e)}")
+                await asyncio.sleep(interval)
                 
-    def get_proxy(self) -> Optional[str]:
+        if self._prober is None or self._prober.done():
+            self._prober = asyncio.create_task(run())
+        return self._prober
+        
+    async def stop_prober(self):
+        """Stop the background prober, if running."""
+        if self._prober is not None:
+            self._prober.cancel()
+            try:
+                await self._prober
+            except asyncio.CancelledError:
+                pass
+            self._prober = None
+            
+    def get_proxy(self, domain: Optional[str] = None) -> Optional[str]:
         """Get the next available proxy.
         
+        Args:
+            domain: Target domain; proxies are weighted by their success on it
+            
         Returns:
             Proxy URL if available, None otherwise
         """
-        now = datetime.now()
-        available_proxies = [
-            proxy for proxy, stats in self.proxies.items()
-            if not stats.is_banned
-            and stats.success_rate >= self.min_success_rate
-        ]
-        
-        if not available_proxies:
+        self._release_expired_bans()
+        tree = self._domain_trees.get(domain, self._tree) if domain else self._tree
+        total = tree.total()
+        index = tree.find(random.random() * total) if total > 0 else None
+        if index is None:
             logger.warning("No proxies available!")
             return None
-            
-        # Weight proxies by success rate and response time
-        weights = []
-        for proxy in available_proxies:
-            stats = self.proxies[proxy]
-            # Normalize response time (lower is better)
-            response_score = 1.0 / (stats.avg_response_time + 1.0)
-            # Combine success rate and response score
-            weight = stats.success_rate * response_score
-            weights.append(weight)
-            
-        # Normalize weights
-        total = sum(weights)
-        if total > 0:
-            weights = [w/total for w in weights]
-            return random.choices(available_proxies, weights=weights, k=1)[0]
+        return self._addresses[index]
         
-        return random.choice(available_proxies)
+    def _record_domain(self, proxy: str, domain: Optional[str], success: bool):
+        if not domain:
+            return
+        tree = self._domain_tree(domain)
+        scores = self._domain_scores[domain]
+        scores[proxy] = (1 - self.domain_alpha) * scores.get(proxy, 1.0) + self.domain_alpha * float(success)
+        tree.set(self._slots[proxy], self._tree.values[self._slots[proxy]] * scores[proxy])
         
-    def report_success(self, proxy: str):
-        """Report successful use of a proxy."""
+    def report_success(self, proxy: str, domain: Optional[str] = None,
+                       response_time: Optional[float] = None):
+        """Report successful use of a proxy.
+        
+        Args:
+            proxy: Proxy URL
+            domain: Target domain the request went to
+            response_time: Request duration in seconds
+        """
         if proxy in self.proxies:
             self.proxies[proxy].success_count += 1
             self.proxies[proxy].last_success = datetime.now()
+            if response_time is not None:
+                self.proxies[proxy].update_response_time(response_time)
             self.current_failures[proxy] = 0
+            self._refresh(proxy)
+            self._record_domain(proxy, domain, True)
             
-    def report_failure(self, proxy: str):
-        """Report failed use of a proxy."""
+    def report_failure(self, proxy: str, domain: Optional[str] = None):
+        """Report failed use of a proxy.
+        
+        Args:
+            proxy: Proxy URL
+            domain: Target domain the request went to
+        """
         if proxy in self.proxies:
             self.proxies[proxy].failure_count += 1
             self.current_failures[proxy] += 1
@@ -157,8 +403,16 @@ class ProxyRotator:
             if self.current_failures[proxy] >= self.max_failures:
                 self.proxies[proxy].banned_until = datetime.now() + timedelta(seconds=self.ban_duration)
                 self.current_failures[proxy] = 0
+                heapq.heappush(self._bans, (self.proxies[proxy].banned_until, proxy))
                 logger.warning(f"Proxy {proxy} banned until {self.proxies[proxy].banned_until}")
-                
+            self._refresh(proxy)
+            self._record_domain(proxy, domain, False)
+            
+    def get_domain_scores(self, domain: str) -> Dict[str, float]:
+        """Per-proxy EWMA success on a target domain (proxies not yet used there score 1.0)."""
+        scores = self._domain_scores.get(domain, {})
+        return {proxy: scores.get(proxy, 1.0) for proxy in self.proxies}
+        
     def get_stats(self) -> Dict[str, Dict]:
         """Get statistics for all proxies."""
         return {
@@ -1,47 +1,188 @@
-"""Rate limiting utilities for job scrapers."""
+"""Rate limiting utilities for job scrapers.
+
+Limits are enforced with GCRA (the generic cell rate algorithm, a token bucket
+expressed as a single "theoretical arrival time" per limit), so ``acquire`` is
+O(1) and keeps no per-request history. State can optionally live in a SQLite
+database so several worker processes share one budget per domain.
+"""
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+@dataclass(frozen=True)
+class RateLimit:
+    """One GCRA limit: ``rate`` requests per ``period`` seconds, ``burst`` back to back."""
+    name: str
+    rate: int
+    period: float
+    burst: int
+
+    @property
+    def interval(self) -> float:
+        """Seconds between requests at the sustained rate."""
+        return self.period / self.rate
+
+    @property
+    def tolerance(self) -> float:
+        """How far ahead of schedule a request may run, in seconds."""
+        return self.interval * (max(1, self.burst) - 1)
 
 class RateLimiter:
     """Rate limiter for managing request rates to job boards."""
-    
-    def __init__(self, requests_per_minute: int = 10):
+
+    def __init__(
+        self,
+        requests_per_minute: int = 10,
+        requests_per_hour: Optional[int] = None,
+        burst_limit: Optional[int] = None,
+        db_path: Optional[str] = None
+    ):
         """Initialize rate limiter.
-        
+
         Args:
-            requests_per_minute: Maximum number of requests allowed per minute
+            requests_per_minute: Maximum sustained requests per minute
+            requests_per_hour: Maximum requests per hour (optional)
+            burst_limit: Requests allowed back to back before the per-minute
+                pacing applies; defaults to requests_per_minute
+            db_path: SQLite database shared by processes that should draw
+                from the same per-domain budget (optional)
         """
         self.requests_per_minute = requests_per_minute
-        self.window_size = 60  # 1 minute in seconds
-        self.requests: Dict[str, list] = {}  # domain -> list of timestamps
-        
+        self.requests_per_hour = requests_per_hour
+        self.burst_limit = burst_limit or requests_per_minute
+        self.limits: List[RateLimit] = [
+            RateLimit('minute', requests_per_minute, 60.0, self.burst_limit)
+        ]
+        if requests_per_hour:
+            # The hourly budget may be spent as fast as the per-minute limit allows
+            self.limits.append(RateLimit('hour', requests_per_hour, 3600.0, requests_per_hour))
+
+        self._tats: Dict[Tuple[str, str], float] = {}  # (domain, limit) -> theoretical arrival time
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._waits = 0
+        self._total_wait = 0.0
+
+        self.db_path = db_path
+        self._db_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limit_state (
+                    domain TEXT NOT NULL,
+                    limit_name TEXT NOT NULL,
+                    tat REAL NOT NULL,
+                    PRIMARY KEY (domain, limit_name)
+                )
+            """)
+
+    @classmethod
+    def from_config(cls, config, db_path: Optional[str] = None) -> "RateLimiter":
+        """Build a limiter from a scraping-service ``RateLimitConfig``.
+
+        Args:
+            config: RateLimitConfig with per-minute, per-hour and burst limits
+            db_path: Optional shared SQLite state
+
+        Returns:
+            Configured RateLimiter
+        """
+        return cls(
+            requests_per_minute=config.requests_per_minute,
+            requests_per_hour=config.requests_per_hour,
+            burst_limit=config.burst_limit,
+            db_path=db_path
+        )
+
+    def _lock_for(self, domain: str) -> asyncio.Lock:
+        lock = self._locks.get(domain)
+        if lock is None:
+            lock = self._locks[domain] = asyncio.Lock()
+        return lock
+
+    def _reserve(self, tats: Dict[str, float], now: float) -> float:
+        """Claim the next slot across all limits, updating ``tats`` in place.
+
+        Returns:
+            Seconds to wait before the claimed slot starts
+        """
+        wait = 0.0
+        for limit in self.limits:
+            tat = max(tats.get(limit.name, now), now)
+            wait = max(wait, tat - limit.tolerance - now)
+        start = now + wait
+        for limit in self.limits:
+            tats[limit.name] = max(tats.get(limit.name, start), start) + limit.interval
+        return wait
+
+    def _reserve_local(self, domain: str, now: float) -> float:
+        tats = {limit.name: self._tats[(domain, limit.name)]
+                for limit in self.limits if (domain, limit.name) in self._tats}
+        wait = self._reserve(tats, now)
+        for name, tat in tats.items():
+            self._tats[(domain, name)] = tat
+        return wait
+
+    def _reserve_shared(self, domain: str, now: float) -> float:
+        with self._db_lock:
+            # BEGIN IMMEDIATE serializes the read-modify-write across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                tats = dict(self._conn.execute(
+                    "SELECT limit_name, tat FROM rate_limit_state WHERE domain = ?", (domain,)
+                ).fetchall())
+                wait = self._reserve(tats, now)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO rate_limit_state (domain, limit_name, tat) VALUES (?, ?, ?)",
+                    [(domain, name, tat) for name, tat in tats.items()]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return wait
+
     async def acquire(self, domain: str):
         """Wait until a request can be made for the given domain.
-        
+
         Args:
             domain: The domain being accessed
         """
-        now = datetime.now()
-        if domain not in self.requests:
-            self.requests[domain] = []
-            
-        # Remove timestamps older than our window
-        window_start = now - timedelta(seconds=self.window_size)
-        self.requests[domain] = [
-            ts for ts in self.requests[domain]
-            if ts > window_start
-        ]
-        
-        # If we're at the limit, wait until the oldest request expires
-        while len(self.requests[domain]) >= self.requests_per_minute:
-            oldest = self.requests[domain][0]
-            expires = oldest + timedelta(seconds=self.window_size)
-            wait_time = (expires - now).total_seconds()
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
-            now = datetime.now()
-            
-        # Add current request
-        self.requests[domain].append(now)
+        async with self._lock_for(domain):
+            if self._conn is not None:
+                wait = await asyncio.to_thread(self._reserve_shared, domain, time.time())
+            else:
+                wait = self._reserve_local(domain, time.time())
+
+        # The slot is already reserved, so sleep outside the lock
+        if wait > 0:
+            self._waits += 1
+            self._total_wait += wait
+            await asyncio.sleep(wait)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get limiter statistics.
+
+        Returns:
+            Dict with wait counts and configured limits
+        """
+        return {
+            'requests_per_minute': self.requests_per_minute,
+            'requests_per_hour': self.requests_per_hour,
+            'burst_limit': self.burst_limit,
+            'waits': self._waits,
+            'total_wait_seconds': round(self._total_wait, 3),
+            'shared_state': self._conn is not None
+        }
+
+    def close(self):
+        """Close the shared state database, if any."""
+        if self._conn is not None:
+            with self._db_lock:
+                self._conn.close()
+            self._conn = None
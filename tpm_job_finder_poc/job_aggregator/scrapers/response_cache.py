@@ -1,19 +1,42 @@
-"""Caching system for job scraper responses."""
+"""Caching system for job scraper responses.
+
+Responses live in a single SQLite index (``<cache_dir>/responses.db``) that
+tracks each entry's key, stored size, last access and timestamp alongside its
+compressed body. Bodies are compressed with zstd when the ``zstandard`` package
+is installed and with zlib otherwise. The cache is bounded by both entry count
+and stored bytes and evicts least-recently-used entries in batches, so a write
+never has to scan the whole cache.
+"""
 
 import asyncio
 from typing import Optional, Any, Dict
 import json
 import hashlib
 import os
-import aiofiles
+import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
+import zlib
 import logging
-from dataclasses import dataclass, asdict
-import pickle
+from dataclasses import dataclass
+from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+NOT_MODIFIED = 304
+
+INDEX_FILENAME = "responses.db"
+
+# Evict down to this fraction of the limits so eviction cost is amortized
+# across many writes instead of paid on each one
+EVICTION_TARGET = 0.9
+
 @dataclass
 class CacheEntry:
     """Cache entry with content and metadata."""
@@ -22,82 +45,293 @@ class CacheEntry:
     timestamp: float
     headers: Dict[str, str]
     status_code: int
-    
+
     def is_expired(self, max_age: int) -> bool:
         """Check if cache entry is expired.
-        
+
         Args:
             max_age: Maximum age in seconds
-            
+
         Returns:
             True if expired, False otherwise
         """
         return time.time() - self.timestamp > max_age
 
+    def _header(self, name: str) -> Optional[str]:
+        """Case-insensitive lookup in the stored response headers."""
+        name = name.lower()
+        for key, value in (self.headers or {}).items():
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._header('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self._header('Last-Modified')
+
+    def has_validators(self) -> bool:
+        """Whether the entry can be revalidated with a conditional GET."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that ask the origin to answer 304 if unchanged.
+
+        Returns:
+            Dict with If-None-Match and/or If-Modified-Since
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
 class ResponseCache:
     """Caches HTTP responses for job scrapers."""
-    
+
     def __init__(
         self,
         cache_dir: str = ".cache",
         max_age: int = 3600,  # 1 hour default
-        max_size: int = 1000  # Maximum number of entries
+        max_size: int = 1000,  # Maximum number of entries
+        max_bytes: int = 256 * 1024 * 1024,  # Maximum stored (compressed) bytes
+        compression_level: int = 3
     ):
         """Initialize cache.
-        
+
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory to store the cache index
             max_age: Maximum age of cache entries in seconds
             max_size: Maximum number of cache entries
+            max_bytes: Maximum total size of stored bodies in bytes
+            compression_level: zstd/zlib compression level
         """
         self.cache_dir = cache_dir
         self.max_age = max_age
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.codec = 'zstd' if ZSTD_AVAILABLE else 'zlib'
+        if ZSTD_AVAILABLE:
+            self._compressor = zstandard.ZstdCompressor(level=compression_level)
+            self._decompressor = zstandard.ZstdDecompressor()
+        # host -> hits / revalidation_hits / misses / bytes_saved
+        self._host_stats: Dict[str, Dict[str, int]] = {}
+        self._evictions = 0
+        self._lock = threading.Lock()
         self._ensure_cache_dir()
-        
+        self._conn = self._connect()
+        self._entry_count, self._total_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
     def _ensure_cache_dir(self):
         """Create cache directory if it doesn't exist."""
         os.makedirs(self.cache_dir, exist_ok=True)
-        
-    def _get_cache_path(self, url: str) -> str:
-        """Get filesystem path for cached response.
-        
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database and create its schema."""
+        conn = sqlite3.connect(
+            os.path.join(self.cache_dir, INDEX_FILENAME),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL,
+                codec TEXT NOT NULL,
+                status_code INTEGER,
+                headers TEXT,
+                body BLOB
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+        return conn
+
+    def _get_cache_key(self, url: str) -> str:
+        """Get index key for a URL.
+
         Args:
             url: URL of the response
-            
+
         Returns:
-            Path to cache file
+            Hex digest identifying the URL
         """
-        # Create unique filename from URL
-        url_hash = hashlib.sha256(url.encode()).hexdigest()
-        return os.path.join(self.cache_dir, f"{url_hash}.cache")
-        
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _compress(self, content: str) -> bytes:
+        data = content.encode('utf-8')
+        if self.codec == 'zstd':
+            return self._compressor.compress(data)
+        return zlib.compress(data, self.compression_level)
+
+    def _decompress(self, body: bytes, codec: str) -> str:
+        if codec == 'zstd':
+            if not ZSTD_AVAILABLE:
+                raise ValueError("entry is zstd-compressed but zstandard is not installed")
+            return self._decompressor.decompress(body).decode('utf-8')
+        return zlib.decompress(body).decode('utf-8')
+
     async def get(self, url: str) -> Optional[CacheEntry]:
         """Get cached response if available and not expired.
-        
+
+        Expired entries that carry an ETag or Last-Modified validator are kept
+        so they can be revalidated with a conditional GET.
+
         Args:
             url: URL to retrieve from cache
-            
+
         Returns:
             CacheEntry if found and valid, None otherwise
         """
-        cache_path = self._get_cache_path(url)
+        entry = await self.get_stale(url)
+        if entry is None:
+            return None
+
+        if entry.is_expired(self.max_age):
+            if not entry.has_validators():
+                await self._remove(self._get_cache_key(url))
+            return None
+
+        return entry
+
+    async def get_stale(self, url: str) -> Optional[CacheEntry]:
+        """Get cached response regardless of age.
+
+        Args:
+            url: URL to retrieve from cache
+
+        Returns:
+            CacheEntry if found, None otherwise
+        """
+        key = self._get_cache_key(url)
         try:
-            if not os.path.exists(cache_path):
-                return None
-                
-            async with aiofiles.open(cache_path, 'rb') as f:
-                entry = pickle.loads(await f.read())
-                
-            if entry.is_expired(self.max_age):
-                await self._remove(cache_path)
-                return None
-                
-            return entry
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT timestamp, codec, status_code, headers, body FROM responses WHERE key = ?",
+                    (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._conn.execute(
+                    "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+                )
+
+            timestamp, codec, status_code, headers, body = row
+            return CacheEntry(
+                content=self._decompress(body, codec),
+                url=url,
+                timestamp=timestamp,
+                headers=json.loads(headers) if headers else {},
+                status_code=status_code
+            )
         except Exception as e:
             logger.error(f"Error reading cache for {url}: {str(e)}")
             return None
-            
+
+    async def fetch(
+        self,
+        url: str,
+        client: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> CacheEntry:
+        """Return a fresh response for url, revalidating stale entries.
+
+        A fresh cached entry is returned without a request. A stale entry with
+        validators is refreshed with a conditional GET; a 304 only bumps its
+        timestamp, so the body is never re-downloaded. Only 2xx responses are
+        stored, so a throttled or failed request is retried on the next call.
+
+        Args:
+            url: URL to fetch
+            client: Async HTTP client with a ``get(url, headers=...)`` method;
+                defaults to the shared pooled client
+            headers: Extra request headers
+
+        Returns:
+            CacheEntry for the current response
+        """
+        entry = await self.get_stale(url)
+        if entry is not None and not entry.is_expired(self.max_age):
+            self._record(url, 'hits')
+            return entry
+
+        if client is None:
+            from ..services.http_client import get_http_client
+            client = get_http_client()
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.conditional_headers())
+
+        response = await client.get(url, headers=request_headers)
+        response_headers = dict(response.headers)
+
+        if entry is not None and response.status_code == NOT_MODIFIED:
+            return await self.revalidated(url, response_headers, entry)
+
+        self._record(url, 'misses')
+        if 200 <= response.status_code < 300:
+            await self.set(url, response.text, response_headers, response.status_code)
+        return CacheEntry(
+            content=response.text,
+            url=url,
+            timestamp=time.time(),
+            headers=response_headers,
+            status_code=response.status_code
+        )
+
+    async def revalidated(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        entry: Optional[CacheEntry] = None
+    ) -> Optional[CacheEntry]:
+        """Record a 304 Not Modified answer for a cached URL.
+
+        Args:
+            url: URL that was revalidated
+            headers: Headers of the 304 response; updated validators replace
+                the stored ones
+            entry: Cached entry, if already loaded
+
+        Returns:
+            The refreshed CacheEntry, or None if url is not cached
+        """
+        if entry is None:
+            entry = await self.get_stale(url)
+            if entry is None:
+                return None
+
+        entry.headers = {**entry.headers, **(headers or {})}
+        entry.timestamp = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET timestamp = ?, last_access = ?, headers = ? WHERE key = ?",
+                (entry.timestamp, entry.timestamp, json.dumps(entry.headers), self._get_cache_key(url))
+            )
+
+        self._record(url, 'revalidation_hits')
+        self._record(url, 'bytes_saved', len(entry.content.encode('utf-8')))
+        return entry
+
+    def _record(self, url: str, metric: str, amount: int = 1):
+        host = urlparse(url).netloc or url
+        stats = self._host_stats.setdefault(
+            host, {'hits': 0, 'revalidation_hits': 0, 'misses': 0, 'bytes_saved': 0}
+        )
+        stats[metric] += amount
+
     async def set(
         self,
         url: str,
@@ -106,7 +340,7 @@ class ResponseCache:
         status_code: int
     ) -> None:
         """Cache a response.
-        
+
         Args:
             url: URL of the response
             content: Response content
@@ -120,76 +354,125 @@ class ResponseCache:
             headers=headers,
             status_code=status_code
         )
-        
-        cache_path = self._get_cache_path(url)
-        
+
         try:
-            async with aiofiles.open(cache_path, 'wb') as f:
-                await f.write(pickle.dumps(entry))
-                
+            await self._write(entry)
+
             # Cleanup old entries if needed
             await self._cleanup()
         except Exception as e:
             logger.error(f"Error caching response for {url}: {str(e)}")
-            
-    async def _remove(self, cache_path: str):
-        """Remove a cache file.
-        
+
+    async def _write(self, entry: CacheEntry):
+        """Insert or replace an entry in the index.
+
+        Args:
+            entry: Entry to store
+        """
+        body = self._compress(entry.content)
+        key = self._get_cache_key(entry.url)
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, timestamp, last_access, size, codec, status_code, headers, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.url, entry.timestamp, time.time(), len(body), self.codec,
+                 entry.status_code, json.dumps(entry.headers or {}), body)
+            )
+            if previous is None:
+                self._entry_count += 1
+            else:
+                self._total_bytes -= previous[0]
+            self._total_bytes += len(body)
+
+    async def _remove(self, key: str):
+        """Remove a cache entry.
+
         Args:
-            cache_path: Path to cache file to remove
+            key: Index key of the entry to remove
         """
         try:
-            os.remove(cache_path)
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT size FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._entry_count -= 1
+                    self._total_bytes -= row[0]
         except Exception as e:
-            logger.error(f"Error removing cache file {cache_path}: {str(e)}")
-            
+            logger.error(f"Error removing cache entry {key}: {str(e)}")
+
     async def _cleanup(self):
-        """Remove old cache entries if cache is too large."""
+        """Evict least-recently-used entries if the cache is over its limits."""
+        if self._entry_count <= self.max_size and self._total_bytes <= self.max_bytes:
+            return
         try:
-            cache_files = []
-            for filename in os.listdir(self.cache_dir):
-                path = os.path.join(self.cache_dir, filename)
-                cache_files.append((os.path.getmtime(path), path))
-                
-            # Sort by modification time
-            cache_files.sort()
-            
-            # Remove oldest files if we have too many
-            while len(cache_files) > self.max_size:
-                _, path = cache_files.pop(0)
-                await self._remove(path)
-                
+            target_count = int(self.max_size * EVICTION_TARGET)
+            target_bytes = int(self.max_bytes * EVICTION_TARGET)
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT key, size FROM responses ORDER BY last_access"
+                )
+                victims = []
+                count, total = self._entry_count, self._total_bytes
+                for key, size in rows:
+                    if count <= target_count and total <= target_bytes:
+                        break
+                    victims.append((key,))
+                    count -= 1
+                    total -= size
+                rows.close()
+                self._conn.execute("BEGIN")
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                self._conn.execute("COMMIT")
+                self._entry_count, self._total_bytes = count, total
+                self._evictions += len(victims)
+
         except Exception as e:
             logger.error(f"Error during cache cleanup: {str(e)}")
-            
+
     async def clear(self):
         """Clear all cached responses."""
         try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses")
+                self._entry_count = 0
+                self._total_bytes = 0
+            # Drop any per-file entries left by the previous pickle-based cache
             for filename in os.listdir(self.cache_dir):
-                path = os.path.join(self.cache_dir, filename)
-                await self._remove(path)
+                if filename.endswith('.cache'):
+                    os.remove(os.path.join(self.cache_dir, filename))
         except Exception as e:
             logger.error(f"Error clearing cache: {str(e)}")
-            
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
-        
+
         Returns:
             Dict with cache statistics
         """
         try:
-            files = os.listdir(self.cache_dir)
-            total_size = sum(
-                os.path.getsize(os.path.join(self.cache_dir, f))
-                for f in files
-            )
-            
             return {
-                'entries': len(files),
-                'size_bytes': total_size,
+                'entries': self._entry_count,
+                'size_bytes': self._total_bytes,
                 'max_age': self.max_age,
-                'max_size': self.max_size
+                'max_size': self.max_size,
+                'max_bytes': self.max_bytes,
+                'compression': self.codec,
+                'evictions': self._evictions,
+                'revalidation_hits': sum(h['revalidation_hits'] for h in self._host_stats.values()),
+                'bytes_saved': sum(h['bytes_saved'] for h in self._host_stats.values()),
+                'hosts': {host: dict(stats) for host, stats in self._host_stats.items()}
             }
         except Exception as e:
             logger.error(f"Error getting cache stats: {str(e)}")
             return {}
+
+    def close(self):
+        """Close the index database."""
+        with self._lock:
+            self._conn.close()
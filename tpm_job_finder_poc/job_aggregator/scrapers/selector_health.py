@@ -1,15 +1,40 @@
-"""Health check system for web scraping selectors."""
+"""Health check system for web scraping selectors.
+
+Each sample page is fetched once and all of a page's selectors are checked in
+a single pass over its parsed tree using the maintainer's compiled selector
+plans; ``check_all`` checks many sites concurrently.
+"""
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import logging
 from bs4 import BeautifulSoup
-from .selector_maintainer import SelectorMaintainer
+from .selector_maintainer import SelectorMaintainer, compile_selector
 from .base import BaseJobScraper
 
 logger = logging.getLogger(__name__)
 
+SEARCH_PAGE_PURPOSES = [
+    'job_card_title',
+    'job_card_company',
+    'job_card_location',
+    'job_card_salary',
+    'job_card_date'
+]
+
+DETAIL_PAGE_PURPOSES = [
+    'job_title',
+    'job_description'
+]
+
+# Links to a job detail page on each supported board's search page
+DETAIL_LINK_SELECTORS = [
+    "a.job_link",  # ZipRecruiter
+    "a.jcs-JobTitle",  # Indeed
+    "a.base-card__full-link"  # LinkedIn
+]
+
 class SelectorHealthChecker:
     """Monitors and validates selectors across job boards."""
     
@@ -38,9 +63,9 @@ class SelectorHealthChecker:
         if site not in self.health_stats:
             self.health_stats[site] = {}
             
-        # Get sample pages
+        # Get sample pages; the search page is fetched once and reused to find a detail link
         search_page = await self._get_sample_search_page(scraper)
-        detail_page = await self._get_sample_detail_page(scraper)
+        detail_page = await self._get_sample_detail_page(scraper, search_page) if search_page else None
         
         results = {
             'search_page': {},
@@ -48,60 +73,77 @@ class SelectorHealthChecker:
         }
         
         if search_page:
-            # Check search page selectors
-            search_selectors = [
-                'job_card_title',
-                'job_card_company',
-                'job_card_location',
-                'job_card_salary',
-                'job_card_date'
-            ]
+            results['search_page'] = self._check_page(site, SEARCH_PAGE_PURPOSES, search_page)
             
-            for purpose in search_selectors:
-                success = await self._check_selector(site, purpose, search_page)
-                results['search_page'][purpose] = success
-                
-                # Update stats
-                if purpose not in self.health_stats[site]:
-                    self.health_stats[site][purpose] = {
-                        'success': 0,
-                        'failure': 0,
-                        'last_check': None
-                    }
-                    
-                if success:
-                    self.health_stats[site][purpose]['success'] += 1
-                else:
-                    self.health_stats[site][purpose]['failure'] += 1
-                    
-                self.health_stats[site][purpose]['last_check'] = datetime.now()
-                
         if detail_page:
-            # Check detail page selectors
-            detail_selectors = [
-                'job_title',
-                'job_description'
-            ]
-            
-            for purpose in detail_selectors:
-                success = await self._check_selector(site, purpose, detail_page)
-                results['detail_page'][purpose] = success
+            results['detail_page'] = self._check_page(site, DETAIL_PAGE_PURPOSES, detail_page)
                 
-                # Update stats
-                if purpose not in self.health_stats[site]:
-                    self.health_stats[site][purpose] = {
-                        'success': 0,
-                        'failure': 0,
-                        'last_check': None
-                    }
-                    
-                if success:
-                    self.health_stats[site][purpose]['success'] += 1
-                else:
-                    self.health_stats[site][purpose]['failure'] += 1
-                    
-                self.health_stats[site][purpose]['last_check'] = datetime.now()
+        return results
+        
+    async def check_all(
+        self,
+        scrapers: Iterable[BaseJobScraper],
+        concurrency: int = 4
+    ) -> Dict[str, Dict[str, Dict[str, bool]]]:
+        """Check selectors for many scrapers concurrently.
+        
+        Args:
+            scrapers: Scrapers to check
+            concurrency: Sites checked at the same time
+            
+        Returns:
+            Dict of site -> check_selectors() results
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def check(scraper: BaseJobScraper):
+            async with semaphore:
+                return await self.check_selectors(scraper)
                 
+        scrapers = list(scrapers)
+        outcomes = await asyncio.gather(*(check(scraper) for scraper in scrapers))
+        # Usage counters were buffered during the checks; write them once
+        self.selector_maintainer.flush()
+        return {
+            scraper.__class__.__name__.lower().replace('scraper', ''): outcome
+            for scraper, outcome in zip(scrapers, outcomes)
+        }
+        
+    def _check_page(self, site: str, purposes: List[str], soup: BeautifulSoup) -> Dict[str, bool]:
+        """Check all of a page's selectors in one pass and record the outcome.
+        
+        Outcomes also go to the maintainer's usage counters, which it buffers.
+        
+        Args:
+            site: Website identifier
+            purposes: Selector purposes expected on the page
+            soup: Parsed page
+            
+        Returns:
+            Dict of purpose -> health status
+        """
+        matches = self.selector_maintainer.get_plan(site, purposes).evaluate(soup)
+        results = {}
+        now = datetime.now()
+        for purpose in purposes:
+            element = matches.get(purpose)
+            success = element is not None and bool(element.get_text(strip=True))
+            results[purpose] = success
+            
+            # Update stats
+            stats = self.health_stats[site].setdefault(purpose, {
+                'success': 0,
+                'failure': 0,
+                'last_check': None
+            })
+            if success:
+                stats['success'] += 1
+                self.selector_maintainer.report_success(site, purpose)
+            else:
+                stats['failure'] += 1
+                self.selector_maintainer.report_failure(site, purpose)
+            stats['last_check'] = now
+            
         return results
         
     async def _get_sample_search_page(self, scraper: BaseJobScraper) -> Optional[BeautifulSoup]:
@@ -122,11 +164,16 @@ class SelectorHealthChecker:
             logger.error(f"Error getting sample search page: {str(e)}")
             return None
             
-    async def _get_sample_detail_page(self, scraper: BaseJobScraper) -> Optional[BeautifulSoup]:
+    async def _get_sample_detail_page(
+        self,
+        scraper: BaseJobScraper,
+        search_soup: Optional[BeautifulSoup] = None
+    ) -> Optional[BeautifulSoup]:
         """Get a sample job detail page for testing selectors.
         
         Args:
             scraper: The scraper to test
+            search_soup: Search page already fetched, if any
             
         Returns:
             BeautifulSoup object of detail page if successful
@@ -134,19 +181,16 @@ class SelectorHealthChecker:
         try:
             # First get a job URL from the search page
             async with scraper:
-                search_soup = await scraper._get_page(scraper.BASE_SEARCH_URL)
+                if search_soup is None:
+                    search_soup = await scraper._get_page(scraper.BASE_SEARCH_URL)
                 if not search_soup:
                     return None
                     
                 # Try to find any job link
                 if isinstance(scraper, BaseJobScraper):
                     link = None
-                    for selector in [
-                        "a.job_link",  # ZipRecruiter
-                        "a.jcs-JobTitle",  # Indeed
-                        "a.base-card__full-link"  # LinkedIn
-                    ]:
-                        link = search_soup.select_one(selector)
+                    for selector in DETAIL_LINK_SELECTORS:
+                        link = compile_selector(selector).select_one(search_soup)
                         if link and link.get('href'):
                             break
                             
@@ -176,10 +220,11 @@ class SelectorHealthChecker:
             True if selector successfully extracts content
         """
         selector = self.selector_maintainer.get_selector(site, purpose)
-        if not selector:
+        compiled = compile_selector(selector) if selector else None
+        if not compiled:
             return False
             
-        element = soup.select_one(selector)
+        element = compiled.select_one(soup)
         if not element:
             return False
             
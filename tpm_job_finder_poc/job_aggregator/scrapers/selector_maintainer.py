@@ -1,17 +1,87 @@
-"""Automated selector maintenance and repair system."""
+"""Automated selector maintenance and repair system.
+
+Selectors are compiled once (``compile_selector``) and a site's selectors are
+evaluated together in a single pass over a parsed page (``SelectorPlan``).
+Success/failure counters are kept in memory and written to the selectors file
+at most once per flush interval rather than on every report.
+"""
 
 import asyncio
+import functools
+import time
 from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 import json
 import os
 import logging
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 from datetime import datetime
 import difflib
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=2048)
+def compile_selector(selector: str) -> Optional[soupsieve.SoupSieve]:
+    """Compile a CSS selector once per process.
+    
+    Args:
+        selector: CSS selector
+        
+    Returns:
+        Compiled selector, or None if it is not valid CSS
+    """
+    try:
+        return soupsieve.compile(selector)
+    except soupsieve.SelectorSyntaxError as e:
+        logger.debug(f"Invalid CSS selector {selector!r}: {e}")
+        return None
+
+
+class SelectorPlan:
+    """Compiled selectors for one site, evaluated together over a page."""
+    
+    def __init__(self, selectors: Dict[str, Optional[str]]):
+        """Compile a site's selectors.
+        
+        Args:
+            selectors: Purpose -> CSS selector (None for purposes with no selector)
+        """
+        self.selectors = selectors
+        self._compiled = {
+            purpose: compile_selector(selector) if selector else None
+            for purpose, selector in selectors.items()
+        }
+        
+    def evaluate(self, soup: Tag) -> Dict[str, Optional[Tag]]:
+        """Find the first match for every selector in one walk of the tree.
+        
+        Equivalent to calling ``soup.select_one(selector)`` per purpose, but
+        the document is traversed once and the walk stops as soon as every
+        selector has matched.
+        
+        Args:
+            soup: Parsed page (or subtree) to search
+            
+        Returns:
+            Purpose -> first matching element in document order, or None
+        """
+        results: Dict[str, Optional[Tag]] = {purpose: None for purpose in self.selectors}
+        remaining = {purpose: compiled for purpose, compiled in self._compiled.items() if compiled}
+        if not remaining:
+            return results
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            matched = [purpose for purpose, compiled in remaining.items() if compiled.match(element)]
+            for purpose in matched:
+                results[purpose] = element
+                del remaining[purpose]
+            if not remaining:
+                break
+        return results
+
 @dataclass
 class SelectorInfo:
     """Information about a CSS selector."""
@@ -26,14 +96,19 @@ class SelectorInfo:
 class SelectorMaintainer:
     """Maintains and repairs CSS selectors for job scrapers."""
     
-    def __init__(self, selectors_file: str):
+    def __init__(self, selectors_file: str, flush_interval: float = 60.0):
         """Initialize the selector maintainer.
         
         Args:
             selectors_file: Path to JSON file containing selector definitions
+            flush_interval: Minimum seconds between writes of usage counters
         """
         self.selectors_file = selectors_file
         self.selectors: Dict[str, Dict[str, SelectorInfo]] = {}
+        self.flush_interval = flush_interval
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._plans: Dict[Tuple[str, Tuple[Tuple[str, Optional[str]], ...]], SelectorPlan] = {}
         self._load_selectors()
         
     def _load_selectors(self):
@@ -49,11 +124,15 @@ class SelectorMaintainer:
             for site, site_selectors in data.items():
                 self.selectors[site] = {}
                 for purpose, info in site_selectors.items():
+                    last_success = info.get('last_success')
                     self.selectors[site][purpose] = SelectorInfo(
                         selector=info['selector'],
                         purpose=purpose,
                         required=info.get('required', True),
-                        fallbacks=info.get('fallbacks', [])
+                        fallbacks=info.get('fallbacks', []),
+                        last_success=datetime.fromisoformat(last_success) if last_success else None,
+                        success_count=info.get('success_count', 0),
+                        failure_count=info.get('failure_count', 0)
                     )
         except Exception as e:
             logger.error(f"Error loading selectors: {str(e)}")
@@ -63,21 +142,46 @@ class SelectorMaintainer:
         try:
             data = {
                 site: {
-                    purpose: {
-                        'selector': info.selector,
-                        'required': info.required,
-                        'fallbacks': info.fallbacks
-                    }
+                    purpose: self._serialize(info)
                     for purpose, info in site_selectors.items()
                 }
                 for site, site_selectors in self.selectors.items()
             }
             
-            with open(self.selectors_file, 'w') as f:
+            # Write-then-rename so a crash mid-write never truncates the file
+            tmp_path = f"{self.selectors_file}.tmp"
+            with open(tmp_path, 'w') as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.selectors_file)
+            self._dirty = False
+            self._last_flush = time.monotonic()
         except Exception as e:
             logger.error(f"Error saving selectors: {str(e)}")
             
+    @staticmethod
+    def _serialize(info: SelectorInfo) -> Dict:
+        data = {
+            'selector': info.selector,
+            'required': info.required,
+            'fallbacks': info.fallbacks
+        }
+        # Usage counters are only written once a selector has been used
+        if info.success_count or info.failure_count:
+            data['success_count'] = info.success_count
+            data['failure_count'] = info.failure_count
+            data['last_success'] = info.last_success.isoformat() if info.last_success else None
+        return data
+        
+    def flush(self):
+        """Write buffered usage counters to the selectors file, if any changed."""
+        if self._dirty:
+            self._save_selectors()
+            
+    def _maybe_flush(self):
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self._save_selectors()
+            
     def get_selector(self, site: str, purpose: str) -> Optional[str]:
         """Get current selector for a specific purpose.
         
@@ -92,6 +196,26 @@ class SelectorMaintainer:
             return self.selectors[site][purpose].selector
         return None
         
+    def get_plan(self, site: str, purposes: List[str]) -> SelectorPlan:
+        """Get the compiled selector plan for a set of purposes on a site.
+        
+        Plans are cached by their selectors, so a repaired selector gets a
+        fresh plan automatically.
+        
+        Args:
+            site: Website identifier
+            purposes: Selector purposes to evaluate together
+            
+        Returns:
+            SelectorPlan over the site's current selectors
+        """
+        selectors = {purpose: self.get_selector(site, purpose) for purpose in purposes}
+        key = (site, tuple(selectors.items()))
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._plans[key] = SelectorPlan(selectors)
+        return plan
+        
     def report_success(self, site: str, purpose: str):
         """Report successful use of a selector.
         
@@ -103,6 +227,7 @@ class SelectorMaintainer:
             info = self.selectors[site][purpose]
             info.success_count += 1
             info.last_success = datetime.now()
+            self._maybe_flush()
             
     def report_failure(self, site: str, purpose: str):
         """Report failed use of a selector.
@@ -114,6 +239,7 @@ class SelectorMaintainer:
         if site in self.selectors and purpose in self.selectors[site]:
             info = self.selectors[site][purpose]
             info.failure_count += 1
+            self._maybe_flush()
             
     async def repair_selector(
         self,
@@ -141,7 +267,8 @@ class SelectorMaintainer:
         
         # Try fallback selectors first
         for fallback in info.fallbacks:
-            element = soup.select_one(fallback)
+            compiled = compile_selector(fallback)
+            element = compiled.select_one(soup) if compiled else None
             if element and self._validate_element(element, purpose, sample_content):
                 logger.info(f"Found working fallback selector for {site}/{purpose}: {fallback}")
                 info.selector = fallback
@@ -311,10 +438,13 @@ class SelectorMaintainer:
             Score between 0 and 1
         """
         try:
-            matches = soup.select(selector)
-            
-            # Ideal selectors should match exactly one element
-            if len(matches) != 1:
+            compiled = compile_selector(selector)
+            if compiled is None:
+                return 0
+                
+            # Ideal selectors should match exactly one element; a second
+            # match is enough to rule the selector out
+            if len(compiled.select(soup, limit=2)) != 1:
                 return 0
                 
             score = 1.0
@@ -0,0 +1,123 @@
+"""Shared async HTTP client for API connectors.
+
+One pooled ``httpx.AsyncClient`` per event loop, so every connector reuses
+keep-alive connections (pooled per origin) instead of paying DNS+TCP+TLS setup
+on each request. HTTP/2 is negotiated when the ``h2`` package is installed,
+and gzip/deflate (plus brotli when ``brotli`` is installed) are decoded
+transparently.
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (TPM Job Finder)"
+DEFAULT_TIMEOUT = 20.0
+DEFAULT_CONNECT_TIMEOUT = 5.0
+# (connect, read) timeout for the connectors' synchronous ``requests`` paths
+SYNC_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_TIMEOUT)
+
+
+class SharedHTTPClient:
+    """Pooled async HTTP client with keep-alive and configurable timeouts."""
+
+    def __init__(self,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 30.0,
+                 http2: Optional[bool] = None,
+                 headers: Optional[Dict[str, str]] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Args:
+            timeout: Read/write/pool timeout in seconds
+            connect_timeout: Connection establishment timeout in seconds
+            max_connections: Upper bound on open connections across all hosts
+            max_keepalive_connections: Idle connections kept warm for reuse
+            keepalive_expiry: Seconds an idle connection stays in the pool
+            http2: Force HTTP/2 on or off; defaults to on when ``h2`` is installed
+            headers: Default headers sent with every request
+            transport: Optional custom transport (e.g. ``httpx.MockTransport`` in tests)
+        """
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=self.http2,
+            headers={"User-Agent": DEFAULT_USER_AGENT, **(headers or {})},
+            follow_redirects=True,
+            transport=transport,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.client.get(url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.client.post(url, **kwargs)
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        """GET ``url`` and return the decoded JSON body, raising on HTTP errors."""
+        response = await self.client.get(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def post_json(self, url: str, **kwargs) -> Any:
+        """POST to ``url`` and return the decoded JSON body, raising on HTTP errors."""
+        response = await self.client.post(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    @property
+    def is_closed(self) -> bool:
+        return self.client.is_closed
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+# Pooled connections belong to the loop that opened them, so keep one client per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SharedHTTPClient]" = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> SharedHTTPClient:
+    """Return the shared client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = SharedHTTPClient()
+        _clients[loop] = client
+        logger.debug(f"Created shared HTTP client (http2={client.http2})")
+    return client
+
+
+async def close_http_client():
+    """Close the shared client for the running event loop, if any."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -61,7 +61,8 @@ class JobAggregationService:
             self.api_connectors.append(
                 CareerjetConnector(
                     affiliate_id=cfg["affiliate_id"],
-                    locales=cfg.get("locales", ["en_US", "en_GB", "en_CA", "en_AU", "en_SG"])
+                    locales=cfg.get("locales", ["en_US", "en_GB", "en_CA", "en_AU", "en_SG"]),
+                    max_concurrency=cfg.get("max_concurrency", 4)
                 )
             )
             
@@ -108,17 +109,16 @@ class JobAggregationService:
         all_jobs = []
         week_ago = datetime.utcnow() - timedelta(days=7)
         
-        # Fetch from API-based sources
-        for connector in self.api_connectors:
-            try:
-                if hasattr(connector, 'fetch_since'):
-                    jobs = connector.fetch_since(week_ago)
-                else:
-                    jobs = connector.fetch_jobs()
-                all_jobs.extend(jobs)
-            except Exception as e:
-                print(f"Error from {connector.__class__.__name__}: {str(e)}")
+        # Fetch from API-based sources concurrently over the shared HTTP client
+        results = await asyncio.gather(
+            *(self._fetch_from_connector(connector, week_ago) for connector in self.api_connectors),
+            return_exceptions=True
+        )
+        for connector, jobs in zip(self.api_connectors, results):
+            if isinstance(jobs, Exception):
+                print(f"Error from {connector.__class__.__name__}: {str(jobs)}")
                 continue
+            all_jobs.extend(jobs)
                 
         # Fetch from scraping sources
         try:
@@ -129,6 +129,19 @@ class JobAggregationService:
             
         return all_jobs
         
+    async def _fetch_from_connector(self, connector: Any, since: datetime) -> List[Any]:
+        """Fetch from one API connector without blocking the event loop.
+        
+        Connectors with an async ``fetch`` coroutine run it over the shared
+        HTTP client; the rest keep their synchronous path in a worker thread.
+        """
+        # Checked on the class so mocks without a real coroutine use the legacy path
+        if asyncio.iscoroutinefunction(getattr(type(connector), 'fetch', None)):
+            return await connector.fetch(since=since)
+        if hasattr(connector, 'fetch_since'):
+            return await asyncio.to_thread(connector.fetch_since, since)
+        return await asyncio.to_thread(connector.fetch_jobs)
+        
     def deduplicate_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate jobs based on URL.
         
@@ -1,66 +1,247 @@
 """
 Job Description Extraction Service
 Scaffolds site-specific adapters and a generic fallback for extracting job descriptions from job URLs.
+
+``extract_many`` fetches a batch of job pages concurrently through the shared
+HTTP client and ResponseCache, with a cap on requests in flight per domain.
+Syndicated copies of one posting (tracking variants of a URL, or URLs sharing
+a posting key) are fetched once per batch. With a DescriptionStore (passed in,
+or opened at ``store_path``) descriptions are also kept across runs, keyed by
+canonical URL, until they pass the store's ``max_age_days``.
 """
+import asyncio
+import logging
 import requests
 from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any
+from collections import defaultdict
+from typing import Optional, Dict, Any, Callable, Iterable, List
+from urllib.parse import urlparse
+
+from tpm_job_finder_poc.cache.description_store import DescriptionStore, canonical_url
+from ..scrapers.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
 
 class JobDescriptionExtractor:
-    def __init__(self):
+    def __init__(self,
+                 store: Optional[DescriptionStore] = None,
+                 store_path: Optional[str] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 client: Optional[Any] = None,
+                 per_domain_limit: int = 2,
+                 max_concurrency: int = 16):
+        """
+        Args:
+            store: Persistent description store; without one (and without
+                store_path) descriptions are not kept between calls
+            store_path: Database path of a DescriptionStore opened on first use
+            response_cache: Cache page fetches go through (created on first use if omitted)
+            client: Async HTTP client for batch fetches; defaults to the shared pooled client
+            per_domain_limit: Batch requests in flight per domain
+            max_concurrency: Batch requests in flight overall
+        """
         self.adapters = {
             'greenhouse.io': self._extract_greenhouse,
             'lever.co': self._extract_lever,
             'remoteok.com': self._extract_remoteok,
             # Add more site adapters here
         }
+        # Page parsers used by extract_many, matched by domain like the adapters
+        self.parsers: Dict[str, Callable[[BeautifulSoup], Optional[str]]] = {
+            'greenhouse.io': self._parse_greenhouse,
+            'lever.co': self._parse_lever,
+            'remoteok.com': self._parse_remoteok,
+        }
+        self.store = store
+        self.store_path = store_path
+        self.response_cache = response_cache
+        self.client = client
+        self.per_domain_limit = per_domain_limit
+        self.max_concurrency = max_concurrency
+        self._stats = defaultdict(int)
+
+    def _get_store(self) -> Optional[DescriptionStore]:
+        if self.store is None and self.store_path:
+            self.store = DescriptionStore(self.store_path)
+        return self.store
 
     def extract(self, url: str) -> Optional[str]:
+        store = self._get_store()
+        stored = store.get(url) if store is not None else None
+        if stored is not None:
+            self._stats['store_hits'] += 1
+            return stored
         for domain, adapter in self.adapters.items():
             if domain in url:
-                return adapter(url)
-        return self._extract_generic(url)
+                description = adapter(url)
+                break
+        else:
+            description = self._extract_generic(url)
+        if description and store is not None:
+            store.put(url, description)
+        return description
 
-    def _extract_greenhouse(self, url: str) -> Optional[str]:
+    async def extract_many(self, urls: Iterable[str],
+                           posting_keys: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+        """
+        Extract descriptions for many job URLs concurrently.
+
+        Args:
+            urls: Job posting URLs
+            posting_keys: Optional ``posting_key()`` per URL; URLs sharing a key
+                are treated as copies of one posting and fetched once
+
+        Returns:
+            Description (or None if it could not be extracted) for each URL
+        """
+        urls = list(dict.fromkeys(urls))
+        posting_keys = posting_keys or {}
+        store = self._get_store()
+        self._stats['requested'] += len(urls)
+
+        # Group tracking variants of one URL, then answer what the store already has
+        by_canonical: Dict[str, List[str]] = defaultdict(list)
+        for url in urls:
+            by_canonical[canonical_url(url)].append(url)
+        self._stats['duplicate_urls'] += len(urls) - len(by_canonical)
+        stored = await asyncio.to_thread(store.get_many, list(by_canonical)) if store is not None else {}
+        resolved: Dict[str, Optional[str]] = {}
+        for canonical in by_canonical:
+            if canonical in stored:
+                resolved[canonical] = stored[canonical]
+                self._stats['store_hits'] += 1
+
+        pending = [canonical for canonical in by_canonical if canonical not in resolved]
+        keys = {}
+        for canonical in pending:
+            key = next((posting_keys[url] for url in by_canonical[canonical] if url in posting_keys), None)
+            if key is not None:
+                keys[canonical] = key
+
+        # Syndicated copies: a posting stored under another URL, or several copies in this batch
+        known = (await asyncio.to_thread(store.find_by_posting_keys, set(keys.values()))
+                 if store is not None else {})
+        groups: Dict[str, List[str]] = defaultdict(list)
+        new_rows = []
+        for canonical in pending:
+            key = keys.get(canonical)
+            if key in known:
+                # Remember this URL too, so the next lookup is a plain store hit
+                resolved[canonical] = known[key]
+                new_rows.append((canonical, known[key], key))
+                self._stats['syndicated_hits'] += 1
+            else:
+                groups[key or canonical].append(canonical)
+        self._stats['syndicated_hits'] += sum(len(group) - 1 for group in groups.values())
+
+        domain_limits: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_domain_limit)
+        )
+        overall_limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(url: str) -> Optional[str]:
+            domain = urlparse(url).netloc.lower()
+            async with domain_limits[domain], overall_limit:
+                return await self._fetch_description(url)
+
+        group_list = list(groups.values())
+        fetched = await asyncio.gather(*(fetch(by_canonical[group[0]][0]) for group in group_list))
+
+        for group, description in zip(group_list, fetched):
+            for canonical in group:
+                resolved[canonical] = description
+            if description:
+                new_rows.extend((canonical, description, keys.get(canonical)) for canonical in group)
+        if new_rows and store is not None:
+            await asyncio.to_thread(store.put_many, new_rows)
+
+        return {url: resolved.get(canonical) for canonical, group in by_canonical.items() for url in group}
+
+    async def _fetch_description(self, url: str) -> Optional[str]:
+        """Fetch one job page through the ResponseCache and parse its description."""
+        if self.response_cache is None:
+            self.response_cache = ResponseCache()
+        self._stats['fetched'] += 1
         try:
-            resp = requests.get(url, timeout=10)
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            desc = soup.find('div', class_='description')
-            return desc.get_text(strip=True) if desc else None
-        except Exception:
+            entry = await self.response_cache.fetch(url, client=self.client)
+        except Exception as e:
+            logger.warning(f"Error fetching job description from {url}: {e}")
+            self._stats['failed'] += 1
             return None
+        if entry.status_code != 200:
+            self._stats['failed'] += 1
+            return None
+        # Parsing a full page takes long enough to stall other fetches
+        description = await asyncio.to_thread(self._parse, url, entry.content)
+        if not description:
+            self._stats['failed'] += 1
+        return description
 
-    def _extract_lever(self, url: str) -> Optional[str]:
+    def _parse(self, url: str, html: str) -> Optional[str]:
+        soup = BeautifulSoup(html, 'html.parser')
+        for domain, parser in self.parsers.items():
+            if domain in url:
+                return parser(soup)
+        return self._parse_generic(soup)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get extraction statistics.
+
+        Returns:
+            Dictionary with URLs requested, store and syndication hits, pages
+            fetched and failures
+        """
+        return {
+            'requested': self._stats['requested'],
+            'store_hits': self._stats['store_hits'],
+            'duplicate_urls': self._stats['duplicate_urls'],
+            'syndicated_hits': self._stats['syndicated_hits'],
+            'fetched': self._stats['fetched'],
+            'failed': self._stats['failed'],
+            'store': self.store.get_stats() if self.store is not None else {}
+        }
+
+    def _fetch_and_parse(self, url: str, parser: Callable[[BeautifulSoup], Optional[str]]) -> Optional[str]:
         try:
             resp = requests.get(url, timeout=10)
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            desc = soup.find('div', class_='content')
-            return desc.get_text(strip=True) if desc else None
+            return parser(BeautifulSoup(resp.text, 'html.parser'))
         except Exception:
             return None
 
+    def _extract_greenhouse(self, url: str) -> Optional[str]:
+        return self._fetch_and_parse(url, self._parse_greenhouse)
+
+    def _extract_lever(self, url: str) -> Optional[str]:
+        return self._fetch_and_parse(url, self._parse_lever)
+
     def _extract_remoteok(self, url: str) -> Optional[str]:
-        try:
-            resp = requests.get(url, timeout=10)
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            desc = soup.find('div', class_='job-description')
-            return desc.get_text(strip=True) if desc else None
-        except Exception:
-            return None
+        return self._fetch_and_parse(url, self._parse_remoteok)
 
     def _extract_generic(self, url: str) -> Optional[str]:
-        try:
-            resp = requests.get(url, timeout=10)
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            # Try common patterns
-            for cls in ['description', 'job-description', 'content', 'details']:
-                desc = soup.find('div', class_=cls)
-                if desc:
-                    return desc.get_text(strip=True)
-            # Fallback: get largest text block
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                return max((p.get_text(strip=True) for p in paragraphs), key=len, default=None)
-            return None
-        except Exception:
-            return None
+        return self._fetch_and_parse(url, self._parse_generic)
+
+    def _parse_greenhouse(self, soup: BeautifulSoup) -> Optional[str]:
+        desc = soup.find('div', class_='description')
+        return desc.get_text(strip=True) if desc else None
+
+    def _parse_lever(self, soup: BeautifulSoup) -> Optional[str]:
+        desc = soup.find('div', class_='content')
+        return desc.get_text(strip=True) if desc else None
+
+    def _parse_remoteok(self, soup: BeautifulSoup) -> Optional[str]:
+        desc = soup.find('div', class_='job-description')
+        return desc.get_text(strip=True) if desc else None
+
+    def _parse_generic(self, soup: BeautifulSoup) -> Optional[str]:
+        # Try common patterns
+        for cls in ['description', 'job-description', 'content', 'details']:
+            desc = soup.find('div', class_=cls)
+            if desc:
+                return desc.get_text(strip=True)
+        # Fallback: get largest text block
+        paragraphs = soup.find_all('p')
+        if paragraphs:
+            return max((p.get_text(strip=True) for p in paragraphs), key=len, default=None)
+        return None
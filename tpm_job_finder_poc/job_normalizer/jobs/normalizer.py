@@ -1,7 +1,8 @@
 
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from .schema import JobPosting
+from tpm_job_finder_poc.cache.near_duplicates import NearDuplicateDetector
 import logging
 
 def normalize_title(title: str) -> str:
@@ -47,13 +48,23 @@ def normalize_job(job: JobPosting) -> JobPosting:
 		logging.error(f"Failed to normalize job: {e}. Job: {job}")
 		raise
 
-def dedupe_jobs(jobs: List[JobPosting]) -> List[JobPosting]:
-	"""Remove duplicate jobs by URL, company, and title."""
+def dedupe_jobs(jobs: List[JobPosting], detector: Optional[NearDuplicateDetector] = None) -> List[JobPosting]:
+	"""Remove duplicate jobs by URL, company, and title.
+
+	If a NearDuplicateDetector is given, near-identical postings from different
+	sources (e.g. slightly different titles) are folded as well.
+	"""
 	seen: Dict[str, JobPosting] = {}
 	for job in jobs:
 		key = f"{str(job.url)}|{job.company}|{job.title}"
 		if key not in seen:
 			seen[key] = job
 	deduped = list(seen.values())
+	if detector is not None:
+		deduped, matches = detector.deduplicate(
+			deduped, lambda job: (str(job.url), job.title, job.company, job.description)
+		)
+		for match in matches:
+			logging.info(f"dedupe_jobs: {match.key} folded into cluster {match.cluster_id} ({match.similarity:.2f})")
 	logging.info(f"dedupe_jobs: {len(jobs)} input, {len(deduped)} output")
 	return deduped
\ No newline at end of file
@@ -1,21 +1,74 @@
 """Resume search functionality"""
 
-from typing import List, Dict
+import os
+from typing import List, Dict, Optional
+
+from tpm_job_finder_poc.enrichment.vector_index import VectorIndex
+
 
 class ResumeSearch:
-    """Resume search and retrieval"""
-    
-    def __init__(self):
+    """Resume search and retrieval over resume embeddings"""
+
+    def __init__(self, engine=None, index: Optional[VectorIndex] = None, index_path: Optional[str] = None):
+        """
+        Args:
+            engine: EmbeddingEngine used to embed resumes and queries
+                (the shared default model if omitted)
+            index: Vector index holding resume embeddings
+            index_path: File the index is loaded from and saved to
+        """
         self.search_index = {}
-        
+        self.engine = engine
+        self.index_path = index_path
+        if index is None:
+            index = VectorIndex.load(index_path) if index_path and os.path.exists(index_path) else VectorIndex()
+        self.vector_index = index
+
+    def _get_engine(self):
+        if self.engine is None:
+            from tpm_job_finder_poc.enrichment.embeddings import EmbeddingEngine
+            self.engine = EmbeddingEngine()
+        return self.engine
+
     def index_resume(self, resume_id: str, content: str):
         """Index resume for search"""
         self.search_index[resume_id] = content
-        
-    def search_resumes(self, query: str) -> List[Dict]:
+        try:
+            self.vector_index.add([resume_id], self._get_engine().encode([content]))
+        except Exception as e:
+            from tpm_job_finder_poc.error_handler.handler import handle_error
+            handle_error(e, context={'component': 'resume_store', 'method': 'index_resume', 'resume_id': resume_id})
+
+    def remove_resume(self, resume_id: str) -> bool:
+        """Remove resume from the search index"""
+        self.search_index.pop(resume_id, None)
+        return self.vector_index.remove([resume_id]) > 0
+
+    def save_index(self):
+        """Persist the vector index to ``index_path``"""
+        if self.index_path:
+            self.vector_index.save(self.index_path)
+
+    def search_resumes(self, query: str, top_k: int = 10) -> List[Dict]:
         """Search resumes by query"""
-        return []
-        
-    def find_similar_resumes(self, resume_id: str) -> List[str]:
+        if not query or not len(self.vector_index):
+            return []
+        try:
+            query_vector = self._get_engine().encode([query])[0]
+        except Exception as e:
+            from tpm_job_finder_poc.error_handler.handler import handle_error
+            handle_error(e, context={'component': 'resume_store', 'method': 'search_resumes', 'query': query})
+            return []
+        return [
+            {"resume_id": resume_id, "score": round(score, 4)}
+            for resume_id, score in self.vector_index.search(query_vector, k=top_k)
+        ]
+
+    def find_similar_resumes(self, resume_id: str, top_k: int = 10) -> List[str]:
         """Find similar resumes"""
-        return []
+        vector = self.vector_index.get_vector(resume_id)
+        if vector is None:
+            return []
+        matches = self.vector_index.search(vector, k=top_k + 1)
+        return [match_id for match_id, _ in matches if match_id != resume_id][:top_k]
+
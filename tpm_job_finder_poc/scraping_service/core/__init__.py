@@ -18,7 +18,8 @@ from .base_job_source import (
     ConfigurationError
 )
 from .service_registry import ServiceRegistry, registry
-from .orchestrator import ScrapingOrchestrator
+from .orchestrator import ScrapingOrchestrator, StreamEvent
+from .concurrency import AdaptiveConcurrencyLimiter
 
 __all__ = [
     "BaseJobSource",
@@ -34,5 +35,7 @@ __all__ = [
     "ConfigurationError",
     "ServiceRegistry",
     "registry",
-    "ScrapingOrchestrator"
+    "ScrapingOrchestrator",
+    "StreamEvent",
+    "AdaptiveConcurrencyLimiter"
 ]
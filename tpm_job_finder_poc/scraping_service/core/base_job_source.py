@@ -99,11 +99,17 @@ class BaseJobSource(ABC):
     must implement to be part of the scraping service ecosystem.
     """
     
+    # Sources that take a ``concurrency_limiter`` slot per page request set
+    # this, so the orchestrator hands them their limiter instead of gating
+    # each whole fetch on it
+    gates_requests: bool = False
+    
     def __init__(self, name: str, source_type: SourceType):
         self.name = name
         self.source_type = source_type
         self.enabled = True
         self._rate_limiter = None
+        self.concurrency_limiter = None
         
     @abstractmethod
     async def fetch_jobs(self, params: FetchParams) -> List[JobPosting]:
@@ -0,0 +1,182 @@
+"""
+Adaptive per-source concurrency control.
+
+Each source gets an AIMD (additive-increase / multiplicative-decrease) limit:
+the number of fetches allowed in flight grows by roughly one per window of
+healthy responses and is cut multiplicatively on rate limiting, unavailability
+or latency blow-ups. A ``RateLimitError.retry_after`` pauses the source until
+the suggested time has passed.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from .base_job_source import RateLimitError, SourceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(sorted_values, fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for a single source.
+
+    The limit is a float so additive increase can be spread across a window of
+    requests; ``int(limit)`` fetches may run at once.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: float = 2.0,
+        min_limit: float = 1.0,
+        max_limit: float = 10.0,
+        backoff_factor: float = 0.5,
+        latency_backoff_factor: float = 0.9,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.1,
+        window_size: int = 100
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Source name, used in logs
+            initial_limit: Starting concurrency
+            min_limit: Floor for the limit
+            max_limit: Ceiling for the limit
+            backoff_factor: Multiplier applied on rate-limit/unavailable errors
+            latency_backoff_factor: Multiplier applied when latency degrades
+            latency_tolerance: A fetch slower than this multiple of the recent
+                median latency counts as degraded
+            max_error_rate: Recent error rate above which the limit stops growing
+            window_size: Number of recent fetches used for latency/error stats
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.limit = min(max(initial_limit, min_limit), self.max_limit)
+        self.backoff_factor = backoff_factor
+        self.latency_backoff_factor = latency_backoff_factor
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._condition: Optional[asyncio.Condition] = None
+        self._condition_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.increases = 0
+        self.decreases = 0
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Conditions bind to the loop they first wait on; rebuild for a new loop
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+        return self._condition
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and for any retry-after pause to elapse."""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                pause = self.paused_until - time.monotonic()
+                if pause > 0:
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=pause)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                await condition.wait()
+
+    async def release(self, latency: float, error: Optional[BaseException] = None) -> None:
+        """
+        Return a slot and adapt the limit to the fetch outcome.
+
+        Args:
+            latency: Fetch duration in seconds
+            error: Exception raised by the fetch, if any
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            self._record(latency, error)
+            condition.notify_all()
+
+    def _record(self, latency: float, error: Optional[BaseException]) -> None:
+        if isinstance(error, RateLimitError):
+            self._outcomes.append(False)
+            retry_after = getattr(error, 'retry_after', None)
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            self._decrease(self.backoff_factor, "rate limited")
+            return
+        if isinstance(error, SourceUnavailableError):
+            self._outcomes.append(False)
+            self._decrease(self.backoff_factor, "unavailable")
+            return
+        if error is not None:
+            # Other failures (auth, parsing) say nothing about load on the source
+            self._outcomes.append(False)
+            return
+
+        self._outcomes.append(True)
+        median = _percentile(sorted(self._latencies), 0.5) if len(self._latencies) >= 5 else None
+        self._latencies.append(latency)
+        if median and latency > median * self.latency_tolerance:
+            self._decrease(self.latency_backoff_factor, f"latency {latency:.2f}s")
+        elif self.error_rate <= self.max_error_rate and self.limit < self.max_limit:
+            # +1 per window of `limit` healthy fetches
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self.increases += 1
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        new_limit = max(self.min_limit, self.limit * factor)
+        if new_limit < self.limit:
+            logger.info(f"Reducing concurrency for {self.name} to {new_limit:.2f} ({reason})")
+            self.decreases += 1
+        self.limit = new_limit
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return 1.0 - sum(self._outcomes) / len(self._outcomes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with the current limit and recent latency percentiles
+        """
+        latencies = sorted(self._latencies)
+        return {
+            "limit": int(self.limit),
+            "limit_exact": round(self.limit, 3),
+            "in_flight": self.in_flight,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "paused_for_seconds": max(0.0, round(self.paused_until - time.monotonic(), 3)),
+            "error_rate": round(self.error_rate, 3),
+            "samples": len(latencies),
+            "latency_p50": _percentile(latencies, 0.5),
+            "latency_p90": _percentile(latencies, 0.9),
+            "latency_p99": _percentile(latencies, 0.99),
+            "increases": self.increases,
+            "decreases": self.decreases
+        }
@@ -7,8 +7,10 @@ failures, deduplication, and aggregation of results.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Set
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Set, AsyncIterator
 from concurrent.futures import as_completed
 from collections import defaultdict
 
@@ -22,10 +24,52 @@ from .base_job_source import (
     RateLimitError
 )
 from .service_registry import ServiceRegistry
+from .concurrency import AdaptiveConcurrencyLimiter
+from tpm_job_finder_poc.cache.near_duplicates import NearDuplicateDetector
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StreamEvent:
+    """
+    One event from ``ScrapingOrchestrator.stream_all_sources``.
+    
+    ``type`` is ``"job"`` (a new deduplicated posting), ``"source_complete"``,
+    ``"source_error"`` or, last of all, ``"summary"`` with the run metadata.
+    """
+    type: str
+    source: Optional[str] = None
+    job: Optional[JobPosting] = None
+    error: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class _DedupeState:
+    """Incremental URL and title+company deduplication."""
+    
+    def __init__(self):
+        self.seen_urls: Set[str] = set()
+        self.seen_combinations: Set[str] = set()
+        
+    def add(self, job: JobPosting) -> bool:
+        """Record a job, returning False if it duplicates one already seen."""
+        # Check URL-based deduplication first (most reliable)
+        if job.url and job.url in self.seen_urls:
+            return False
+            
+        # Check title+company combination
+        combo_key = f"{job.title}|{job.company}".lower()
+        if combo_key in self.seen_combinations:
+            return False
+            
+        # Add to seen sets
+        if job.url:
+            self.seen_urls.add(job.url)
+        self.seen_combinations.add(combo_key)
+        return True
+
+
 class ScrapingOrchestrator:
     """
     Orchestrates job fetching across multiple sources.
@@ -34,17 +78,45 @@ class ScrapingOrchestrator:
     and basic deduplication of job postings.
     """
     
-    def __init__(self, registry: ServiceRegistry, max_concurrent: int = 10):
+    def __init__(
+        self,
+        registry: ServiceRegistry,
+        max_concurrent: int = 10,
+        near_duplicate_detector: Optional[NearDuplicateDetector] = None,
+        max_concurrent_per_source: Optional[int] = None,
+        initial_concurrency_per_source: int = 2
+    ):
         """
         Initialize the orchestrator.
         
         Args:
             registry: Service registry containing job sources
             max_concurrent: Maximum number of concurrent fetch operations
+            near_duplicate_detector: Optional MinHash/LSH detector used to fold
+                the same role syndicated by several sources into one job
+            max_concurrent_per_source: Ceiling for each source's adaptive
+                concurrency limit (defaults to max_concurrent)
+            initial_concurrency_per_source: Starting limit for each source
         """
         self.registry = registry
         self.max_concurrent = max_concurrent
+        self.near_duplicate_detector = near_duplicate_detector
+        self.max_concurrent_per_source = max_concurrent_per_source or max_concurrent
+        self.initial_concurrency_per_source = initial_concurrency_per_source
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._source_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+        
+    def _get_source_limiter(self, source_name: str) -> AdaptiveConcurrencyLimiter:
+        """Get (or create) the adaptive concurrency limiter for a source."""
+        limiter = self._source_limiters.get(source_name)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(
+                source_name,
+                initial_limit=self.initial_concurrency_per_source,
+                max_limit=self.max_concurrent_per_source
+            )
+            self._source_limiters[source_name] = limiter
+        return limiter
         
     async def fetch_all_sources(
         self, 
@@ -65,26 +137,7 @@ class ScrapingOrchestrator:
         """
         start_time = datetime.now(timezone.utc)
         
-        # Determine which sources to use
-        if source_names:
-            sources = [self.registry.get_source(name) for name in source_names]
-            sources = [s for s in sources if s is not None]
-        else:
-            # Get all enabled sources
-            enabled_source_names = self.registry.list_sources(enabled_only=True)
-            sources = [self.registry.get_source(name) for name in enabled_source_names]
-            
-        # Filter by health status if requested
-        if not include_unhealthy:
-            healthy_sources = []
-            for source in sources:
-                health_status = self.registry.get_health_status(source.name)
-                if health_status in [HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.UNKNOWN]:
-                    healthy_sources.append(source)
-                else:
-                    logger.warning(f"Skipping unhealthy source: {source.name}")
-            sources = healthy_sources
-            
+        sources = self._select_sources(source_names, include_unhealthy)
         logger.info(f"Fetching jobs from {len(sources)} sources with params: {params}")
         
         # Execute fetches concurrently
@@ -96,7 +149,8 @@ class ScrapingOrchestrator:
         # Wait for all tasks to complete
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        # Process results
+        # Process results; each job is serialized once and shared by both views
+        job_dicts: Dict[int, Dict[str, Any]] = {}
         all_jobs = []
         source_results = {}
         errors = {}
@@ -116,44 +170,178 @@ class ScrapingOrchestrator:
             else:
                 jobs = result if result else []
                 all_jobs.extend(jobs)
+                for job in jobs:
+                    job_dicts[id(job)] = job.to_dict()
                 source_results[source.name] = {
-                    "jobs": [job.to_dict() for job in jobs],
+                    "jobs": [job_dicts[id(job)] for job in jobs],
                     "count": len(jobs),
                     "error": None
                 }
                 
         # Basic deduplication
         deduplicated_jobs = self._deduplicate_jobs(all_jobs)
+        near_duplicates = []
+        if self.near_duplicate_detector is not None:
+            deduplicated_jobs, near_duplicates = self.near_duplicate_detector.deduplicate(
+                deduplicated_jobs,
+                lambda job: (job.url or f"{job.source}:{job.id}", job.title, job.company, job.description)
+            )
         
         end_time = datetime.now(timezone.utc)
-        fetch_duration = (end_time - start_time).total_seconds()
         
         return {
-            "jobs": [job.to_dict() for job in deduplicated_jobs],
-            "metadata": {
-                "total_jobs": len(deduplicated_jobs),
-                "raw_jobs": len(all_jobs),
-                "duplicates_removed": len(all_jobs) - len(deduplicated_jobs),
-                "sources_queried": len(sources),
-                "successful_sources": len(sources) - len(errors),
-                "failed_sources": len(errors),
-                "fetch_start_time": start_time.isoformat(),
-                "fetch_end_time": end_time.isoformat(),
-                "fetch_duration_seconds": fetch_duration,
-                "timestamp": end_time.isoformat(),
-                "params": {
-                    "keywords": params.keywords,
-                    "location": params.location,
-                    "company_ids": params.company_ids,
-                    "date_range": params.date_range,
-                    "limit": params.limit,
-                    "offset": params.offset
-                }
-            },
+            "jobs": [job_dicts[id(job)] for job in deduplicated_jobs],
+            "metadata": self._build_metadata(
+                params, sources, errors, len(all_jobs), len(deduplicated_jobs),
+                near_duplicates, start_time, end_time
+            ),
             "source_results": source_results,
             "errors": errors
         }
         
+    async def stream_all_sources(
+        self,
+        params: FetchParams,
+        source_names: Optional[List[str]] = None,
+        include_unhealthy: bool = False
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Stream deduplicated jobs as each source completes.
+        
+        Unlike ``fetch_all_sources`` a slow source does not hold back results
+        from faster ones: jobs are deduplicated against everything yielded so
+        far and emitted as soon as their source returns. The final event is a
+        ``"summary"`` carrying the same metadata ``fetch_all_sources`` returns.
+        Closing the iterator early cancels the outstanding fetches.
+        
+        Args:
+            params: Parameters for the job fetch operation
+            source_names: Optional list of specific sources to use
+            include_unhealthy: Whether to include sources with unhealthy status
+            
+        Yields:
+            StreamEvent objects
+        """
+        start_time = datetime.now(timezone.utc)
+        sources = self._select_sources(source_names, include_unhealthy)
+        logger.info(f"Streaming jobs from {len(sources)} sources with params: {params}")
+        
+        pending = {
+            asyncio.create_task(self._fetch_from_source(source, params)): source
+            for source in sources
+        }
+        dedupe_state = _DedupeState()
+        errors = {}
+        raw_count = 0
+        unique_count = 0
+        near_duplicates = []
+        
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    source = pending.pop(task)
+                    try:
+                        jobs = task.result() or []
+                    except Exception as e:
+                        errors[source.name] = str(e)
+                        logger.error(f"Error fetching from {source.name}: {e}")
+                        yield StreamEvent(type="source_error", source=source.name, error=str(e))
+                        continue
+                        
+                    raw_count += len(jobs)
+                    new_jobs = [job for job in jobs if dedupe_state.add(job)]
+                    if self.near_duplicate_detector is not None:
+                        new_jobs, matches = self.near_duplicate_detector.deduplicate(
+                            new_jobs,
+                            lambda job: (job.url or f"{job.source}:{job.id}", job.title, job.company, job.description)
+                        )
+                        near_duplicates.extend(matches)
+                        
+                    for job in new_jobs:
+                        unique_count += 1
+                        yield StreamEvent(type="job", source=source.name, job=job)
+                    yield StreamEvent(
+                        type="source_complete",
+                        source=source.name,
+                        metadata={"count": len(jobs), "new": len(new_jobs)}
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
+                
+        end_time = datetime.now(timezone.utc)
+        yield StreamEvent(
+            type="summary",
+            metadata=self._build_metadata(
+                params, sources, errors, raw_count, unique_count,
+                near_duplicates, start_time, end_time
+            )
+        )
+        
+    def _build_metadata(
+        self,
+        params: FetchParams,
+        sources: List[BaseJobSource],
+        errors: Dict[str, str],
+        raw_count: int,
+        unique_count: int,
+        near_duplicates: List[Any],
+        start_time: datetime,
+        end_time: datetime
+    ) -> Dict[str, Any]:
+        """Build the run metadata shared by the batch and streaming modes."""
+        return {
+            "total_jobs": unique_count,
+            "raw_jobs": raw_count,
+            "duplicates_removed": raw_count - unique_count,
+            "near_duplicates_removed": len(near_duplicates),
+            "duplicate_clusters": [match.to_dict() for match in near_duplicates],
+            "sources_queried": len(sources),
+            "successful_sources": len(sources) - len(errors),
+            "failed_sources": len(errors),
+            "fetch_start_time": start_time.isoformat(),
+            "fetch_end_time": end_time.isoformat(),
+            "fetch_duration_seconds": (end_time - start_time).total_seconds(),
+            "timestamp": end_time.isoformat(),
+            "params": {
+                "keywords": params.keywords,
+                "location": params.location,
+                "company_ids": params.company_ids,
+                "date_range": params.date_range,
+                "limit": params.limit,
+                "offset": params.offset
+            }
+        }
+        
+    def _select_sources(
+        self,
+        source_names: Optional[List[str]],
+        include_unhealthy: bool
+    ) -> List[BaseJobSource]:
+        """Resolve the sources to fetch from, skipping unhealthy ones unless asked."""
+        # Determine which sources to use
+        if source_names:
+            sources = [self.registry.get_source(name) for name in source_names]
+            sources = [s for s in sources if s is not None]
+        else:
+            # Get all enabled sources
+            enabled_source_names = self.registry.list_sources(enabled_only=True)
+            sources = [self.registry.get_source(name) for name in enabled_source_names]
+            
+        # Filter by health status if requested
+        if not include_unhealthy:
+            healthy_sources = []
+            for source in sources:
+                health_status = self.registry.get_health_status(source.name)
+                if health_status in [HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.UNKNOWN]:
+                    healthy_sources.append(source)
+                else:
+                    logger.warning(f"Skipping unhealthy source: {source.name}")
+            sources = healthy_sources
+            
+        return sources
+        
     async def fetch_from_sources(
         self,
         source_names: List[str],
@@ -189,32 +377,54 @@ class ScrapingOrchestrator:
         Returns:
             List of job postings from the source
         """
-        async with self._semaphore:
-            try:
-                logger.debug(f"Starting fetch from {source.name}")
+        limiter = self._get_source_limiter(source.name)
+        fetch_limiter = None
+        if source.gates_requests:
+            # The source takes a slot per page request, so its limit widens and
+            # backs off within this fetch rather than only across searches
+            source.concurrency_limiter = limiter
+        else:
+            # Wait on the per-source limit before taking a global slot, so a
+            # backed-off source never holds capacity other sources could use
+            fetch_limiter = limiter
+            await fetch_limiter.acquire()
+        start = None
+        error = None
+        try:
+            async with self._semaphore:
+                start = time.monotonic()
+                try:
+                    logger.debug(f"Starting fetch from {source.name}")
                 
-                jobs = await source.fetch_jobs(params)
+                    jobs = await source.fetch_jobs(params)
                 
-                logger.info(f"Successfully fetched {len(jobs)} jobs from {source.name}")
-                return jobs
+                    logger.info(f"Successfully fetched {len(jobs)} jobs from {source.name}")
+                    return jobs
                 
-            except RateLimitError as e:
-                logger.warning(f"Rate limit exceeded for {source.name}: {e}")
-                if hasattr(e, 'retry_after') and e.retry_after:
-                    logger.info(f"Suggested retry after: {e.retry_after} seconds")
-                raise
+                except RateLimitError as e:
+                    logger.warning(f"Rate limit exceeded for {source.name}: {e}")
+                    if hasattr(e, 'retry_after') and e.retry_after:
+                        logger.info(f"Suggested retry after: {e.retry_after} seconds")
+                    raise
                 
-            except AuthenticationError as e:
-                logger.error(f"Authentication failed for {source.name}: {e}")
-                raise
+                except AuthenticationError as e:
+                    logger.error(f"Authentication failed for {source.name}: {e}")
+                    raise
                 
-            except SourceUnavailableError as e:
-                logger.warning(f"Source {source.name} is unavailable: {e}")
-                raise
+                except SourceUnavailableError as e:
+                    logger.warning(f"Source {source.name} is unavailable: {e}")
+                    raise
                 
-            except Exception as e:
-                logger.error(f"Unexpected error fetching from {source.name}: {e}")
-                raise
+                except Exception as e:
+                    logger.error(f"Unexpected error fetching from {source.name}: {e}")
+                    raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if fetch_limiter is not None:
+                latency = time.monotonic() - start if start is not None else 0.0
+                await fetch_limiter.release(latency, error)
                 
     def _deduplicate_jobs(self, jobs: List[JobPosting]) -> List[JobPosting]:
         """
@@ -230,26 +440,8 @@ class ScrapingOrchestrator:
             return []
             
         # Simple deduplication based on URL and title+company
-        seen_urls: Set[str] = set()
-        seen_combinations: Set[str] = set()
-        deduplicated = []
-        
-        for job in jobs:
-            # Check URL-based deduplication first (most reliable)
-            if job.url and job.url in seen_urls:
-                continue
-                
-            # Check title+company combination
-            combo_key = f"{job.title}|{job.company}".lower()
-            if combo_key in seen_combinations:
-                continue
-                
-            # Add to seen sets
-            if job.url:
-                seen_urls.add(job.url)
-            seen_combinations.add(combo_key)
-            
-            deduplicated.append(job)
+        dedupe_state = _DedupeState()
+        deduplicated = [job for job in jobs if dedupe_state.add(job)]
             
         logger.info(f"Deduplication: {len(jobs)} -> {len(deduplicated)} jobs")
         return deduplicated
@@ -348,5 +540,9 @@ class ScrapingOrchestrator:
             "max_concurrent": self.max_concurrent,
             "registry_stats": registry_stats,
             "semaphore_available": self._semaphore._value,
-            "semaphore_locked": self.max_concurrent - self._semaphore._value
+            "semaphore_locked": self.max_concurrent - self._semaphore._value,
+            "max_concurrent_per_source": self.max_concurrent_per_source,
+            "source_concurrency": {
+                name: limiter.get_stats() for name, limiter in self._source_limiters.items()
+            }
         }
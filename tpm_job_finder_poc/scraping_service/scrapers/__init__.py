@@ -5,6 +5,7 @@ Contains browser-based job scrapers for various job boards and platforms.
 """
 
 from .base_scraper import BaseScraper, BrowserProfile
+from .browser_pool import BrowserPool, PooledBrowser
 from .indeed import IndeedScraper
 from .linkedin import LinkedInScraper
 from .ziprecruiter import ZipRecruiterScraper
@@ -13,6 +14,8 @@ from .greenhouse import GreenhouseScraper
 __all__ = [
     'BaseScraper',
     'BrowserProfile', 
+    'BrowserPool',
+    'PooledBrowser',
     'IndeedScraper',
     'LinkedInScraper',
     'ZipRecruiterScraper', 
@@ -0,0 +1,139 @@
+"""
+Executor-backed async facade over a Selenium WebDriver.
+
+Selenium calls are blocking HTTP round trips to chromedriver. Awaiting them
+directly inside ``async def`` scraper methods freezes the event loop, so
+"concurrent" scrapers run one at a time. ``AsyncWebDriver`` pins each browser
+session to its own worker thread and exposes awaitable versions of the
+WebDriver operations scrapers use.
+
+Scraper routines written against the synchronous driver API (card parsing,
+pagination) can be moved to the session thread as a whole with ``run``: the
+thread owns a private event loop, so the routine's own ``await`` calls keep
+working while its WebDriver calls block only that thread.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class AsyncWebDriver:
+    """Awaitable WebDriver operations on a dedicated per-session thread."""
+
+    def __init__(self, driver: Any, name: str = "browser"):
+        """
+        Wrap a WebDriver instance.
+
+        Args:
+            driver: Selenium WebDriver (or compatible) instance
+            name: Label for the worker thread
+        """
+        self.driver = driver
+        self.name = name
+        self._thread_id: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"webdriver-{name}",
+            initializer=self._init_worker
+        )
+        self._closed = False
+
+    def _init_worker(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+    def in_worker_thread(self) -> bool:
+        """Whether the caller is already running on this session's thread."""
+        return threading.get_ident() == self._thread_id
+
+    async def call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking callable on the session thread.
+
+        Args:
+            fn: Callable performing WebDriver I/O
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value
+        """
+        if self.in_worker_thread():
+            # Already inside a routine started with run(); don't queue behind ourselves
+            return fn(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def run(self, routine: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        Run an async scraper routine on the session thread's event loop.
+
+        Args:
+            routine: Coroutine function using the synchronous driver API
+            *args: Positional arguments for routine
+            **kwargs: Keyword arguments for routine
+
+        Returns:
+            routine's result
+        """
+        if self.in_worker_thread():
+            return await routine(*args, **kwargs)
+        return await self.call(lambda: self._loop.run_until_complete(routine(*args, **kwargs)))
+
+    async def get(self, url: str) -> None:
+        await self.call(self.driver.get, url)
+
+    async def execute_script(self, script: str, *args) -> Any:
+        return await self.call(self.driver.execute_script, script, *args)
+
+    async def find_element(self, by: str, value: str) -> Any:
+        return await self.call(self.driver.find_element, by, value)
+
+    async def find_elements(self, by: str, value: str) -> List[Any]:
+        return await self.call(self.driver.find_elements, by, value)
+
+    async def wait_until(self, condition: Callable[[Any], Any], timeout: float = 10) -> Any:
+        """
+        Await a ``WebDriverWait(...).until(condition)`` without blocking the loop.
+
+        Args:
+            condition: Expected condition or callable taking the driver
+            timeout: Seconds before TimeoutException is raised
+
+        Returns:
+            The condition's truthy result
+        """
+        return await self.call(lambda: WebDriverWait(self.driver, timeout).until(condition))
+
+    async def current_url(self) -> str:
+        return await self.call(lambda: self.driver.current_url)
+
+    async def page_source(self) -> str:
+        return await self.call(lambda: self.driver.page_source)
+
+    async def title(self) -> str:
+        return await self.call(lambda: self.driver.title)
+
+    async def aclose(self) -> None:
+        """Quit the browser and stop the session thread."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self.call(self.driver.quit)
+        finally:
+            if self._loop is not None:
+                self._executor.submit(self._loop.close)
+            self._executor.shutdown(wait=False)
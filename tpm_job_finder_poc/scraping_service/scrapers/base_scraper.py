@@ -6,18 +6,21 @@ with Selenium or Playwright.
 """
 
 from abc import abstractmethod
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union, AsyncIterator
 import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone, timedelta
+from urllib.parse import urlparse, urlencode, parse_qsl, urlunparse
+import httpx
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 
 from ..core.base_job_source import (
     BaseJobSource,
@@ -30,6 +33,15 @@ from ..core.base_job_source import (
     SourceUnavailableError,
     RateLimitError
 )
+from tpm_job_finder_poc.job_aggregator.scrapers.rate_limiter import RateLimiter
+from tpm_job_finder_poc.job_aggregator.scrapers.captcha_handler import CaptchaDetector
+from tpm_job_finder_poc.job_aggregator.services.http_client import get_http_client
+from .browser_pool import BrowserPool, PooledBrowser, get_chromedriver_path
+from .async_driver import AsyncWebDriver
+from .page_snapshot import PageSnapshot
+from .structured_data import extract_structured_jobs
+from .readiness import PageReadiness
+from .resource_blocking import ResourceBlocker, ResourceBlockingRules
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +65,13 @@ class BrowserProfile:
         return random.choice(profiles)
 
 
+class _RequestSlot:
+    """Outcome of one page request, reported to the source's concurrency limiter."""
+    
+    def __init__(self):
+        self.error: Optional[BaseException] = None
+
+
 class BaseScraper(BaseJobSource):
     """
     Base class for browser-based job scrapers.
@@ -61,7 +80,11 @@ class BaseScraper(BaseJobSource):
     anti-detection measures, and element interaction utilities.
     """
     
-    def __init__(self, name: str, base_url: str, rate_limits: Optional[RateLimitConfig] = None):
+    gates_requests = True
+    
+    def __init__(self, name: str, base_url: str, rate_limits: Optional[RateLimitConfig] = None,
+                 rate_limit_db_path: Optional[str] = None, snapshot_parsing: bool = True,
+                 http_first: bool = False):
         """
         Initialize the scraper.
         
@@ -69,6 +92,12 @@ class BaseScraper(BaseJobSource):
             name: Name of the scraper
             base_url: Base URL of the job site
             rate_limits: Rate limiting configuration
+            rate_limit_db_path: SQLite file holding rate-limit state shared with
+                other worker processes scraping the same site (optional)
+            snapshot_parsing: Parse result pages from a single HTML snapshot
+                instead of querying live elements card by card
+            http_first: Try a plain HTTP fetch (structured data, then static
+                markup) before escalating to the browser
         """
         super().__init__(name, SourceType.BROWSER_SCRAPER)
         self.base_url = base_url.rstrip('/')
@@ -77,8 +106,29 @@ class BaseScraper(BaseJobSource):
             requests_per_hour=300
         )
         self._driver: Optional[webdriver.Chrome] = None
+        self._driver_facade: Optional[AsyncWebDriver] = None
         self._profile = BrowserProfile.random_profile()
         self._last_request_time: Optional[datetime] = None
+        self._rate_limiter = RateLimiter.from_config(self._rate_limits, db_path=rate_limit_db_path)
+        self._rate_limit_domain = urlparse(self.base_url).netloc or self.base_url
+        self._browser_pool: Optional[BrowserPool] = None
+        self._lease: Optional[PooledBrowser] = None
+        self.snapshot_parsing = snapshot_parsing
+        self.http_first = http_first
+        # Results pages per query (first page included) and how many load at once
+        self.max_pages = 4
+        self.page_concurrency = 3
+        self._captcha_detector = CaptchaDetector()
+        self._readiness = PageReadiness(name)
+        rules = self.get_resource_rules()
+        self._resource_blocker = ResourceBlocker(name, rules) if rules is not None else None
+        self._fetch_stats = {
+            "http_attempts": 0,
+            "http_hits": 0,
+            "structured_data_hits": 0,
+            "browser_fetches": 0,
+            "fallback_reasons": defaultdict(int)
+        }
         
     @abstractmethod
     def get_search_url(self, **kwargs) -> str:
@@ -116,6 +166,17 @@ class BaseScraper(BaseJobSource):
         """
         pass
         
+    def get_resource_rules(self) -> Optional[ResourceBlockingRules]:
+        """
+        Get the requests this site's browser sessions should block.
+        
+        Subclasses extend the defaults with site-specific deny/allow patterns.
+        
+        Returns:
+            Blocking rules, or None to load every resource
+        """
+        return ResourceBlockingRules()
+        
     async def setup_browser(self) -> webdriver.Chrome:
         """
         Set up and configure the browser instance.
@@ -134,22 +195,25 @@ class BaseScraper(BaseJobSource):
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
-        # Performance optimizations
-        options.add_argument("--disable-images")
+        # Performance optimizations; images, fonts and trackers are blocked
+        # per request below, since Chrome has no switch that disables images
         options.add_argument("--disable-plugins")
         options.add_argument("--disable-extensions")
+        if self._resource_blocker is not None:
+            self._resource_blocker.configure_options(options)
         
         # Headless mode (can be disabled for debugging)
         options.add_argument("--headless")
         
-        # Use webdriver-manager for automatic driver management
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        # Use webdriver-manager for automatic driver management (resolved once per process);
+        # launching Chrome blocks for seconds, so keep it off the event loop
+        service = Service(await asyncio.to_thread(get_chromedriver_path))
+        driver = await asyncio.to_thread(webdriver.Chrome, service=service, options=options)
         
         # Execute script to remove webdriver property
         # Execute JavaScript for anti-detection (safely)
         try:
-            driver.execute_script("""
+            await asyncio.to_thread(driver.execute_script, """
                 // Remove webdriver traces (check if property exists first)
                 if (navigator.webdriver !== undefined) {
                     try {
@@ -162,6 +226,9 @@ class BaseScraper(BaseJobSource):
             """)
         except Exception as e:
             logger.warning(f"Could not execute anti-detection script: {e}")
+            
+        if self._resource_blocker is not None:
+            await asyncio.to_thread(self._resource_blocker.apply, driver)
         
         return driver
         
@@ -173,21 +240,82 @@ class BaseScraper(BaseJobSource):
             True if initialization was successful
         """
         try:
-            self._driver = await self.setup_browser()
+            if self._browser_pool is not None:
+                if self._lease is None:
+                    self._lease = await self._browser_pool.acquire(self)
+                self._driver = self._lease.driver
+            else:
+                self._driver = await self.setup_browser()
             logger.info(f"Successfully initialized scraper: {self.name}")
             return True
         except Exception as e:
             logger.error(f"Error initializing scraper {self.name}: {e}")
             return False
             
+    def use_browser_pool(self, pool: Optional[BrowserPool]) -> None:
+        """
+        Lease browsers from a shared warm pool instead of launching one per initialize.
+        
+        Args:
+            pool: BrowserPool to lease from, or None to launch browsers directly
+        """
+        self._browser_pool = pool
+        
+    @property
+    def _browser(self) -> AsyncWebDriver:
+        """Awaitable facade over ``_driver``; all WebDriver I/O goes through its session thread."""
+        if self._lease is not None and self._lease.driver is self._driver:
+            return self._lease.browser
+        if self._driver_facade is None or self._driver_facade.driver is not self._driver:
+            self._driver_facade = AsyncWebDriver(self._driver, name=self.name)
+        return self._driver_facade
+        
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[_RequestSlot]:
+        """
+        Hold one of this source's adaptive concurrency slots for a page request.
+        
+        The request's latency and outcome (an exception raised in the block, or
+        ``slot.error`` set by the caller) go to ``concurrency_limiter``, so the
+        number of pages in flight adapts while a query runs.
+        """
+        slot = _RequestSlot()
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            yield slot
+            return
+        await limiter.acquire()
+        start = time.monotonic()
+        try:
+            yield slot
+        except BaseException as e:
+            slot.error = e
+            raise
+        finally:
+            await limiter.release(time.monotonic() - start, slot.error)
+            
+    def _record_page(self) -> None:
+        """Count a page load against the pooled session's recycle budget."""
+        self._readiness.record_page()
+        if self._lease is not None:
+            self._lease.record_page()
+            
     async def cleanup(self) -> None:
         """Clean up resources including browser instance."""
+        if self._lease is not None:
+            # Pooled sessions go back to the pool warm instead of being quit
+            lease, self._lease = self._lease, None
+            self._driver = None
+            await self._browser_pool.release(lease)
+            return
+            
         if self._driver:
             try:
-                self._driver.quit()
+                await self._browser.aclose()
             except Exception as e:
                 logger.warning(f"Error closing browser for {self.name}: {e}")
             self._driver = None
+            self._driver_facade = None
             
     async def health_check(self) -> HealthCheckResult:
         """
@@ -203,19 +331,21 @@ class BaseScraper(BaseJobSource):
             
         try:
             # Navigate to base URL and check if it loads
-            self._driver.get(self.base_url)
+            await self._browser.get(self.base_url)
+            self._record_page()
             
             # Wait for page to load
-            WebDriverWait(self._driver, 10).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
+            await self._browser.wait_until(
+                lambda d: d.execute_script("return document.readyState") == "complete",
+                timeout=10
             )
             
             end_time = datetime.now(timezone.utc)
             response_time = (end_time - start_time).total_seconds() * 1000
             
             # Check if we got blocked or redirected to CAPTCHA
-            current_url = self._driver.current_url
-            page_source = self._driver.page_source.lower()
+            current_url = await self._browser.current_url()
+            page_source = (await self._browser.page_source()).lower()
             
             if "captcha" in page_source or "robot" in page_source:
                 return HealthCheckResult(
@@ -249,6 +379,8 @@ class BaseScraper(BaseJobSource):
             )
         except Exception as e:
             end_time = datetime.now(timezone.utc)
+            if self._lease is not None:
+                self._lease.mark_unhealthy()
             return HealthCheckResult(
                 status=HealthStatus.UNHEALTHY,
                 message=f"Health check failed: {str(e)}",
@@ -272,9 +404,6 @@ class BaseScraper(BaseJobSource):
         """
         jobs = []
         
-        if not self._driver:
-            await self.initialize()
-            
         try:
             # Apply rate limiting
             await self._apply_rate_limiting()
@@ -282,23 +411,45 @@ class BaseScraper(BaseJobSource):
             # Construct search URL
             search_url = self._build_search_url(params)
             
+            # Fast path: no browser at all if the page is served statically
+            if self.http_first:
+                http_jobs = await self._fetch_page_via_http(search_url)
+                if http_jobs is not None:
+                    http_jobs = await self._fetch_more_pages_via_http(search_url, params, http_jobs)
+                if http_jobs is not None:
+                    self._last_request_time = datetime.now(timezone.utc)
+                    logger.info(f"Fetched {len(http_jobs)} jobs from {self.name} over HTTP")
+                    return http_jobs[:params.limit] if params.limit else http_jobs
+                # The browser load is a second request to the site
+                await self._apply_rate_limiting()
+                
+            if not self._driver:
+                await self.initialize()
+            self._fetch_stats["browser_fetches"] += 1
+            
             # Navigate to search page
             logger.info(f"Navigating to: {search_url}")
-            self._driver.get(search_url)
-            
-            # Wait for page to load
-            await self._wait_for_page_load()
+            async with self._request_slot():
+                await self._browser.get(search_url)
+                self._record_page()
+                
+                # Wait for page to load
+                await self._wait_for_page_load()
             
             # Handle any popups or cookie banners
             await self._handle_popups()
             
-            # Parse jobs from current page
-            page_jobs = await self.parse_job_elements(self._driver)
+            # Parse jobs from current page; scraper parsing uses the synchronous
+            # driver API, so it runs on the session thread rather than the loop
+            page_jobs = await self._browser.run(self._parse_current_page)
             jobs.extend(page_jobs)
             
             # Handle pagination if needed and limit not reached
             if params.limit is None or len(jobs) < params.limit:
-                jobs.extend(await self._handle_pagination(params, len(jobs)))
+                if self.get_page_url(search_url, 1) is not None:
+                    jobs.extend(await self._fetch_offset_pages(search_url, params, page_jobs))
+                else:
+                    jobs.extend(await self._browser.run(self._handle_pagination, params, len(jobs)))
                 
             # Apply limit if specified
             if params.limit and len(jobs) > params.limit:
@@ -311,8 +462,353 @@ class BaseScraper(BaseJobSource):
             
         except Exception as e:
             logger.error(f"Error scraping jobs from {self.name}: {e}")
+            if self._lease is not None and isinstance(e, WebDriverException) and not isinstance(e, TimeoutException):
+                # The session itself failed; don't hand it to the next query
+                self._lease.mark_unhealthy()
             raise SourceUnavailableError(f"Scraping failed: {str(e)}")
             
+    async def _fetch_page_via_http(self, url: str) -> Optional[List[JobPosting]]:
+        """
+        Try to get a results page's jobs without a browser.
+        
+        The page is fetched with the shared pooled HTTP client; jobs come from
+        embedded structured data (JSON-LD / ``__NEXT_DATA__``) when present,
+        otherwise from the static markup via ``parse_job_elements``.
+        
+        Args:
+            url: Results page URL
+            
+        Returns:
+            Jobs on the page, or None when the browser is needed (request
+            failed, CAPTCHA served, or no jobs in the static page)
+        """
+        self._fetch_stats["http_attempts"] += 1
+        jobs, reason = await self._load_page_via_http(url)
+        if jobs is not None:
+            self._fetch_stats["http_hits"] += 1
+            return jobs
+            
+        self._fetch_stats["fallback_reasons"][reason] += 1
+        logger.info(f"Falling back to browser for {self.name} ({reason})")
+        return None
+        
+    async def _fetch_more_pages_via_http(self, search_url: str, params: FetchParams,
+                                         first_page: List[JobPosting]) -> Optional[List[JobPosting]]:
+        """
+        Complete an HTTP fast-path result with the following results pages.
+        
+        URL-addressed pages are fetched over HTTP one at a time through the rate
+        limiter, stopping once ``params.limit`` is covered, a page has no new
+        jobs, or a page is entirely older than ``params.date_range``. Sites that
+        paginate by clicking need the browser when the first page falls short
+        of the limit.
+        
+        Args:
+            search_url: URL of the first results page
+            params: Fetch parameters
+            first_page: Jobs already parsed from the first page
+            
+        Returns:
+            Jobs from all pages, or None when the browser is needed
+        """
+        if params.limit and len(first_page) >= params.limit:
+            return first_page
+        if self.get_page_url(search_url, 1) is None:
+            return first_page if params.limit is None else None
+            
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=params.date_range)
+                  if params.date_range else None)
+        jobs = list(first_page)
+        seen = {job.id for job in jobs}
+        page_jobs = first_page
+        for page in range(1, self.max_pages):
+            if self._is_past_cutoff(page_jobs, cutoff) or (params.limit and len(jobs) >= params.limit):
+                break
+            await self._apply_rate_limiting()
+            page_jobs, reason = await self._load_page_via_http(self.get_page_url(search_url, page))
+            if reason == "no_jobs":
+                break
+            if page_jobs is None:
+                self._fetch_stats["fallback_reasons"][reason] += 1
+                logger.info(f"Falling back to browser for {self.name} page {page + 1} ({reason})")
+                return None
+            page_jobs = [job for job in page_jobs if job.id not in seen]
+            if not page_jobs:
+                break  # Past the last page some sites repeat it
+            seen.update(job.id for job in page_jobs)
+            jobs.extend(page_jobs)
+        return jobs
+        
+    async def _load_page_via_http(self, url: str) -> Tuple[Optional[List[JobPosting]], Optional[str]]:
+        """
+        Request and parse one results page with the shared pooled HTTP client.
+        
+        Args:
+            url: Results page URL
+            
+        Returns:
+            Tuple of (jobs, None), or (None, reason) when the page can't be used
+        """
+        reason = None
+        async with self._request_slot() as slot:
+            try:
+                response = await get_http_client().get(url, headers={
+                    "User-Agent": self._profile.user_agent,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.9"
+                })
+            except httpx.HTTPError as e:
+                logger.debug(f"HTTP fast path failed for {self.name}: {e}")
+                response, reason = None, "request_error"
+                slot.error = SourceUnavailableError(str(e))
+                
+            if response is not None:
+                if response.status_code != 200:
+                    reason = f"http_{response.status_code}"
+                    slot.error = self._overload_error(response)
+                elif self._captcha_detector.detect_captcha(response.text):
+                    reason = "captcha"
+                    slot.error = RateLimitError("CAPTCHA served")
+                
+        if reason is None:
+            page_url = str(response.url)
+            jobs = self.extract_structured_jobs(response.text, page_url)
+            if jobs:
+                self._fetch_stats["structured_data_hits"] += 1
+            else:
+                jobs = await self.parse_job_elements(PageSnapshot(response.text, page_url))
+            if jobs:
+                return jobs, None
+            reason = "no_jobs"
+        return None, reason
+        
+    @staticmethod
+    def _overload_error(response: httpx.Response) -> Optional[Exception]:
+        """Map a throttling or overload status to the error the concurrency limiter backs off on."""
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            return RateLimitError("HTTP 429", retry_after=int(retry_after) if retry_after.isdigit() else None)
+        if response.status_code >= 500:
+            return SourceUnavailableError(f"HTTP {response.status_code}")
+        return None
+        
+    def extract_structured_jobs(self, html: str, page_url: str) -> List[JobPosting]:
+        """
+        Extract jobs from structured data embedded in a page.
+        
+        Override for sites whose embedded data is not schema.org JobPosting.
+        
+        Args:
+            html: Page HTML
+            page_url: URL the page was fetched from
+            
+        Returns:
+            Jobs found in the page's structured data
+        """
+        return extract_structured_jobs(html, self.name, page_url)
+        
+    def get_fetch_stats(self) -> Dict[str, Any]:
+        """
+        Get HTTP fast-path vs browser statistics.
+        
+        Returns:
+            Dictionary with fast-path attempts, hits, hit rate, fallback reasons,
+            readiness and request-blocking figures
+        """
+        attempts = self._fetch_stats["http_attempts"]
+        return {
+            "http_first": self.http_first,
+            "http_attempts": attempts,
+            "http_hits": self._fetch_stats["http_hits"],
+            "structured_data_hits": self._fetch_stats["structured_data_hits"],
+            "http_hit_rate": self._fetch_stats["http_hits"] / attempts if attempts else 0.0,
+            "browser_fetches": self._fetch_stats["browser_fetches"],
+            "fallback_reasons": dict(self._fetch_stats["fallback_reasons"]),
+            "readiness": self._readiness.get_stats(),
+            "resource_blocking": (self._resource_blocker.get_stats()
+                                  if self._resource_blocker is not None else {"enabled": False})
+        }
+        
+    def get_page_url(self, search_url: str, page: int) -> Optional[str]:
+        """
+        URL of a results page, for sites that paginate with an offset parameter.
+        
+        Scrapers that return URLs here get their pages fetched concurrently;
+        the default (None) keeps click-through ``_handle_pagination``.
+        
+        Args:
+            search_url: URL of the first results page
+            page: Zero-based page index
+            
+        Returns:
+            Page URL, or None if pages can't be addressed directly
+        """
+        return None
+        
+    @staticmethod
+    def _with_query_params(url: str, **params: Any) -> str:
+        """Return ``url`` with query parameters added or replaced."""
+        parts = urlparse(url)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        query.update({key: str(value) for key, value in params.items()})
+        return urlunparse(parts._replace(query=urlencode(query)))
+        
+    @staticmethod
+    def _is_past_cutoff(jobs: List[JobPosting], cutoff: Optional[datetime]) -> bool:
+        """Whether every job on a (date-sorted) page is older than the cutoff."""
+        if cutoff is None or not jobs:
+            return False
+        return all(job.date_posted is not None and job.date_posted < cutoff for job in jobs)
+        
+    async def _fetch_offset_pages(self, search_url: str, params: FetchParams,
+                                  first_page: List[JobPosting]) -> List[JobPosting]:
+        """
+        Fetch results pages 1..max_pages-1 concurrently by URL.
+        
+        Pages are spread over this scraper's session plus any extra sessions the
+        browser pool can lend without waiting; every load goes through the rate
+        limiter and holds a slot of the source's adaptive concurrency limit, so
+        fewer pages load at once when the site slows down or throttles. Each
+        page is parsed as soon as it arrives, and no further pages
+        are requested once ``params.limit`` is covered, a page comes back
+        empty, or a page is entirely older than ``params.date_range``.
+        
+        Args:
+            search_url: URL of the first results page
+            params: Fetch parameters
+            first_page: Jobs already parsed from the first page
+            
+        Returns:
+            Jobs from the additional pages, in page order
+        """
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=params.date_range)
+                  if params.date_range else None)
+        if not first_page or self.max_pages <= 1 or self._is_past_cutoff(first_page, cutoff):
+            return []
+            
+        pages: Dict[int, List[JobPosting]] = {}
+        state = {"next": 1, "last": self.max_pages - 1}
+        
+        def stop_after(page: int) -> None:
+            state["last"] = min(state["last"], page)
+            
+        async def worker(browser: AsyncWebDriver, lease: Optional[PooledBrowser]) -> None:
+            while state["next"] <= state["last"]:
+                page = state["next"]
+                state["next"] += 1
+                await self._apply_rate_limiting()
+                if page > state["last"]:
+                    return  # An earlier page finished the query while we waited
+                try:
+                    async with self._request_slot():
+                        await browser.get(self.get_page_url(search_url, page))
+                        self._readiness.record_page()
+                        if lease is not None:
+                            lease.record_page()
+                        jobs = await browser.run(self._parse_current_page, browser)
+                except Exception as e:
+                    logger.warning(f"Error loading page {page + 1} from {self.name}: {e}")
+                    if lease is not None and isinstance(e, WebDriverException):
+                        lease.mark_unhealthy()
+                    stop_after(page - 1)
+                    return
+                    
+                pages[page] = jobs
+                if not jobs or self._is_past_cutoff(jobs, cutoff):
+                    stop_after(page)
+                elif params.limit:
+                    # Count only the contiguous run of pages from the start
+                    total, contiguous = len(first_page), 0
+                    while contiguous + 1 in pages:
+                        contiguous += 1
+                        total += len(pages[contiguous])
+                    if total >= params.limit:
+                        stop_after(contiguous)
+                        
+        extra_leases: List[PooledBrowser] = []
+        if self._browser_pool is not None and self.snapshot_parsing:
+            # Live-element parsing reads self._driver, so only snapshots can use extra sessions
+            while len(extra_leases) + 1 < min(self.page_concurrency, state["last"]):
+                lease = await self._browser_pool.try_acquire(self)
+                if lease is None:
+                    break
+                extra_leases.append(lease)
+                
+        try:
+            workers = [worker(self._browser, self._lease)]
+            workers.extend(worker(lease.browser, lease) for lease in extra_leases)
+            await asyncio.gather(*workers)
+        finally:
+            for lease in extra_leases:
+                await self._browser_pool.release(lease)
+                
+        return [job for page in sorted(pages) if page <= state["last"] for job in pages[page]]
+        
+    async def _parse_current_page(self, browser: Optional[AsyncWebDriver] = None) -> List[JobPosting]:
+        """
+        Parse the jobs on the page the browser is showing.
+        
+        In snapshot mode the DOM is fetched with one ``execute_script`` call once
+        cards have rendered, and ``parse_job_elements`` runs against the local
+        copy; otherwise it queries the live page element by element.
+        
+        Args:
+            browser: Session to read from (defaults to this scraper's own)
+            
+        Returns:
+            List of parsed job postings
+        """
+        browser = browser or self._browser
+        if not self.snapshot_parsing:
+            await self._collect_blocked_requests(browser)
+            return await self.parse_job_elements(browser.driver)
+            
+        selectors = self.get_selectors()
+        card_selector = ', '.join(
+            selectors[key] for key in ('job_cards', 'job_cards_fallback') if selectors.get(key)
+        )
+        if card_selector:
+            try:
+                await browser.wait_until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, card_selector)),
+                    timeout=10
+                )
+            except TimeoutException:
+                pass  # Parsers report empty or blocked pages themselves
+                
+        await self._collect_blocked_requests(browser)
+        snapshot = await browser.call(PageSnapshot.capture, browser.driver)
+        return await self.parse_job_elements(snapshot)
+        
+    async def _collect_blocked_requests(self, browser: AsyncWebDriver) -> None:
+        """Account the requests blocked and loaded for the page the session is on."""
+        if self._resource_blocker is not None:
+            await browser.call(self._resource_blocker.collect, browser.driver)
+            
+    async def _wait_for_element(self, driver: Union[webdriver.Chrome, PageSnapshot],
+                                selector: str, timeout: int = 10) -> None:
+        """
+        Wait for a selector to match, raising TimeoutException if it never does.
+        
+        Snapshots never change, so they are checked once instead of polled.
+        """
+        if isinstance(driver, PageSnapshot):
+            if not driver.find_elements(By.CSS_SELECTOR, selector):
+                raise TimeoutException(f"No element matching {selector!r} in page snapshot")
+            return
+        await self._browser.wait_until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector)),
+            timeout=timeout
+        )
+        
+    async def _scroll_into_view(self, driver: Union[webdriver.Chrome, PageSnapshot],
+                                element: Any, pause: float) -> None:
+        """Scroll a live card into view and let it settle; a no-op on snapshots."""
+        if isinstance(driver, PageSnapshot):
+            return
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        await asyncio.sleep(pause)
+        
     def _build_search_url(self, params: FetchParams) -> str:
         """Build search URL from parameters."""
         search_params = {}
@@ -324,17 +820,37 @@ class BaseScraper(BaseJobSource):
             
         return self.get_search_url(**search_params)
         
-    async def _wait_for_page_load(self, timeout: int = 15) -> None:
-        """Wait for page to fully load."""
+    async def _wait_for_page_load(self, timeout: int = 15, require_change: bool = False,
+                                  baseline: float = 2.0) -> None:
+        """
+        Wait for page to fully load and for dynamic content to settle.
+        
+        Args:
+            timeout: Seconds to wait for ``document.readyState``
+            require_change: The page is being updated in place (e.g. after a
+                "next" click), so wait for it to change before settling
+            baseline: Fixed delay this wait used to be, for savings metrics
+        """
         try:
-            WebDriverWait(self._driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
+            await self._browser.wait_until(
+                lambda d: d.execute_script("return document.readyState") == "complete",
+                timeout=timeout
             )
-            # Additional wait for dynamic content
-            await asyncio.sleep(2)
+            # Wait for dynamic content to stop changing instead of a fixed sleep
+            await self._wait_until_settled(baseline, require_change=require_change)
         except TimeoutException:
             logger.warning(f"Page load timeout for {self.name}")
             
+    async def _wait_until_settled(self, baseline: float, require_change: bool = False,
+                                  selector: Optional[str] = None) -> None:
+        """Wait for DOM and network activity to go quiet; replaces a ``baseline``-second sleep."""
+        await self._readiness.settle(self._browser, baseline, selector=selector,
+                                     require_change=require_change)
+        
+    async def _wait_until_hidden(self, element: Any, baseline: float = 1.0) -> None:
+        """Wait for a dismissed popup to disappear; replaces a ``baseline``-second sleep."""
+        await self._readiness.until_hidden(self._browser, element, baseline)
+            
     async def _handle_popups(self) -> None:
         """Handle common popups and cookie banners."""
         # Common selectors for cookie acceptance buttons
@@ -346,15 +862,21 @@ class BaseScraper(BaseJobSource):
             "button[id*='accept']"
         ]
         
-        for selector in cookie_selectors:
+        clicked = await self._browser.call(self._click_first_visible, cookie_selectors)
+        if clicked is not None:
+            await self._wait_until_hidden(clicked)
+            
+    def _click_first_visible(self, selectors: List[str]) -> Optional[Any]:
+        """Click the first displayed element matching one of the selectors and return it."""
+        for selector in selectors:
             try:
                 element = self._driver.find_element(By.CSS_SELECTOR, selector)
                 if element.is_displayed():
                     element.click()
-                    await asyncio.sleep(1)
-                    break
+                    return element
             except NoSuchElementException:
                 continue
+        return None
                 
     async def _handle_pagination(self, params: FetchParams, current_count: int) -> List[JobPosting]:
         """Handle pagination to get more jobs."""
@@ -362,15 +884,8 @@ class BaseScraper(BaseJobSource):
         return []
         
     async def _apply_rate_limiting(self) -> None:
-        """Apply rate limiting between requests."""
-        if self._last_request_time:
-            min_interval = 60.0 / self._rate_limits.requests_per_minute
-            elapsed = (datetime.now(timezone.utc) - self._last_request_time).total_seconds()
-            
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                await asyncio.sleep(sleep_time)
+        """Wait for this site's per-minute, per-hour and burst budget."""
+        await self._rate_limiter.acquire(self._rate_limit_domain)
                 
     def _find_element_with_fallback(self, parent_element, selectors: List[str]):
         """Find element using multiple selector fallbacks."""
@@ -0,0 +1,322 @@
+"""
+Warm browser pool for browser-based scrapers.
+
+Launching Chrome (and resolving the chromedriver binary) is the largest fixed
+cost of a scrape. The pool keeps configured sessions alive between queries and
+leases them to scrapers: each session is created by the scraper's own
+``setup_browser`` so its profile and anti-detection script are already applied,
+and it is reused by later leases from the same scraper class. Sessions are
+recycled after a number of pages, after sitting idle too long, or when they
+fail a liveness check.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+from .async_driver import AsyncWebDriver
+
+logger = logging.getLogger(__name__)
+
+_chromedriver_path: Optional[str] = None
+
+
+def get_chromedriver_path() -> str:
+    """
+    Resolve the chromedriver binary once per process.
+
+    ``ChromeDriverManager().install()`` checks (and possibly downloads) the
+    driver on every call, so the result is cached.
+
+    Returns:
+        Filesystem path of the chromedriver executable
+    """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+
+class PooledBrowser:
+    """A live browser session owned by a BrowserPool."""
+
+    def __init__(self, key: str, driver: Any):
+        self.key = key
+        self.driver = driver
+        self.browser = AsyncWebDriver(driver, name=key)
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.pages = 0
+        self.leases = 0
+        self.healthy = True
+
+    def record_page(self, count: int = 1) -> None:
+        """Count page loads towards the recycle threshold."""
+        self.pages += count
+
+    def mark_unhealthy(self) -> None:
+        """Have the session discarded instead of reused when it is released."""
+        self.healthy = False
+
+
+class BrowserPool:
+    """
+    Pool of warm browser sessions shared by browser scrapers.
+
+    Sessions are grouped by scraper class, since each class configures its
+    browser (profile, viewport, scripts) differently.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages_per_session: int = 50,
+        max_idle_seconds: float = 300.0,
+        max_session_age: float = 1800.0
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Maximum number of live sessions across all scrapers
+            max_pages_per_session: Page loads after which a session is recycled
+            max_idle_seconds: Idle time after which a session is recycled
+            max_session_age: Lifetime after which a session is recycled
+        """
+        self.size = size
+        self.max_pages_per_session = max_pages_per_session
+        self.max_idle_seconds = max_idle_seconds
+        self.max_session_age = max_session_age
+        self._idle: Dict[str, Deque[PooledBrowser]] = defaultdict(deque)
+        self._in_use: Dict[int, PooledBrowser] = {}
+        self._launching = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._condition_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+        self._stats = {
+            "leases": 0,
+            "reused": 0,
+            "created": 0,
+            "recycled": 0,
+            "health_failures": 0,
+            "wait_seconds": 0.0
+        }
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+        return self._condition
+
+    @staticmethod
+    def _key_for(scraper: Any) -> str:
+        return type(scraper).__name__
+
+    @property
+    def live_sessions(self) -> int:
+        return len(self._in_use) + self._launching + self._idle_count()
+
+    def _idle_count(self) -> int:
+        return sum(len(idle) for idle in self._idle.values())
+
+    async def _is_alive(self, session: PooledBrowser) -> bool:
+        try:
+            await session.browser.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _is_worn_out(self, session: PooledBrowser) -> bool:
+        now = time.monotonic()
+        return (
+            not session.healthy
+            or session.pages >= self.max_pages_per_session
+            or now - session.created_at >= self.max_session_age
+        )
+
+    async def _quit(self, session: PooledBrowser) -> None:
+        self._stats["recycled"] += 1
+        try:
+            await session.browser.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing pooled browser ({session.key}): {e}")
+
+    async def _evict_one_idle(self) -> bool:
+        """Close the least recently used idle session to make room."""
+        oldest_key, oldest = None, None
+        for key, idle in self._idle.items():
+            if idle and (oldest is None or idle[0].last_used < oldest.last_used):
+                oldest_key, oldest = key, idle[0]
+        if oldest is None:
+            return False
+        self._idle[oldest_key].popleft()
+        await self._quit(oldest)
+        return True
+
+    async def _take_idle(self, key: str) -> Optional[PooledBrowser]:
+        idle = self._idle[key]
+        while idle:
+            # Most recently used first: it is the likeliest to still be warm
+            session = idle.pop()
+            if (self._is_worn_out(session)
+                    or time.monotonic() - session.last_used > self.max_idle_seconds):
+                await self._quit(session)
+                continue
+            if not await self._is_alive(session):
+                self._stats["health_failures"] += 1
+                await self._quit(session)
+                continue
+            return session
+        return None
+
+    async def acquire(self, scraper: Any) -> PooledBrowser:
+        """
+        Lease a warm session for a scraper, launching one if none is idle.
+
+        Args:
+            scraper: BaseScraper whose ``setup_browser`` configures new sessions
+
+        Returns:
+            PooledBrowser to hand back with ``release``
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed")
+
+        key = self._key_for(scraper)
+        condition = self._get_condition()
+        start = time.monotonic()
+
+        async with condition:
+            while True:
+                session = await self._take_idle(key)
+                if session is not None:
+                    self._stats["reused"] += 1
+                    break
+                if self.live_sessions < self.size or await self._evict_one_idle():
+                    # Reserve the slot while the browser launches
+                    self._launching += 1
+                    break
+                await condition.wait()
+
+        return await self._complete_lease(scraper, key, session, start)
+
+    async def try_acquire(self, scraper: Any) -> Optional[PooledBrowser]:
+        """
+        Lease a session without waiting: reuse an idle one or launch one if
+        the pool has room, otherwise return None.
+
+        Args:
+            scraper: BaseScraper whose ``setup_browser`` configures new sessions
+
+        Returns:
+            PooledBrowser to hand back with ``release``, or None if the pool is full
+        """
+        if self._closed:
+            return None
+
+        key = self._key_for(scraper)
+        condition = self._get_condition()
+        start = time.monotonic()
+
+        async with condition:
+            session = await self._take_idle(key)
+            if session is not None:
+                self._stats["reused"] += 1
+            elif self.live_sessions < self.size:
+                self._launching += 1
+            else:
+                return None
+
+        return await self._complete_lease(scraper, key, session, start)
+
+    async def _complete_lease(self, scraper: Any, key: str, session: Optional[PooledBrowser],
+                              start: float) -> PooledBrowser:
+        """Launch the session if a slot was reserved for it, then record the lease."""
+        if session is None:
+            condition = self._get_condition()
+            try:
+                driver = await scraper.setup_browser()
+            except BaseException:
+                async with condition:
+                    self._launching -= 1
+                    condition.notify_all()
+                raise
+            session = PooledBrowser(key, driver)
+            self._stats["created"] += 1
+            self._launching -= 1
+
+        session.leases += 1
+        self._in_use[id(session)] = session
+        self._stats["leases"] += 1
+        self._stats["wait_seconds"] += time.monotonic() - start
+        return session
+
+    async def release(self, session: PooledBrowser) -> None:
+        """
+        Return a leased session to the pool, recycling it if it is worn out.
+
+        Args:
+            session: Session obtained from ``acquire``
+        """
+        condition = self._get_condition()
+        async with condition:
+            self._in_use.pop(id(session), None)
+            session.last_used = time.monotonic()
+            if self._closed or self._is_worn_out(session):
+                await self._quit(session)
+            else:
+                self._idle[session.key].append(session)
+            condition.notify_all()
+
+    async def warm(self, scraper: Any, count: int = 1) -> None:
+        """
+        Pre-launch sessions for a scraper so its first lease is warm.
+
+        Args:
+            scraper: Scraper whose sessions to launch
+            count: Number of sessions to launch (bounded by pool size)
+        """
+        sessions = []
+        for _ in range(count):
+            if self.live_sessions >= self.size:
+                break
+            sessions.append(await self.acquire(scraper))
+        for session in sessions:
+            await self.release(session)
+
+    async def close(self) -> None:
+        """Quit every idle session; leased sessions are quit when released."""
+        self._closed = True
+        for idle in self._idle.values():
+            while idle:
+                await self._quit(idle.pop())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool utilization statistics.
+
+        Returns:
+            Dictionary with session counts, reuse and recycle figures
+        """
+        leases = self._stats["leases"]
+        in_use = len(self._in_use)
+        return {
+            "size": self.size,
+            "live_sessions": self.live_sessions,
+            "in_use": in_use,
+            "idle": self._idle_count(),
+            "utilization": in_use / self.size if self.size else 0.0,
+            "leases": leases,
+            "reused": self._stats["reused"],
+            "reuse_rate": self._stats["reused"] / leases if leases else 0.0,
+            "created": self._stats["created"],
+            "recycled": self._stats["recycled"],
+            "health_failures": self._stats["health_failures"],
+            "avg_wait_seconds": self._stats["wait_seconds"] / leases if leases else 0.0,
+            "idle_by_scraper": {key: len(idle) for key, idle in self._idle.items() if idle}
+        }
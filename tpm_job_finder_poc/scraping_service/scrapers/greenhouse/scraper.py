@@ -5,16 +5,14 @@ Scrapes job postings from Greenhouse.io-powered company job boards.
 Handles dynamic company discovery and various Greenhouse board layouts.
 """
 
+import asyncio
 import re
-import time
 import logging
 from typing import List, Dict, Any, Optional, Set
 from datetime import datetime, timezone, timedelta
 from urllib.parse import urlencode, quote, urlparse
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 
 from ..base_scraper import BaseScraper, BrowserProfile
@@ -40,7 +38,9 @@ class GreenhouseScraper(BaseScraper):
                 requests_per_minute=15,  # Conservative for company boards
                 requests_per_hour=400,
                 burst_limit=5
-            )
+            ),
+            # Board pages are server-rendered, so most never need a browser
+            http_first=True
         )
         self.known_companies = self._get_default_greenhouse_companies()
         
@@ -152,7 +152,7 @@ class GreenhouseScraper(BaseScraper):
         
         # Greenhouse-specific optimizations (safe)
         try:
-            driver.execute_script("""
+            await asyncio.to_thread(driver.execute_script, """
                 // Safe anti-detection setup
                 console.log('Greenhouse setup complete');
             """)
@@ -174,9 +174,6 @@ class GreenhouseScraper(BaseScraper):
         Returns:
             List of JobPosting objects
         """
-        if not await self.initialize():
-            return []
-            
         company = params.extra_params.get('company') if params.extra_params else None
         
         if company:
@@ -199,16 +196,15 @@ class GreenhouseScraper(BaseScraper):
             
             logger.info(f"Scraping Greenhouse board for {company}: {search_url}")
             
-            self._driver.get(search_url)
-            await self._wait_for_page_load()
-            
-            # Parse jobs from this company
-            jobs = await self.parse_job_elements(self._driver)
-            
-            # Handle pagination if needed
-            if params.limit is None or len(jobs) < params.limit:
-                additional_jobs = await self._handle_pagination(params, len(jobs))
-                jobs.extend(additional_jobs)
+            jobs = await self._fetch_page_via_http(search_url) if self.http_first else None
+            if jobs is None:
+                if not self._driver and not await self.initialize():
+                    return []
+                self._fetch_stats["browser_fetches"] += 1
+                # Board scraping drives the synchronous WebDriver API, so it runs on the
+                # browser session's thread instead of blocking the event loop
+                async with self._request_slot():
+                    jobs = await self._browser.run(self._scrape_board_in_browser, search_url, params)
                 
             # Set company name in job data
             for job in jobs:
@@ -221,6 +217,20 @@ class GreenhouseScraper(BaseScraper):
             logger.error(f"Error scraping Greenhouse board for {company}: {e}")
             return []
             
+    async def _scrape_board_in_browser(self, search_url: str, params: FetchParams) -> List[JobPosting]:
+        """Load a board in the browser and parse it, following "load more" pagination."""
+        self._driver.get(search_url)
+        await self._wait_for_page_load()
+        
+        # Parse jobs from this company
+        jobs = await self._parse_current_page()
+        
+        # Handle pagination if needed
+        if params.limit is None or len(jobs) < params.limit:
+            additional_jobs = await self._handle_pagination(params, len(jobs))
+            jobs.extend(additional_jobs)
+        return jobs
+        
     async def _scrape_multiple_companies(self, params: FetchParams) -> List[JobPosting]:
         """Scrape multiple companies' Greenhouse boards."""
         all_jobs = []
@@ -252,7 +262,7 @@ class GreenhouseScraper(BaseScraper):
                     break
                     
                 # Rate limiting between companies
-                time.sleep(2)
+                await asyncio.sleep(2)
                 
             except Exception as e:
                 logger.warning(f"Error scraping {company}: {e}")
@@ -265,7 +275,7 @@ class GreenhouseScraper(BaseScraper):
         Parse job postings from Greenhouse job board.
         
         Args:
-            driver: Selenium WebDriver instance
+            driver: Selenium WebDriver instance or PageSnapshot
             
         Returns:
             List of JobPosting objects
@@ -275,9 +285,7 @@ class GreenhouseScraper(BaseScraper):
         
         try:
             # Wait for job cards to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selectors['job_cards']))
-            )
+            await self._wait_for_element(driver, selectors['job_cards'], timeout=10)
             
             job_cards = driver.find_elements(By.CSS_SELECTOR, selectors['job_cards'])
             
@@ -290,10 +298,9 @@ class GreenhouseScraper(BaseScraper):
             for i, card in enumerate(job_cards):
                 try:
                     # Scroll card into view
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-                    time.sleep(0.2)
+                    await self._scroll_into_view(driver, card, pause=0.2)
                     
-                    job = await self._parse_single_greenhouse_job(card, selectors)
+                    job = await self._parse_single_greenhouse_job(card, selectors, page=driver)
                     if job:
                         jobs.append(job)
                         
@@ -309,13 +316,14 @@ class GreenhouseScraper(BaseScraper):
             
         return jobs
         
-    async def _parse_single_greenhouse_job(self, card_element, selectors: Dict[str, str]) -> Optional[JobPosting]:
+    async def _parse_single_greenhouse_job(self, card_element, selectors: Dict[str, str], page=None) -> Optional[JobPosting]:
         """
         Parse a single Greenhouse job card element.
         
         Args:
-            card_element: Selenium WebElement for job card
+            card_element: Selenium WebElement (or snapshot element) for job card
             selectors: Dictionary of CSS selectors
+            page: Driver or PageSnapshot the card came from (defaults to the live driver)
             
         Returns:
             JobPosting object or None if parsing fails
@@ -339,16 +347,18 @@ class GreenhouseScraper(BaseScraper):
             )
             job_url = job_link.get_attribute('href') if job_link else None
             
+            page = page or self._driver
+            
             # Make URL absolute if relative
             if job_url and job_url.startswith('/'):
-                base_url = f"{urlparse(self._driver.current_url).scheme}://{urlparse(self._driver.current_url).netloc}"
+                base_url = f"{urlparse(page.current_url).scheme}://{urlparse(page.current_url).netloc}"
                 job_url = f"{base_url}{job_url}"
             
             # Extract job ID from URL
             job_id = self._extract_greenhouse_job_id(job_url)
             
             # Extract company name from URL or page
-            company = self._extract_company_name()
+            company = self._extract_company_name(page)
             
             # Extract department
             department_element = self._find_element_with_fallback(
@@ -374,7 +384,7 @@ class GreenhouseScraper(BaseScraper):
                 date_posted=datetime.now(timezone.utc),  # Greenhouse doesn't always show dates
                 raw_data={
                     'scraped_at': datetime.now(timezone.utc).isoformat(),
-                    'page_url': self._driver.current_url,
+                    'page_url': page.current_url,
                     'department': department,
                     'greenhouse_board': True
                 }
@@ -395,9 +405,10 @@ class GreenhouseScraper(BaseScraper):
         # Fallback to timestamp
         return f"greenhouse_{int(datetime.now(timezone.utc).timestamp())}"
         
-    def _extract_company_name(self) -> str:
+    def _extract_company_name(self, page=None) -> str:
         """Extract company name from current page/URL."""
-        current_url = self._driver.current_url
+        page = page or self._driver
+        current_url = page.current_url
         
         # Try to get from subdomain
         match = re.search(r'https://([^.]+)\.greenhouse\.io', current_url)
@@ -406,7 +417,7 @@ class GreenhouseScraper(BaseScraper):
             
         # Try to get from page title or content
         try:
-            title = self._driver.title
+            title = page.title
             if 'Jobs at' in title:
                 return title.replace('Jobs at ', '').split(' |')[0].strip()
         except:
@@ -444,10 +455,10 @@ class GreenhouseScraper(BaseScraper):
                 self._driver.execute_script("arguments[0].click();", load_more)
                 
                 # Wait for new content
-                time.sleep(3)
+                await self._wait_until_settled(baseline=3.0, require_change=True)
                 
                 # Parse newly loaded jobs
-                page_jobs = await self.parse_job_elements(self._driver)
+                page_jobs = await self._parse_current_page()
                 
                 # Filter out duplicates (compare by URL or ID)
                 existing_ids = {job.id for job in additional_jobs}
@@ -10,8 +10,6 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
 from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from ..base_scraper import BaseScraper, BrowserProfile
@@ -67,6 +65,21 @@ class IndeedScraper(BaseScraper):
             return f"{base_search_url}?{urlencode(params)}"
         return base_search_url
         
+    def get_page_url(self, search_url: str, page: int) -> Optional[str]:
+        """
+        Indeed results pages are addressed with a ``start`` offset of 10 per page.
+        
+        Args:
+            search_url: URL of the first results page
+            page: Zero-based page index
+            
+        Returns:
+            URL of the requested page
+        """
+        if page == 0:
+            return search_url
+        return self._with_query_params(search_url, start=page * 10)
+        
     def get_selectors(self) -> Dict[str, str]:
         """
         Get CSS selectors for Indeed job elements.
@@ -99,7 +112,7 @@ class IndeedScraper(BaseScraper):
         Parse job postings from Indeed search results page.
         
         Args:
-            driver: Selenium WebDriver instance
+            driver: Selenium WebDriver instance or PageSnapshot
             
         Returns:
             List of JobPosting objects
@@ -109,16 +122,14 @@ class IndeedScraper(BaseScraper):
         
         try:
             # Wait for job cards to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selectors['job_cards']))
-            )
+            await self._wait_for_element(driver, selectors['job_cards'], timeout=10)
             
             job_cards = driver.find_elements(By.CSS_SELECTOR, selectors['job_cards'])
             logger.info(f"Found {len(job_cards)} job cards on page")
             
             for card in job_cards:
                 try:
-                    job = await self._parse_single_job(card, selectors)
+                    job = await self._parse_single_job(card, selectors, page=driver)
                     if job:
                         jobs.append(job)
                 except Exception as e:
@@ -133,13 +144,14 @@ class IndeedScraper(BaseScraper):
             
         return jobs
         
-    async def _parse_single_job(self, card_element, selectors: Dict[str, str]) -> Optional[JobPosting]:
+    async def _parse_single_job(self, card_element, selectors: Dict[str, str], page=None) -> Optional[JobPosting]:
         """
         Parse a single job card element.
         
         Args:
-            card_element: Selenium WebElement for job card
+            card_element: Selenium WebElement (or snapshot element) for job card
             selectors: Dictionary of CSS selectors
+            page: Driver or PageSnapshot the card came from (defaults to the live driver)
             
         Returns:
             JobPosting object or None if parsing fails
@@ -204,7 +216,7 @@ class IndeedScraper(BaseScraper):
                 description=description,
                 raw_data={
                     'scraped_at': datetime.now(timezone.utc).isoformat(),
-                    'page_url': self._driver.current_url
+                    'page_url': (page or self._driver).current_url
                 }
             )
             
@@ -305,10 +317,10 @@ class IndeedScraper(BaseScraper):
                 next_button.click()
                 
                 # Wait for new page to load
-                await self._wait_for_page_load()
+                await self._wait_for_page_load(require_change=True)
                 
                 # Parse jobs from new page
-                page_jobs = await self.parse_job_elements(self._driver)
+                page_jobs = await self._parse_current_page()
                 additional_jobs.extend(page_jobs)
                 pages_scraped += 1
                 
@@ -5,8 +5,8 @@ Scrapes job postings from LinkedIn.com using browser automation.
 Handles authentication requirements and LinkedIn's anti-bot measures.
 """
 
+import asyncio
 import re
-import time
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
@@ -18,6 +18,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 
 from ..base_scraper import BaseScraper, BrowserProfile
+from ..page_snapshot import PageSnapshot
+from ..resource_blocking import ResourceBlockingRules
 from ...core.base_job_source import JobPosting, FetchParams, RateLimitConfig
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,8 @@ class LinkedInScraper(BaseScraper):
         self.email = email
         self.password = password
         self.authenticated = False
+        self.max_pages = 3  # Conservative for LinkedIn
+        self.page_concurrency = 2
         
     def get_search_url(self, **kwargs) -> str:
         """
@@ -80,6 +84,35 @@ class LinkedInScraper(BaseScraper):
             return f"{base_search_url}?{urlencode(params)}"
         return base_search_url
         
+    def get_page_url(self, search_url: str, page: int) -> Optional[str]:
+        """
+        LinkedIn results pages are addressed with a ``start`` offset of 25 per page.
+        
+        Args:
+            search_url: URL of the first results page
+            page: Zero-based page index
+            
+        Returns:
+            URL of the requested page
+        """
+        if page == 0:
+            return search_url
+        return self._with_query_params(search_url, start=page * 25)
+        
+    def get_resource_rules(self) -> Optional[ResourceBlockingRules]:
+        """
+        Block LinkedIn's own telemetry and realtime channel as well as the defaults.
+        
+        The realtime long-poll keeps the network busy, so pages never look settled.
+        
+        Returns:
+            Blocking rules for LinkedIn sessions
+        """
+        return super().get_resource_rules().extend(deny=[
+            "*linkedin.com/li/track*",
+            "*realtime.www.linkedin.com*"
+        ])
+        
     def get_selectors(self) -> Dict[str, str]:
         """
         Get CSS selectors for LinkedIn job elements.
@@ -134,7 +167,7 @@ class LinkedInScraper(BaseScraper):
         
         # LinkedIn-specific settings (safe anti-detection)
         try:
-            driver.execute_script("""
+            await asyncio.to_thread(driver.execute_script, """
                 // Safe anti-detection - don't redefine existing properties
                 console.log('LinkedIn anti-detection setup');
             """)
@@ -209,15 +242,15 @@ class LinkedInScraper(BaseScraper):
         if not success:
             return False
             
-        # Attempt authentication
-        return await self.authenticate()
+        # Attempt authentication (on the session thread: it drives the login form directly)
+        return await self._browser.run(self.authenticate)
         
     async def parse_job_elements(self, driver) -> List[JobPosting]:
         """
         Parse job postings from LinkedIn search results page.
         
         Args:
-            driver: Selenium WebDriver instance
+            driver: Selenium WebDriver instance or PageSnapshot
             
         Returns:
             List of JobPosting objects
@@ -225,14 +258,13 @@ class LinkedInScraper(BaseScraper):
         jobs = []
         selectors = self.get_selectors()
         
-        # Handle guest mode overlays
-        await self._handle_linkedin_overlays()
+        # Handle guest mode overlays (live pages only; snapshots can't be clicked)
+        if not isinstance(driver, PageSnapshot):
+            await self._handle_linkedin_overlays()
         
         try:
             # Wait for job cards to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selectors['job_cards']))
-            )
+            await self._wait_for_element(driver, selectors['job_cards'], timeout=15)
             
             job_cards = driver.find_elements(By.CSS_SELECTOR, selectors['job_cards'])
             
@@ -245,10 +277,9 @@ class LinkedInScraper(BaseScraper):
             for i, card in enumerate(job_cards):
                 try:
                     # Scroll card into view
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-                    time.sleep(0.5)  # Brief pause for stability
+                    await self._scroll_into_view(driver, card, pause=0.5)
                     
-                    job = await self._parse_single_linkedin_job(card, selectors)
+                    job = await self._parse_single_linkedin_job(card, selectors, page=driver)
                     if job:
                         jobs.append(job)
                         
@@ -264,13 +295,14 @@ class LinkedInScraper(BaseScraper):
             
         return jobs
         
-    async def _parse_single_linkedin_job(self, card_element, selectors: Dict[str, str]) -> Optional[JobPosting]:
+    async def _parse_single_linkedin_job(self, card_element, selectors: Dict[str, str], page=None) -> Optional[JobPosting]:
         """
         Parse a single LinkedIn job card element.
         
         Args:
-            card_element: Selenium WebElement for job card
+            card_element: Selenium WebElement (or snapshot element) for job card
             selectors: Dictionary of CSS selectors
+            page: Driver or PageSnapshot the card came from (defaults to the live driver)
             
         Returns:
             JobPosting object or None if parsing fails
@@ -327,7 +359,7 @@ class LinkedInScraper(BaseScraper):
                 date_posted=date_posted,
                 raw_data={
                     'scraped_at': datetime.now(timezone.utc).isoformat(),
-                    'page_url': self._driver.current_url,
+                    'page_url': (page or self._driver).current_url,
                     'authenticated': self.authenticated
                 }
             )
@@ -403,7 +435,7 @@ class LinkedInScraper(BaseScraper):
             if cookie_banner.is_displayed():
                 accept_button = cookie_banner.find_element(By.TAG_NAME, 'button')
                 accept_button.click()
-                time.sleep(1)
+                await self._wait_until_hidden(cookie_banner)
         except NoSuchElementException:
             pass
             
@@ -413,7 +445,7 @@ class LinkedInScraper(BaseScraper):
             if guest_modal.is_displayed():
                 close_button = guest_modal.find_element(By.CSS_SELECTOR, selectors['close_button'])
                 close_button.click()
-                time.sleep(1)
+                await self._wait_until_hidden(guest_modal)
         except (NoSuchElementException, ElementClickInterceptedException):
             pass
             
@@ -448,7 +480,7 @@ class LinkedInScraper(BaseScraper):
             try:
                 # Scroll to bottom to load more content
                 self._driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                await self._wait_until_settled(baseline=2.0)
                 
                 # Look for next button
                 next_button = self._driver.find_element(By.CSS_SELECTOR, selectors['next_button'])
@@ -460,14 +492,13 @@ class LinkedInScraper(BaseScraper):
                 self._driver.execute_script("arguments[0].click();", next_button)
                 
                 # Wait for new page
-                await self._wait_for_page_load(timeout=10)
-                time.sleep(3)  # Additional wait for LinkedIn
+                await self._wait_for_page_load(timeout=10, require_change=True, baseline=5.0)
                 
                 # Handle overlays again
                 await self._handle_linkedin_overlays()
                 
                 # Parse new page
-                page_jobs = await self.parse_job_elements(self._driver)
+                page_jobs = await self._parse_current_page()
                 additional_jobs.extend(page_jobs)
                 pages_scraped += 1
                 
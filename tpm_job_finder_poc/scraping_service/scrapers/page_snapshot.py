@@ -0,0 +1,173 @@
+"""
+Static snapshots of rendered result pages.
+
+Parsing job cards through live WebElements costs one WebDriver HTTP round
+trip per ``find_element``/``.text``/``get_attribute`` call, which adds up to
+hundreds of round trips per results page. A ``PageSnapshot`` is captured with a
+single ``execute_script`` call and then parsed locally with BeautifulSoup. It
+implements the subset of the WebDriver/WebElement API the scrapers' card
+parsers use (``find_element(s)`` with CSS selectors, ``.text``,
+``get_attribute``), so the same ``get_selectors()`` maps and parsing code work
+on both, and parsers can be tested against saved HTML fixtures.
+"""
+
+import logging
+import re
+from typing import Any, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+logger = logging.getLogger(__name__)
+
+# Returns everything needed to parse the page in one round trip
+CAPTURE_SCRIPT = (
+    "return [document.documentElement.outerHTML, window.location.href, document.title];"
+)
+
+# Attributes Selenium's get_attribute() resolves to absolute URLs
+_URL_ATTRIBUTES = {'href', 'src', 'action'}
+
+# Elements rendered on their own line, so their text starts a new line in .text
+_BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4',
+    'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+    'table', 'tr', 'ul'
+}
+_INVISIBLE_TAGS = {'script', 'style', 'template', 'noscript'}
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _to_css(by: str, value: str) -> str:
+    """Translate a Selenium locator into a CSS selector."""
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.TAG_NAME:
+        return value
+    if by == By.ID:
+        return f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return f'.{value}'
+    if by == By.NAME:
+        return f'[name="{value}"]'
+    raise NotImplementedError(f"Locator strategy not supported on page snapshots: {by}")
+
+
+def rendered_text(tag: Tag) -> str:
+    """
+    Approximate a browser's rendered text (``WebElement.text``) for a tag.
+
+    Whitespace runs collapse to single spaces and block-level elements start
+    new lines; script/style contents and comments are dropped.
+    """
+    parts = []
+    for node in tag.descendants:
+        if isinstance(node, Tag):
+            if node.name in _BLOCK_TAGS:
+                parts.append('\n')
+        elif (isinstance(node, NavigableString) and not isinstance(node, Comment)
+              and node.parent.name not in _INVISIBLE_TAGS):
+            parts.append(_WHITESPACE.sub(' ', str(node)))
+    lines = (line.strip() for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+class SnapshotElement:
+    """Read-only WebElement look-alike backed by a parsed HTML tag."""
+
+    def __init__(self, tag: Tag, page: "PageSnapshot"):
+        self._tag = tag
+        self._page = page
+
+    @property
+    def tag_name(self) -> str:
+        return self._tag.name
+
+    @property
+    def text(self) -> str:
+        """Element text with whitespace collapsed, approximating rendered text."""
+        return rendered_text(self._tag)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        value = self._tag.get(name)
+        if isinstance(value, list):
+            # Multi-valued attributes such as class come back as lists
+            value = ' '.join(value)
+        if value is not None and name in _URL_ATTRIBUTES:
+            value = urljoin(self._page.current_url, value)
+        return value
+
+    def is_displayed(self) -> bool:
+        # No layout information in a snapshot; treat hidden markup as hidden
+        style = (self._tag.get('style') or '').replace(' ', '').lower()
+        return 'display:none' not in style and not self._tag.has_attr('hidden')
+
+    def is_enabled(self) -> bool:
+        return not self._tag.has_attr('disabled')
+
+    def find_element(self, by: str, value: str) -> "SnapshotElement":
+        tag = self._tag.select_one(_to_css(by, value))
+        if tag is None:
+            raise NoSuchElementException(f"No element matching {value!r} in snapshot")
+        return SnapshotElement(tag, self._page)
+
+    def find_elements(self, by: str, value: str) -> List["SnapshotElement"]:
+        return [SnapshotElement(tag, self._page) for tag in self._tag.select(_to_css(by, value))]
+
+
+class PageSnapshot:
+    """
+    Parsed copy of a rendered page, usable where scrapers expect a driver.
+
+    Only read operations are supported; ``execute_script`` is a no-op so
+    scroll-into-view calls in shared parsing code are harmless.
+    """
+
+    def __init__(self, html: str, url: str = "", title: Optional[str] = None):
+        """
+        Parse a page.
+
+        Args:
+            html: Page HTML (typically ``document.documentElement.outerHTML``)
+            url: URL the page was loaded from, used to resolve relative links
+            title: Document title; read from the HTML when omitted
+        """
+        self.page_source = html
+        self.current_url = url
+        self._soup = BeautifulSoup(html, HTML_PARSER)
+        if title is None:
+            title = self._soup.title.get_text().strip() if self._soup.title else ""
+        self.title = title
+
+    @classmethod
+    def capture(cls, driver: Any) -> "PageSnapshot":
+        """
+        Snapshot a live WebDriver page in a single round trip.
+
+        Args:
+            driver: Selenium WebDriver positioned on the page
+
+        Returns:
+            PageSnapshot of the current DOM
+        """
+        html, url, title = driver.execute_script(CAPTURE_SCRIPT)
+        return cls(html, url, title)
+
+    def find_element(self, by: str, value: str) -> SnapshotElement:
+        return SnapshotElement(self._soup, self).find_element(by, value)
+
+    def find_elements(self, by: str, value: str) -> List[SnapshotElement]:
+        return SnapshotElement(self._soup, self).find_elements(by, value)
+
+    def execute_script(self, script: str, *args) -> None:
+        return None
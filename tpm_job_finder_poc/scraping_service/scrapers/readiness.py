@@ -0,0 +1,215 @@
+"""
+Event-driven page readiness for browser scrapers.
+
+Scrapers used to sleep a fixed time after every navigation, popup click and
+"next page" click. ``PageReadiness`` instead runs a small script in the page
+that resolves as soon as the DOM has stopped mutating and no new resource
+requests have started for a quiet window (an in-page network-idle signal), or
+once a specific selector has rendered. Per-site timeouts are learned from the
+settle times observed so far, and the time saved against the old fixed sleeps
+is reported per page.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+
+logger = logging.getLogger(__name__)
+
+# Resolves with {reason, elapsed} once the page is quiet. With require_change it
+# first waits for a DOM mutation, or for a new document (no settle marker), so a
+# click that updates the page in place isn't mistaken for an already-settled page.
+SETTLE_SCRIPT = """
+var selector = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2],
+    requireChange = arguments[3], done = arguments[arguments.length - 1];
+var start = performance.now(), last = start, finished = false;
+var changed = !requireChange || !window.__scraperSettled;
+var mutations = new MutationObserver(function () { last = performance.now(); changed = true; });
+mutations.observe(document.documentElement,
+    {childList: true, subtree: true, attributes: true, characterData: true});
+var resources = null;
+try {
+    resources = new PerformanceObserver(function () { last = performance.now(); });
+    resources.observe({entryTypes: ['resource']});
+} catch (e) {}
+var timer = setInterval(function () {
+    var now = performance.now();
+    if (now - start >= timeoutMs) { return finish('timeout'); }
+    if (!changed || (selector && !document.querySelector(selector))) { return; }
+    if (now - last >= quietMs) { finish('quiet'); }
+}, 50);
+function finish(reason) {
+    if (finished) { return; }
+    finished = true;
+    clearInterval(timer);
+    mutations.disconnect();
+    if (resources) { resources.disconnect(); }
+    window.__scraperSettled = true;
+    done({reason: reason, elapsed: performance.now() - start});
+}
+"""
+
+
+def _percentile(sorted_values, fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class ReadinessProfile:
+    """Per-site settle timing, learned from observed waits."""
+
+    def __init__(
+        self,
+        quiet_ms: int = 300,
+        min_timeout: float = 1.0,
+        max_timeout: float = 10.0,
+        headroom: float = 1.5,
+        history_size: int = 50
+    ):
+        """
+        Initialize the profile.
+
+        Args:
+            quiet_ms: How long the page must stay quiet to count as settled
+            min_timeout: Lower bound for the learned settle timeout (seconds)
+            max_timeout: Upper bound, also used until enough history exists
+            headroom: Multiplier applied to the p90 settle time
+            history_size: Number of recent settle times kept
+        """
+        self.quiet_ms = quiet_ms
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.headroom = headroom
+        self._samples: Deque[float] = deque(maxlen=history_size)
+
+    def timeout(self) -> float:
+        """Settle timeout for the next wait, in seconds."""
+        if len(self._samples) < 5:
+            return self.max_timeout
+        p90 = _percentile(sorted(self._samples), 0.9)
+        return min(self.max_timeout, max(self.min_timeout, p90 * self.headroom + self.quiet_ms / 1000))
+
+    def record(self, settle_seconds: float) -> None:
+        self._samples.append(settle_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        samples = sorted(self._samples)
+        return {
+            "quiet_ms": self.quiet_ms,
+            "learned_timeout": round(self.timeout(), 3),
+            "settle_p50": _percentile(samples, 0.5),
+            "settle_p90": _percentile(samples, 0.9),
+            "samples": len(samples)
+        }
+
+
+class PageReadiness:
+    """Waits for pages to settle and accounts for time saved versus fixed sleeps."""
+
+    def __init__(self, name: str, profile: Optional[ReadinessProfile] = None):
+        """
+        Args:
+            name: Site/scraper name, used in logs
+            profile: Timing profile (a default one is created if omitted)
+        """
+        self.name = name
+        self.profile = profile or ReadinessProfile()
+        self._pages = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._fallbacks = 0
+        self._waited = 0.0
+        self._baseline = 0.0
+
+    async def settle(self, browser: Any, baseline: float, selector: Optional[str] = None,
+                     require_change: bool = False) -> float:
+        """
+        Wait until the page is quiet (and ``selector`` is present, if given).
+
+        Args:
+            browser: AsyncWebDriver for the session
+            baseline: Fixed sleep this wait replaces, for savings accounting
+            selector: CSS selector that must be present before settling
+            require_change: Wait for the page to change first (after a click)
+
+        Returns:
+            Seconds waited
+        """
+        timeout = self.profile.timeout()
+        start = time.monotonic()
+        try:
+            result = await browser.call(
+                browser.driver.execute_async_script, SETTLE_SCRIPT,
+                selector, self.profile.quiet_ms, int(timeout * 1000), require_change
+            )
+        except Exception as e:
+            # No script support (or the page navigated away mid-wait): fall back to the fixed delay
+            logger.debug(f"Readiness script failed for {self.name}: {e}")
+            self._fallbacks += 1
+            await asyncio.sleep(baseline)
+            result = None
+
+        waited = time.monotonic() - start
+        if isinstance(result, dict):
+            if result.get('reason') == 'timeout':
+                self._timeouts += 1
+            self.profile.record(float(result.get('elapsed', waited * 1000)) / 1000)
+        self.record_wait(waited, baseline)
+        return waited
+
+    async def until_hidden(self, browser: Any, element: Any, baseline: float) -> float:
+        """
+        Wait for a dismissed popup element to disappear.
+
+        Args:
+            browser: AsyncWebDriver for the session
+            element: Element that should become hidden or detached
+            baseline: Fixed sleep this wait replaces
+
+        Returns:
+            Seconds waited
+        """
+        start = time.monotonic()
+        try:
+            await browser.wait_until(EC.invisibility_of_element(element), timeout=baseline)
+        except TimeoutException:
+            pass
+        waited = time.monotonic() - start
+        self.record_wait(waited, baseline)
+        return waited
+
+    def record_page(self) -> None:
+        """Count a page load, for per-page savings."""
+        self._pages += 1
+
+    def record_wait(self, waited: float, baseline: float) -> None:
+        """Account a wait against the fixed sleep it replaced."""
+        self._waits += 1
+        self._waited += waited
+        self._baseline += baseline
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get readiness statistics.
+
+        Returns:
+            Dictionary with wait counts, time waited and time saved
+        """
+        saved = self._baseline - self._waited
+        return {
+            "pages": self._pages,
+            "waits": self._waits,
+            "timeouts": self._timeouts,
+            "fallbacks": self._fallbacks,
+            "total_wait_seconds": round(self._waited, 3),
+            "total_saved_seconds": round(saved, 3),
+            "avg_saved_per_page": round(saved / self._pages, 3) if self._pages else 0.0,
+            "profile": self.profile.get_stats()
+        }
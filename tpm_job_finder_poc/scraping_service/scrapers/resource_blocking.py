@@ -0,0 +1,244 @@
+"""
+Request blocking for scraper browsers.
+
+Card parsers only need the document and the scripts that render it; images,
+media, web fonts, analytics beacons and third-party widgets cost bandwidth and
+main-thread time without contributing anything. ``ResourceBlockingRules`` turns
+per-site allow/deny rules into a URL blocklist that ``ResourceBlocker`` installs
+with the DevTools ``Network.setBlockedURLs`` command, so blocked requests are
+never sent. After each page the blocker drains Chrome's performance log to
+count what was blocked and what was actually transferred.
+"""
+
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# setBlockedURLs patterns: '*' matches any run of characters. Extension patterns
+# end in '*' so query strings and CDN resize suffixes are covered.
+CATEGORY_PATTERNS: Dict[str, List[str]] = {
+    "image": [
+        "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*",
+        "*.ico*", "*.bmp*"
+    ],
+    "media": [
+        "*.mp4*", "*.webm*", "*.m4v*", "*.mov*", "*.m3u8*", "*.mp3*", "*.wav*", "*.ogg*"
+    ],
+    "font": [
+        "*.woff*", "*.ttf*", "*.otf*", "*.eot*", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+        "*use.typekit.net*"
+    ],
+    "tracker": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.com*",
+        "*connect.facebook.net*", "*facebook.com/tr*", "*bat.bing.com*",
+        "*px.ads.linkedin.com*", "*snap.licdn.com*", "*analytics.twitter.com*",
+        "*scorecardresearch.com*", "*quantserve.com*", "*criteo.com*", "*criteo.net*",
+        "*taboola.com*", "*outbrain.com*", "*nr-data.net*", "*js-agent.newrelic.com*",
+        "*cdn.segment.com*", "*api.segment.io*", "*sentry-cdn.com*", "*browser.sentry-cdn.com*"
+    ],
+    "third_party_script": [
+        "*static.hotjar.com*", "*script.hotjar.com*", "*clarity.ms*", "*fullstory.com*",
+        "*cdn.heapanalytics.com*", "*cdn.mxpnl.com*", "*cdn.amplitude.com*",
+        "*cdn.optimizely.com*", "*js.hs-scripts.com*", "*js.hs-analytics.net*",
+        "*js.driftt.com*", "*widget.intercom.io*", "*js.intercomcdn.com*",
+        "*script.crazyegg.com*", "*static.zdassets.com*", "*embed.tawk.to*"
+    ]
+}
+
+DEFAULT_CATEGORIES = tuple(CATEGORY_PATTERNS)
+
+# Blocked requests are never sent, so their size is unknown; bytes blocked are
+# estimated from typical transfer sizes for each DevTools resource type.
+TYPICAL_BYTES: Dict[str, int] = {
+    "Image": 30_000,
+    "Media": 500_000,
+    "Font": 40_000,
+    "Script": 30_000,
+    "Stylesheet": 15_000,
+    "XHR": 2_000,
+    "Fetch": 2_000,
+    "Ping": 500,
+    "Other": 5_000
+}
+
+# blockedReason DevTools reports for requests matched by setBlockedURLs
+_INSPECTOR_BLOCKED = "inspector"
+
+
+class ResourceBlockingRules:
+    """Which requests a site's browser sessions should never send."""
+
+    def __init__(
+        self,
+        categories: Iterable[str] = DEFAULT_CATEGORIES,
+        deny: Optional[Sequence[str]] = None,
+        allow: Optional[Sequence[str]] = None
+    ):
+        """
+        Initialize the rules.
+
+        Args:
+            categories: Built-in pattern groups to block (keys of ``CATEGORY_PATTERNS``)
+            deny: Extra site-specific URL patterns to block
+            allow: Patterns exempted from blocking; any built-in or denied
+                pattern listed here is left out of the blocklist
+        """
+        self.categories = tuple(categories)
+        unknown = set(self.categories) - set(CATEGORY_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource categories: {sorted(unknown)}")
+        self.deny = list(deny or [])
+        self.allow = list(allow or [])
+
+    def extend(self, deny: Sequence[str] = (), allow: Sequence[str] = ()) -> "ResourceBlockingRules":
+        """
+        Return a copy with additional deny/allow patterns, for per-site overrides.
+
+        Args:
+            deny: Patterns to block in addition to these rules
+            allow: Patterns to exempt in addition to these rules
+        """
+        return ResourceBlockingRules(
+            self.categories, self.deny + list(deny), self.allow + list(allow)
+        )
+
+    def patterns(self) -> List[str]:
+        """
+        Build the ``Network.setBlockedURLs`` pattern list.
+
+        Returns:
+            De-duplicated blocklist patterns, minus allowed ones
+        """
+        allowed = set(self.allow)
+        blocked: Dict[str, None] = {}
+        for category in self.categories:
+            for pattern in CATEGORY_PATTERNS[category]:
+                blocked.setdefault(pattern)
+        for pattern in self.deny:
+            blocked.setdefault(pattern)
+        return [pattern for pattern in blocked if pattern not in allowed]
+
+
+class ResourceBlocker:
+    """Installs blocking rules in browser sessions and accounts for what they save."""
+
+    def __init__(self, name: str, rules: ResourceBlockingRules):
+        """
+        Args:
+            name: Site/scraper name, used in logs
+            rules: Rules applied to every session this blocker configures
+        """
+        self.name = name
+        self.rules = rules
+        self._sessions = 0
+        self._pages = 0
+        self._requests_blocked = 0
+        self._bytes_blocked = 0
+        self._requests_loaded = 0
+        self._bytes_loaded = 0
+        self._blocked_by_type: Dict[str, int] = defaultdict(int)
+        self._log_unavailable = 0
+
+    @staticmethod
+    def configure_options(options: Any) -> None:
+        """
+        Enable the network performance log blocked requests are counted from.
+
+        Args:
+            options: Chrome Options for a session being launched
+        """
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+    def apply(self, driver: Any) -> bool:
+        """
+        Install the blocklist in a browser session (blocking call).
+
+        Args:
+            driver: Chrome WebDriver supporting ``execute_cdp_cmd``
+
+        Returns:
+            True if the blocklist was installed
+        """
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.rules.patterns()})
+        except Exception as e:
+            logger.warning(f"Could not install request blocking for {self.name}: {e}")
+            return False
+        self._sessions += 1
+        return True
+
+    def collect(self, driver: Any) -> Optional[Dict[str, int]]:
+        """
+        Drain the session's performance log and account the page it covers.
+
+        Args:
+            driver: Chrome WebDriver positioned on the page just loaded
+
+        Returns:
+            The page's blocked/loaded request and byte counts, or None if the
+            session has no performance log
+        """
+        try:
+            entries = list(driver.get_log('performance'))
+        except Exception as e:
+            logger.debug(f"Performance log unavailable for {self.name}: {e}")
+            self._log_unavailable += 1
+            return None
+
+        page = {"requests_blocked": 0, "bytes_blocked": 0, "requests_loaded": 0, "bytes_loaded": 0}
+        for entry in entries:
+            message = entry.get('message', '') if isinstance(entry, dict) else ''
+            # Most entries are other Network events; skip them without decoding
+            if 'Network.loadingFailed' not in message and 'Network.loadingFinished' not in message:
+                continue
+            try:
+                event = json.loads(message)['message']
+            except (ValueError, KeyError, TypeError):
+                continue
+            params = event.get('params', {})
+            if event.get('method') == 'Network.loadingFinished':
+                page["requests_loaded"] += 1
+                page["bytes_loaded"] += int(params.get('encodedDataLength') or 0)
+            elif params.get('blockedReason') == _INSPECTOR_BLOCKED:
+                resource_type = params.get('type', 'Other')
+                page["requests_blocked"] += 1
+                page["bytes_blocked"] += TYPICAL_BYTES.get(resource_type, TYPICAL_BYTES["Other"])
+                self._blocked_by_type[resource_type] += 1
+
+        self._pages += 1
+        self._requests_blocked += page["requests_blocked"]
+        self._bytes_blocked += page["bytes_blocked"]
+        self._requests_loaded += page["requests_loaded"]
+        self._bytes_loaded += page["bytes_loaded"]
+        return page
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request blocking statistics.
+
+        Returns:
+            Dictionary with totals and per-page averages of blocked and loaded
+            requests and bytes (blocked bytes are estimates)
+        """
+        pages = self._pages
+        return {
+            "enabled": True,
+            "sessions": self._sessions,
+            "patterns": len(self.rules.patterns()),
+            "pages": pages,
+            "requests_blocked": self._requests_blocked,
+            "est_bytes_blocked": self._bytes_blocked,
+            "requests_loaded": self._requests_loaded,
+            "bytes_loaded": self._bytes_loaded,
+            "avg_requests_blocked_per_page": round(self._requests_blocked / pages, 1) if pages else 0.0,
+            "avg_est_bytes_blocked_per_page": round(self._bytes_blocked / pages) if pages else 0,
+            "avg_bytes_loaded_per_page": round(self._bytes_loaded / pages) if pages else 0,
+            "blocked_by_type": dict(self._blocked_by_type),
+            "log_unavailable": self._log_unavailable
+        }
@@ -0,0 +1,235 @@
+"""
+Structured job data embedded in static pages.
+
+Many job boards ship their listings as machine-readable data alongside the
+rendered markup: schema.org ``JobPosting`` objects in JSON-LD script tags, or
+the page props of a Next.js app in ``<script id="__NEXT_DATA__">``. Reading
+those from a plain HTTP response avoids launching a browser at all.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from ..core.base_job_source import JobPosting
+from .page_snapshot import HTML_PARSER, rendered_text
+
+logger = logging.getLogger(__name__)
+
+_JSON_LD = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+_NEXT_DATA = re.compile(
+    r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def extract_json_ld(html: str) -> List[Any]:
+    """
+    Decode every JSON-LD block in a page.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        Decoded JSON values, skipping blocks that are not valid JSON
+    """
+    blocks = []
+    for match in _JSON_LD.finditer(html):
+        try:
+            blocks.append(json.loads(match.group(1).strip()))
+        except ValueError:
+            logger.debug("Skipping malformed JSON-LD block")
+    return blocks
+
+
+def extract_next_data(html: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode a Next.js ``__NEXT_DATA__`` payload, if the page has one.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        Decoded payload or None
+    """
+    match = _NEXT_DATA.search(html)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1).strip())
+    except ValueError:
+        logger.debug("Skipping malformed __NEXT_DATA__ payload")
+        return None
+
+
+def _is_job_posting(value: Dict[str, Any]) -> bool:
+    kind = value.get('@type')
+    if isinstance(kind, list):
+        return 'JobPosting' in kind
+    return kind == 'JobPosting'
+
+
+def find_job_postings(data: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Yield schema.org JobPosting objects nested anywhere in decoded JSON.
+
+    Handles ``@graph`` containers, ``ItemList`` wrappers and arbitrary page
+    props, since sites embed postings at different depths.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if _is_job_posting(value):
+                yield value
+                continue
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+
+
+def _text(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get('name') or value.get('value')
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _format_location(posting: Dict[str, Any]) -> Optional[str]:
+    locations = posting.get('jobLocation') or []
+    if isinstance(locations, dict):
+        locations = [locations]
+    formatted = []
+    for location in locations:
+        address = location.get('address', location) if isinstance(location, dict) else location
+        if isinstance(address, dict):
+            parts = [_text(address.get(key)) for key in
+                     ('addressLocality', 'addressRegion', 'addressCountry')]
+            text = ', '.join(part for part in parts if part)
+        else:
+            text = _text(address)
+        if text and text not in formatted:
+            formatted.append(text)
+    if not formatted and posting.get('jobLocationType') == 'TELECOMMUTE':
+        return "Remote"
+    return '; '.join(formatted) or None
+
+
+def _format_salary(posting: Dict[str, Any]) -> Optional[str]:
+    salary = posting.get('baseSalary') or posting.get('estimatedSalary')
+    if isinstance(salary, list):
+        salary = salary[0] if salary else None
+    if not isinstance(salary, dict):
+        return _text(salary)
+    currency = salary.get('currency', '')
+    value = salary.get('value', salary)
+    if not isinstance(value, dict):
+        return f"{currency} {value}".strip() if value is not None else None
+    low, high = value.get('minValue'), value.get('maxValue')
+    amount = value.get('value')
+    if low is not None and high is not None:
+        amount = f"{low}-{high}"
+    elif amount is None:
+        amount = low if low is not None else high
+    if amount is None:
+        return None
+    unit = value.get('unitText') or salary.get('unitText')
+    text = f"{currency} {amount}".strip()
+    return f"{text} per {unit.lower()}" if unit else text
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _html_to_text(value: Any) -> Optional[str]:
+    text = _text(value)
+    if text and '<' in text:
+        text = rendered_text(BeautifulSoup(text, HTML_PARSER))
+    return text or None
+
+
+def job_posting_from_schema(posting: Dict[str, Any], source: str, page_url: str) -> Optional[JobPosting]:
+    """
+    Convert a schema.org JobPosting object into a JobPosting.
+
+    Args:
+        posting: Decoded schema.org JobPosting
+        source: Source name for the posting
+        page_url: URL of the page the posting was embedded in
+
+    Returns:
+        JobPosting, or None when the object has no title
+    """
+    title = _text(posting.get('title'))
+    if not title:
+        return None
+    url = posting.get('url') or posting.get('sameAs')
+    url = urljoin(page_url, url) if url else page_url
+
+    identifier = posting.get('identifier')
+    if isinstance(identifier, dict):
+        identifier = identifier.get('value')
+    if not identifier:
+        identifier = hashlib.blake2b(f"{url}|{title}".encode('utf-8'), digest_size=8).hexdigest()
+
+    return JobPosting(
+        id=f"{source}_{identifier}",
+        source=source,
+        company=_text(posting.get('hiringOrganization')) or "Unknown",
+        title=title,
+        location=_format_location(posting),
+        salary=_format_salary(posting),
+        url=url,
+        date_posted=_parse_date(posting.get('datePosted')) or datetime.now(timezone.utc),
+        description=_html_to_text(posting.get('description')),
+        raw_data={
+            'scraped_at': datetime.now(timezone.utc).isoformat(),
+            'page_url': page_url,
+            'employment_type': posting.get('employmentType'),
+            'valid_through': posting.get('validThrough'),
+            'structured_data': True
+        }
+    )
+
+
+def extract_structured_jobs(html: str, source: str, page_url: str) -> List[JobPosting]:
+    """
+    Extract JobPostings from JSON-LD and ``__NEXT_DATA__`` in a page.
+
+    Args:
+        html: Page HTML
+        source: Source name for the postings
+        page_url: URL the page was fetched from
+
+    Returns:
+        Postings found in the page's structured data, de-duplicated by id
+    """
+    candidates = list(find_job_postings(extract_json_ld(html)))
+    next_data = extract_next_data(html)
+    if next_data is not None:
+        candidates.extend(find_job_postings(next_data))
+
+    jobs: Dict[str, JobPosting] = {}
+    for candidate in candidates:
+        job = job_posting_from_schema(candidate, source, page_url)
+        if job is not None and job.id not in jobs:
+            jobs[job.id] = job
+    return list(jobs.values())
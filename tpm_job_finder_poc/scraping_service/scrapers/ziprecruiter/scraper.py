@@ -5,19 +5,18 @@ Scrapes job postings from ZipRecruiter.com using browser automation.
 Handles ZipRecruiter's job board structure and search functionality.
 """
 
+import asyncio
 import re
-import time
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone, timedelta
 from urllib.parse import urlencode, quote
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
 
 from ..base_scraper import BaseScraper, BrowserProfile
+from ..page_snapshot import PageSnapshot
 from ...core.base_job_source import JobPosting, FetchParams, RateLimitConfig
 
 logger = logging.getLogger(__name__)
@@ -40,7 +39,9 @@ class ZipRecruiterScraper(BaseScraper):
                 requests_per_minute=10,  # ZipRecruiter is more permissive
                 requests_per_hour=300,
                 burst_limit=3
-            )
+            ),
+            # Search results embed JSON-LD/__NEXT_DATA__ job data in the static page
+            http_first=True
         )
         
     def get_search_url(self, **kwargs) -> str:
@@ -71,6 +72,21 @@ class ZipRecruiterScraper(BaseScraper):
             return f"{base_search_url}?{urlencode(params)}"
         return base_search_url
         
+    def get_page_url(self, search_url: str, page: int) -> Optional[str]:
+        """
+        ZipRecruiter results pages are addressed with a one-based ``page`` parameter.
+        
+        Args:
+            search_url: URL of the first results page
+            page: Zero-based page index
+            
+        Returns:
+            URL of the requested page
+        """
+        if page == 0:
+            return search_url
+        return self._with_query_params(search_url, page=page + 1)
+        
     def get_selectors(self) -> Dict[str, str]:
         """
         Get CSS selectors for ZipRecruiter job elements.
@@ -128,7 +144,7 @@ class ZipRecruiterScraper(BaseScraper):
         
         # ZipRecruiter-specific optimizations (safe)
         try:
-            driver.execute_script("""
+            await asyncio.to_thread(driver.execute_script, """
                 // Safe anti-detection setup
                 console.log('ZipRecruiter setup complete');
             """)
@@ -142,7 +158,7 @@ class ZipRecruiterScraper(BaseScraper):
         Parse job postings from ZipRecruiter search results page.
         
         Args:
-            driver: Selenium WebDriver instance
+            driver: Selenium WebDriver instance or PageSnapshot
             
         Returns:
             List of JobPosting objects
@@ -150,14 +166,13 @@ class ZipRecruiterScraper(BaseScraper):
         jobs = []
         selectors = self.get_selectors()
         
-        # Handle any popups
-        await self._handle_ziprecruiter_popups()
+        # Handle any popups (live pages only; snapshots can't be clicked)
+        if not isinstance(driver, PageSnapshot):
+            await self._handle_ziprecruiter_popups()
         
         try:
             # Wait for job cards to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selectors['job_cards']))
-            )
+            await self._wait_for_element(driver, selectors['job_cards'], timeout=15)
             
             job_cards = driver.find_elements(By.CSS_SELECTOR, selectors['job_cards'])
             
@@ -170,10 +185,9 @@ class ZipRecruiterScraper(BaseScraper):
             for i, card in enumerate(job_cards):
                 try:
                     # Scroll card into view
-                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-                    time.sleep(0.3)  # Brief pause for stability
+                    await self._scroll_into_view(driver, card, pause=0.3)
                     
-                    job = await self._parse_single_ziprecruiter_job(card, selectors)
+                    job = await self._parse_single_ziprecruiter_job(card, selectors, page=driver)
                     if job:
                         jobs.append(job)
                         
@@ -189,13 +203,14 @@ class ZipRecruiterScraper(BaseScraper):
             
         return jobs
         
-    async def _parse_single_ziprecruiter_job(self, card_element, selectors: Dict[str, str]) -> Optional[JobPosting]:
+    async def _parse_single_ziprecruiter_job(self, card_element, selectors: Dict[str, str], page=None) -> Optional[JobPosting]:
         """
         Parse a single ZipRecruiter job card element.
         
         Args:
-            card_element: Selenium WebElement for job card
+            card_element: Selenium WebElement (or snapshot element) for job card
             selectors: Dictionary of CSS selectors
+            page: Driver or PageSnapshot the card came from (defaults to the live driver)
             
         Returns:
             JobPosting object or None if parsing fails
@@ -260,7 +275,7 @@ class ZipRecruiterScraper(BaseScraper):
                 date_posted=date_posted,
                 raw_data={
                     'scraped_at': datetime.now(timezone.utc).isoformat(),
-                    'page_url': self._driver.current_url,
+                    'page_url': (page or self._driver).current_url,
                     'salary': salary,
                     'description_snippet': description[:200] if description else None
                 }
@@ -343,7 +358,7 @@ class ZipRecruiterScraper(BaseScraper):
             if cookie_banner.is_displayed():
                 accept_button = cookie_banner.find_element(By.TAG_NAME, 'button')
                 accept_button.click()
-                time.sleep(1)
+                await self._wait_until_hidden(cookie_banner)
         except NoSuchElementException:
             pass
             
@@ -352,7 +367,7 @@ class ZipRecruiterScraper(BaseScraper):
             popup_close = self._driver.find_element(By.CSS_SELECTOR, selectors['popup_close'])
             if popup_close.is_displayed():
                 popup_close.click()
-                time.sleep(1)
+                await self._wait_until_hidden(popup_close)
         except (NoSuchElementException, ElementClickInterceptedException):
             pass
             
@@ -387,7 +402,7 @@ class ZipRecruiterScraper(BaseScraper):
             try:
                 # Scroll to bottom to ensure next button is visible
                 self._driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
+                await self._wait_until_settled(baseline=1.0)
                 
                 # Look for next button
                 next_button = self._find_element_with_fallback(
@@ -402,14 +417,13 @@ class ZipRecruiterScraper(BaseScraper):
                 next_button.click()
                 
                 # Wait for new page
-                await self._wait_for_page_load(timeout=10)
-                time.sleep(2)
+                await self._wait_for_page_load(timeout=10, require_change=True, baseline=4.0)
                 
                 # Handle popups again
                 await self._handle_ziprecruiter_popups()
                 
                 # Parse new page
-                page_jobs = await self.parse_job_elements(self._driver)
+                page_jobs = await self._parse_current_page()
                 additional_jobs.extend(page_jobs)
                 pages_scraped += 1
                 